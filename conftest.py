@@ -4,6 +4,7 @@
 # """
 
 import os
+import json
 import shutil
 import subprocess
 import time
@@ -14,8 +15,24 @@ import allure
 import pytest
 from playwright.sync_api import Browser, Page
 from data import URLs
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.autoscaler import BATCH_ENV
+from utils.selector_preferences import SelectorPreferences
+from utils.benchmark import BenchmarkRecorder
+from utils.data_corpus import CorpusSlice, DataCorpus
+from utils.data_driven import DataDrivenSession
+from utils.helper import FileManager, WaitHelper
+from utils.network_stats import NetworkAccountant, NetworkReport
+from utils import resource_sampler
+from utils.resource_sampler import ResourceSampler
+from utils.perf_metrics import (
+    LONG_TASKS_INIT_SCRIPT,
+    PagePerformanceCollector,
+    PerformanceAggregator,
+)
 
 # # Импорты всех страниц
+from pages.base_page import BasePage
 from pages.alerts.alerts_page import AlertsPage
 from pages.alerts.browser_windows_page import BrowserWindowsPage
 from pages.alerts.frames_page import FramesPage
@@ -49,6 +66,9 @@ from pages.widgets.tool_tips_page import ToolTipsPage
 
 logger = logging.getLogger(__name__)
 
+# Счетчик сетевой активности текущего теста (заполняется фикстурой browser_context)
+network_accountant_key = pytest.StashKey[NetworkAccountant]()
+
 # Домены для блокировки внешних ресурсов
 BLOCKED_DOMAINS = [
     "doubleclick.net",
@@ -79,18 +99,21 @@ BLOCKED_DOMAINS = [
 ]
 
 
-def block_external_resources(route):
+def block_external_resources(route, accountant: NetworkAccountant = None):
     """
     Блокирует внешние ресурсы (шрифты, изображения, рекламу) для ускорения тестов.
 
     Args:
         route: Playwright route объект для перехвата запросов
+        accountant: Счетчик сетевой активности для учета заблокированных запросов
     """
     url = route.request.url.lower()
     resource_type = route.request.resource_type
     if resource_type in {"font", "image"} or any(
         domain in url for domain in BLOCKED_DOMAINS
     ):
+        if accountant is not None:
+            accountant.record_blocked(route.request)
         route.abort()
     else:
         route.continue_()
@@ -127,7 +150,7 @@ def auth_storage(tmp_path_factory, browser):
 
 
 @pytest.fixture(scope="function")
-def browser_context(playwright, browser_name, browser_context_args):
+def browser_context(playwright, browser_name, browser_context_args, request):
     """
     Создает основной браузерный контекст с блокировкой внешних запросов.
 
@@ -135,6 +158,7 @@ def browser_context(playwright, browser_name, browser_context_args):
         playwright: Playwright instance
         browser_name: Имя браузера (chromium, firefox, webkit)
         browser_context_args: Дополнительные аргументы контекста
+        request: Запрос pytest текущего теста (включение метрик и учета трафика)
 
     Yields:
         BrowserContext: Настроенный контекст браузера
@@ -146,28 +170,92 @@ def browser_context(playwright, browser_name, browser_context_args):
         viewport={"width": 1920, "height": 1080},
         **browser_context_args,
     )
-    context.route("**/*", block_external_resources)
+    network_report = request.config.network_report
+    accountant = NetworkAccountant() if network_report is not None else None
+    if accountant is not None:
+        request.node.stash[network_accountant_key] = accountant
+        accountant.attach(context)
+        context.route("**/*", lambda route: block_external_resources(route, accountant))
+    else:
+        context.route("**/*", block_external_resources)
+    if request.config.perf_aggregator is not None:
+        context.add_init_script(LONG_TASKS_INIT_SCRIPT)
     yield context
+    if accountant is not None:
+        summary = accountant.summary()
+        network_report.add(request.node.nodeid, summary)
+        request.node.user_properties.append(("network_summary", summary))
+        allure.attach(
+            json.dumps(summary, indent=2, ensure_ascii=False),
+            name="network_summary",
+            attachment_type=allure.attachment_type.JSON,
+        )
     context.close()
     browser.close()
 
 
 @pytest.fixture(scope="function")
-def page(browser_context) -> Page:
+def page(browser_context, request) -> Page:
     """
     Создает страницу в основном браузерном контексте.
+    При запуске с --perf-metrics собирает браузерные метрики страницы
+    и прикрепляет их к результату теста.
 
     Args:
         browser_context: Браузерный контекст
+        request: Запрос pytest текущего теста
 
     Yields:
         Page: Страница браузера
     """
     page = browser_context.new_page()
+    accountant = request.node.stash.get(network_accountant_key, None)
+    aggregator = request.config.perf_aggregator
+    collector = PagePerformanceCollector(page) if aggregator is not None else None
     yield page
+    if collector is not None:
+        metrics = collector.collect()
+        collector.detach()
+        if metrics:
+            aggregator.add(metrics)
+            request.node.user_properties.append(("browser_metrics", metrics))
+            allure.attach(
+                json.dumps(metrics, indent=2, ensure_ascii=False),
+                name="browser_metrics",
+                attachment_type=allure.attachment_type.JSON,
+            )
+    if accountant is not None:
+        accountant.resolve()
     page.close()
 
 
+@pytest.fixture(scope="session")
+def data_driven_session(browser):
+    """
+    Общая страница воркера для data-driven тестов: один контекст на весь прогон,
+    между строками набора выполняется сброс сценария, а не новый браузер.
+
+    Args:
+        browser: Browser instance
+
+    Yields:
+        DataDrivenSession: Сессия с общими страницами сценариев
+    """
+    context = browser.new_context(
+        ignore_https_errors=True,
+        bypass_csp=True,
+        viewport={"width": 1920, "height": 1080},
+    )
+    context.route("**/*", block_external_resources)
+    session = DataDrivenSession(context)
+    yield session
+    summary = session.summary()
+    if summary:
+        logger.info(f"Data-driven сводка: {summary}")
+    session.close()
+    context.close()
+
+
 @pytest.fixture(scope="function")
 def auth_context(browser, auth_storage):
     """
@@ -248,6 +336,59 @@ def text_box_page(page: Page):
     yield TextBoxPage(page)
 
 
+@pytest.fixture(scope="function")
+def data_seed(request) -> str:
+    """
+    Зерно для пакетной генерации данных, стабильное для каждого теста.
+    Переменная окружения TEST_DATA_SEED задает общую "соль" прогона.
+
+    Returns:
+        str: Зерно для DataGenerator.users/addresses/rng
+    """
+    return f"{os.getenv('TEST_DATA_SEED', '')}{request.node.nodeid}"
+
+
+@pytest.fixture(scope="session")
+def test_file():
+    """
+    Фабрика файлов для загрузки: файлы создаются один раз на машину в кэше
+    с адресацией по содержимому и выдаются только на чтение.
+
+    Returns:
+        Callable: test_file("sample_image") -> путь к файлу из TestData.FILES,
+            test_file(kind="text", name="a.txt", content="...") -> путь по спецификации
+    """
+    return FileManager.fixture_file
+
+
+@pytest.fixture(scope="session")
+def data_corpus():
+    """
+    Корпус заранее сгенерированных тестовых данных (mmap, доступ по индексу O(1)).
+    Создается командой: python run_tests.py build-corpus
+
+    Yields:
+        DataCorpus: Корпус данных
+    """
+    path = os.getenv("TEST_DATA_CORPUS", "test_data_corpus.bin")
+    if not os.path.exists(path):
+        pytest.skip(f"Корпус данных {path} не найден, выполните: python run_tests.py build-corpus")
+    corpus = DataCorpus(path)
+    yield corpus
+    corpus.close()
+
+
+@pytest.fixture(scope="session")
+def corpus_slice(data_corpus) -> CorpusSlice:
+    """
+    Срез корпуса текущего xdist воркера; записи не пересекаются с другими воркерами.
+
+    Returns:
+        CorpusSlice: Срез с методом take(n) для выдачи неиспользованных записей
+    """
+    return data_corpus.worker_slice()
+
+
 @pytest.fixture(scope="function")
 def make_page():
     """
@@ -525,6 +666,83 @@ def authenticated_page(auth_context):
     page.close()
 
 
+def pytest_addoption(parser):
+    """Регистрирует опции командной строки для бенчмарка фреймворка."""
+    group = parser.getgroup("benchmark", "Бенчмарк фреймворка")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Запустить тесты с маркером benchmark (по умолчанию пропускаются)",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        default=os.path.join("benchmarks", "baseline.json"),
+        help="Путь к файлу базовой линии бенчмарка",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.2,
+        help="Допустимый относительный рост медианы метрики (0.2 = +20%%)",
+    )
+    group.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        default=False,
+        help="Сохранить результаты текущего прогона как новую базовую линию",
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="Собирать браузерные метрики производительности страниц (perf-results/)",
+    )
+    parser.addoption(
+        "--network-stats",
+        action="store_true",
+        default=False,
+        help="Учитывать сетевой трафик тестов: запросы, байты, блокировки (network-results/)",
+    )
+    parser.addoption(
+        "--resource-sampler",
+        action="store_true",
+        default=False,
+        help="Замерять CPU/RSS воркеров и браузеров, рекомендовать число воркеров (resource-results/)",
+    )
+    parser.addoption(
+        "--resource-interval",
+        type=int,
+        default=500,
+        help="Интервал замеров сэмплера ресурсов в миллисекундах",
+    )
+    parser.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=False,
+        help="Таймауты ожиданий по истории длительностей вместо статических констант",
+    )
+    parser.addoption(
+        "--timeout-history",
+        default="timeout-history.json",
+        help="Файл истории длительностей для --adaptive-timeouts",
+    )
+    parser.addoption(
+        "--selector-history",
+        default="selector-history.json",
+        help="Файл выученного порядка альтернативных селекторов (пустая строка - без файла)",
+    )
+
+
+def _owns_reports(config) -> bool:
+    """
+    Строит ли процесс общие отчеты (Allure, метрики, сеть, ресурсы, бенчмарк).
+    xdist воркеры и пакеты адаптивного запуска (utils.autoscaler) только сохраняют
+    свои замеры: отчеты строит контроллер один раз после всех процессов.
+    """
+    return not hasattr(config, "workerinput") and BATCH_ENV not in os.environ
+
+
 def pytest_configure(config):
     """Регистрирует кастомные маркеры pytest."""
     config.addinivalue_line(
@@ -532,6 +750,107 @@ def pytest_configure(config):
     )
     config.addinivalue_line("markers", "smoke: marks tests as smoke tests")
     config.addinivalue_line("markers", "regression: marks tests as regression tests")
+    config.addinivalue_line(
+        "markers", "benchmark: marks framework performance benchmarks"
+    )
+
+    if config.getoption("--benchmark", default=False):
+        config.benchmark_recorder = BenchmarkRecorder(
+            threshold=config.getoption("--benchmark-threshold")
+        )
+        if _owns_reports(config):
+            config.benchmark_recorder.clear_stale_samples()
+    else:
+        config.benchmark_recorder = None
+
+    if config.getoption("--perf-metrics", default=False):
+        config.perf_aggregator = PerformanceAggregator()
+        if _owns_reports(config):
+            config.perf_aggregator.clear_stale_samples()
+    else:
+        config.perf_aggregator = None
+
+    if config.getoption("--network-stats", default=False):
+        config.network_report = NetworkReport()
+        if _owns_reports(config):
+            config.network_report.clear_stale_samples()
+    else:
+        config.network_report = None
+
+    config.resource_sampler = None
+    if config.getoption("--resource-sampler", default=False):
+        sampler = ResourceSampler(interval_ms=config.getoption("--resource-interval"))
+        is_controller = not hasattr(config, "workerinput")
+        if _owns_reports(config):
+            sampler.clear_stale_samples()
+        # Контроллер xdist тестов не выполняет, а дерево его процессов включает всех
+        # воркеров с браузерами - его замер не является замером одного воркера
+        xdist_controller = is_controller and getattr(config.option, "numprocesses", None)
+        if not xdist_controller and sampler.start():
+            config.resource_sampler = sampler
+
+    if config.getoption("--adaptive-timeouts", default=False):
+        BasePage.timeouts = AdaptiveTimeouts(config.getoption("--timeout-history"))
+        BasePage.timeouts.load()
+
+    BasePage.selectors = SelectorPreferences(config.getoption("--selector-history") or None)
+    BasePage.selectors.load()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Привязывает замеры сэмплера ресурсов и записи ожиданий к выполняемому тесту."""
+    sampler = item.config.resource_sampler
+    if sampler is not None:
+        sampler.begin_test(item.nodeid)
+    # Ожидания предыдущего теста (например, из его teardown) к этому тесту не относятся
+    WaitHelper.drain_records()
+    yield
+    if sampler is not None:
+        sampler.end_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Прикрепляет длительности ожиданий setup и теста к результату (свойство waits)."""
+    yield
+    waits = WaitHelper.drain_records()
+    if waits:
+        item.user_properties.append(("waits", waits))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Пропускает бенчмарки, если прогон запущен без --benchmark."""
+    if config.benchmark_recorder is not None:
+        return
+    skip_benchmark = pytest.mark.skip(reason="Бенчмарк запускается только с --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Замеряет время создания фикстур во время прогона бенчмарка."""
+    recorder = request.config.benchmark_recorder
+    if recorder is None or "benchmark" not in request.node.keywords:
+        yield
+        return
+    with recorder.measure(f"fixture_setup.{fixturedef.argname}"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder(pytestconfig) -> BenchmarkRecorder:
+    """
+    Накопитель замеров бенчмарка для текущего прогона.
+
+    Returns:
+        BenchmarkRecorder: Общий для сессии накопитель метрик
+    """
+    if pytestconfig.benchmark_recorder is None:
+        pytest.skip("Бенчмарк запускается только с --benchmark")
+    return pytestconfig.benchmark_recorder
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -580,11 +899,106 @@ def pytest_runtest_makereport(item, call):
                 logger.warning(f"Не удалось создать аттачменты: {e}")
 
 
+def _finish_benchmark(session) -> None:
+    """
+    Сливает замеры xdist воркеров, сохраняет результаты бенчмарка и сравнивает
+    их с базовой линией. При регрессии выше порога помечает сессию как упавшую.
+    """
+    recorder = session.config.benchmark_recorder
+    if recorder is None:
+        return
+    recorder.merge_samples()
+    if not recorder.samples:
+        if getattr(session.config.option, "numprocesses", None):
+            logger.warning("Замеры бенчмарка от воркеров не получены, сравнение с базовой линией пропущено")
+        return
+
+    results_path = os.path.join(
+        "benchmark-results", f"benchmark_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    recorder.save(results_path)
+    logger.info(f"Результаты бенчмарка сохранены в: {results_path}")
+
+    baseline_path = session.config.getoption("--benchmark-baseline")
+    if session.config.getoption("--benchmark-save-baseline"):
+        recorder.save(baseline_path)
+        logger.info(f"Базовая линия бенчмарка обновлена: {baseline_path}")
+        return
+
+    baseline = recorder.load_baseline(baseline_path)
+    if baseline is None:
+        logger.warning(f"Базовая линия не найдена: {baseline_path}")
+        return
+
+    if baseline.get("metadata", {}).get("hostname") != recorder.machine_metadata()["hostname"]:
+        logger.warning("Базовая линия снята на другой машине, сравнение неточно")
+
+    regressions = recorder.compare(baseline)
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    for item in regressions:
+        message = (
+            f"Регрессия {item['metric']}: {item['baseline_ms']} мс -> "
+            f"{item['current_ms']} мс (+{item['regression']:.0%})"
+        )
+        logger.error(message)
+        if reporter:
+            reporter.write_line(message, red=True)
+
+    if regressions:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def _report_resources(session) -> None:
+    """Сливает замеры ресурсов воркеров и выводит рекомендацию по числу воркеров."""
+    report = resource_sampler.merge_and_report()
+    if report is None:
+        return
+
+    message = (
+        f"Пик памяти воркера: {report['peak_worker_rss_mb']} МБ, "
+        f"рекомендуемое число воркеров: -n {report['recommended_workers']} "
+        f"(отчет: {report['path']})"
+    )
+    logger.info(message)
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter:
+        reporter.write_line(message)
+
+
 def pytest_sessionfinish(session, exitstatus):
     """
     Автоматически генерирует HTML отчет Allure после завершения тестов.
     Работает только если установлен allure CLI.
     """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER") or os.environ.get(BATCH_ENV, "master")
+    if session.config.benchmark_recorder is not None and not _owns_reports(session.config):
+        session.config.benchmark_recorder.save_samples(worker_id)
+    if session.config.perf_aggregator is not None:
+        session.config.perf_aggregator.save_samples(worker_id)
+    if session.config.network_report is not None:
+        session.config.network_report.save_samples(worker_id)
+    if session.config.resource_sampler is not None:
+        session.config.resource_sampler.stop()
+        session.config.resource_sampler.save_samples(worker_id)
+    if BasePage.timeouts is not None:
+        BasePage.timeouts.save()
+    BasePage.selectors.save()
+
+    if not _owns_reports(session.config):
+        return
+
+    _finish_benchmark(session)
+    if session.config.perf_aggregator is not None:
+        report_path = session.config.perf_aggregator.merge_and_report()
+        if report_path:
+            logger.info(f"Метрики страниц по URL сохранены в: {report_path}")
+    if session.config.network_report is not None:
+        report_path = session.config.network_report.merge_and_report()
+        if report_path:
+            logger.info(f"Отчет по сетевому трафику сохранен в: {report_path}")
+    if session.config.getoption("--resource-sampler"):
+        _report_resources(session)
+
     if shutil.which("allure"):
         results_dir = os.path.abspath("allure-results")
         report_dir = os.path.abspath("allure-report")
@@ -2,35 +2,68 @@
 Централизованные данные проекта: URL'ы, константы, тестовые данные.
 """
 
-# Гибридные структуры для одновременной поддержки доступа по ключам и по атрибутам
-class _Hybrid:
-    def __init__(self, data: dict):
-        # Преобразуем вложенные словари в _Hybrid рекурсивно
-        for k, v in data.items():
-            if isinstance(v, dict):
-                v = _Hybrid(v)
-            setattr(self, k, v)
-        # Сохраняем оригинальный словарь для []-доступа
-        self._data = {k: getattr(self, k) for k in data.keys()}
-
-    def __getitem__(self, key):
-        return self._data[key]
-
-    def __iter__(self):
-        return iter(self._data)
-
-    def items(self):
-        return self._data.items()
-
-    def get(self, key, default=None):
-        return self._data.get(key, default)
+import os
+
+from utils.datasets import LazyDataset
+from utils.records import record_type
+
+# Схемы тестовых данных: записи неизменяемы, поддерживают доступ по атрибутам
+# и по ключам и проверяются при загрузке набора
+ValidUser = record_type(
+    "ValidUser",
+    {
+        "first_name": str,
+        "last_name": str,
+        "email": str,
+        "age": str,
+        "salary": str,
+        "department": str,
+    },
+)
+LoginUser = record_type(
+    "LoginUser",
+    {"username": str, "password": str, "first_name": str, "last_name": str},
+)
+Users = record_type("Users", {"valid_user": ValidUser, "test_user": LoginUser})
+
+PracticeForm = record_type(
+    "PracticeForm",
+    {
+        "first_name": str,
+        "last_name": str,
+        "email": str,
+        "gender": str,
+        "mobile": str,
+        "subjects": tuple,
+        "hobbies": tuple,
+        "current_address": str,
+        "state": str,
+        "city": str,
+    },
+)
+FormData = record_type("FormData", {"practice_form": PracticeForm})
+
+FileSpec = record_type(
+    "FileSpec", {"kind": str, "name": str, "size": (int, tuple)}, optional=("size",)
+)
+Files = record_type(
+    "Files", {"sample_image": FileSpec, "sample_document": FileSpec, "large_file": FileSpec}
+)
+
+ApiResponses = record_type(
+    "ApiResponses",
+    dict.fromkeys(
+        ["created", "no_content", "moved", "bad_request", "unauthorized", "forbidden", "not_found"],
+        str,
+    ),
+)
 
 
 class URLs:
     """Константы URL'ов для всех страниц приложения."""
 
-    # Базовый URL
-    BASE_URL = "https://demoqa.com"
+    # Базовый URL (DEMOQA_BASE_URL позволяет направить тесты на локальный стенд)
+    BASE_URL = os.getenv("DEMOQA_BASE_URL", "https://demoqa.com").rstrip("/")
 
     # Elements
     TEXT_BOX = f"{BASE_URL}/text-box"
@@ -81,60 +114,25 @@ class URLs:
 class TestData:
     """Тестовые данные для различных форм и полей."""
 
-    # Данные пользователя: гибрид поддерживает и USERS["valid_user"]["first_name"],
-    # и USERS.valid_user.first_name, и USERS.test_user.username
-    USERS = _Hybrid(
+    # Данные пользователя (datasets/users.yaml): запись поддерживает и
+    # USERS["valid_user"]["first_name"], и USERS.valid_user.first_name
+    USERS = LazyDataset("users", Users)
+
+    # Данные для форм (datasets/form_data.yaml)
+    FORM_DATA = LazyDataset("form_data", FormData)
+
+    # Файлы для тестирования: спецификации для FileManager.cached_file,
+    # файлы создаются один раз на машину в кэше (см. FileManager.fixture_file)
+    FILES = Files.from_dict(
         {
-            "valid_user": {
-                "first_name": "John",
-                "last_name": "Doe",
-                "email": "john.doe@example.com",
-                "age": "30",
-                "salary": "75000",
-                "department": "Engineering",
-            },
-            "test_user": {
-                "username": "TestUser",
-                "password": "TestPassword123!",
-                "first_name": "Test",
-                "last_name": "User",
-            },
+            "sample_image": {"kind": "image", "name": "sample.jpg", "size": (100, 100)},
+            "sample_document": {"kind": "pdf", "name": "sample.pdf"},
+            "large_file": {"kind": "text", "name": "large_file.txt", "size": 50 * 1024 * 1024},
         }
     )
 
-    # Данные для форм
-    FORM_DATA = {
-        "practice_form": {
-            "first_name": "Alice",
-            "last_name": "Johnson",
-            "email": "alice.johnson@test.com",
-            "gender": "Female",
-            "mobile": "1234567890",
-            "subjects": ["Math", "Physics"],
-            "hobbies": ["Sports", "Reading"],
-            "current_address": "123 Main Street, Test City",
-            "state": "NCR",
-            "city": "Delhi",
-        }
-    }
-
-    # Файлы для тестирования
-    FILES = {
-        "sample_image": "test_files/sample.jpg",
-        "sample_document": "test_files/sample.pdf",
-        "large_file": "test_files/large_file.txt",
-    }
-
-    # API ответы
-    API_RESPONSES = {
-        "created": "Link has responded with staus 201 and status text Created",
-        "no_content": "Link has responded with staus 204 and status text No Content",
-        "moved": "Link has responded with staus 301 and status text Moved Permanently",
-        "bad_request": "Link has responded with staus 400 and status text Bad Request",
-        "unauthorized": "Link has responded with staus 401 and status text Unauthorized",
-        "forbidden": "Link has responded with staus 403 and status text Forbidden",
-        "not_found": "Link has responded with staus 404 and status text Not Found",
-    }
+    # API ответы (datasets/api_responses.json)
+    API_RESPONSES = LazyDataset("api_responses", ApiResponses)
 
 
 class Colors:
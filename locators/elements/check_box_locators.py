@@ -67,5 +67,10 @@ class CheckboxLocators:
     ALL_CHECKBOXES = "span.rct-checkbox"  # Все чекбоксы
     ALL_TITLES = "span.rct-title"  # Все заголовки узлов
     TREE_CONTAINER = ".rct-tree"  # Контейнер дерева
+    TREE_ROOT = ".react-checkbox-tree"  # Корень react-checkbox-tree для снимка дерева
+    NODE_CHECKBOX = "label[for='tree-node-{id}'] span.rct-checkbox"  # Чекбокс узла по id
+    NODE_TOGGLE = (
+        "xpath=//label[@for='tree-node-{id}']/preceding-sibling::button"  # Раскрытие узла по id
+    )
     EXPAND_ICON = ".rct-icon.rct-icon-expand-close"  # Иконка раскрытия
     COLLAPSE_ICON = ".rct-icon.rct-icon-expand-open"  # Иконка сворачивания
@@ -90,6 +90,9 @@ class WebTablesLocators:
     # Кнопка отправки формы
     SUBMIT_BUTTON: str = "#submit"
 
+    # Альтернативы кнопки отправки для BasePage.resolve_selector
+    SUBMIT_CANDIDATES: tuple = ("text=Submit", SUBMIT_BUTTON)
+
     # Кнопка закрытия формы
     CLOSE_BUTTON: str = ".close"
 
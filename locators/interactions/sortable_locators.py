@@ -15,6 +15,8 @@ class SortableLocators:
     ITEM_LIST = "div.list-group-item.list-group-item-action"  # Элементы в списке
     LIST_CONTAINER = "#demo-tabpane-list"  # Контейнер списка
     LIST_ITEM_TEMPLATE = ".list-group-item:nth-child({})"  # Шаблон для N-го элемента
+    LIST_ITEMS = "#demo-tabpane-list .list-group-item"  # Все элементы списка
+    LIST_ITEM_AT = "#demo-tabpane-list .list-group-item:nth-child({})"  # N-й элемент списка (с 1)
 
     # === ЭЛЕМЕНТЫ СЕТКИ ===
     GRID_ITEM_LIST = ".create-grid > li"  # Элементы в сетке
@@ -22,6 +24,8 @@ class SortableLocators:
     GRID_ITEM_TEMPLATE = (
         ".create-grid > li:nth-child({})"  # Шаблон для N-го элемента сетки
     )
+    GRID_ITEMS = "#demo-tabpane-grid .list-group-item"  # Все элементы сетки
+    GRID_ITEM_AT = "#demo-tabpane-grid .list-group-item:nth-child({})"  # N-й элемент сетки (с 1)
 
     # === СОСТОЯНИЯ ЭЛЕМЕНТОВ ===
     DRAGGING_ELEMENT = ".ui-sortable-helper"  # Перетаскиваемый элемент
@@ -25,6 +25,13 @@ class ToolTipsLocators:
     TOOLTIP = ".tooltip"  # Основная подсказка
     TOOLTIP_INNER = ".tooltip-inner"  # Внутреннее содержимое подсказки
     TOOLTIP_ARROW = ".tooltip-arrow"  # Стрелка подсказки
+    # Альтернативы текста подсказки для BasePage.resolve_selector
+    TOOLTIP_TEXT_CANDIDATES = (
+        ".tooltip-inner",
+        ".tooltip .tooltip-inner",
+        "[role='tooltip']",
+        ".react-tooltip",
+    )
 
     # === БИБЛИОТЕКА REACT-TOOLTIP ===
     REACT_TOOLTIP = ".__react_component_tooltip"  # React tooltip компонент
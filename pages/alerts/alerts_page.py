@@ -202,7 +202,7 @@ class AlertsPage(BasePage):
 
         try:
             for button in buttons:
-                if not self.page.locator(button).is_visible():
+                if not self.locator(button).is_visible():
                     return False
             return True
         except Exception:
@@ -219,14 +219,14 @@ class AlertsPage(BasePage):
             bool: True если элемент существует
         """
         try:
-            return self.page.locator(selector).count() > 0
+            return self.locator(selector).count() > 0
         except Exception:
             return False
 
     def get_confirm_result_safe(self) -> str:
         """Безопасно получает результат confirm."""
         try:
-            element = self.page.locator(AlertsLocators.CONFIRM_RESULT)
+            element = self.locator(AlertsLocators.CONFIRM_RESULT)
             element.wait_for(state="visible", timeout=2000)
             return element.inner_text()
         except Exception:
@@ -235,7 +235,7 @@ class AlertsPage(BasePage):
     def get_prompt_result_safe(self) -> str:
         """Безопасно получает результат prompt."""
         try:
-            element = self.page.locator(AlertsLocators.PROMPT_RESULT)
+            element = self.locator(AlertsLocators.PROMPT_RESULT)
             element.wait_for(state="visible", timeout=2000)
             return element.inner_text()
         except Exception:
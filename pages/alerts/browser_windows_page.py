@@ -51,7 +51,7 @@ class BrowserWindowsPage(BasePage):
         """Гарантирует нахождение на нужном URL и ожидает видимость селектора."""
         if not self.page.url.startswith(url):
             self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        self.page.locator(wait_selector).wait_for(state="visible", timeout=10000)
+        self.locator(wait_selector).wait_for(state="visible", timeout=10000)
 
     def navigate_to_frames(self) -> None:
         """Переходит на страницу Frames и фиксирует рабочую область."""
@@ -181,7 +181,7 @@ class BrowserWindowsPage(BasePage):
     def get_frames_count(self) -> int:
         """Возвращает количество iframe на странице Frames."""
         self.navigate_to_frames()
-        return self.page.locator(FramesLocators.ALL_FRAMES).count()
+        return self.locator(FramesLocators.ALL_FRAMES).count()
 
     def switch_to_default_content(self) -> None:
         """Сбрасывает внутреннее состояние 'текущего фрейма/контекста'."""
@@ -195,8 +195,8 @@ class BrowserWindowsPage(BasePage):
         В противном случае — наличие #app.
         """
         if self._area in ("frames", "nested"):
-            return self.page.locator("#framesWrapper").is_visible()
-        return self.page.locator("#app").is_visible()
+            return self.locator("#framesWrapper").is_visible()
+        return self.locator("#app").is_visible()
 
     def is_frame_element_accessible_from_main(self) -> bool:
         """
@@ -204,7 +204,7 @@ class BrowserWindowsPage(BasePage):
         Для корректной изоляции должно возвращать False.
         """
         self.navigate_to_frames()
-        return self.page.locator(FramesLocators.FRAME_HEADING).is_visible()
+        return self.locator(FramesLocators.FRAME_HEADING).is_visible()
 
     def find_elements_inside_frame(self) -> bool:
         """Проверяет наличие элементов внутри большого фрейма."""
@@ -218,7 +218,7 @@ class BrowserWindowsPage(BasePage):
         индекс и превью текста (первые 100 символов).
         """
         self.navigate_to_frames()
-        total = self.page.locator(FramesLocators.ALL_FRAMES).count()
+        total = self.locator(FramesLocators.ALL_FRAMES).count()
         info: List[Dict[str, Any]] = []
         for i in range(total):
             fl = self.page.frame_locator(FramesLocators.ALL_FRAMES).nth(i)
@@ -239,7 +239,7 @@ class BrowserWindowsPage(BasePage):
         Логически 'переключается' на фрейм по индексу (сохраняет индекс для последующих вызовов).
         """
         self.navigate_to_frames()
-        total = self.page.locator(FramesLocators.ALL_FRAMES).count()
+        total = self.locator(FramesLocators.ALL_FRAMES).count()
         if index < 0 or index >= total:
             raise IndexError(f"Frame index out of range: {index}")
         self._current_frame_index = index
@@ -326,7 +326,7 @@ class BrowserWindowsPage(BasePage):
         Для корректной изоляции должно возвращать False.
         """
         self.navigate_to_nested_frames()
-        return self.page.locator(NestedFramesLocators.PARENT_TEXT).is_visible()
+        return self.locator(NestedFramesLocators.PARENT_TEXT).is_visible()
 
     def can_access_child_frame_elements(self) -> bool:
         """
@@ -334,7 +334,7 @@ class BrowserWindowsPage(BasePage):
         Для корректной изоляции должно возвращать False.
         """
         self.navigate_to_nested_frames()
-        return self.page.locator(NestedFramesLocators.CHILD_TEXT).is_visible()
+        return self.locator(NestedFramesLocators.CHILD_TEXT).is_visible()
 
     def can_access_main_content_elements(self) -> bool:
         """
@@ -346,5 +346,5 @@ class BrowserWindowsPage(BasePage):
         if self._area == "frames" and self._current_frame_index is not None:
             return False
         if self._area in ("frames", "nested"):
-            return self.page.locator("#framesWrapper").is_visible()
-        return self.page.locator("#app").is_visible()
+            return self.locator("#framesWrapper").is_visible()
+        return self.locator("#app").is_visible()
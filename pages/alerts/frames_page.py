@@ -54,7 +54,7 @@ class FramesPage(BasePage):
         Returns:
             bool: True если большой фрейм видим на странице
         """
-        return self.page.locator(FramesLocators.BIG_FRAME).is_visible()
+        return self.locator(FramesLocators.BIG_FRAME).is_visible()
 
     def is_small_frame_visible(self) -> bool:
         """
@@ -63,7 +63,7 @@ class FramesPage(BasePage):
         Returns:
             bool: True если малый фрейм видим на странице
         """
-        return self.page.locator(FramesLocators.SMALL_FRAME).is_visible()
+        return self.locator(FramesLocators.SMALL_FRAME).is_visible()
 
     def get_frame_count(self) -> int:
         """
@@ -72,7 +72,7 @@ class FramesPage(BasePage):
         Returns:
             int: Количество iframe элементов
         """
-        frames = self.page.locator("iframe")
+        frames = self.locator("iframe")
         return frames.count()
 
     def switch_to_big_frame_context(self):
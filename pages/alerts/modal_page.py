@@ -4,8 +4,10 @@ Page Object для страницы Modal Dialogs.
 """
 
 from playwright.sync_api import Page
+from data import Timeouts
 from locators.alerts.modal_locators import ModalDialogsLocators
 from pages.base_page import BasePage
+from utils.geometry import read_layout
 
 
 class ModalPage(BasePage):
@@ -33,10 +35,10 @@ class ModalPage(BasePage):
         # Ждём либо контейнер малого модального окна, либо активный модал как fallback
         try:
             self.wait_for_visible(
-                ModalDialogsLocators.SMALL_MODAL_CONTAINER, timeout=5000
+                ModalDialogsLocators.SMALL_MODAL_CONTAINER, default=Timeouts.MODAL
             )
         except Exception:
-            self.wait_for_visible(ModalDialogsLocators.MODAL_ACTIVE, timeout=5000)
+            self.wait_for_visible(ModalDialogsLocators.MODAL_ACTIVE, default=Timeouts.MODAL)
 
     def open_large_modal(self) -> None:
         """
@@ -48,10 +50,10 @@ class ModalPage(BasePage):
         # Ждём либо контейнер большого модального окна, либо активный модал как fallback
         try:
             self.wait_for_visible(
-                ModalDialogsLocators.LARGE_MODAL_CONTAINER, timeout=5000
+                ModalDialogsLocators.LARGE_MODAL_CONTAINER, default=Timeouts.MODAL
             )
         except Exception:
-            self.wait_for_visible(ModalDialogsLocators.MODAL_ACTIVE, timeout=5000)
+            self.wait_for_visible(ModalDialogsLocators.MODAL_ACTIVE, default=Timeouts.MODAL)
 
     def close_modal_by_x(self) -> None:
         """
@@ -76,7 +78,7 @@ class ModalPage(BasePage):
         """
         self.log_step("Закрываем модальный диалог кликом по overlay")
         # Кликаем по затемненной области рядом с диалогом
-        modal_backdrop = self.page.locator(ModalDialogsLocators.MODAL_BACKDROP)
+        modal_backdrop = self.locator(ModalDialogsLocators.MODAL_BACKDROP)
         modal_backdrop.click(
             position={"x": 10, "y": 10}
         )  # Клик в левый верхний угол overlay
@@ -88,7 +90,7 @@ class ModalPage(BasePage):
         Returns:
             bool: True если модальный диалог видим
         """
-        return self.page.locator(ModalDialogsLocators.MODAL_DIALOG).is_visible()
+        return self.locator(ModalDialogsLocators.MODAL_DIALOG).is_visible()
 
     def get_modal_title(self) -> str:
         """
@@ -115,88 +117,82 @@ class ModalPage(BasePage):
 
     def is_small_modal_visible(self) -> bool:
         """Проверяет видимость малого модального окна (несколько вариантов селекторов)."""
-        small = self.page.locator(ModalDialogsLocators.SMALL_MODAL_CONTAINER)
-        title = self.page.locator(ModalDialogsLocators.SMALL_MODAL_TITLE)
+        small = self.locator(ModalDialogsLocators.SMALL_MODAL_CONTAINER)
+        title = self.locator(ModalDialogsLocators.SMALL_MODAL_TITLE)
         if small.count() > 0:
             return small.is_visible()
         if title.count() > 0:
             return title.is_visible()
         # fallback: общий активный modal
-        active = self.page.locator(ModalDialogsLocators.MODAL_ACTIVE)
+        active = self.locator(ModalDialogsLocators.MODAL_ACTIVE)
         return active.count() > 0 and active.is_visible()
 
     def is_large_modal_visible(self) -> bool:
         """Проверяет видимость большого модального окна (несколько вариантов селекторов)."""
-        large = self.page.locator(ModalDialogsLocators.LARGE_MODAL_CONTAINER)
-        title = self.page.locator(ModalDialogsLocators.LARGE_MODAL_TITLE)
+        large = self.locator(ModalDialogsLocators.LARGE_MODAL_CONTAINER)
+        title = self.locator(ModalDialogsLocators.LARGE_MODAL_TITLE)
         if large.count() > 0:
             return large.is_visible()
         if title.count() > 0:
             return title.is_visible()
-        active = self.page.locator(ModalDialogsLocators.MODAL_ACTIVE)
+        active = self.locator(ModalDialogsLocators.MODAL_ACTIVE)
         return active.count() > 0 and active.is_visible()
 
     def has_small_modal_close_button(self) -> bool:
         """Проверяет наличие кнопки закрытия в малом модальном окне."""
         return (
-            self.page.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).count() > 0
-            and self.page.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).is_visible()
+            self.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).count() > 0
+            and self.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).is_visible()
         )
 
     def has_large_modal_close_button(self) -> bool:
         """Проверяет наличие кнопки закрытия в большом модальном окне."""
         return (
-            self.page.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).count() > 0
-            and self.page.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).is_visible()
+            self.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).count() > 0
+            and self.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).is_visible()
         )
 
+    def _modal_size(self, candidates: list, method: str) -> dict:
+        """
+        Размер первого видимого кандидата модального окна. Геометрия всех
+        кандидатов читается одним запросом; если ни один еще не виден (анимация
+        открытия), ожидается объединение кандидатов и геометрия читается повторно.
+        """
+        layout = read_layout(self.page, candidates)
+        visible = [sel for sel in candidates if layout[sel].visible]
+        if not visible:
+            selector = self.resolve_selector(candidates, method, timeout=Timeouts.MODAL)
+            if selector is None:
+                return {"width": 0, "height": 0}
+            layout = read_layout(self.page, [selector])
+            visible = [selector]
+        return layout.size(visible[0])
+
     def get_small_modal_size(self) -> dict:
         """Возвращает размеры малого модального окна в виде {'width': w, 'height': h}."""
-        # Пытаемся несколько селекторов, ждём их и затем берём bounding_box
-        candidates = [
-            ModalDialogsLocators.SMALL_MODAL_CONTAINER,
-            ModalDialogsLocators.MODAL_DIALOG,
-            ModalDialogsLocators.MODAL_ACTIVE,
-        ]
-        for sel in candidates:
-            loc = self.page.locator(sel)
-            if loc.count() > 0:
-                try:
-                    # дождаться элемента (небольшой таймаут)
-                    loc.wait_for(state="visible", timeout=2000)
-                    box = loc.bounding_box() or {}
-                    return {
-                        "width": box.get("width", 0),
-                        "height": box.get("height", 0),
-                    }
-                except Exception:
-                    continue
-        return {"width": 0, "height": 0}
+        return self._modal_size(
+            [
+                ModalDialogsLocators.SMALL_MODAL_CONTAINER,
+                ModalDialogsLocators.MODAL_DIALOG,
+                ModalDialogsLocators.MODAL_ACTIVE,
+            ],
+            "get_small_modal_size",
+        )
 
     def get_large_modal_size(self) -> dict:
         """Возвращает размеры большого модального окна в виде {'width': w, 'height': h}."""
-        candidates = [
-            ModalDialogsLocators.LARGE_MODAL_CONTAINER,
-            ModalDialogsLocators.MODAL_DIALOG,
-            ModalDialogsLocators.MODAL_ACTIVE,
-        ]
-        for sel in candidates:
-            loc = self.page.locator(sel)
-            if loc.count() > 0:
-                try:
-                    loc.wait_for(state="visible", timeout=2000)
-                    box = loc.bounding_box() or {}
-                    return {
-                        "width": box.get("width", 0),
-                        "height": box.get("height", 0),
-                    }
-                except Exception:
-                    continue
-        return {"width": 0, "height": 0}
+        return self._modal_size(
+            [
+                ModalDialogsLocators.LARGE_MODAL_CONTAINER,
+                ModalDialogsLocators.MODAL_DIALOG,
+                ModalDialogsLocators.MODAL_ACTIVE,
+            ],
+            "get_large_modal_size",
+        )
 
     def close_small_modal(self) -> None:
         """Закрывает малое модальное окно кнопкой закрытия (если есть)."""
-        if self.page.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).count() > 0:
+        if self.locator(ModalDialogsLocators.SMALL_MODAL_CLOSE).count() > 0:
             self.safe_click(ModalDialogsLocators.SMALL_MODAL_CLOSE)
         else:
             # fallback to generic close
@@ -204,25 +200,25 @@ class ModalPage(BasePage):
 
     def close_large_modal(self) -> None:
         """Закрывает большое модальное окно кнопкой закрытия (если есть)."""
-        if self.page.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).count() > 0:
+        if self.locator(ModalDialogsLocators.LARGE_MODAL_CLOSE).count() > 0:
             self.safe_click(ModalDialogsLocators.LARGE_MODAL_CLOSE)
         else:
             self.close_modal_by_close_button()
 
     def has_modal_overlay(self) -> bool:
         """Проверяет наличие overlay (фон) модального окна."""
-        return self.page.locator(ModalDialogsLocators.MODAL_BACKDROP).count() > 0
+        return self.locator(ModalDialogsLocators.MODAL_BACKDROP).count() > 0
 
     def is_modal_overlay_visible(self) -> bool:
         """Проверяет, виден ли overlay (активный класс)."""
-        return self.page.locator(
+        return self.locator(
             ModalDialogsLocators.MODAL_BACKDROP_ACTIVE
         ).is_visible()
 
     def click_modal_overlay(self) -> bool:
         """Кликает по overlay, возвращает True если клик выполнен."""
         try:
-            backdrop = self.page.locator(ModalDialogsLocators.MODAL_BACKDROP)
+            backdrop = self.locator(ModalDialogsLocators.MODAL_BACKDROP)
             if backdrop.count() > 0:
                 backdrop.first.click(position={"x": 5, "y": 5})
                 return True
@@ -232,7 +228,7 @@ class ModalPage(BasePage):
 
     def get_modal_aria_attributes(self) -> dict:
         """Возвращает словарь ключевых ARIA атрибутов модального окна."""
-        modal = self.page.locator(ModalDialogsLocators.MODAL_DIALOG)
+        modal = self.locator(ModalDialogsLocators.MODAL_DIALOG)
         attrs = {}
         for attr in ("role", "aria-modal", "aria-labelledby"):
             try:
@@ -295,7 +291,7 @@ class ModalPage(BasePage):
         Returns:
             str: CSS класс определяющий размер модального диалога
         """
-        modal = self.page.locator(ModalDialogsLocators.MODAL_DIALOG)
+        modal = self.locator(ModalDialogsLocators.MODAL_DIALOG)
         class_attr = modal.get_attribute("class") or ""
 
         if "modal-sm" in class_attr:
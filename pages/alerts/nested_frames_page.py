@@ -53,7 +53,7 @@ class NestedFramesPage(BasePage):
         Returns:
             bool: True если родительский фрейм видим
         """
-        return self.page.locator(NestedFramesLocators.PARENT_FRAME).is_visible()
+        return self.locator(NestedFramesLocators.PARENT_FRAME).is_visible()
 
     def get_nested_frames_count(self) -> int:
         """
@@ -63,7 +63,7 @@ class NestedFramesPage(BasePage):
             int: Общее количество фреймов
         """
         # Подсчитываем фреймы на основной странице
-        main_frames = self.page.locator(NestedFramesLocators.CHILD_FRAME_ALT).count()
+        main_frames = self.locator(NestedFramesLocators.CHILD_FRAME_ALT).count()
 
         # Подсчитываем вложенные фреймы в родительском фрейме
         try:
@@ -3,12 +3,304 @@
 Содержит методы ожидания, безопасных кликов и логирования.
 """
 
+import time
 import logging
-from typing import Optional, Union
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 from playwright.sync_api import Page, Locator
+from data import Timeouts
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.geometry import Rect, read_layout
+from utils.helper import BrowserCondition, WaitHelper
+from utils.locator_registry import registry
+from utils.selector_preferences import SelectorPreferences
 
 logger = logging.getLogger(__name__)
 
+# Виды наблюдаемых изменений элемента для watch_element
+WATCH_KINDS = ("attribute", "class", "style", "enabled", "visible")
+
+# Устанавливает в странице наблюдатель за свойством элемента. Время изменения
+# фиксируется в колбэке MutationObserver (performance.now(), мс от начала навигации);
+# для вычисленного стиля значение перечитывается по окончании CSS перехода, а временем
+# изменения считается мутация элемента, запустившая переход.
+WATCH_ELEMENT_SCRIPT = """
+({id, selector, kind, name, expected, hasExpected}) => {
+    const read = () => {
+        const el = document.querySelector(selector);
+        if (!el) return kind === 'enabled' || kind === 'visible' ? false : null;
+        switch (kind) {
+            case 'attribute': return el.getAttribute(name);
+            case 'class': return el.getAttribute('class') || '';
+            case 'style': return getComputedStyle(el).getPropertyValue(name);
+            case 'enabled': return !el.disabled && !el.hasAttribute('disabled');
+            case 'visible': {
+                const style = getComputedStyle(el);
+                const rect = el.getBoundingClientRect();
+                return style.display !== 'none' && style.visibility !== 'hidden'
+                    && rect.width > 0 && rect.height > 0;
+            }
+        }
+        throw new Error('Неизвестный вид наблюдения: ' + kind);
+    };
+    const initial = read();
+    const matches = value => hasExpected ? value === expected : value !== initial;
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const watch = {
+        initial, value: initial, at: null, already: false,
+        started: performance.now(),
+        domReady: navigation ? navigation.domContentLoadedEventEnd : null,
+        cause: null, resolve: null,
+    };
+    const check = at => {
+        if (watch.at !== null) return;
+        const value = read();
+        if (!matches(value)) return;
+        watch.value = value;
+        watch.at = at;
+        watch.stop();
+        if (watch.resolve) watch.resolve();
+    };
+    const observer = new MutationObserver(records => {
+        const now = performance.now();
+        const el = document.querySelector(selector);
+        if (el && records.some(r => r.target === el || r.target.contains(el))) {
+            watch.cause = now;
+        }
+        check(now);
+    });
+    const onTransition = () => check(watch.cause ?? performance.now());
+    watch.stop = () => {
+        observer.disconnect();
+        document.removeEventListener('transitionend', onTransition, true);
+    };
+    (window.__qaWatches = window.__qaWatches || {})[id] = watch;
+
+    if (hasExpected && matches(initial)) {
+        watch.at = watch.started;
+        watch.already = true;
+    } else {
+        observer.observe(document.documentElement, {
+            subtree: true, childList: true, attributes: true, characterData: true,
+        });
+        if (kind === 'style') {
+            document.addEventListener('transitionend', onTransition, true);
+        }
+    }
+    return initial;
+}
+"""
+
+# Дожидается срабатывания наблюдателя (или таймаута) одним вызовом evaluate
+WAIT_WATCH_SCRIPT = """
+({id, timeout}) => new Promise(resolve => {
+    const watch = window.__qaWatches && window.__qaWatches[id];
+    if (!watch) return resolve(null);
+    const result = () => {
+        delete window.__qaWatches[id];
+        const {initial, value, at, started, domReady, already} = watch;
+        return {initial, value, at, started, domReady, already};
+    };
+    if (watch.at !== null) return resolve(result());
+    const timer = setTimeout(() => { watch.stop(); resolve(result()); }, timeout);
+    watch.resolve = () => { clearTimeout(timer); resolve(result()); };
+})
+"""
+
+# Предикаты BrowserCondition для wait_until: выполняются в браузере при изменениях DOM
+VISIBLE_PREDICATE = """
+(selector) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const style = getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.visibility !== 'hidden' && style.display !== 'none'
+        && rect.width > 0 && rect.height > 0;
+}
+"""
+
+TEXT_CHANGED_PREDICATE = """
+([selector, previous]) => {
+    const el = document.querySelector(selector);
+    return !!el && el.textContent !== previous;
+}
+"""
+
+CLASS_CONTAINS_PREDICATE = """
+([selector, name]) => {
+    const el = document.querySelector(selector);
+    return !!el && (el.getAttribute('class') || '').includes(name);
+}
+"""
+
+# Первый подходящий кандидат из списка селекторов за один запрос. Селекторы движка
+# Playwright (text=, :has-text) браузер не разбирает - для них возвращается null,
+# и они проверяются средствами Playwright
+RESOLVE_SELECTORS_SCRIPT = """
+({selectors, state}) => {
+    const visible = el => {
+        const style = getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        return style.visibility !== 'hidden' && style.display !== 'none'
+            && rect.width > 0 && rect.height > 0;
+    };
+    const unsupported = [];
+    for (let i = 0; i < selectors.length; i++) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selectors[i]);
+        } catch (e) {
+            unsupported.push(i);
+            continue;
+        }
+        for (const el of elements) {
+            if (state === 'attached' || visible(el)) return {index: i, unsupported};
+        }
+    }
+    return {index: null, unsupported};
+}
+"""
+
+# Ожидание завершения реакции страницы на перетаскивание: quiet мс без мутаций DOM
+# и событий CSS переходов/анимаций внутри scope и без конечных анимаций, запущенных
+# на его элементах (бесконечные анимации, например рекламные, не учитываются)
+SETTLE_SCRIPT = """
+({scope, quiet, timeout}) => new Promise(resolve => {
+    const root = document.querySelector(scope) || document.body;
+    const started = performance.now();
+    let last = started;
+    let mutations = 0;
+    const touch = event => {
+        if (!event || root.contains(event.target)) last = performance.now();
+    };
+    const observer = new MutationObserver(records => { mutations += records.length; touch(); });
+    observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+    const events = ['transitionrun', 'transitionend', 'animationstart', 'animationend'];
+    events.forEach(name => document.addEventListener(name, touch, true));
+    const animating = () => document.getAnimations && document.getAnimations().some(animation => {
+        const effect = animation.effect;
+        return animation.playState === 'running' && effect && effect.target
+            && root.contains(effect.target)
+            && effect.getComputedTiming().iterations !== Infinity;
+    });
+    const check = () => {
+        const now = performance.now();
+        const settled = now - last >= quiet && !animating();
+        if (settled || now - started >= timeout) {
+            observer.disconnect();
+            events.forEach(name => document.removeEventListener(name, touch, true));
+            return resolve({settled, mutations, ms: now - started});
+        }
+        requestAnimationFrame(check);
+    };
+    requestAnimationFrame(check);
+})
+"""
+
+_NOT_SET = object()
+
+
+class ElementWatch:
+    """
+    Подписка на изменение свойства элемента, установленная в странице.
+    Изменение фиксируется в момент мутации DOM, а не при очередном опросе.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        page: Page,
+        selector: str,
+        kind: str,
+        name: Optional[str] = None,
+        expected: Any = _NOT_SET,
+    ):
+        """
+        Устанавливает наблюдатель.
+
+        Args:
+            page: Экземпляр страницы Playwright
+            selector: CSS селектор элемента (элемент может еще отсутствовать в DOM)
+            kind: Вид изменения из WATCH_KINDS
+            name: Имя атрибута (attribute) или CSS свойства (style)
+            expected: Ожидаемое значение; если не задано - любое отличие от начального
+
+        Raises:
+            ValueError: Если вид изменения неизвестен или не указано имя
+        """
+        if kind not in WATCH_KINDS:
+            raise ValueError(f"Неизвестный вид наблюдения {kind}, допустимы: {WATCH_KINDS}")
+        if kind in ("attribute", "style") and not name:
+            raise ValueError(f"Для наблюдения {kind} требуется имя атрибута или свойства")
+        self.page = page
+        self.selector = selector
+        self.kind = kind
+        self.id = f"watch-{next(self._ids)}"
+        self.initial = page.evaluate(
+            WATCH_ELEMENT_SCRIPT,
+            {
+                "id": self.id,
+                "selector": selector,
+                "kind": kind,
+                "name": name,
+                "expected": None if expected is _NOT_SET else expected,
+                "hasExpected": expected is not _NOT_SET,
+            },
+        )
+
+    def wait(self, timeout: int) -> Optional[Dict[str, Any]]:
+        """
+        Ожидает изменения.
+
+        Args:
+            timeout: Максимальное время ожидания в миллисекундах
+
+        Returns:
+            dict или None: None при таймауте, иначе
+                initial/value - значения до и после изменения,
+                at_ms - момент изменения в мс от начала навигации страницы,
+                delay_ms - задержка изменения от установки наблюдателя,
+                since_dom_ready_ms - задержка от DOMContentLoaded,
+                already - ожидаемое значение было до установки наблюдателя
+        """
+        change = self.page.evaluate(WAIT_WATCH_SCRIPT, {"id": self.id, "timeout": timeout})
+        if not change or change["at"] is None:
+            return None
+        at = change["at"]
+        return {
+            "initial": change["initial"],
+            "value": change["value"],
+            "at_ms": round(at, 1),
+            "delay_ms": round(at - change["started"], 1),
+            "since_dom_ready_ms": (
+                round(at - change["domReady"], 1) if change["domReady"] else None
+            ),
+            "already": change["already"],
+        }
+
+
+@dataclass
+class DragResult:
+    """Результат перетаскивания BasePage.drag."""
+
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+    before: Optional[Rect]
+    after: Optional[Rect]
+    settled: bool
+    settle_ms: float
+    mutations: int
+    verified: Optional[bool] = None
+
+    @property
+    def moved(self) -> Tuple[float, float]:
+        """Фактическое смещение элемента (dx, dy) по его прямоугольнику."""
+        if not (self.before and self.after):
+            return 0.0, 0.0
+        return self.after.x - self.before.x, self.after.y - self.before.y
+
 
 class BasePage:
     """
@@ -16,6 +308,11 @@ class BasePage:
     Предоставляет общие методы для взаимодействия с элементами страницы.
     """
 
+    # Сервис адаптивных таймаутов, задается в conftest при запуске с --adaptive-timeouts
+    timeouts: Optional[AdaptiveTimeouts] = None
+    # Выученный порядок альтернативных селекторов (история задается в conftest)
+    selectors: SelectorPreferences = SelectorPreferences()
+
     def __init__(self, page: Page):
         """
         Инициализация базовой страницы.
@@ -25,88 +322,423 @@ class BasePage:
         """
         self.page = page
 
-    def wait_for_visible(self, selector: Union[str, Locator], timeout: int = 10000) -> None:
+    def locator(self, selector: str) -> Locator:
+        """
+        Возвращает закэшированный Locator страницы (utils.locator_registry).
+
+        Args:
+            selector: Селектор
+
+        Returns:
+            Locator: Локатор, созданный один раз на страницу
+        """
+        return registry.get(self.page, selector)
+
+    def _first(self, selector: Union[str, Locator]) -> Locator:
+        """
+        Первый элемент селектора (через кэш локаторов) или Locator.
+        Повторяет нестрогое поведение page.click/page.fill при нескольких совпадениях.
+        """
+        return (self.locator(selector) if isinstance(selector, str) else selector).first
+
+    @staticmethod
+    def _operation(method: str, selector: Union[str, Locator, None]) -> str:
+        """Ключ операции для истории таймаутов: метод и строковый селектор."""
+        return f"{method}:{selector}" if isinstance(selector, str) else method
+
+    def resolve_timeout(
+        self, method: str, selector: Union[str, Locator, None], default: int
+    ) -> int:
+        """
+        Возвращает таймаут операции: адаптивный по истории или статический.
+
+        Args:
+            method: Имя операции
+            selector: Селектор элемента (учитывается, если это строка)
+            default: Статический таймаут в миллисекундах
+
+        Returns:
+            int: Таймаут в миллисекундах
+        """
+        if BasePage.timeouts is None:
+            return default
+        return BasePage.timeouts.timeout(
+            type(self).__name__, self._operation(method, selector), default
+        )
+
+    def _record_duration(
+        self, method: str, selector: Union[str, Locator, None], started: float
+    ) -> None:
+        """Записывает длительность успешной операции в историю таймаутов."""
+        if BasePage.timeouts is not None:
+            BasePage.timeouts.record(
+                type(self).__name__,
+                self._operation(method, selector),
+                (time.perf_counter() - started) * 1000,
+            )
+
+    def wait_for_visible(
+        self,
+        selector: Union[str, Locator],
+        timeout: Optional[int] = None,
+        default: int = Timeouts.MEDIUM,
+    ) -> None:
         """
         Ожидает появления видимого элемента на странице.
     
         Args:
             selector: CSS селектор элемента или Locator
-            timeout: Максимальное время ожидания в миллисекундах
+            timeout: Максимальное время ожидания в миллисекундах (по умолчанию адаптивное)
+            default: Статический таймаут, если история ожиданий отсутствует
     
         Raises:
             TimeoutError: Если элемент не появился за указанное время
         """
-        if isinstance(selector, str):
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-        else:
-            selector.wait_for(state="visible", timeout=timeout)
+        if timeout is None:
+            timeout = self.resolve_timeout("wait_for_visible", selector, default)
+        started = time.perf_counter()
+        self._first(selector).wait_for(state="visible", timeout=timeout)
+        self._record_duration("wait_for_visible", selector, started)
+
+    def browser_condition(
+        self,
+        predicate: str,
+        arg: Any = None,
+        polling: Union[str, int] = "mutation",
+        name: Optional[str] = None,
+    ) -> BrowserCondition:
+        """
+        Условие, проверяемое в браузере этой страницы.
+
+        Args:
+            predicate: Исходный код JS функции от одного аргумента
+            arg: Аргумент предиката
+            polling: "mutation" - при изменениях DOM, "raf" - каждый кадр, число - интервал в мс
+            name: Имя условия для статистики ожиданий
 
-    def safe_click(self, selector: Union[str, Locator], timeout: int = 10000) -> None:
+        Returns:
+            BrowserCondition: Условие для wait_until, WaitHelper.all_of/any_of
+        """
+        return BrowserCondition(self.page, predicate, arg, polling=polling, name=name)
+
+    def wait_until(
+        self,
+        condition: Union[BrowserCondition, Callable[[], bool]],
+        timeout: Optional[int] = None,
+        default: int = Timeouts.SHORT,
+    ) -> bool:
+        """
+        Ожидает выполнения условия через WaitHelper (длительность попадает в статистику).
+
+        Args:
+            condition: BrowserCondition, составное условие или функция без аргументов
+            timeout: Максимальное время ожидания в миллисекундах (по умолчанию адаптивное)
+            default: Статический таймаут, если история ожиданий отсутствует
+
+        Returns:
+            bool: True если условие выполнилось за отведенное время
+        """
+        name = getattr(condition, "name", None) or getattr(condition, "__name__", "condition")
+        if timeout is None:
+            timeout = self.resolve_timeout("wait_until", name, default)
+        started = time.perf_counter()
+        success = WaitHelper.wait_for_condition(
+            condition, timeout / 1000, name=f"{type(self).__name__}.{name}"
+        )
+        if success:
+            self._record_duration("wait_until", name, started)
+        return success
+
+    def safe_click(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> None:
         """
         Безопасный клик по элементу с предварительным ожиданием.
     
         Args:
             selector: CSS селектор элемента или Locator
-            timeout: Максимальное время ожидания элемента
+            timeout: Максимальное время ожидания элемента (по умолчанию адаптивное)
         """
         self.wait_for_visible(selector, timeout)
-        if isinstance(selector, str):
-            self.page.click(selector)
-        else:
-            selector.first.click()
+        self._first(selector).click()
 
-    def safe_fill(self, selector: Union[str, Locator], text: str, timeout: int = 10000) -> None:
+    def safe_fill(
+        self, selector: Union[str, Locator], text: str, timeout: Optional[int] = None
+    ) -> None:
         """
         Безопасное заполнение поля с предварительным ожиданием.
     
         Args:
             selector: CSS селектор поля ввода или Locator
             text: Текст для ввода
-            timeout: Максимальное время ожидания элемента
+            timeout: Максимальное время ожидания элемента (по умолчанию адаптивное)
         """
         self.wait_for_visible(selector, timeout)
-        if isinstance(selector, str):
-            self.page.fill(selector, text)
-        else:
-            selector.first.fill(text)
+        self._first(selector).fill(text)
 
-    def get_text_safe(self, selector: Union[str, Locator], timeout: int = 5000) -> Optional[str]:
+    def get_text_safe(
+        self,
+        selector: Union[str, Locator],
+        timeout: Optional[int] = None,
+        default: int = Timeouts.MEDIUM,
+    ) -> Optional[str]:
         """
         Безопасное получение текста элемента.
     
         Args:
             selector: CSS селектор элемента или Locator
-            timeout: Максимальное время ожидания элемента
+            timeout: Максимальное время ожидания элемента (по умолчанию адаптивное)
+            default: Статический таймаут, если история ожиданий отсутствует
     
         Returns:
             str или None: Текст элемента или None если элемент не найден
         """
+        if timeout is None:
+            timeout = self.resolve_timeout("get_text_safe", selector, default)
         try:
-            locator = self.page.locator(selector) if isinstance(selector, str) else selector
-            locator = locator.first
+            started = time.perf_counter()
+            locator = self._first(selector)
             locator.wait_for(state="visible", timeout=timeout)
+            self._record_duration("get_text_safe", selector, started)
             return (locator.inner_text() or "").strip()
         except Exception as e:
             logger.warning(f"Не удалось получить текст для {selector}: {e}")
             return None
 
-    def wait_for_url_contains(self, url_part: str, timeout: int = 10000) -> bool:
+    def wait_for_url_contains(self, url_part: str, timeout: Optional[int] = None) -> bool:
         """
         Ожидает, пока URL не будет содержать указанную строку.
 
         Args:
             url_part: Часть URL для поиска
-            timeout: Максимальное время ожидания
+            timeout: Максимальное время ожидания (по умолчанию адаптивное)
 
         Returns:
             bool: True если URL содержит нужную строку
         """
+        if timeout is None:
+            timeout = self.resolve_timeout("wait_for_url_contains", url_part, Timeouts.MEDIUM)
         try:
+            started = time.perf_counter()
             self.page.wait_for_url(f"**/*{url_part}*", timeout=timeout)
+            self._record_duration("wait_for_url_contains", url_part, started)
             return True
         except:
             return False
 
+    def resolve_selector(
+        self,
+        candidates: Sequence[str],
+        method: str,
+        state: str = "visible",
+        timeout: Optional[int] = None,
+        default: int = Timeouts.SHORT,
+    ) -> Optional[str]:
+        """
+        Находит первый подходящий селектор из альтернатив.
+
+        Все кандидаты проверяются одним запросом к странице в выученном порядке
+        (сначала тот, что чаще находил элемент в этом методе этой страницы). Если
+        ничего не найдено, выполняется одно общее ожидание объединения кандидатов,
+        а не ожидание каждого по очереди.
+
+        Args:
+            candidates: Селекторы-кандидаты в порядке по умолчанию
+            method: Имя метода для истории побед
+            state: visible или attached
+            timeout: Время ожидания в миллисекундах; 0 - проверить без ожидания
+            default: Статический таймаут, если история ожиданий отсутствует
+
+        Returns:
+            str или None: Найденный селектор
+        """
+        page_name = type(self).__name__
+        ordered = BasePage.selectors.order(page_name, method, candidates)
+        if timeout is None:
+            timeout = self.resolve_timeout(f"resolve:{method}", None, default)
+
+        def find() -> Optional[str]:
+            found = self.page.evaluate(
+                RESOLVE_SELECTORS_SCRIPT, {"selectors": ordered, "state": state}
+            )
+            unsupported = [ordered[i] for i in found["unsupported"]]
+            if found["index"] is not None:
+                # Селектор Playwright раньше в порядке выигрывает, если он тоже найден
+                earlier = [s for s in unsupported if ordered.index(s) < found["index"]]
+                matches = [s for s in earlier if self._matches(s, state)]
+                return matches[0] if matches else ordered[found["index"]]
+            return next((s for s in unsupported if self._matches(s, state)), None)
+
+        winner = find()
+        if winner is None and timeout > 0:
+            union = self.locator(ordered[0])
+            for selector in ordered[1:]:
+                union = union.or_(self.locator(selector))
+            try:
+                union.first.wait_for(state=state, timeout=timeout)
+                winner = find()
+            except Exception:
+                winner = None
+
+        if winner is None:
+            if timeout > 0:
+                logger.warning(f"{page_name}.{method}: ни один селектор не найден: {ordered}")
+            return None
+        BasePage.selectors.record(page_name, method, winner)
+        return winner
+
+    def _matches(self, selector: str, state: str) -> bool:
+        """Проверяет селектор средствами Playwright без ожидания."""
+        locator = self.locator(selector)
+        if state == "attached":
+            return locator.count() > 0
+        return locator.first.is_visible()
+
+    def watch_element(
+        self,
+        selector: str,
+        kind: str,
+        name: Optional[str] = None,
+        expected: Any = _NOT_SET,
+    ) -> ElementWatch:
+        """
+        Подписывается на изменение свойства элемента до действия, которое его вызывает.
+
+        Args:
+            selector: CSS селектор элемента
+            kind: attribute, class, style, enabled или visible
+            name: Имя атрибута (attribute) или CSS свойства (style)
+            expected: Ожидаемое значение; если не задано - любое отличие от начального
+
+        Returns:
+            ElementWatch: Наблюдатель, изменение ожидается методом wait()
+        """
+        return ElementWatch(self.page, selector, kind, name, expected)
+
+    def wait_for_element_change(
+        self,
+        selector: str,
+        kind: str,
+        name: Optional[str] = None,
+        expected: Any = _NOT_SET,
+        timeout: Optional[int] = None,
+        default: int = Timeouts.MEDIUM,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ожидает изменения свойства элемента и возвращает точное время изменения.
+
+        Args:
+            selector: CSS селектор элемента
+            kind: attribute, class, style, enabled или visible
+            name: Имя атрибута (attribute) или CSS свойства (style)
+            expected: Ожидаемое значение; если не задано - любое отличие от начального
+            timeout: Максимальное время ожидания в миллисекундах (по умолчанию адаптивное)
+            default: Статический таймаут, если история ожиданий отсутствует
+
+        Returns:
+            dict или None: Описание изменения (см. ElementWatch.wait) или None при таймауте
+        """
+        operation = f"wait_for_element_change[{kind}]"
+        if timeout is None:
+            timeout = self.resolve_timeout(operation, selector, default)
+        started = time.perf_counter()
+        change = self.watch_element(selector, kind, name, expected).wait(timeout)
+        if change is not None:
+            self._record_duration(operation, selector, started)
+        return change
+
+    def drag(
+        self,
+        source: str,
+        target: Optional[str] = None,
+        offset: Tuple[float, float] = (0, 0),
+        steps: int = 10,
+        grab: Tuple[float, float] = (0.5, 0.5),
+        drop: Tuple[float, float] = (0.5, 0.5),
+        verify: Optional[Callable[[DragResult], bool]] = None,
+        scope: str = "body",
+        quiet_ms: int = 50,
+        timeout: Optional[int] = None,
+        default: int = Timeouts.SHORT,
+    ) -> DragResult:
+        """
+        Перетаскивает элемент мышью и дожидается, пока страница обработает drop.
+
+        Путь строится по геометрии, прочитанной непосредственно перед перетаскиванием
+        (одним запросом для источника и цели): из точки grab источника в точку drop
+        цели (или в точку захвата, если цель не задана) со смещением offset. После
+        отпускания кнопки ожидается отсутствие мутаций DOM и анимаций в области scope
+        (SETTLE_SCRIPT), затем читается новый прямоугольник источника и выполняется
+        проверка verify.
+
+        Args:
+            source: Селектор перетаскиваемого элемента (или ручки)
+            target: Селектор элемента, на который выполняется drop
+            offset: Смещение (dx, dy) точки отпускания в пикселях
+            steps: Количество промежуточных событий mousemove
+            grab: Точка захвата в долях ширины и высоты источника
+            drop: Точка отпускания в долях ширины и высоты цели
+            verify: Проверка результата; False приводит к AssertionError
+            scope: CSS селектор области, изменения в которой ожидаются после drop
+            quiet_ms: Длительность тишины DOM, после которой drop считается завершенным
+            timeout: Максимальное ожидание завершения в миллисекундах (по умолчанию адаптивное)
+            default: Статический таймаут, если история ожиданий отсутствует
+
+        Returns:
+            DragResult: Точки пути, прямоугольники источника до и после, итог ожидания
+
+        Raises:
+            AssertionError: Если источник или цель не найдены или verify вернула False
+        """
+        selectors = {"source": source}
+        if target is not None:
+            selectors["target"] = target
+        layout = read_layout(self.page, selectors)
+        if not all(layout.within_viewport().values()):
+            self.locator(source).scroll_into_view_if_needed()
+            layout = read_layout(self.page, selectors)
+
+        before = layout.rect("source")
+        if before is None:
+            raise AssertionError(f"Элемент {source} для перетаскивания не найден")
+        start = (before.x + before.width * grab[0], before.y + before.height * grab[1])
+        anchor = start
+        if target is not None:
+            goal = layout.rect("target")
+            if goal is None:
+                raise AssertionError(f"Цель перетаскивания {target} не найдена")
+            anchor = (goal.x + goal.width * drop[0], goal.y + goal.height * drop[1])
+        end = (anchor[0] + offset[0], anchor[1] + offset[1])
+        self.log_step(f"Перетаскиваем {source} из {start} в {end} за {steps} шагов")
+
+        if timeout is None:
+            timeout = self.resolve_timeout("drag", source, default)
+        mouse = self.page.mouse
+        mouse.move(*start)
+        mouse.down()
+        mouse.move(*end, steps=max(1, steps))
+        mouse.up()
+
+        started = time.perf_counter()
+        settle = self.page.evaluate(SETTLE_SCRIPT, {"scope": scope, "quiet": quiet_ms, "timeout": timeout})
+        if settle["settled"]:
+            self._record_duration("drag", source, started)
+        else:
+            logger.warning(f"Страница не успокоилась за {timeout} мс после перетаскивания {source}")
+
+        result = DragResult(
+            start=start,
+            end=end,
+            before=before,
+            after=read_layout(self.page, [source]).rect(source),
+            settled=settle["settled"],
+            settle_ms=round(settle["ms"], 1),
+            mutations=settle["mutations"],
+        )
+        if verify is not None:
+            result.verified = bool(verify(result))
+            if not result.verified:
+                raise AssertionError(f"Перетаскивание {source} не дало ожидаемого результата: {result}")
+        return result
+
     def log_step(self, step_description: str) -> None:
         """
         Логирует шаг теста для отладки.
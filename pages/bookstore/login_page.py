@@ -109,7 +109,7 @@ class LoginPage(BasePage):
             str или None: Текст ошибки или None если ошибки нет
         """
         try:
-            error_elem = self.page.locator(LoginLocators.ERROR_MESSAGE)
+            error_elem = self.locator(LoginLocators.ERROR_MESSAGE)
             error_elem.wait_for(state="visible", timeout=5000)
             return error_elem.text_content()
         except:
@@ -123,7 +123,7 @@ class LoginPage(BasePage):
             str или None: Текст ошибки reCAPTCHA или None если ошибки нет
         """
         try:
-            error_elem = self.page.locator(LoginLocators.CAPTCHA_ERROR)
+            error_elem = self.locator(LoginLocators.CAPTCHA_ERROR)
             error_elem.wait_for(state="visible", timeout=7000)
             return error_elem.text_content()
         except:
@@ -161,7 +161,7 @@ class LoginPage(BasePage):
         """
         try:
             # Проверяем наличие лейбла "Books :" на странице профиля
-            books_label = self.page.locator(LoginLocators.BOOKS_LABEL)
+            books_label = self.locator(LoginLocators.BOOKS_LABEL)
             return books_label.is_visible() and books_label.inner_text().strip() == "Books :"
         except:
             return False
@@ -29,7 +29,7 @@ class BrokenLinksPage(BasePage):
     # ===================== ВНУТРЕННИЕ ПОМОЩНИКИ =====================
 
     def _all_images(self) -> Locator:
-        return self.page.locator(BrokenLinksLocators.ALL_IMAGES)
+        return self.locator(BrokenLinksLocators.ALL_IMAGES)
 
     def _valid_image_locator(self) -> Locator:
         """
@@ -130,7 +130,7 @@ class BrokenLinksPage(BasePage):
             Exception: Если элемент с селектором не найден
         """
         self.log_step(f"Проверяем состояние изображения: {selector}")
-        loc = self.page.locator(selector)
+        loc = self.locator(selector)
         if loc.count() == 0:
             raise Exception(f"Ни одного элемента с селектором {selector} не найдено")
         widths = loc.evaluate_all("els => els.map(e => e.naturalWidth)")
@@ -166,9 +166,9 @@ class BrokenLinksPage(BasePage):
         Возвращает True, если найденный элемент имеет naturalWidth == 0
         или по сети пришел ошибочный статус.
         """
-        locator = self.page.locator(f"img[src='{image_url}']")
+        locator = self.locator(f"img[src='{image_url}']")
         if locator.count() == 0:
-            locator = self.page.locator(f"img[src*='{image_url}']")
+            locator = self.locator(f"img[src*='{image_url}']")
         if locator.count() == 0:
             # Нет элемента на странице — проверяем по HTTP
             try:
@@ -244,7 +244,7 @@ class BrokenLinksPage(BasePage):
         Возвращает список словарей с информацией обо всех ссылках на странице.
         """
         links = []
-        loc = self.page.locator(BrokenLinksLocators.ALL_LINKS)
+        loc = self.locator(BrokenLinksLocators.ALL_LINKS)
         count = loc.count()
         for i in range(count):
             el = loc.nth(i)
@@ -46,9 +46,9 @@ class ButtonsPage(BasePage):
         """
         self.log_step("Выполняем обычный клик по кнопке Click Me")
         # Предпочитаем стабильный селектор по тексту, с резервом
-        btn = self.page.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT)
+        btn = self.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT)
         if btn.count() == 0 or not btn.first.is_visible():
-            btn = self.page.locator(ButtonsLocators.CLICK_ME_BUTTON)
+            btn = self.locator(ButtonsLocators.CLICK_ME_BUTTON)
         btn.first.click()
 
     def get_double_click_message(self) -> str:
@@ -86,24 +86,24 @@ class ButtonsPage(BasePage):
 
     # Видимость кнопок
     def is_double_click_button_visible(self) -> bool:
-        return self.page.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).is_visible()
+        return self.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).is_visible()
 
     def is_right_click_button_visible(self) -> bool:
-        return self.page.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).is_visible()
+        return self.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).is_visible()
 
     def is_click_me_button_visible(self) -> bool:
         # Считаем видимой, если хотя бы один из селекторов доступен
         return (
-            self.page.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT).is_visible()
-            or self.page.locator(ButtonsLocators.CLICK_ME_BUTTON).is_visible()
+            self.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT).is_visible()
+            or self.locator(ButtonsLocators.CLICK_ME_BUTTON).is_visible()
         )
 
     # Доступность (enabled) кнопок
     def is_double_click_button_enabled(self) -> bool:
-        return self.page.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).is_enabled()
+        return self.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).is_enabled()
 
     def is_right_click_button_enabled(self) -> bool:
-        return self.page.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).is_enabled()
+        return self.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).is_enabled()
 
     def is_click_me_button_enabled(self, timeout: int = 5000) -> bool:
         try:
@@ -116,7 +116,7 @@ class ButtonsPage(BasePage):
 
             for selector in selectors:
                 try:
-                    locator = self.page.locator(selector)
+                    locator = self.locator(selector)
                     if locator.count() > 0:
                         return locator.is_enabled(timeout=timeout)
                 except:
@@ -128,13 +128,13 @@ class ButtonsPage(BasePage):
 
     # Тексты на кнопках
     def get_double_click_button_text(self) -> str:
-        return self.page.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).inner_text()
+        return self.locator(ButtonsLocators.DOUBLE_CLICK_BUTTON).inner_text()
 
     def get_right_click_button_text(self) -> str:
-        return self.page.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).inner_text()
+        return self.locator(ButtonsLocators.RIGHT_CLICK_BUTTON).inner_text()
 
     def get_click_me_button_text(self) -> str:
-        locator = self.page.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT)
+        locator = self.locator(ButtonsLocators.CLICK_ME_BUTTON_ALT)
         if not locator.is_visible():
-            locator = self.page.locator(ButtonsLocators.CLICK_ME_BUTTON)
+            locator = self.locator(ButtonsLocators.CLICK_ME_BUTTON)
         return locator.inner_text()
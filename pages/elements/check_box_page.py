@@ -3,9 +3,58 @@ Page Object для страницы CheckBox с иерархическими ч
 Содержит методы для работы с раскрытием/сворачиванием дерева и выбором элементов.
 """
 
+from typing import Iterable
+
 from playwright.sync_api import Page
 from locators.elements.check_box_locators import CheckboxLocators
 from pages.base_page import BasePage
+from utils.checkbox_tree import CheckboxTree
+
+# Снимок всего отрисованного дерева за один вызов: путь, заголовок, раскрытие,
+# состояние отметки и видимость каждого узла, плюс тексты блока результатов
+TREE_SNAPSHOT_SCRIPT = """
+(rootSelector) => {
+    const root = document.querySelector(rootSelector);
+    const nodes = [];
+    const stateOf = (label, input) => {
+        const icon = label && label.querySelector('.rct-checkbox .rct-icon');
+        if (icon) {
+            if (icon.classList.contains('rct-icon-half-check')) return 'indeterminate';
+            if (icon.classList.contains('rct-icon-check')) return 'checked';
+            if (icon.classList.contains('rct-icon-uncheck')) return 'unchecked';
+        }
+        if (input && input.indeterminate) return 'indeterminate';
+        return input && input.checked ? 'checked' : 'unchecked';
+    };
+    const walk = (list, parent, depth) => {
+        for (const li of list.children) {
+            if (!li.classList.contains('rct-node')) continue;
+            const label = li.querySelector(':scope > .rct-text label');
+            const input = label && label.querySelector('input[type=checkbox]');
+            const title = label && label.querySelector('.rct-title');
+            const id = ((input && input.id) || (label && label.htmlFor) || '')
+                .replace(/^tree-node-/, '');
+            const path = parent ? parent + '/' + id : id;
+            const rect = label ? label.getBoundingClientRect() : null;
+            nodes.push({
+                id, path, parent, depth,
+                title: title ? title.textContent.trim() : id,
+                leaf: li.classList.contains('rct-node-leaf'),
+                expanded: li.classList.contains('rct-node-expanded'),
+                state: stateOf(label, input),
+                visible: !!(rect && rect.width && rect.height),
+            });
+            const children = li.querySelector(':scope > ol');
+            if (children) walk(children, path, depth + 1);
+        }
+    };
+    const top = root && root.querySelector(':scope > ol');
+    if (top) walk(top, null, 0);
+    const results = Array.from(document.querySelectorAll('#result .text-success'))
+        .map(el => el.textContent.trim());
+    return {nodes, results};
+}
+"""
 
 
 class CheckBoxPage(BasePage):
@@ -22,6 +71,8 @@ class CheckBoxPage(BasePage):
             page: Экземпляр страницы Playwright
         """
         super().__init__(page)
+        # Последний план кликов apply_selection (пути узлов)
+        self.last_plan: list[str] = []
 
     def expand_all(self) -> None:
         """
@@ -54,7 +105,7 @@ class CheckBoxPage(BasePage):
         Returns:
             bool: True если результаты скрыты или пусты
         """
-        locator = self.page.locator(CheckboxLocators.CHECKBOX_RESULT)
+        locator = self.locator(CheckboxLocators.CHECKBOX_RESULT)
         try:
             # Пытаемся дождаться скрытия элемента
             locator.wait_for(state="hidden", timeout=5000)
@@ -76,7 +127,7 @@ class CheckBoxPage(BasePage):
             str: Текст с информацией о выбранных элементах
         """
         try:
-            locator = self.page.locator(CheckboxLocators.CHECKBOX_RESULT)
+            locator = self.locator(CheckboxLocators.CHECKBOX_RESULT)
             locator.wait_for(state="visible", timeout=5000)
             return locator.inner_text()
         except Exception as e:
@@ -85,46 +136,127 @@ class CheckBoxPage(BasePage):
 
     # ==================== Методы, ожидаемые тестами ====================
 
-    def get_visible_nodes_count(self) -> int:
+    def snapshot(self) -> CheckboxTree:
         """
-        Возвращает количество видимых узлов дерева по заголовкам.
+        Снимает состояние всего отрисованного дерева одним запросом к странице.
+
+        Returns:
+            CheckboxTree: Дерево с индексом узлов по пути (home/documents/office)
         """
-        try:
-            return self.page.locator(CheckboxLocators.ALL_TITLES).evaluate_all(
-                "els => els.filter(e => !!(e.offsetParent)).length"
+        return CheckboxTree.from_snapshot(
+            self.page.evaluate(TREE_SNAPSHOT_SCRIPT, CheckboxLocators.TREE_ROOT)
+        )
+
+    def _complete_snapshot(self) -> CheckboxTree:
+        """Снимок, содержащий все узлы дерева (при необходимости дерево раскрывается)."""
+        tree = self.snapshot()
+        if not tree.nodes or not tree.complete:
+            self.expand_all()
+            tree = self.snapshot()
+        return tree
+
+    def click_node(self, node_id: str) -> None:
+        """
+        Кликает по чекбоксу узла.
+
+        Args:
+            node_id: id узла (часть tree-node-<id>, например wordFile)
+        """
+        self.locator(CheckboxLocators.NODE_CHECKBOX.format(id=node_id)).click()
+
+    def toggle_expand(self, node_id: str) -> None:
+        """
+        Раскрывает или сворачивает узел кнопкой рядом с ним.
+
+        Args:
+            node_id: id родительского узла
+        """
+        self.locator(CheckboxLocators.NODE_TOGGLE.format(id=node_id)).click()
+
+    def apply_selection(self, names: Iterable[str], mode: str = "select") -> CheckboxTree:
+        """
+        Приводит отметки дерева к нужному набору минимальным числом кликов
+        и проверяет результат одним повторным снимком.
+
+        Args:
+            names: Узлы (путь, id или заголовок)
+            mode: select - добавить к отмеченным, unselect - снять,
+                  exact - отмечены должны быть только указанные узлы
+
+        Returns:
+            CheckboxTree: Снимок дерева после кликов
+
+        Raises:
+            ValueError: Если режим неизвестен
+            AssertionError: Если отмеченные листья не совпали с ожидаемыми
+        """
+        tree = self._complete_snapshot()
+        requested = tree.desired_leaves(names)
+        if mode == "select":
+            desired = tree.checked_leaves() | requested
+        elif mode == "unselect":
+            desired = tree.checked_leaves() - requested
+        elif mode == "exact":
+            desired = requested
+        else:
+            raise ValueError(f"Неизвестный режим выбора: {mode}")
+
+        self.last_plan = tree.plan(desired)
+        self.log_step(f"Кликаем по узлам ({len(self.last_plan)}): {self.last_plan}")
+        for path in self.last_plan:
+            self.click_node(tree.nodes[path].id)
+
+        result = self.snapshot()
+        checked = result.checked_leaves()
+        if checked != desired:
+            raise AssertionError(
+                f"Отметки дерева не совпали: лишние {sorted(checked - desired)}, "
+                f"не отмечены {sorted(desired - checked)}"
             )
-        except Exception:
-            # Fallback: приблизительная оценка
-            titles = self.page.locator(CheckboxLocators.ALL_TITLES)
-            count = 0
-            for i in range(titles.count()):
-                if titles.nth(i).is_visible():
-                    count += 1
-            return count
+        return result
+
+    def select_many(self, names: Iterable[str]) -> CheckboxTree:
+        """
+        Отмечает несколько узлов минимальным числом кликов (см. apply_selection).
+
+        Args:
+            names: Узлы (путь, id или заголовок)
+
+        Returns:
+            CheckboxTree: Снимок дерева после выбора
+        """
+        return self.apply_selection(names, mode="select")
+
+    def unselect_many(self, names: Iterable[str]) -> CheckboxTree:
+        """
+        Снимает отметки с нескольких узлов минимальным числом кликов.
+
+        Args:
+            names: Узлы (путь, id или заголовок)
+
+        Returns:
+            CheckboxTree: Снимок дерева после снятия
+        """
+        return self.apply_selection(names, mode="unselect")
+
+    def get_visible_nodes_count(self) -> int:
+        """
+        Возвращает количество видимых узлов дерева.
+        """
+        return len(self.snapshot().visible_titles())
 
     def get_all_visible_checkboxes(self) -> list[str]:
         """
-        Возвращает список имен (текста) видимых чекбоксов (по заголовкам).
-        """
-        names: list[str] = []
-        titles = self.page.locator(CheckboxLocators.ALL_TITLES)
-        for i in range(titles.count()):
-            t = titles.nth(i)
-            if t.is_visible():
-                try:
-                    text = (t.inner_text() or "").strip()
-                    if text:
-                        names.append(text)
-                except Exception:
-                    continue
-        return names
+        Возвращает список имен (текста) видимых чекбоксов в порядке дерева.
+        """
+        return self.snapshot().visible_titles()
 
     def _label_for(self, name: str):
         """
         Возвращает локатор label соответствующий заголовку узла (по тексту).
         """
         # Используем :has() для надёжной привязки checkbox к заголовку
-        return self.page.locator(
+        return self.locator(
             f"label:has(span.rct-title:has-text('{name}'))"
         ).first
 
@@ -152,11 +284,7 @@ class CheckBoxPage(BasePage):
         """
         Проверяет, выбран ли чекбокс (иконка галочки возле данного узла).
         """
-        label = self._label_for(name)
-        try:
-            return label.locator(".rct-icon.rct-icon-check").is_visible()
-        except Exception:
-            return False
+        return self.snapshot().state(name) == "checked"
 
     def get_selected_results(self) -> list[str]:
         """
@@ -206,7 +334,7 @@ class CheckBoxPage(BasePage):
             return raw[:1].upper() + raw[1:].lower()
 
         results = []
-        container = self.page.locator(CheckboxLocators.CHECKBOX_RESULT)
+        container = self.locator(CheckboxLocators.CHECKBOX_RESULT)
         if not container.is_visible():
             return results
         chips = container.locator(".text-success")
@@ -220,45 +348,17 @@ class CheckBoxPage(BasePage):
         """
         Снимает выбор со всех выбранных чекбоксов.
         """
-        # Раскрываем, чтобы все узлы были доступны
-        self.expand_all()
-        # Снимаем выбранные и частично выбранные
-        nodes = self.page.locator("label:has(span.rct-checkbox)")
-        total = nodes.count()
-        for i in range(total):
-            label = nodes.nth(i)
-            checkbox = label.locator("span.rct-checkbox")
-            # Если выбран (галочка) или частично выбран (half-check) — кликаем, чтобы снять
-            if (
-                label.locator(".rct-icon.rct-icon-check").count() > 0
-                or label.locator(".rct-icon.rct-icon-half-check").count() > 0
-            ):
-                checkbox.click()
+        self.apply_selection([], mode="exact")
 
     def get_checkbox_state(self, name: str) -> str:
         """
         Возвращает состояние чекбокса: 'checked' | 'unchecked' | 'indeterminate'
         """
-        label = self._label_for(name)
-        if label.locator(".rct-icon.rct-icon-check").count() > 0:
-            return "checked"
-        if label.locator(".rct-icon.rct-icon-half-check").count() > 0:
-            return "indeterminate"
-        return "unchecked"
+        return self.snapshot().state(name)
 
     def select_all_checkboxes(self) -> None:
         """
         Отмечает все доступные чекбоксы в дереве.
         """
-        self.expand_all()
-        nodes = self.page.locator("label:has(span.rct-checkbox)")
-        total = nodes.count()
-        for i in range(total):
-            label = nodes.nth(i)
-            checkbox = label.locator("span.rct-checkbox")
-            # Отмечаем только не выбранные
-            if (
-                label.locator(".rct-icon.rct-icon-check").count() == 0
-                and label.locator(".rct-icon.rct-icon-half-check").count() == 0
-            ):
-                checkbox.click()
+        tree = self._complete_snapshot()
+        self.apply_selection([root.path for root in tree.roots], mode="select")
@@ -3,6 +3,8 @@ Page Object для страницы Dynamic Properties.
 Содержит методы для работы с элементами, изменяющими свои свойства во времени.
 """
 
+from typing import Any, Dict, Optional
+
 from playwright.sync_api import Page
 
 from data import Colors
@@ -24,6 +26,8 @@ class DynamicPropertiesPage(BasePage):
             page: Экземпляр страницы Playwright
         """
         super().__init__(page)
+        # Последнее изменение, зафиксированное наблюдателем (см. BasePage.wait_for_element_change)
+        self.last_change: Optional[Dict[str, Any]] = None
 
     def is_enable_after_enabled(self) -> bool:
         """
@@ -32,13 +36,14 @@ class DynamicPropertiesPage(BasePage):
         Returns:
             bool: True если кнопка активна (не disabled)
         """
-        return self.page.locator(
+        return self.locator(
             DynamicPropertiesLocators.ENABLE_AFTER_BUTTON
         ).is_enabled()
 
     def wait_and_check_enable_after(self, timeout: int = 10000) -> bool:
         """
         Ожидает активации кнопки "Enable After" и проверяет её состояние.
+        Момент активации сохраняется в last_change.
 
         Args:
             timeout: Максимальное время ожидания в миллисекундах
@@ -47,14 +52,13 @@ class DynamicPropertiesPage(BasePage):
             bool: True если кнопка стала активной в указанное время
         """
         self.log_step("Ожидаем активации кнопки Enable After")
-        self.page.wait_for_function(
-            "element => !element.disabled",
-            arg=self.page.locator(
-                DynamicPropertiesLocators.ENABLE_AFTER_BUTTON
-            ).element_handle(),
+        self.last_change = self.wait_for_element_change(
+            DynamicPropertiesLocators.ENABLE_AFTER_BUTTON,
+            "enabled",
+            expected=True,
             timeout=timeout,
         )
-        return self.is_enable_after_enabled()
+        return self.last_change is not None and self.is_enable_after_enabled()
 
     def is_visible_after_visible(self, timeout: int = 10000) -> bool:
         """
@@ -71,7 +75,7 @@ class DynamicPropertiesPage(BasePage):
             self.page.wait_for_selector(
                 DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON, timeout=timeout
             )
-            return self.page.locator(
+            return self.locator(
                 DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON
             ).is_visible()
         except:
@@ -81,42 +85,31 @@ class DynamicPropertiesPage(BasePage):
         self,
         expected_hex_color: str = Colors.RED,
         timeout: int = 10000,
-        poll_interval: int = 200,
+        poll_interval: Optional[int] = None,
     ) -> bool:
         """
         Ожидает изменения цвета текста кнопки на ожидаемый.
+        Момент изменения сохраняется в last_change.
 
         Args:
             expected_hex_color: Ожидаемый HEX цвет (по умолчанию красный)
             timeout: Максимальное время ожидания в миллисекундах
-            poll_interval: Интервал между проверками в миллисекундах
+            poll_interval: Не используется: изменение отслеживается наблюдателем в странице
 
         Returns:
             bool: True если цвет изменился на ожидаемый
         """
         self.log_step(f"Ожидаем изменения цвета текста на {expected_hex_color}")
-        locator = self.page.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
-        elapsed = 0
-
-        while elapsed < timeout:
-            try:
-                current_rgb = locator.evaluate(
-                    "el => window.getComputedStyle(el).color"
-                )
-                # Конвертируем RGB в HEX
-                parts = current_rgb.strip()[4:-1].split(",")
-                r, g, b = [int(p.strip()) for p in parts]
-                current_hex = f"#{r:02x}{g:02x}{b:02x}"
-
-                if current_hex.lower() == expected_hex_color.lower():
-                    return True
-            except Exception as e:
-                self.log_step(f"Ошибка при проверке цвета: {e}")
-
-            self.page.wait_for_timeout(poll_interval)
-            elapsed += poll_interval
-
-        return False
+        hex_color = expected_hex_color.lstrip("#")
+        r, g, b = (int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        self.last_change = self.wait_for_element_change(
+            DynamicPropertiesLocators.COLOR_CHANGE_BUTTON,
+            "style",
+            name="color",
+            expected=f"rgb({r}, {g}, {b})",
+            timeout=timeout,
+        )
+        return self.last_change is not None
 
     def click_enable_after_button(self) -> bool:
         """
@@ -162,7 +155,7 @@ class DynamicPropertiesPage(BasePage):
         Returns:
             str: Цвет в HEX формате (например, "#000000")
         """
-        locator = self.page.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
+        locator = self.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
         current_rgb = locator.evaluate("el => window.getComputedStyle(el).color")
         parts = current_rgb.strip()[4:-1].split(",")
         r, g, b = [int(p.strip()) for p in parts]
@@ -173,7 +166,7 @@ class DynamicPropertiesPage(BasePage):
         return self.is_enable_after_enabled()
 
     def get_enable_after_button_attributes(self) -> dict:
-        loc = self.page.locator(DynamicPropertiesLocators.ENABLE_AFTER_BUTTON)
+        loc = self.locator(DynamicPropertiesLocators.ENABLE_AFTER_BUTTON)
         return {
             "id": loc.get_attribute("id") or "",
             "disabled": (not loc.is_enabled()),
@@ -184,47 +177,64 @@ class DynamicPropertiesPage(BasePage):
         return self.wait_and_check_enable_after(timeout=timeout)
 
     def get_color_change_button_color(self) -> str:
-        loc = self.page.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
+        loc = self.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
         return loc.evaluate("el => window.getComputedStyle(el).color")
 
     def get_color_change_button_classes(self) -> str:
-        return self.page.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON).get_attribute("class") or ""
+        return self.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON).get_attribute("class") or ""
 
-    def wait_for_color_change(self, timeout: int = 10000, poll_interval: int = 200) -> bool:
-        loc = self.page.locator(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON)
-        try:
-            initial_color = loc.evaluate("el => window.getComputedStyle(el).color")
-        except Exception:
-            initial_color = ""
-        initial_class = loc.get_attribute("class") or ""
-        elapsed = 0
-        while elapsed < timeout:
-            try:
-                curr_color = loc.evaluate("el => window.getComputedStyle(el).color")
-                curr_class = loc.get_attribute("class") or ""
-                if curr_color != initial_color or curr_class != initial_class:
-                    return True
-            except Exception:
-                pass
-            self.page.wait_for_timeout(poll_interval)
-            elapsed += poll_interval
-        return False
+    def wait_for_color_change(
+        self, timeout: int = 10000, poll_interval: Optional[int] = None
+    ) -> bool:
+        """
+        Ожидает смены класса цвета кнопки "Color Change" (цвет текста следует за классом).
+        Момент изменения сохраняется в last_change.
+
+        Args:
+            timeout: Максимальное время ожидания в миллисекундах
+            poll_interval: Не используется: изменение отслеживается наблюдателем в странице
+
+        Returns:
+            bool: True если класс изменился в указанное время
+        """
+        self.log_step("Ожидаем изменения цвета кнопки Color Change")
+        self.last_change = self.wait_for_element_change(
+            DynamicPropertiesLocators.COLOR_CHANGE_BUTTON, "class", timeout=timeout
+        )
+        return self.last_change is not None
 
     def is_visible_after_button_visible(self) -> bool:
-        return self.page.locator(DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON).is_visible()
+        return self.locator(DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON).is_visible()
 
     def is_visible_after_button_in_dom(self) -> bool:
-        return self.page.locator(DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON).count() > 0
+        return self.locator(DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON).count() > 0
 
     def wait_for_visible_after_button(self, timeout: int = 10000) -> bool:
-        return self.is_visible_after_visible(timeout=timeout)
+        """
+        Ожидает появления кнопки "Visible After" (кнопка добавляется в DOM по таймеру).
+        Момент появления сохраняется в last_change.
+
+        Args:
+            timeout: Максимальное время ожидания в миллисекундах
+
+        Returns:
+            bool: True если кнопка стала видимой в указанное время
+        """
+        self.log_step("Ожидаем появления кнопки Visible After")
+        self.last_change = self.wait_for_element_change(
+            DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON,
+            "visible",
+            expected=True,
+            timeout=timeout,
+        )
+        return self.last_change is not None
 
     def find_random_id_element(self):
-        loc = self.page.locator("[id^='random']")
+        loc = self.locator("[id^='random']")
         return bool(loc.count() > 0)
 
     def get_random_id_element_info(self) -> dict:
-        loc = self.page.locator("[id^='random']").first
+        loc = self.locator("[id^='random']").first
         if loc.count() == 0:
             return {}
         tag = loc.evaluate("el => el.tagName") or ""
@@ -235,7 +245,7 @@ class DynamicPropertiesPage(BasePage):
         }
 
     def get_random_id_element_id(self) -> str:
-        loc = self.page.locator("[id^='random']").first
+        loc = self.locator("[id^='random']").first
         return loc.get_attribute("id") or ""
 
     def get_current_timestamp(self) -> int:
@@ -73,34 +73,34 @@ class LinksPage(BasePage):
 
     # ======== Атрибуты ссылок ========
     def is_simple_link_visible(self) -> bool:
-        return self.page.locator(LinksLocators.SIMPLE_LINK).is_visible()
+        return self.locator(LinksLocators.SIMPLE_LINK).is_visible()
 
     def is_simple_link_enabled(self) -> bool:
-        return not self.page.locator(LinksLocators.SIMPLE_LINK).is_disabled()
+        return not self.locator(LinksLocators.SIMPLE_LINK).is_disabled()
 
     def get_simple_link_href(self) -> str:
-        return self.page.locator(LinksLocators.SIMPLE_LINK).get_attribute("href") or ""
+        return self.locator(LinksLocators.SIMPLE_LINK).get_attribute("href") or ""
 
     def get_simple_link_text(self) -> str:
-        return (self.page.locator(LinksLocators.SIMPLE_LINK).inner_text() or "").strip()
+        return (self.locator(LinksLocators.SIMPLE_LINK).inner_text() or "").strip()
 
     def get_simple_link_target(self) -> str:
-        return self.page.locator(LinksLocators.SIMPLE_LINK).get_attribute("target") or ""
+        return self.locator(LinksLocators.SIMPLE_LINK).get_attribute("target") or ""
 
     def is_dynamic_link_visible(self) -> bool:
-        return self.page.locator(LinksLocators.DYNAMIC_LINK).is_visible()
+        return self.locator(LinksLocators.DYNAMIC_LINK).is_visible()
 
     def is_dynamic_link_enabled(self) -> bool:
-        return not self.page.locator(LinksLocators.DYNAMIC_LINK).is_disabled()
+        return not self.locator(LinksLocators.DYNAMIC_LINK).is_disabled()
 
     def get_dynamic_link_href(self) -> str:
-        return self.page.locator(LinksLocators.DYNAMIC_LINK).get_attribute("href") or ""
+        return self.locator(LinksLocators.DYNAMIC_LINK).get_attribute("href") or ""
 
     def get_dynamic_link_text(self) -> str:
-        return (self.page.locator(LinksLocators.DYNAMIC_LINK).inner_text() or "").strip()
+        return (self.locator(LinksLocators.DYNAMIC_LINK).inner_text() or "").strip()
 
     def get_dynamic_link_target(self) -> str:
-        return self.page.locator(LinksLocators.DYNAMIC_LINK).get_attribute("target") or ""
+        return self.locator(LinksLocators.DYNAMIC_LINK).get_attribute("target") or ""
 
     def click_dynamic_link(self) -> None:
         self.log_step("Кликаем по динамической ссылке")
@@ -119,7 +119,7 @@ class LinksPage(BasePage):
         """
         self.log_step(f"Кликаем по API ссылке и проверяем ответ: {expected_text}")
         self.safe_click(locator)
-        expect(self.page.locator(LinksLocators.LINK_RESPONSE_MESSAGE)).to_have_text(
+        expect(self.locator(LinksLocators.LINK_RESPONSE_MESSAGE)).to_have_text(
             expected_text
         )
 
@@ -151,7 +151,7 @@ class LinksPage(BasePage):
             return False
         self.safe_click(loc)
         try:
-            self.page.locator(LinksLocators.LINK_RESPONSE_MESSAGE).wait_for(
+            self.locator(LinksLocators.LINK_RESPONSE_MESSAGE).wait_for(
                 state="visible", timeout=5000
             )
             return True
@@ -165,7 +165,7 @@ class LinksPage(BasePage):
 
     # ======== Статистика ссылок ========
     def get_all_links_count(self) -> int:
-        return self.page.locator(LinksLocators.ALL_LINKS).count()
+        return self.locator(LinksLocators.ALL_LINKS).count()
 
     def get_api_links_count(self) -> int:
         # На странице API ссылки имеют id из набора ниже
@@ -180,7 +180,7 @@ class LinksPage(BasePage):
         ]
         total = 0
         for sel in api_ids:
-            total += self.page.locator(sel).count()
+            total += self.locator(sel).count()
         return total
 
     # ======== Приватные вспомогательные (оставлены без изменений) ========
@@ -68,7 +68,7 @@ class RadioButtonPage(BasePage):
             bool: True если Yes выбрана
         """
         try:
-            yes_input = self.page.locator("input#yesRadio")
+            yes_input = self.locator("input#yesRadio")
             return yes_input.is_checked()
         except:
             return False
@@ -81,7 +81,7 @@ class RadioButtonPage(BasePage):
             bool: True если Impressive выбрана
         """
         try:
-            impressive_input = self.page.locator("input#impressiveRadio")
+            impressive_input = self.locator("input#impressiveRadio")
             return impressive_input.is_checked()
         except:
             return False
@@ -94,7 +94,7 @@ class RadioButtonPage(BasePage):
             bool: True если No доступна (обычно False)
         """
         try:
-            no_input = self.page.locator("input#noRadio")
+            no_input = self.locator("input#noRadio")
             return no_input.is_enabled()
         except:
             return False
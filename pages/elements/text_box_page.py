@@ -79,7 +79,7 @@ class TextBoxPage(BasePage):
         self.log_step("Отправляем форму")
 
         # Проверяем состояние перед отправкой
-        submit_button = self.page.locator(TextBoxLocators.SUBMIT_BUTTON)
+        submit_button = self.locator(TextBoxLocators.SUBMIT_BUTTON)
         initial_button_text = submit_button.inner_text() if submit_button.is_visible() else "not visible"
 
         self.safe_click(TextBoxLocators.SUBMIT_BUTTON)
@@ -89,7 +89,7 @@ class TextBoxPage(BasePage):
 
         # Проверяем что кнопка submit изменила состояние (если есть индикатор загрузки)
         try:
-            submit_button = self.page.locator(TextBoxLocators.SUBMIT_BUTTON)
+            submit_button = self.locator(TextBoxLocators.SUBMIT_BUTTON)
             if submit_button.is_visible():
                 final_button_text = submit_button.inner_text()
                 self.log_step(f"Кнопка submit: '{initial_button_text}' -> '{final_button_text}'")
@@ -124,7 +124,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти по тексту "Name:"
         try:
-            name_element = self.page.locator("p").filter(has_text="Name:").first
+            name_element = self.locator("p").filter(has_text="Name:").first
             if name_element.is_visible():
                 return name_element.inner_text().replace("Name:", "").strip()
         except Exception:
@@ -132,7 +132,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти все элементы в области вывода и ищем имя
         try:
-            output_container = self.page.locator("#output")
+            output_container = self.locator("#output")
             if output_container.is_visible():
                 all_text = output_container.inner_text()
                 # Ищем строку с именем
@@ -164,7 +164,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти по тексту "Email:"
         try:
-            email_element = self.page.locator("p").filter(has_text="Email:").first
+            email_element = self.locator("p").filter(has_text="Email:").first
             if email_element.is_visible():
                 return email_element.inner_text().replace("Email:", "").strip()
         except Exception:
@@ -172,7 +172,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти все элементы в области вывода и ищем email
         try:
-            output_container = self.page.locator("#output")
+            output_container = self.locator("#output")
             if output_container.is_visible():
                 all_text = output_container.inner_text()
                 # Ищем строку с email
@@ -204,7 +204,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти по тексту "Current Address:"
         try:
-            address_element = self.page.locator("p").filter(has_text="Current Address:").first
+            address_element = self.locator("p").filter(has_text="Current Address:").first
             if address_element.is_visible():
                 return address_element.inner_text().replace("Current Address:", "").strip()
         except Exception:
@@ -231,7 +231,7 @@ class TextBoxPage(BasePage):
 
         # Пробуем найти по тексту "Permanent Address:"
         try:
-            address_element = self.page.locator("p").filter(has_text="Permanent Address:").first
+            address_element = self.locator("p").filter(has_text="Permanent Address:").first
             if address_element.is_visible():
                 return address_element.inner_text().replace("Permanent Address:", "").strip()
         except Exception:
@@ -246,7 +246,7 @@ class TextBoxPage(BasePage):
         Returns:
             bool: True если область вывода видима
         """
-        return self.page.locator("#output").is_visible()
+        return self.locator("#output").is_visible()
 
     def wait_for_output(self, timeout: int = 5000) -> bool:
         """
@@ -259,7 +259,7 @@ class TextBoxPage(BasePage):
             bool: True если область вывода появилась
         """
         try:
-            self.page.locator("#output").wait_for(state="visible", timeout=timeout)
+            self.locator("#output").wait_for(state="visible", timeout=timeout)
             return True
         except Exception:
             return False
@@ -275,7 +275,7 @@ class TextBoxPage(BasePage):
 
         try:
             # Проверяем основную область вывода
-            output_locator = self.page.locator("#output")
+            output_locator = self.locator("#output")
             debug_info["output_visible"] = output_locator.is_visible()
             if output_locator.is_visible():
                 debug_info["output_text"] = output_locator.inner_text()
@@ -285,11 +285,11 @@ class TextBoxPage(BasePage):
                 debug_info["output_html"] = "Output not visible"
 
             # Проверяем тело страницы
-            body_text = self.page.locator("body").inner_text()
+            body_text = self.locator("body").inner_text()
             debug_info["body_contains_output"] = "#output" in body_text
 
             # Ищем любые элементы, которые могут содержать результаты
-            all_divs = self.page.locator("div").all()
+            all_divs = self.locator("div").all()
             div_contents = []
             for i, div in enumerate(all_divs[:10]):  # Проверяем первые 10 div'ов
                 try:
@@ -301,7 +301,7 @@ class TextBoxPage(BasePage):
             debug_info["sample_divs"] = div_contents
 
             # Проверяем наличие элементов с id, содержащими "output"
-            output_elements = self.page.locator("[id*='output']").all()
+            output_elements = self.locator("[id*='output']").all()
             debug_info["output_elements_count"] = len(output_elements)
             if output_elements:
                 debug_info["output_elements"] = []
@@ -378,7 +378,7 @@ class TextBoxPage(BasePage):
             bool: True если кнопка активна и доступна для клика
         """
         try:
-            submit_button = self.page.locator(TextBoxLocators.SUBMIT_BUTTON)
+            submit_button = self.locator(TextBoxLocators.SUBMIT_BUTTON)
             if not submit_button.is_visible():
                 return False
 
@@ -6,10 +6,17 @@ Page Object для страницы Upload and Download.
 import os
 import time
 import re
+from typing import Optional
 from urllib.parse import urlparse
 from playwright.sync_api import Page
 from locators.elements.download_locators import UploadDownloadLocators
 from pages.base_page import BasePage
+from utils.download_verifier import (
+    DownloadVerification,
+    StreamingVerifier,
+    probe_url,
+    verify_download,
+)
 
 
 class UploadDownloadPage(BasePage):
@@ -78,6 +85,43 @@ class UploadDownloadPage(BasePage):
 
         return file_path
 
+    def download_and_verify(
+        self,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        expected_type: Optional[str] = None,
+        max_size: Optional[int] = None,
+        keep: bool = False,
+    ) -> DownloadVerification:
+        """
+        Скачивает файл по ссылке и проверяет его потоково, без сохранения копии.
+
+        Хеш, размер и тип считаются по блокам из временного файла Playwright,
+        который удаляется после проверки. Память не зависит от размера файла.
+
+        Args:
+            expected_size: Ожидаемый размер в байтах
+            expected_sha256: Ожидаемый SHA-256 в hex
+            expected_type: Ожидаемый MIME тип (по сигнатуре файла)
+            max_size: Максимально допустимый размер в байтах
+            keep: Не удалять временный файл после проверки
+
+        Returns:
+            DownloadVerification: Имя, размер, SHA-256, тип и список ошибок
+        """
+        self.log_step("Скачиваем файл с потоковой проверкой")
+
+        with self.page.expect_download() as download_info:
+            self.safe_click(UploadDownloadLocators.DOWNLOAD_BUTTON)
+
+        verifier = StreamingVerifier(expected_size, expected_sha256, expected_type, max_size)
+        result = verify_download(download_info.value, verifier, keep=keep)
+        self.log_step(
+            f"Файл {result.filename}: {result.size} байт, {result.mime_type}, "
+            f"sha256={result.sha256[:12]}, ошибки: {result.errors or 'нет'}"
+        )
+        return result
+
     def is_upload_successful(self) -> bool:
         """
         Проверяет, успешно ли прошла загрузка файла.
@@ -115,7 +159,7 @@ class UploadDownloadPage(BasePage):
         Returns:
             bool: True если кнопка скачивания видима
         """
-        return self.page.locator(UploadDownloadLocators.DOWNLOAD_BUTTON).is_visible()
+        return self.locator(UploadDownloadLocators.DOWNLOAD_BUTTON).is_visible()
 
     def set_upload_timeout(self, timeout_ms: int) -> None:
         """
@@ -142,7 +186,7 @@ class UploadDownloadPage(BasePage):
         Returns:
             dict: Словарь с атрибутами кнопки скачивания
         """
-        button_locator = self.page.locator(UploadDownloadLocators.DOWNLOAD_BUTTON)
+        button_locator = self.locator(UploadDownloadLocators.DOWNLOAD_BUTTON)
         attributes = {}
 
         # Получаем основные атрибуты
@@ -190,10 +234,10 @@ class UploadDownloadPage(BasePage):
             bool: True если URL доступен
         """
         try:
-            # Создаем новый контекст для проверки URL
-            with self.page.context.new_page() as test_page:
-                response = test_page.goto(url, timeout=5000)
-                return response is not None and response.status < 400
+            # HEAD или запрос одного байта вместо полного скачивания
+            info = probe_url(self.page.context.request, url, timeout=5000)
+            self.log_step(f"Проверка URL ({info['method']}): {info}")
+            return info["status"] < 400
         except Exception:
             return False
 
@@ -4,6 +4,7 @@ Page Object для страницы Web Tables.
 """
 
 from playwright.sync_api import Page
+from data import Timeouts
 from locators.elements.web_tables_locators import WebTablesLocators
 from pages.base_page import BasePage
 
@@ -67,15 +68,14 @@ class WebTablesPage(BasePage):
         Postconditions: форма отправлена, модальное окно закрыто, запись добавлена/обновлена в таблице.
         """
         self.log_step("Отправляем форму регистрации")
-        # Попробуем кликнуть по тексту Submit
-        try:
-            self.page.click("text=Submit")
-        except Exception:
-            self.safe_click(WebTablesLocators.SUBMIT_BUTTON)
+        submit = self.resolve_selector(
+            WebTablesLocators.SUBMIT_CANDIDATES, "submit_form", default=Timeouts.MEDIUM
+        )
+        self.locator(submit or WebTablesLocators.SUBMIT_BUTTON).first.click()
 
         # Ждем закрытия формы
         try:
-            self.page.locator(WebTablesLocators.REGISTRATION_FORM).wait_for(
+            self.locator(WebTablesLocators.REGISTRATION_FORM).wait_for(
                 state="hidden", timeout=5000
             )
             self.log_step("Форма успешно закрылась после отправки")
@@ -86,8 +86,8 @@ class WebTablesPage(BasePage):
                 # Сначала попробуем кликнуть по overlay
                 self.page.click("body", position={"x": 10, "y": 10})
                 self.page.wait_for_timeout(500)
-                if self.page.locator(WebTablesLocators.REGISTRATION_FORM).is_visible():
-                    close_button = self.page.locator(WebTablesLocators.CLOSE_BUTTON)
+                if self.locator(WebTablesLocators.REGISTRATION_FORM).is_visible():
+                    close_button = self.locator(WebTablesLocators.CLOSE_BUTTON)
                     if close_button.is_visible():
                         close_button.click()
                         self.log_step("Форма закрыта принудительно")
@@ -130,7 +130,7 @@ class WebTablesPage(BasePage):
         """
         self.log_step("Получаем данные из таблицы")
         rows = []
-        table_rows = self.page.locator(WebTablesLocators.TABLE_ROWS)
+        table_rows = self.locator(WebTablesLocators.TABLE_ROWS)
 
         for i in range(table_rows.count()):
             row = table_rows.nth(i)
@@ -156,7 +156,7 @@ class WebTablesPage(BasePage):
         Returns:
             int: Количество строк данных в таблице
         """
-        table_rows = self.page.locator(WebTablesLocators.TABLE_ROWS)
+        table_rows = self.locator(WebTablesLocators.TABLE_ROWS)
         # Исключаем пустые строки
         count = 0
         for i in range(table_rows.count()):
@@ -176,7 +176,7 @@ class WebTablesPage(BasePage):
         Postconditions: указанная строка удалена из таблицы
         """
         self.log_step(f"Удаляем строку с индексом {row_index}")
-        delete_buttons = self.page.locator(WebTablesLocators.DELETE_BUTTON)
+        delete_buttons = self.locator(WebTablesLocators.DELETE_BUTTON)
         if delete_buttons.count() > row_index:
             delete_buttons.nth(row_index).click()
 
@@ -190,7 +190,7 @@ class WebTablesPage(BasePage):
         Postconditions: открывается модальное окно с данными для редактирования
         """
         self.log_step(f"Редактируем строку с индексом {row_index}")
-        edit_buttons = self.page.locator(WebTablesLocators.EDIT_BUTTON)
+        edit_buttons = self.locator(WebTablesLocators.EDIT_BUTTON)
         if edit_buttons.count() > row_index:
             edit_buttons.nth(row_index).click()
 
@@ -201,7 +201,7 @@ class WebTablesPage(BasePage):
         Returns:
             bool: True если модальное окно видимо
         """
-        return self.page.locator(WebTablesLocators.REGISTRATION_FORM).is_visible()
+        return self.locator(WebTablesLocators.REGISTRATION_FORM).is_visible()
 
     def close_modal(self) -> None:
         """
@@ -209,7 +209,7 @@ class WebTablesPage(BasePage):
         Postconditions: модальное окно закрыто.
         """
         self.log_step("Закрываем модальное окно")
-        close_button = self.page.locator(".close, .btn-secondary")
+        close_button = self.locator(".close, .btn-secondary")
         if close_button.is_visible():
             close_button.click()
     
@@ -268,7 +268,7 @@ class WebTablesPage(BasePage):
             f"Добавляем новую запись: {person_data.get('first_name')} {person_data.get('last_name')}"
         )
         self.click_add_button()
-        self.wait_for_visible(WebTablesLocators.REGISTRATION_FORM, timeout=5000)
+        self.wait_for_visible(WebTablesLocators.REGISTRATION_FORM, default=Timeouts.MODAL)
 
         self.fill_registration_form(
             person_data.get("first_name", ""),
@@ -283,7 +283,7 @@ class WebTablesPage(BasePage):
         # Ждем закрытия формы и обновления таблицы
         self.page.wait_for_timeout(1000)
         try:
-            self.page.locator(WebTablesLocators.REGISTRATION_FORM).wait_for(
+            self.locator(WebTablesLocators.REGISTRATION_FORM).wait_for(
                 state="hidden", timeout=5000
             )
             self.log_step("Форма успешно закрылась после отправки")
@@ -297,8 +297,8 @@ class WebTablesPage(BasePage):
 
         # Отладочная информация о таблице
         table_info = {
-            "table_rows_count": self.page.locator(WebTablesLocators.TABLE_ROWS).count(),
-            "table_data_rows_count": self.page.locator(WebTablesLocators.TABLE_DATA_ROWS).count(),
+            "table_rows_count": self.locator(WebTablesLocators.TABLE_ROWS).count(),
+            "table_data_rows_count": self.locator(WebTablesLocators.TABLE_DATA_ROWS).count(),
             "current_records": current_records,
             "person_data": person_data
         }
@@ -362,7 +362,7 @@ class WebTablesPage(BasePage):
     def get_form_data(self) -> dict:
         def _val(sel: str) -> str:
             try:
-                return self.page.locator(sel).input_value()
+                return self.locator(sel).input_value()
             except Exception:
                 return ""
     
@@ -429,9 +429,9 @@ class WebTablesPage(BasePage):
             "available_pages": [],
         }
         try:
-            container = self.page.locator(WebTablesLocators.PAGINATION_CONTAINER)
+            container = self.locator(WebTablesLocators.PAGINATION_CONTAINER)
             if container.count() > 0 and container.is_visible():
-                buttons = self.page.locator(WebTablesLocators.PAGE_BUTTONS)
+                buttons = self.locator(WebTablesLocators.PAGE_BUTTONS)
                 pages = []
                 for i in range(buttons.count()):
                     txt = (buttons.nth(i).inner_text() or "").strip()
@@ -445,7 +445,7 @@ class WebTablesPage(BasePage):
     
     def go_to_page(self, page_num: int) -> bool:
         try:
-            buttons = self.page.locator(WebTablesLocators.PAGE_BUTTONS)
+            buttons = self.locator(WebTablesLocators.PAGE_BUTTONS)
             for i in range(buttons.count()):
                 if (buttons.nth(i).inner_text() or "").strip() == str(page_num):
                     buttons.nth(i).click()
@@ -459,7 +459,7 @@ class WebTablesPage(BasePage):
     
     def get_active_page_number(self) -> int:
         try:
-            active = self.page.locator(WebTablesLocators.ACTIVE_PAGE)
+            active = self.locator(WebTablesLocators.ACTIVE_PAGE)
             txt = (active.inner_text() or "").strip()
             return int(txt) if txt.isdigit() else 1
         except Exception:
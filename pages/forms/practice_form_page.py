@@ -121,19 +121,19 @@ class AutomationPracticeFormPage(BasePage):
         self.page.wait_for_timeout(500)
 
         # Выбираем месяц
-        month_dropdown = self.page.locator(
+        month_dropdown = self.locator(
             AutomationPracticeFormLocators.DATE_MONTH_SELECT
         )
         month_dropdown.select_option(full_month)
 
         # Выбираем год
-        year_dropdown = self.page.locator(
+        year_dropdown = self.locator(
             AutomationPracticeFormLocators.DATE_YEAR_SELECT
         )
         year_dropdown.select_option(year)
 
         # Выбираем день (исключая дни из других месяцев)
-        day_element = self.page.locator(f".react-datepicker__day--0{day.zfill(2)}:not(.react-datepicker__day--outside-month)")
+        day_element = self.locator(f".react-datepicker__day--0{day.zfill(2)}:not(.react-datepicker__day--outside-month)")
         day_element.click()
 
         # Закрываем календарь нажатием ESC и кликом на body
@@ -165,7 +165,7 @@ class AutomationPracticeFormPage(BasePage):
             subjects: Список предметов для добавления
         """
         self.log_step(f"Заполняем предметы: {subjects}")
-        subjects_input = self.page.locator(
+        subjects_input = self.locator(
             AutomationPracticeFormLocators.SUBJECTS_INPUT
         )
 
@@ -224,13 +224,13 @@ class AutomationPracticeFormPage(BasePage):
         """
         self.log_step(f"Выбираем штат: {state}")
         # Кликаем по dropdown для его открытия
-        state_dropdown = self.page.locator(
+        state_dropdown = self.locator(
             AutomationPracticeFormLocators.STATE_DROPDOWN
         )
         state_dropdown.click()
 
         # Выбираем опцию
-        option = self.page.locator(f".css-1n7v3ny-option:has-text('{state}')")
+        option = self.locator(f".css-1n7v3ny-option:has-text('{state}')")
         option.click()
 
     def select_city(self, city: str) -> None:
@@ -242,11 +242,11 @@ class AutomationPracticeFormPage(BasePage):
         """
         self.log_step(f"Выбираем город: {city}")
         # Кликаем по dropdown для его открытия
-        city_dropdown = self.page.locator(AutomationPracticeFormLocators.CITY_DROPDOWN)
+        city_dropdown = self.locator(AutomationPracticeFormLocators.CITY_DROPDOWN)
         city_dropdown.click()
 
         # Выбираем опцию
-        option = self.page.locator(f".css-1n7v3ny-option:has-text('{city}')")
+        option = self.locator(f".css-1n7v3ny-option:has-text('{city}')")
         option.click()
 
     def submit_form(self) -> None:
@@ -264,7 +264,7 @@ class AutomationPracticeFormPage(BasePage):
         Returns:
             bool: True если модальное окно с результатами видимо
         """
-        return self.page.locator(
+        return self.locator(
             AutomationPracticeFormLocators.MODAL_DIALOG
         ).is_visible()
 
@@ -294,7 +294,7 @@ class AutomationPracticeFormPage(BasePage):
             dict: Словарь с парами ключ-значение из таблицы результатов
         """
         results = {}
-        table_rows = self.page.locator(
+        table_rows = self.locator(
             f"{AutomationPracticeFormLocators.MODAL_TABLE} tbody tr"
         )
 
@@ -38,16 +38,11 @@ class DragabblePage(BasePage):
         Postconditions: элемент перемещен на новую позицию
         """
         self.log_step(f"Перетаскиваем элемент на смещение ({x_offset}, {y_offset})")
-        drag_box = self.page.locator(DragabbleLocators.DRAG_BOX)
-        box_bounding = drag_box.bounding_box()
-
-        start_x = box_bounding["x"] + box_bounding["width"] / 2
-        start_y = box_bounding["y"] + box_bounding["height"] / 2
-
-        self.page.mouse.move(start_x, start_y)
-        self.page.mouse.down()
-        self.page.mouse.move(start_x + x_offset, start_y + y_offset, steps=10)
-        self.page.mouse.up()
+        self.drag(
+            DragabbleLocators.DRAG_BOX,
+            offset=(x_offset, y_offset),
+            scope=DragabbleLocators.SIMPLE_TAB_PANE,
+        )
 
     def get_drag_box_position(self) -> tuple[float, float]:
         """
@@ -56,7 +51,7 @@ class DragabblePage(BasePage):
         Returns:
             tuple: Координаты (x, y) левого верхнего угла элемента
         """
-        drag_box = self.page.locator(DragabbleLocators.DRAG_BOX)
+        drag_box = self.locator(DragabbleLocators.DRAG_BOX)
         box_bounding = drag_box.bounding_box()
         return box_bounding["x"], box_bounding["y"]
 
@@ -82,25 +77,17 @@ class DragabblePage(BasePage):
         self.log_step(f"Перетаскиваем элемент с ограничением по оси {axis}")
 
         if axis == "x":
-            element = self.page.locator(DragabbleLocators.DRAG_BOX_AXIS_X)
+            self.drag(
+                DragabbleLocators.DRAG_BOX_AXIS_X,
+                offset=(offset, 0),
+                scope=DragabbleLocators.AXIS_TAB_PANE,
+            )
         elif axis == "y":
-            element = self.page.locator(DragabbleLocators.DRAG_BOX_AXIS_Y)
-        else:
-            return
-
-        box_bounding = element.bounding_box()
-        start_x = box_bounding["x"] + box_bounding["width"] / 2
-        start_y = box_bounding["y"] + box_bounding["height"] / 2
-
-        self.page.mouse.move(start_x, start_y)
-        self.page.mouse.down()
-
-        if axis == "x":
-            self.page.mouse.move(start_x + offset, start_y, steps=10)
-        else:
-            self.page.mouse.move(start_x, start_y + offset, steps=10)
-
-        self.page.mouse.up()
+            self.drag(
+                DragabbleLocators.DRAG_BOX_AXIS_Y,
+                offset=(0, offset),
+                scope=DragabbleLocators.AXIS_TAB_PANE,
+            )
 
     def container_restricted_tab(self) -> None:
         """
@@ -126,7 +113,6 @@ class DragabblePage(BasePage):
         Postconditions: элемент перемещен в пределах родительского контейнера
         """
         self.log_step(f"Перетаскиваем контейнерный элемент с ограничениями")
-        element = self.page.locator(locator)
 
         # Отключаем выделение текста для стабильности drag&drop
         self.page.eval_on_selector(
@@ -140,26 +126,14 @@ class DragabblePage(BasePage):
         """,
         )
 
-        box_bounding = element.bounding_box()
-        start_x = box_bounding["x"] + box_bounding["width"] / 2
-        start_y = box_bounding["y"] + box_bounding["height"] / 2
-
-        self.page.mouse.move(start_x, start_y)
-        self.page.mouse.down()
-
         steps = abs(y_offset) if vertical_only else max(abs(x_offset), abs(y_offset))
         steps = max(steps, 10)  # минимум 10 шагов для плавности
-
-        for step in range(1, steps + 1):
-            if vertical_only:
-                new_y = start_y + y_offset * step / steps
-                self.page.mouse.move(start_x, new_y)
-            else:
-                new_x = start_x + x_offset * step / steps
-                new_y = start_y + y_offset * step / steps
-                self.page.mouse.move(new_x, new_y)
-
-        self.page.mouse.up()
+        self.drag(
+            locator,
+            offset=(0 if vertical_only else x_offset, y_offset),
+            steps=steps,
+            scope=DragabbleLocators.CONTAINER_TAB_PANE,
+        )
 
         # Восстанавливаем возможность выделения текста
         self.page.eval_on_selector(
@@ -194,16 +168,9 @@ class DragabblePage(BasePage):
         Postconditions: элемент перемещен с демонстрацией стиля курсора
         """
         self.log_step(f"Перетаскиваем элемент с курсорным стилем: {locator}")
-        element = self.page.locator(locator)
-        box_bounding = element.bounding_box()
-
-        start_x = box_bounding["x"] + box_bounding["width"] / 2
-        start_y = box_bounding["y"] + box_bounding["height"] / 2
-
-        self.page.mouse.move(start_x, start_y)
-        self.page.mouse.down()
-        self.page.mouse.move(start_x + x_offset, start_y + y_offset, steps=10)
-        self.page.mouse.up()
+        self.drag(
+            locator, offset=(x_offset, y_offset), scope=DragabbleLocators.CURSOR_TAB_PANE
+        )
 
     # === Методы для совместимости с тестами ===
 
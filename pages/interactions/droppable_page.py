@@ -30,9 +30,11 @@ class DroppablePage(BasePage):
         Postconditions: drop box меняет цвет и текст на "Dropped!"
         """
         self.log_step("Перетаскиваем элемент в drop box")
-        drag_element = self.page.locator(DroppableLocators.DRAG_ME_BOX)
-        drop_element = self.page.locator(DroppableLocators.DROP_HERE_BOX)
-        drag_element.drag_to(drop_element)
+        self.drag(
+            DroppableLocators.SIMPLE_DRAG,
+            DroppableLocators.SIMPLE_DROP,
+            scope=DroppableLocators.SIMPLE_TAB_PANE,
+        )
 
     def get_drop_box_text(self) -> str:
         """
@@ -41,7 +43,7 @@ class DroppablePage(BasePage):
         Returns:
             str: Текущий текст в drop box
         """
-        return self.get_text_safe(DroppableLocators.DROP_HERE_BOX)
+        return self.get_text_safe(DroppableLocators.SIMPLE_DROP)
 
     def is_dropped(self) -> bool:
         """
@@ -58,7 +60,7 @@ class DroppablePage(BasePage):
         Postconditions: активна вкладка с acceptable и not acceptable элементами.
         """
         self.log_step("Переключаемся на вкладку Accept")
-        self.safe_click(DroppableLocators.TAB_ACCEPT)
+        self.safe_click(DroppableLocators.ACCEPT_TAB)
         time.sleep(1)
 
     def drag_acceptable_to_drop_box(self) -> None:
@@ -67,9 +69,11 @@ class DroppablePage(BasePage):
         Postconditions: drop принимает элемент, меняется цвет и текст.
         """
         self.log_step("Перетаскиваем acceptable элемент")
-        drag_element = self.page.locator(DroppableLocators.ACCEPTABLE)
-        drop_element = self.page.locator(DroppableLocators.DROP_HERE_BOX_ACCEPT)
-        drag_element.drag_to(drop_element)
+        self.drag(
+            DroppableLocators.ACCEPT_DRAG_ACCEPT,
+            DroppableLocators.ACCEPT_DROP,
+            scope=DroppableLocators.ACCEPT_TAB_PANE,
+        )
 
     def drag_not_acceptable_to_drop_box(self) -> None:
         """
@@ -77,9 +81,11 @@ class DroppablePage(BasePage):
         Postconditions: drop не принимает элемент, остается без изменений.
         """
         self.log_step("Перетаскиваем not acceptable элемент")
-        drag_element = self.page.locator(DroppableLocators.NOT_ACCEPTABLE)
-        drop_element = self.page.locator(DroppableLocators.DROP_HERE_BOX_ACCEPT)
-        drag_element.drag_to(drop_element)
+        self.drag(
+            DroppableLocators.ACCEPT_DRAG_NON_ACCEPT,
+            DroppableLocators.ACCEPT_DROP,
+            scope=DroppableLocators.ACCEPT_TAB_PANE,
+        )
 
     def get_accept_drop_box_text(self) -> str:
         """
@@ -88,7 +94,7 @@ class DroppablePage(BasePage):
         Returns:
             str: Текущий текст в accept drop box
         """
-        return self.get_text_safe(DroppableLocators.DROP_HERE_BOX_ACCEPT)
+        return self.get_text_safe(DroppableLocators.ACCEPT_DROP)
 
     def prevent_propogation_tab(self) -> None:
         """
@@ -96,7 +102,7 @@ class DroppablePage(BasePage):
         Postconditions: активна вкладка с nested drop boxes.
         """
         self.log_step("Переключаемся на вкладку Prevent Propogation")
-        self.safe_click(DroppableLocators.TAB_PREVENT_PROPOGATION)
+        self.safe_click(DroppableLocators.PREVENT_TAB)
         time.sleep(1)
 
     def drag_to_outer_drop_box(self) -> None:
@@ -105,9 +111,12 @@ class DroppablePage(BasePage):
         Postconditions: только внешний box меняется, внутренний остается.
         """
         self.log_step("Перетаскиваем во внешний drop box")
-        drag_element = self.page.locator(DroppableLocators.DRAG_BOX_PREVENT)
-        drop_element = self.page.locator(DroppableLocators.OUTER_DROP_BOX)
-        drag_element.drag_to(drop_element)
+        self.drag(
+            DroppableLocators.DRAG_BOX,
+            DroppableLocators.NOT_GREEDY_DROP_BOX,
+            drop=(0.5, 0.1),  # над заголовком, а не над внутренней областью
+            scope=DroppableLocators.PREVENT_TAB_PANE,
+        )
 
     def drag_to_inner_drop_box(self) -> None:
         """
@@ -115,9 +124,11 @@ class DroppablePage(BasePage):
         Postconditions: изменяется состояние внутреннего box.
         """
         self.log_step("Перетаскиваем во внутренний drop box")
-        drag_element = self.page.locator(DroppableLocators.DRAG_BOX_PREVENT)
-        drop_element = self.page.locator(DroppableLocators.INNER_DROP_BOX)
-        drag_element.drag_to(drop_element)
+        self.drag(
+            DroppableLocators.DRAG_BOX,
+            DroppableLocators.NOT_GREEDY_INNER_DROP_BOX,
+            scope=DroppableLocators.PREVENT_TAB_PANE,
+        )
 
     def get_outer_drop_box_text(self) -> str:
         """
@@ -126,7 +137,7 @@ class DroppablePage(BasePage):
         Returns:
             str: Текст внешнего drop box
         """
-        return self.get_text_safe(DroppableLocators.OUTER_DROP_BOX)
+        return self.get_text_safe(DroppableLocators.NOT_GREEDY_DROP_BOX)
 
     def get_inner_drop_box_text(self) -> str:
         """
@@ -135,7 +146,7 @@ class DroppablePage(BasePage):
         Returns:
             str: Текст внутреннего drop box
         """
-        return self.get_text_safe(DroppableLocators.INNER_DROP_BOX)
+        return self.get_text_safe(DroppableLocators.NOT_GREEDY_INNER_DROP_BOX)
 
     def revert_draggable_tab(self) -> None:
         """
@@ -143,7 +154,7 @@ class DroppablePage(BasePage):
         Postconditions: активна вкладка с revertible элементами.
         """
         self.log_step("Переключаемся на вкладку Revert Draggable")
-        self.safe_click(DroppableLocators.TAB_REVERT_DRAGGABLE)
+        self.safe_click(DroppableLocators.REVERT_TAB)
         time.sleep(1)
 
     # === Методы для совместимости с тестами ===
@@ -155,7 +166,7 @@ class DroppablePage(BasePage):
         Returns:
             tuple: (x, y) координаты элемента
         """
-        drag_element = self.page.locator(DroppableLocators.DRAG_ME_BOX)
+        drag_element = self.locator(DroppableLocators.SIMPLE_DRAG)
         box = drag_element.bounding_box()
         return int(box["x"]), int(box["y"])
 
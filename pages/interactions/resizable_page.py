@@ -3,9 +3,11 @@ Page Object для страницы Resizable.
 Содержит методы для изменения размеров элементов через drag handle.
 """
 
+from typing import Dict, Tuple
 from playwright.sync_api import Page
 from locators.interactions.resizable_locators import ResizableLocators
 from pages.base_page import BasePage
+from utils.geometry import read_layout
 
 
 class ResizablePage(BasePage):
@@ -34,18 +36,12 @@ class ResizablePage(BasePage):
         Postconditions: размер box изменен в пределах ограничений (150x150 - 500x300)
         """
         self.log_step(f"Изменяем размер ограниченного box на ({x_offset}, {y_offset})")
-        resize_handle = self.page.locator(ResizableLocators.RESIZE_HANDLE_RESTRICTED)
-
-        # Получаем позицию handle
-        handle_box = resize_handle.bounding_box()
-        handle_x = handle_box["x"] + handle_box["width"] / 2
-        handle_y = handle_box["y"] + handle_box["height"] / 2
-
-        # Выполняем drag для resize
-        self.page.mouse.move(handle_x, handle_y)
-        self.page.mouse.down()
-        self.page.mouse.move(handle_x + x_offset, handle_y + y_offset, steps=5)
-        self.page.mouse.up()
+        self.drag(
+            ResizableLocators.RESIZE_HANDLE_RESTRICTED,
+            offset=(x_offset, y_offset),
+            steps=5,
+            scope=ResizableLocators.RESIZABLE_BOX_RESTRICTED,
+        )
 
     def resize_box_no_restriction(self, x_offset: int, y_offset: int) -> None:
         """
@@ -60,18 +56,32 @@ class ResizablePage(BasePage):
         self.log_step(
             f"Изменяем размер неограниченного box на ({x_offset}, {y_offset})"
         )
-        resize_handle = self.page.locator(
-            ResizableLocators.RESIZE_HANDLE_NO_RESTRICTION
+        self.drag(
+            ResizableLocators.RESIZE_HANDLE_NO_RESTRICTION,
+            offset=(x_offset, y_offset),
+            steps=5,
+            scope=ResizableLocators.RESIZABLE_BOX_NO_RESTRICTION,
         )
 
-        handle_box = resize_handle.bounding_box()
-        handle_x = handle_box["x"] + handle_box["width"] / 2
-        handle_y = handle_box["y"] + handle_box["height"] / 2
+    def get_box_sizes(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Получает размеры обоих resizable box одним запросом к странице.
 
-        self.page.mouse.move(handle_x, handle_y)
-        self.page.mouse.down()
-        self.page.mouse.move(handle_x + x_offset, handle_y + y_offset, steps=5)
-        self.page.mouse.up()
+        Returns:
+            dict: {"restricted": (ширина, высота), "no_restriction": (ширина, высота)}
+        """
+        layout = read_layout(
+            self.page,
+            {
+                "restricted": ResizableLocators.RESIZABLE_BOX_RESTRICTED,
+                "no_restriction": ResizableLocators.RESIZABLE_BOX_NO_RESTRICTION,
+            },
+        )
+        sizes = {}
+        for name in ("restricted", "no_restriction"):
+            size = layout.size(name)
+            sizes[name] = int(size["width"]), int(size["height"])
+        return sizes
 
     def get_restricted_box_size(self) -> tuple[int, int]:
         """
@@ -80,9 +90,7 @@ class ResizablePage(BasePage):
         Returns:
             tuple: (ширина, высота) в пикселях
         """
-        box = self.page.locator(ResizableLocators.RESIZABLE_BOX_RESTRICTED)
-        bounding_box = box.bounding_box()
-        return int(bounding_box["width"]), int(bounding_box["height"])
+        return self.get_box_sizes()["restricted"]
 
     def get_no_restriction_box_size(self) -> tuple[int, int]:
         """
@@ -91,9 +99,7 @@ class ResizablePage(BasePage):
         Returns:
             tuple: (ширина, высота) в пикселях
         """
-        box = self.page.locator(ResizableLocators.RESIZABLE_BOX_NO_RESTRICTION)
-        bounding_box = box.bounding_box()
-        return int(bounding_box["width"]), int(bounding_box["height"])
+        return self.get_box_sizes()["no_restriction"]
 
     def get_free_box_size(self) -> tuple[int, int]:
         """
@@ -119,4 +125,4 @@ class ResizablePage(BasePage):
             if restricted
             else ResizableLocators.RESIZE_HANDLE_NO_RESTRICTION
         )
-        return self.page.locator(locator).is_visible()
+        return self.locator(locator).is_visible()
@@ -52,7 +52,7 @@ class SelectablePage(BasePage):
         Postconditions: элемент выделен, добавлен класс active
         """
         self.log_step(f"Выбираем элемент списка: {item_text}")
-        list_items = self.page.locator(SelectableLocators.LIST_ITEMS)
+        list_items = self.locator(SelectableLocators.LIST_ITEMS)
 
         for i in range(list_items.count()):
             item = list_items.nth(i)
@@ -70,7 +70,7 @@ class SelectablePage(BasePage):
         Postconditions: элемент по указанному индексу выделен
         """
         self.log_step(f"Выбираем элемент списка по индексу: {index}")
-        list_items = self.page.locator(SelectableLocators.LIST_ITEMS)
+        list_items = self.locator(SelectableLocators.LIST_ITEMS)
 
         if list_items.count() > index:
             list_items.nth(index).click()
@@ -85,7 +85,7 @@ class SelectablePage(BasePage):
         Postconditions: элемент сетки выделен, добавлен класс active
         """
         self.log_step(f"Выбираем элемент сетки: {item_text}")
-        grid_items = self.page.locator(SelectableLocators.GRID_ITEMS)
+        grid_items = self.locator(SelectableLocators.GRID_ITEMS)
 
         for i in range(grid_items.count()):
             item = grid_items.nth(i)
@@ -103,7 +103,7 @@ class SelectablePage(BasePage):
         Postconditions: элемент сетки по указанному индексу выделен
         """
         self.log_step(f"Выбираем элемент сетки по индексу: {index}")
-        grid_items = self.page.locator(SelectableLocators.GRID_ITEMS)
+        grid_items = self.locator(SelectableLocators.GRID_ITEMS)
 
         if grid_items.count() > index:
             grid_items.nth(index).click()
@@ -118,7 +118,7 @@ class SelectablePage(BasePage):
         Postconditions: все указанные элементы выделены
         """
         self.log_step(f"Выбираем несколько элементов списка: {indices}")
-        list_items = self.page.locator(SelectableLocators.LIST_ITEMS)
+        list_items = self.locator(SelectableLocators.LIST_ITEMS)
 
         for i, index in enumerate(indices):
             if list_items.count() > index:
@@ -139,7 +139,7 @@ class SelectablePage(BasePage):
         Postconditions: все указанные элементы сетки выделены
         """
         self.log_step(f"Выбираем несколько элементов сетки: {indices}")
-        grid_items = self.page.locator(SelectableLocators.GRID_ITEMS)
+        grid_items = self.locator(SelectableLocators.GRID_ITEMS)
 
         for i, index in enumerate(indices):
             if grid_items.count() > index:
@@ -157,7 +157,7 @@ class SelectablePage(BasePage):
         Returns:
             list: Список текстов выбранных элементов
         """
-        selected_items = self.page.locator(f"{SelectableLocators.LIST_ITEMS}.active")
+        selected_items = self.locator(f"{SelectableLocators.LIST_ITEMS}.active")
         return [
             selected_items.nth(i).inner_text() for i in range(selected_items.count())
         ]
@@ -169,7 +169,7 @@ class SelectablePage(BasePage):
         Returns:
             list: Список текстов выбранных элементов
         """
-        selected_items = self.page.locator(f"{SelectableLocators.GRID_ITEMS}.active")
+        selected_items = self.locator(f"{SelectableLocators.GRID_ITEMS}.active")
         return [
             selected_items.nth(i).inner_text() for i in range(selected_items.count())
         ]
@@ -181,7 +181,7 @@ class SelectablePage(BasePage):
         Returns:
             int: Количество элементов в списке
         """
-        return self.page.locator(SelectableLocators.LIST_ITEMS).count()
+        return self.locator(SelectableLocators.LIST_ITEMS).count()
 
     def get_grid_items_count(self) -> int:
         """
@@ -190,7 +190,7 @@ class SelectablePage(BasePage):
         Returns:
             int: Количество элементов в сетке
         """
-        return self.page.locator(SelectableLocators.GRID_ITEMS).count()
+        return self.locator(SelectableLocators.GRID_ITEMS).count()
 
     def clear_selection(self) -> None:
         """
@@ -199,7 +199,7 @@ class SelectablePage(BasePage):
         """
         self.log_step("Очищаем выделение")
         # Кликаем в пустое место контейнера
-        container = self.page.locator("#demo-tab-list, #demo-tab-grid")
+        container = self.locator("#demo-tab-list, #demo-tab-grid")
         if container.count() > 0:
             container.first.click(position={"x": 10, "y": 10})
 
@@ -213,7 +213,7 @@ class SelectablePage(BasePage):
         Returns:
             bool: True если элемент выбран (имеет класс active)
         """
-        list_items = self.page.locator(SelectableLocators.LIST_ITEMS)
+        list_items = self.locator(SelectableLocators.LIST_ITEMS)
         if list_items.count() > index:
             item_class = list_items.nth(index).get_attribute("class") or ""
             return "active" in item_class
@@ -229,7 +229,7 @@ class SelectablePage(BasePage):
         Returns:
             bool: True если элемент выбран (имеет класс active)
         """
-        grid_items = self.page.locator(SelectableLocators.GRID_ITEMS)
+        grid_items = self.locator(SelectableLocators.GRID_ITEMS)
         if grid_items.count() > index:
             item_class = grid_items.nth(index).get_attribute("class") or ""
             return "active" in item_class
@@ -244,7 +244,7 @@ class SelectablePage(BasePage):
         Returns:
             list: Список текстов всех элементов списка
         """
-        list_items = self.page.locator(SelectableLocators.LIST_ITEMS)
+        list_items = self.locator(SelectableLocators.LIST_ITEMS)
         return [
             list_items.nth(i).inner_text().strip() for i in range(list_items.count())
         ]
@@ -4,9 +4,11 @@ Page Object для страницы Sortable.
 """
 
 import time
+from typing import Sequence
 from playwright.sync_api import Page
 from locators.interactions.sortable_locators import SortableLocators
 from pages.base_page import BasePage
+from utils.reorder import apply_moves, plan_moves
 
 
 class SortablePage(BasePage):
@@ -23,6 +25,8 @@ class SortablePage(BasePage):
             page: Экземпляр страницы Playwright
         """
         super().__init__(page)
+        # Последний план перестановки reorder: [(from_index, to_index), ...]
+        self.last_plan: list[tuple[int, int]] = []
 
     def list_tab(self) -> None:
         """
@@ -44,27 +48,70 @@ class SortablePage(BasePage):
 
     def get_list_order(self) -> list[str]:
         """
-        Получает текущий порядок элементов в списке.
+        Получает текущий порядок элементов в списке (одним запросом к странице).
 
         Returns:
             list: Список текстов элементов в их текущем порядке
         """
-        list_items = self.page.locator(SortableLocators.LIST_ITEMS)
-        return [
-            list_items.nth(i).inner_text().strip() for i in range(list_items.count())
-        ]
+        return [text.strip() for text in self.locator(SortableLocators.LIST_ITEMS).all_inner_texts()]
 
     def get_grid_order(self) -> list[str]:
         """
-        Получает текущий порядок элементов в сетке.
+        Получает текущий порядок элементов в сетке (одним запросом к странице).
 
         Returns:
             list: Список текстов элементов в их текущем порядке
         """
-        grid_items = self.page.locator(SortableLocators.GRID_ITEMS)
-        return [
-            grid_items.nth(i).inner_text().strip() for i in range(grid_items.count())
-        ]
+        return [text.strip() for text in self.locator(SortableLocators.GRID_ITEMS).all_inner_texts()]
+
+    def reorder(self, target_order: Sequence[str], is_grid: bool = False) -> list[tuple[int, int]]:
+        """
+        Приводит список или сетку к целевому порядку минимальным числом перетаскиваний.
+
+        План (utils.reorder.plan_moves) строится по порядку, прочитанному один раз:
+        элементы наибольшей возрастающей подпоследовательности остаются на месте,
+        остальные перетаскиваются по одному разу. Итоговый порядок читается
+        и проверяется одним запросом после всех перетаскиваний.
+
+        Args:
+            target_order: Целевой порядок текстов элементов (перестановка текущего)
+            is_grid: True для сетки, False для списка
+
+        Returns:
+            list: Выполненные перемещения (from_index, to_index)
+
+        Raises:
+            ValueError: Если целевой порядок не является перестановкой текущего
+            AssertionError: Если итоговый порядок не совпал с целевым
+        """
+        read_order = self.get_grid_order if is_grid else self.get_list_order
+        template = SortableLocators.GRID_ITEM_AT if is_grid else SortableLocators.LIST_ITEM_AT
+        container = SortableLocators.GRID_CONTAINER if is_grid else SortableLocators.LIST_CONTAINER
+
+        moves = plan_moves(read_order(), target_order)
+        self.last_plan = moves
+        self.log_step(f"План перестановки: {len(moves)} перетаскиваний {moves}")
+        for from_index, to_index in moves:
+            self.drag(
+                template.format(from_index + 1),
+                template.format(to_index + 1),
+                steps=15,
+                scope=container,
+            )
+
+        final_order = read_order()
+        if final_order != list(target_order):
+            raise AssertionError(
+                f"Порядок после перестановки {final_order}, ожидался {list(target_order)}"
+            )
+        return moves
+
+    def _drag_item(self, is_grid: bool, from_index: int, to_index: int) -> None:
+        """Перемещает элемент с позиции from_index на to_index с проверкой порядка."""
+        order = self.get_grid_order() if is_grid else self.get_list_order()
+        if len(order) <= max(from_index, to_index):
+            return
+        self.reorder(apply_moves(order, [(from_index, to_index)]), is_grid)
 
     def drag_list_item(self, from_index: int, to_index: int) -> None:
         """
@@ -74,19 +121,15 @@ class SortablePage(BasePage):
             from_index: Исходный индекс элемента (начиная с 0)
             to_index: Целевой индекс для перемещения
 
+        Raises:
+            AssertionError: Если после перетаскивания порядок не соответствует перемещению
+
         Postconditions: элемент перемещен на новую позицию, порядок списка изменен
         """
         self.log_step(
             f"Перетаскиваем элемент списка с позиции {from_index} на {to_index}"
         )
-        list_items = self.page.locator(SortableLocators.LIST_ITEMS)
-
-        if list_items.count() > max(from_index, to_index):
-            source = list_items.nth(from_index)
-            target = list_items.nth(to_index)
-
-            source.drag_to(target)
-            time.sleep(500)  # Пауза для стабилизации
+        self._drag_item(False, from_index, to_index)
 
     def drag_grid_item(self, from_index: int, to_index: int) -> None:
         """
@@ -96,19 +139,25 @@ class SortablePage(BasePage):
             from_index: Исходный индекс элемента (начиная с 0)
             to_index: Целевой индекс для перемещения
 
+        Raises:
+            AssertionError: Если после перетаскивания порядок не соответствует перемещению
+
         Postconditions: элемент перемещен на новую позицию в сетке
         """
         self.log_step(
             f"Перетаскиваем элемент сетки с позиции {from_index} на {to_index}"
         )
-        grid_items = self.page.locator(SortableLocators.GRID_ITEMS)
-
-        if grid_items.count() > max(from_index, to_index):
-            source = grid_items.nth(from_index)
-            target = grid_items.nth(to_index)
-
-            source.drag_to(target)
-            time.sleep(500)  # Пауза для стабилизации
+        self._drag_item(True, from_index, to_index)
+
+    def _move_item_to_position(self, is_grid: bool, item_text: str, target_position: int) -> None:
+        """Перемещает элемент с указанным текстом на позицию одним перетаскиванием."""
+        order = self.get_grid_order() if is_grid else self.get_list_order()
+        if item_text not in order:
+            self.log_step(f"Элемент '{item_text}' не найден в {'сетке' if is_grid else 'списке'}")
+            return
+        target = [item for item in order if item != item_text]
+        target.insert(target_position, item_text)
+        self.reorder(target, is_grid)
 
     def move_list_item_to_position(self, item_text: str, target_position: int) -> None:
         """
@@ -121,13 +170,7 @@ class SortablePage(BasePage):
         Postconditions: элемент с указанным текстом перемещен на целевую позицию
         """
         self.log_step(f"Перемещаем элемент '{item_text}' на позицию {target_position}")
-        current_order = self.get_list_order()
-
-        try:
-            current_index = current_order.index(item_text)
-            self.drag_list_item(current_index, target_position)
-        except ValueError:
-            self.log_step(f"Элемент '{item_text}' не найден в списке")
+        self._move_item_to_position(False, item_text, target_position)
 
     def move_grid_item_to_position(self, item_text: str, target_position: int) -> None:
         """
@@ -142,30 +185,21 @@ class SortablePage(BasePage):
         self.log_step(
             f"Перемещаем элемент сетки '{item_text}' на позицию {target_position}"
         )
-        current_order = self.get_grid_order()
-
-        try:
-            current_index = current_order.index(item_text)
-            self.drag_grid_item(current_index, target_position)
-        except ValueError:
-            self.log_step(f"Элемент '{item_text}' не найден в сетке")
+        self._move_item_to_position(True, item_text, target_position)
 
     def reverse_list_order(self) -> None:
         """
-        Изменяет порядок элементов списка на обратный.
+        Изменяет порядок элементов списка на обратный
+        (n - 1 перетаскиваний по плану reorder).
         Postconditions: элементы списка расположены в обратном порядке.
         """
         self.log_step("Изменяем порядок списка на обратный")
-        list_count = self.page.locator(SortableLocators.LIST_ITEMS).count()
-
-        # Перемещаем элементы с конца в начало
-        for i in range(list_count - 1, 0, -1):
-            self.drag_list_item(i, 0)
-            time.sleep(200)
+        self.reorder(self.get_list_order()[::-1])
 
     def shuffle_list_items(self, moves: list[tuple[int, int]]) -> None:
         """
-        Выполняет серию перестановок элементов списка.
+        Выполняет серию перестановок элементов списка. Итоговый порядок серии
+        вычисляется заранее и достигается минимальным числом перетаскиваний.
 
         Args:
             moves: Список кортежей (from_index, to_index) для перестановок
@@ -173,9 +207,9 @@ class SortablePage(BasePage):
         Postconditions: выполнены все указанные перестановки
         """
         self.log_step(f"Выполняем серию перестановок: {moves}")
-        for from_idx, to_idx in moves:
-            self.drag_list_item(from_idx, to_idx)
-            time.sleep(300)
+        order = self.get_list_order()
+        valid = [move for move in moves if max(move) < len(order)]
+        self.reorder(apply_moves(order, valid))
 
     def verify_list_order(self, expected_order: list[str]) -> bool:
         """
@@ -231,9 +265,9 @@ class SortablePage(BasePage):
             int: Количество элементов
         """
         if is_grid:
-            return self.page.locator(SortableLocators.GRID_ITEMS).count()
+            return self.locator(SortableLocators.GRID_ITEMS).count()
         else:
-            return self.page.locator(SortableLocators.LIST_ITEMS).count()
+            return self.locator(SortableLocators.LIST_ITEMS).count()
 
     # === Методы для совместимости с тестами ===
 
@@ -123,7 +123,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_CONTENT
         ]
         try:
-            return self.page.locator(contents[index]).is_visible()
+            return self.locator(contents[index]).is_visible()
         except:
             return False
 
@@ -143,7 +143,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_CONTENT
         ]
         try:
-            bbox = self.page.locator(contents[index]).bounding_box()
+            bbox = self.locator(contents[index]).bounding_box()
             return int(bbox['height']) if bbox else 0
         except:
             return 0
@@ -164,7 +164,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_CONTENT
         ]
         try:
-            return self.page.locator(contents[index]).locator("*").count()
+            return self.locator(contents[index]).locator("*").count()
         except:
             return 0
 
@@ -205,7 +205,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_HEADER
         ]
         try:
-            return self.page.locator(headers[index]).evaluate("el => el === document.activeElement")
+            return self.locator(headers[index]).evaluate("el => el === document.activeElement")
         except:
             return False
 
@@ -258,8 +258,8 @@ class AccordionPage(BasePage):
             ]
             info = {}
             for i, header in enumerate(headers):
-                tabindex = self.page.locator(header).get_attribute("tabindex")
-                aria_expanded = self.page.locator(header).get_attribute("aria-expanded")
+                tabindex = self.locator(header).get_attribute("tabindex")
+                aria_expanded = self.locator(header).get_attribute("aria-expanded")
                 info[f"section_{i+1}"] = {
                     "tabindex": tabindex,
                     "aria_expanded": aria_expanded
@@ -295,7 +295,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_CONTENT
         ]
         try:
-            self.page.locator(contents[index]).wait_for(state="visible", timeout=timeout)
+            self.locator(contents[index]).wait_for(state="visible", timeout=timeout)
             return True
         except:
             return False
@@ -317,7 +317,7 @@ class AccordionPage(BasePage):
             AccordionLocators.THIRD_SECTION_CONTENT
         ]
         try:
-            self.page.locator(contents[index]).wait_for(state="hidden", timeout=timeout)
+            self.locator(contents[index]).wait_for(state="hidden", timeout=timeout)
             return True
         except:
             return False
@@ -405,7 +405,7 @@ class AccordionPage(BasePage):
         ]
 
         header_text = self.get_text_safe(headers[index])
-        is_expanded = self.page.locator(contents[index]).is_visible()
+        is_expanded = self.locator(contents[index]).is_visible()
 
         return {
             "header_text": header_text,
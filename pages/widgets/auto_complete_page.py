@@ -3,10 +3,10 @@ Page Object для страницы AutoComplete.
 Содержит методы для тестирования полей с автодополнением.
 """
 
-import time
 from playwright.sync_api import Page
 from locators.widgets.autocomplete_locators import AutoCompleteLocators
-from pages.base_page import BasePage
+from pages.base_page import BasePage, VISIBLE_PREDICATE
+from utils.helper import WaitHelper
 
 
 class AutoCompletePage(BasePage):
@@ -24,6 +24,17 @@ class AutoCompletePage(BasePage):
         """
         super().__init__(page)
 
+    def _wait_for_suggestions(self, options_selector: str) -> bool:
+        """Ждет в браузере, пока появятся подсказки или сообщение об их отсутствии."""
+        return self.wait_until(
+            WaitHelper.any_of(
+                self.browser_condition(VISIBLE_PREDICATE, options_selector, name="suggestions"),
+                self.browser_condition(
+                    VISIBLE_PREDICATE, AutoCompleteLocators.NO_OPTIONS_MESSAGE, name="no_options"
+                ),
+            )
+        )
+
     def fill_multiple_colors(self, colors: list[str]) -> None:
         """
         Заполняет поле множественного выбора цветов.
@@ -34,15 +45,15 @@ class AutoCompletePage(BasePage):
         Postconditions: выбранные цвета отображаются как теги в поле
         """
         self.log_step(f"Заполняем множественное поле цветами: {colors}")
-        input_field = self.page.locator(AutoCompleteLocators.MULTIPLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.MULTIPLE_INPUT)
 
         for color in colors:
             input_field.click()
             input_field.fill(color)
-            time.sleep(500)  # Ждем появления dropdown
+            self._wait_for_suggestions(AutoCompleteLocators.MULTIPLE_OPTIONS)
 
             # Выбираем первый вариант из dropdown
-            suggestions = self.page.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
+            suggestions = self.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
             if suggestions.count() > 0:
                 suggestions.first.click()
 
@@ -56,13 +67,13 @@ class AutoCompletePage(BasePage):
         Postconditions: выбранный цвет отображается в поле
         """
         self.log_step(f"Заполняем одиночное поле цветом: {color}")
-        input_field = self.page.locator(AutoCompleteLocators.SINGLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.SINGLE_INPUT)
 
         input_field.click()
         input_field.fill(color)
-        time.sleep(500)  # Ждем появления dropdown
+        self._wait_for_suggestions(AutoCompleteLocators.SINGLE_OPTIONS)
 
-        suggestions = self.page.locator(AutoCompleteLocators.SINGLE_OPTIONS)
+        suggestions = self.locator(AutoCompleteLocators.SINGLE_OPTIONS)
         if suggestions.count() > 0:
             suggestions.first.click()
 
@@ -74,7 +85,7 @@ class AutoCompletePage(BasePage):
             list: Список выбранных цветов
         """
         values = []
-        tags = self.page.locator(AutoCompleteLocators.MULTIPLE_VALUES)
+        tags = self.locator(AutoCompleteLocators.MULTIPLE_VALUES)
 
         for i in range(tags.count()):
             tag_text = tags.nth(i).inner_text()
@@ -89,7 +100,7 @@ class AutoCompletePage(BasePage):
         Returns:
             str: Выбранный цвет или пустая строка
         """
-        input_field = self.page.locator(AutoCompleteLocators.SINGLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.SINGLE_INPUT)
         return input_field.input_value().strip()
 
     def remove_multiple_value(self, index: int = 0) -> None:
@@ -102,7 +113,7 @@ class AutoCompletePage(BasePage):
         Postconditions: указанный тег удален из поля
         """
         self.log_step(f"Удаляем значение с индексом {index}")
-        remove_buttons = self.page.locator(AutoCompleteLocators.REMOVE_VALUE)
+        remove_buttons = self.locator(AutoCompleteLocators.REMOVE_VALUE)
 
         if remove_buttons.count() > index:
             remove_buttons.nth(index).click()
@@ -113,7 +124,7 @@ class AutoCompletePage(BasePage):
         Postconditions: поле очищено от выбранного значения.
         """
         self.log_step("Очищаем одиночное поле")
-        clear_button = self.page.locator(AutoCompleteLocators.SINGLE_CLEAR)
+        clear_button = self.locator(AutoCompleteLocators.SINGLE_CLEAR)
         if clear_button.is_visible():
             clear_button.click()
 
@@ -132,7 +143,7 @@ class AutoCompletePage(BasePage):
             if multiple
             else AutoCompleteLocators.SINGLE_OPTIONS
         )
-        return self.page.locator(locator).count() > 0
+        return self.locator(locator).count() > 0
 
     def get_dropdown_options(self, multiple: bool = True) -> list[str]:
         """
@@ -149,7 +160,7 @@ class AutoCompletePage(BasePage):
             if multiple
             else AutoCompleteLocators.SINGLE_OPTIONS
         )
-        options = self.page.locator(locator)
+        options = self.locator(locator)
 
         return [options.nth(i).inner_text() for i in range(options.count())]
 
@@ -162,7 +173,7 @@ class AutoCompletePage(BasePage):
         Returns:
             bool: True если поле присутствует
         """
-        return self.page.locator(AutoCompleteLocators.SINGLE_INPUT).is_visible()
+        return self.locator(AutoCompleteLocators.SINGLE_INPUT).is_visible()
 
     def is_multiple_auto_complete_input_present(self) -> bool:
         """
@@ -171,7 +182,7 @@ class AutoCompletePage(BasePage):
         Returns:
             bool: True если поле присутствует
         """
-        return self.page.locator(AutoCompleteLocators.MULTIPLE_INPUT).is_visible()
+        return self.locator(AutoCompleteLocators.MULTIPLE_INPUT).is_visible()
 
     # === ДОПОЛНИТЕЛЬНЫЕ МЕТОДЫ ДЛЯ ТЕСТОВ ===
 
@@ -181,11 +192,11 @@ class AutoCompletePage(BasePage):
         """
         self.log_step("Очищаем поле одиночного автодополнения")
         # Для React Select нужно кликнуть на контейнер, а не на input
-        container = self.page.locator(AutoCompleteLocators.SINGLE_CONTAINER)
+        container = self.locator(AutoCompleteLocators.SINGLE_CONTAINER)
         container.click()
 
         # Проверяем, есть ли кнопка очистки
-        clear_button = self.page.locator(AutoCompleteLocators.SINGLE_CLEAR)
+        clear_button = self.locator(AutoCompleteLocators.SINGLE_CLEAR)
         if clear_button.is_visible():
             clear_button.click()
         else:
@@ -200,7 +211,7 @@ class AutoCompletePage(BasePage):
         Returns:
             str: Текущее значение поля
         """
-        input_field = self.page.locator(AutoCompleteLocators.SINGLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.SINGLE_INPUT)
         return input_field.input_value()
 
     def type_in_single_input(self, text: str) -> None:
@@ -212,11 +223,11 @@ class AutoCompletePage(BasePage):
         """
         self.log_step(f"Вводим текст в одиночное поле: '{text}'")
         # Сначала кликаем на контейнер, чтобы активировать поле
-        container = self.page.locator(AutoCompleteLocators.SINGLE_CONTAINER)
+        container = self.locator(AutoCompleteLocators.SINGLE_CONTAINER)
         container.click()
 
         # Затем вводим текст
-        input_field = self.page.locator(AutoCompleteLocators.SINGLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.SINGLE_INPUT)
         input_field.fill(text)
 
     def are_single_suggestions_visible(self) -> bool:
@@ -226,7 +237,7 @@ class AutoCompletePage(BasePage):
         Returns:
             bool: True если предложения видны
         """
-        return self.page.locator(AutoCompleteLocators.SINGLE_OPTIONS).count() > 0
+        return self.locator(AutoCompleteLocators.SINGLE_OPTIONS).count() > 0
 
     def get_single_suggestions_list(self) -> list[str]:
         """
@@ -235,7 +246,7 @@ class AutoCompletePage(BasePage):
         Returns:
             list: Список текстов предложений
         """
-        options = self.page.locator(AutoCompleteLocators.SINGLE_OPTIONS)
+        options = self.locator(AutoCompleteLocators.SINGLE_OPTIONS)
         return [options.nth(i).inner_text() for i in range(options.count())]
 
     def select_first_single_suggestion(self) -> bool:
@@ -246,7 +257,7 @@ class AutoCompletePage(BasePage):
             bool: True если выбор успешен
         """
         try:
-            options = self.page.locator(AutoCompleteLocators.SINGLE_OPTIONS)
+            options = self.locator(AutoCompleteLocators.SINGLE_OPTIONS)
             if options.count() > 0:
                 options.first.click()
                 return True
@@ -260,7 +271,7 @@ class AutoCompletePage(BasePage):
         """
         self.log_step("Очищаем множественное поле автодополнения")
         # Удаляем все выбранные значения
-        remove_buttons = self.page.locator(AutoCompleteLocators.REMOVE_VALUE)
+        remove_buttons = self.locator(AutoCompleteLocators.REMOVE_VALUE)
         count = remove_buttons.count()
         for i in range(count):
             try:
@@ -277,7 +288,7 @@ class AutoCompletePage(BasePage):
             list: Список выбранных значений
         """
         values = []
-        tags = self.page.locator(AutoCompleteLocators.MULTIPLE_VALUES)
+        tags = self.locator(AutoCompleteLocators.MULTIPLE_VALUES)
         for i in range(tags.count()):
             tag_text = tags.nth(i).inner_text()
             values.append(tag_text.strip())
@@ -292,11 +303,11 @@ class AutoCompletePage(BasePage):
         """
         self.log_step(f"Вводим текст в множественное поле: '{text}'")
         # Кликаем на контейнер множественного поля
-        container = self.page.locator(AutoCompleteLocators.MULTIPLE_CONTAINER)
+        container = self.locator(AutoCompleteLocators.MULTIPLE_CONTAINER)
         container.click()
 
         # Затем вводим текст в input поле
-        input_field = self.page.locator(AutoCompleteLocators.MULTIPLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.MULTIPLE_INPUT)
         input_field.fill(text)
 
     def are_multiple_suggestions_visible(self) -> bool:
@@ -306,7 +317,7 @@ class AutoCompletePage(BasePage):
         Returns:
             bool: True если предложения видны
         """
-        return self.page.locator(AutoCompleteLocators.MULTIPLE_OPTIONS).count() > 0
+        return self.locator(AutoCompleteLocators.MULTIPLE_OPTIONS).count() > 0
 
     def get_multiple_suggestions_list(self) -> list[str]:
         """
@@ -315,7 +326,7 @@ class AutoCompletePage(BasePage):
         Returns:
             list: Список текстов предложений
         """
-        options = self.page.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
+        options = self.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
         return [options.nth(i).inner_text() for i in range(options.count())]
 
     def select_multiple_suggestion_by_text(self, text: str) -> bool:
@@ -329,7 +340,7 @@ class AutoCompletePage(BasePage):
             bool: True если выбор успешен
         """
         try:
-            options = self.page.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
+            options = self.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
             for i in range(options.count()):
                 option_text = options.nth(i).inner_text()
                 if text.lower() in option_text.lower():
@@ -347,7 +358,7 @@ class AutoCompletePage(BasePage):
             bool: True если выбор успешен
         """
         try:
-            options = self.page.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
+            options = self.locator(AutoCompleteLocators.MULTIPLE_OPTIONS)
             if options.count() > 0:
                 options.first.click()
                 return True
@@ -360,7 +371,7 @@ class AutoCompletePage(BasePage):
         Очищает текстовое поле множественного автодополнения (не выбранные значения).
         """
         self.log_step("Очищаем текстовое поле множественного автодополнения")
-        input_field = self.page.locator(AutoCompleteLocators.MULTIPLE_INPUT)
+        input_field = self.locator(AutoCompleteLocators.MULTIPLE_INPUT)
         input_field.click()
         input_field.clear()
 
@@ -375,7 +386,7 @@ class AutoCompletePage(BasePage):
             bool: True если удаление успешно
         """
         try:
-            remove_buttons = self.page.locator(AutoCompleteLocators.REMOVE_VALUE)
+            remove_buttons = self.locator(AutoCompleteLocators.REMOVE_VALUE)
             if remove_buttons.count() > index:
                 remove_buttons.nth(index).click()
                 return True
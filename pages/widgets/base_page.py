@@ -3,10 +3,9 @@
 Расширяет функциональность основного BasePage специфичными для виджетов методами.
 """
 
-import time
 import logging
 from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BasePage, CLASS_CONTAINS_PREDICATE
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +57,7 @@ class WidgetBasePage(BasePage):
             wait_time: Время ожидания эффекта в миллисекундах
         """
         self.log_step(f"Наводим курсор на элемент: {selector}")
-        self.page.hover(selector)
+        self._first(selector).hover()
         self.page.wait_for_timeout(wait_time)
 
     def wait_for_dropdown_to_appear(
@@ -75,9 +74,7 @@ class WidgetBasePage(BasePage):
             bool: True если dropdown появился
         """
         try:
-            self.page.wait_for_selector(
-                dropdown_selector, state="visible", timeout=timeout
-            )
+            self.wait_for_visible(dropdown_selector, timeout)
             return True
         except:
             return False
@@ -95,7 +92,7 @@ class WidgetBasePage(BasePage):
         """
         self.log_step(f"Выбираем опцию в dropdown: {option_text}")
         try:
-            option = self.page.locator(f"{dropdown_selector} >> text={option_text}")
+            option = self.locator(f"{dropdown_selector} >> text={option_text}")
             if option.is_visible():
                 option.click()
                 return True
@@ -118,15 +115,10 @@ class WidgetBasePage(BasePage):
             bool: True если состояние изменилось
         """
         self.log_step(f"Ожидаем изменения состояния виджета: {expected_class}")
-        start_time = time.time()
-
-        while time.time() - start_time < timeout / 1000:
-            current_class = self.page.get_attribute(element_selector, "class") or ""
-            if expected_class in current_class:
-                return True
-            time.sleep(0.1)
-
-        return False
+        condition = self.browser_condition(
+            CLASS_CONTAINS_PREDICATE, [element_selector, expected_class], name="widget_state"
+        )
+        return self.wait_until(condition, timeout)
 
     def get_widget_attribute(self, selector: str, attribute: str) -> str:
         """
@@ -140,7 +132,7 @@ class WidgetBasePage(BasePage):
             str: Значение атрибута или пустая строка
         """
         try:
-            return self.page.get_attribute(selector, attribute) or ""
+            return self._first(selector).get_attribute(attribute) or ""
         except:
             return ""
 
@@ -152,7 +144,7 @@ class WidgetBasePage(BasePage):
             selector: CSS селектор элемента
         """
         self.log_step(f"Прокручиваем до элемента: {selector}")
-        self.page.locator(selector).scroll_into_view_if_needed()
+        self.locator(selector).scroll_into_view_if_needed()
 
     def wait_for_tooltip(
         self, tooltip_selector: str = ".tooltip", timeout: int = 3000
@@ -169,9 +161,7 @@ class WidgetBasePage(BasePage):
         """
         self.log_step("Ожидаем появления tooltip")
         try:
-            self.page.wait_for_selector(
-                tooltip_selector, state="visible", timeout=timeout
-            )
+            self.wait_for_visible(tooltip_selector, timeout)
             return True
         except:
             return False
@@ -3,9 +3,11 @@ Page Object для страницы Date Picker.
 Содержит методы для работы с календарем и выбором даты/времени.
 """
 
-import time
+from typing import Optional
 from playwright.sync_api import Page
+from data import Timeouts
 from locators.widgets.datepicker_locators import DatePickerLocators
+from pages.base_page import TEXT_CHANGED_PREDICATE
 from pages.widgets.base_page import WidgetBasePage
 
 
@@ -31,7 +33,7 @@ class DatePickerPage(WidgetBasePage):
         """
         self.log_step("Открываем date picker")
         self.safe_click(DatePickerLocators.DATE_INPUT)
-        self.wait_for_visible(".react-datepicker", timeout=3000)
+        self.wait_for_visible(".react-datepicker", default=Timeouts.SHORT)
 
     def open_date_time_picker(self) -> None:
         """
@@ -40,7 +42,7 @@ class DatePickerPage(WidgetBasePage):
         """
         self.log_step("Открываем date time picker")
         self.safe_click(DatePickerLocators.DATE_TIME_INPUT)
-        self.wait_for_visible(".react-datepicker", timeout=3000)
+        self.wait_for_visible(".react-datepicker", default=Timeouts.SHORT)
 
     def select_date(self, day: str, month: str = None, year: str = None) -> None:
         """
@@ -57,13 +59,13 @@ class DatePickerPage(WidgetBasePage):
 
         # Если указан год, выбираем его
         if year:
-            year_dropdown = self.page.locator(DatePickerLocators.YEAR_DROPDOWN)
+            year_dropdown = self.locator(DatePickerLocators.YEAR_DROPDOWN)
             if year_dropdown.is_visible():
                 year_dropdown.select_option(year)
 
         # Если указан месяц, выбираем его
         if month:
-            month_dropdown = self.page.locator(DatePickerLocators.MONTH_DROPDOWN)
+            month_dropdown = self.locator(DatePickerLocators.MONTH_DROPDOWN)
             if month_dropdown.is_visible():
                 month_dropdown.select_option(month)
 
@@ -72,12 +74,12 @@ class DatePickerPage(WidgetBasePage):
         day_normalized = day.zfill(2)
         day_selector = f".react-datepicker__day--0{day_normalized}:not(.react-datepicker__day--outside-month)"
 
-        day_element = self.page.locator(day_selector).first
+        day_element = self.locator(day_selector).first
         if day_element.is_visible():
             day_element.click()
         else:
             # Альтернативный способ - поиск по тексту
-            day_elements = self.page.locator(
+            day_elements = self.locator(
                 f".react-datepicker__day:not(.react-datepicker__day--outside-month)"
             )
             for i in range(day_elements.count()):
@@ -99,10 +101,10 @@ class DatePickerPage(WidgetBasePage):
         self.log_step(f"Выбираем время: {hour}:{minute}")
 
         # Кликаем по полю времени если оно есть
-        time_input = self.page.locator(".react-datepicker__time-container")
+        time_input = self.locator(".react-datepicker__time-container")
         if time_input.is_visible():
             # Ищем нужное время в списке
-            time_option = self.page.locator(f"text={hour}:{minute}")
+            time_option = self.locator(f"text={hour}:{minute}")
             if time_option.is_visible():
                 time_option.click()
 
@@ -113,7 +115,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             str: Выбранная дата в формате поля ввода
         """
-        date_input = self.page.locator(DatePickerLocators.DATE_INPUT)
+        date_input = self.locator(DatePickerLocators.DATE_INPUT)
         return date_input.input_value()
 
     def get_selected_date_time(self) -> str:
@@ -123,7 +125,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             str: Выбранная дата и время в формате поля ввода
         """
-        datetime_input = self.page.locator(DatePickerLocators.DATE_TIME_INPUT)
+        datetime_input = self.locator(DatePickerLocators.DATE_TIME_INPUT)
         return datetime_input.input_value()
 
     def clear_date(self) -> None:
@@ -132,7 +134,7 @@ class DatePickerPage(WidgetBasePage):
         Postconditions: поле даты очищено.
         """
         self.log_step("Очищаем поле даты")
-        date_input = self.page.locator(DatePickerLocators.DATE_INPUT)
+        date_input = self.locator(DatePickerLocators.DATE_INPUT)
         date_input.clear()
 
     def clear_date_time(self) -> None:
@@ -141,7 +143,7 @@ class DatePickerPage(WidgetBasePage):
         Postconditions: поле даты и времени очищено.
         """
         self.log_step("Очищаем поле даты и времени")
-        datetime_input = self.page.locator(DatePickerLocators.DATE_TIME_INPUT)
+        datetime_input = self.locator(DatePickerLocators.DATE_TIME_INPUT)
         datetime_input.clear()
 
     def is_calendar_visible(self) -> bool:
@@ -151,7 +153,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             bool: True если календарь открыт и видим
         """
-        return self.page.locator(".react-datepicker").is_visible()
+        return self.locator(".react-datepicker").is_visible()
 
     def close_calendar(self) -> None:
         """
@@ -162,6 +164,16 @@ class DatePickerPage(WidgetBasePage):
         # Кликаем в пустое место рядом с календарем
         self.page.click("body", position={"x": 10, "y": 10})
 
+    def _wait_for_month_change(self, header: Optional[str]) -> bool:
+        """Ждет в браузере смены заголовка месяца после перехода."""
+        return self.wait_until(
+            self.browser_condition(
+                TEXT_CHANGED_PREDICATE,
+                [DatePickerLocators.MONTH_YEAR_HEADER, header],
+                name="month_header",
+            )
+        )
+
     def navigate_to_previous_month(self) -> bool:
         """
         Переходит к предыдущему месяцу в календаре.
@@ -173,11 +185,11 @@ class DatePickerPage(WidgetBasePage):
         """
         self.log_step("Переходим к предыдущему месяцу")
         try:
-            prev_button = self.page.locator(".react-datepicker__navigation--previous")
+            prev_button = self.locator(".react-datepicker__navigation--previous")
             if prev_button.is_visible():
+                header = self.page.text_content(DatePickerLocators.MONTH_YEAR_HEADER)
                 prev_button.click()
-                time.sleep(0.5)
-                return True
+                return self._wait_for_month_change(header)
             return False
         except Exception as e:
             self.log_step(f"Ошибка при навигации к предыдущему месяцу: {e}")
@@ -194,11 +206,11 @@ class DatePickerPage(WidgetBasePage):
         """
         self.log_step("Переходим к следующему месяцу")
         try:
-            next_button = self.page.locator(".react-datepicker__navigation--next")
+            next_button = self.locator(".react-datepicker__navigation--next")
             if next_button.is_visible():
+                header = self.page.text_content(DatePickerLocators.MONTH_YEAR_HEADER)
                 next_button.click()
-                time.sleep(0.5)
-                return True
+                return self._wait_for_month_change(header)
             return False
         except Exception as e:
             self.log_step(f"Ошибка при навигации к следующему месяцу: {e}")
@@ -211,7 +223,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             str: Месяц и год в формате "January 2024"
         """
-        month_year = self.page.locator(".react-datepicker__current-month")
+        month_year = self.locator(".react-datepicker__current-month")
         if month_year.is_visible():
             return month_year.inner_text()
         return ""
@@ -222,7 +234,7 @@ class DatePickerPage(WidgetBasePage):
         Postconditions: выбрана текущая дата.
         """
         self.log_step("Выбираем сегодняшнюю дату")
-        today_button = self.page.locator(".react-datepicker__day--today")
+        today_button = self.locator(".react-datepicker__day--today")
         if today_button.is_visible():
             today_button.click()
 
@@ -239,9 +251,9 @@ class DatePickerPage(WidgetBasePage):
         self.log_step(f"Устанавливаем дату вводом: {date_string}")
 
         if is_datetime:
-            input_field = self.page.locator(DatePickerLocators.DATE_TIME_INPUT)
+            input_field = self.locator(DatePickerLocators.DATE_TIME_INPUT)
         else:
-            input_field = self.page.locator(DatePickerLocators.DATE_INPUT)
+            input_field = self.locator(DatePickerLocators.DATE_INPUT)
 
         input_field.clear()
         input_field.type(date_string)
@@ -257,7 +269,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             bool: True если поле присутствует
         """
-        return self.page.locator(DatePickerLocators.DATE_INPUT).is_visible()
+        return self.locator(DatePickerLocators.DATE_INPUT).is_visible()
 
     def clear_date_input(self) -> None:
         """
@@ -272,7 +284,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             bool: True если поле присутствует
         """
-        return self.page.locator(DatePickerLocators.DATE_TIME_INPUT).is_visible()
+        return self.locator(DatePickerLocators.DATE_TIME_INPUT).is_visible()
 
     def is_date_range_picker_available(self) -> bool:
         """
@@ -283,8 +295,8 @@ class DatePickerPage(WidgetBasePage):
         """
         # Проверяем наличие дополнительных полей для диапазона дат
         return (
-            self.page.locator(DatePickerLocators.DATE_INPUT).is_visible() and
-            self.page.locator(DatePickerLocators.DATE_TIME_INPUT).is_visible()
+            self.locator(DatePickerLocators.DATE_INPUT).is_visible() and
+            self.locator(DatePickerLocators.DATE_TIME_INPUT).is_visible()
         )
 
     def open_date_calendar(self) -> bool:
@@ -323,7 +335,7 @@ class DatePickerPage(WidgetBasePage):
         """
         try:
             self.log_step(f"Ввод даты вручную: {date_string}")
-            date_input = self.page.locator(DatePickerLocators.DATE_INPUT)
+            date_input = self.locator(DatePickerLocators.DATE_INPUT)
             date_input.clear()
             date_input.type(date_string)
             return True
@@ -388,13 +400,13 @@ class DatePickerPage(WidgetBasePage):
 
         try:
             # Проверяем навигацию
-            prev_button = self.page.locator(DatePickerLocators.PREV_MONTH_BUTTON)
-            next_button = self.page.locator(DatePickerLocators.NEXT_MONTH_BUTTON)
+            prev_button = self.locator(DatePickerLocators.PREV_MONTH_BUTTON)
+            next_button = self.locator(DatePickerLocators.NEXT_MONTH_BUTTON)
             info["has_navigation"] = prev_button.is_visible() and next_button.is_visible()
             info["navigation_buttons"] = ["previous", "next"] if info["has_navigation"] else []
 
             # Проверяем ячейки с датами
-            day_elements = self.page.locator(DatePickerLocators.DAY)
+            day_elements = self.locator(DatePickerLocators.DAY)
             info["total_days"] = day_elements.count()
             info["has_date_cells"] = info["total_days"] > 0
 
@@ -423,7 +435,7 @@ class DatePickerPage(WidgetBasePage):
         """
         try:
             self.log_step(f"Выбор даты {day} в календаре")
-            day_elements = self.page.locator(DatePickerLocators.DAY)
+            day_elements = self.locator(DatePickerLocators.DAY)
 
             for i in range(day_elements.count()):
                 element = day_elements.nth(i)
@@ -443,7 +455,7 @@ class DatePickerPage(WidgetBasePage):
             bool: True если дата выбрана
         """
         try:
-            day_elements = self.page.locator(DatePickerLocators.DAY)
+            day_elements = self.locator(DatePickerLocators.DAY)
             for i in range(day_elements.count()):
                 element = day_elements.nth(i)
                 if element.is_visible() and not element.has_class("react-datepicker__day--disabled"):
@@ -459,7 +471,7 @@ class DatePickerPage(WidgetBasePage):
         Подтверждает ввод даты (нажатием Enter или кликом вне поля).
         """
         try:
-            date_input = self.page.locator(DatePickerLocators.DATE_INPUT)
+            date_input = self.locator(DatePickerLocators.DATE_INPUT)
             date_input.press("Enter")
         except Exception as e:
             self.log_step(f"Ошибка при подтверждении ввода даты: {e}")
@@ -480,7 +492,7 @@ class DatePickerPage(WidgetBasePage):
         ]
 
         for selector in validation_selectors:
-            element = self.page.locator(selector).first
+            element = self.locator(selector).first
             if element.is_visible():
                 return element.inner_text().strip()
         return ""
@@ -535,7 +547,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             bool: True если time picker доступен
         """
-        return self.page.locator(DatePickerLocators.TIME_CONTAINER).is_visible()
+        return self.locator(DatePickerLocators.TIME_CONTAINER).is_visible()
 
     def set_time(self, hour: int, minute: int) -> bool:
         """
@@ -550,7 +562,7 @@ class DatePickerPage(WidgetBasePage):
         """
         try:
             time_str = f"{hour:02d}:{minute:02d}"
-            time_option = self.page.locator(f"text={time_str}")
+            time_option = self.locator(f"text={time_str}")
             if time_option.is_visible():
                 time_option.click()
                 return True
@@ -567,7 +579,7 @@ class DatePickerPage(WidgetBasePage):
             bool: True если время выбрано
         """
         try:
-            time_items = self.page.locator(DatePickerLocators.TIME_LIST_ITEM)
+            time_items = self.locator(DatePickerLocators.TIME_LIST_ITEM)
             if time_items.count() > 0:
                 time_items.first.click()
                 return True
@@ -618,7 +630,7 @@ class DatePickerPage(WidgetBasePage):
         """
         # Выбираем другую дату для диапазона
         try:
-            day_elements = self.page.locator(DatePickerLocators.DAY)
+            day_elements = self.locator(DatePickerLocators.DAY)
             if day_elements.count() > 1:
                 # Выбираем вторую доступную дату
                 for i in range(1, day_elements.count()):
@@ -638,7 +650,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             bool: True если доступна
         """
-        return self.page.locator(DatePickerLocators.YEAR_SELECT).is_visible()
+        return self.locator(DatePickerLocators.YEAR_SELECT).is_visible()
 
     def get_calendar_current_year(self) -> str:
         """
@@ -647,7 +659,7 @@ class DatePickerPage(WidgetBasePage):
         Returns:
             str: Текущий год
         """
-        year_select = self.page.locator(DatePickerLocators.YEAR_SELECT)
+        year_select = self.locator(DatePickerLocators.YEAR_SELECT)
         if year_select.is_visible():
             return year_select.input_value()
         return ""
@@ -660,7 +672,7 @@ class DatePickerPage(WidgetBasePage):
             bool: True если переход успешен
         """
         try:
-            next_year_button = self.page.locator(DatePickerLocators.NEXT_YEAR_BUTTON)
+            next_year_button = self.locator(DatePickerLocators.NEXT_YEAR_BUTTON)
             if next_year_button.is_visible():
                 next_year_button.click()
                 return True
@@ -677,7 +689,7 @@ class DatePickerPage(WidgetBasePage):
             bool: True если переход успешен
         """
         try:
-            prev_year_button = self.page.locator(DatePickerLocators.PREV_YEAR_BUTTON)
+            prev_year_button = self.locator(DatePickerLocators.PREV_YEAR_BUTTON)
             if prev_year_button.is_visible():
                 prev_year_button.click()
                 return True
@@ -3,10 +3,12 @@ Page Object для страницы Menu.
 Содержит методы для работы с многоуровневым навигационным меню.
 """
 
-import time
 from playwright.sync_api import Page
+from data import Timeouts
 from locators.widgets.menu_locators import MenuLocators
+from pages.base_page import VISIBLE_PREDICATE
 from pages.widgets.base_page import WidgetBasePage
+from utils.helper import WaitHelper
 
 
 class MenuPage(WidgetBasePage):
@@ -80,15 +82,20 @@ class MenuPage(WidgetBasePage):
         """
         self.log_step("Навигируем к подменю третьего уровня")
 
-        # Наводим на Main Item 2
+        # Наводим на Main Item 2, затем на Sub Sub List
         self.hover_main_item_2()
-        time.sleep(500)
-
-        # Наводим на Sub Sub List
         self.hover_sub_item(MenuLocators.SUB_SUB_LIST)
-        time.sleep(500)
 
-        # Теперь должно быть видно подменю третьего уровня
+        # Подменю раскрываются по очереди: сначала второй уровень, затем третий
+        WaitHelper.wait_for_sequence(
+            [
+                self.browser_condition(VISIBLE_PREDICATE, MenuLocators.SUB_MENU, name="sub_menu"),
+                self.browser_condition(
+                    VISIBLE_PREDICATE, MenuLocators.SUB_SUB_MENU, name="sub_sub_menu"
+                ),
+            ],
+            timeout=Timeouts.SHORT / 1000,
+        )
 
     def is_submenu_visible(self, submenu_selector: str) -> bool:
         """
@@ -100,7 +107,7 @@ class MenuPage(WidgetBasePage):
         Returns:
             bool: True если подменю видимо
         """
-        return self.page.locator(submenu_selector).is_visible()
+        return self.locator(submenu_selector).is_visible()
 
     def get_visible_menu_items(self) -> list[str]:
         """
@@ -110,7 +117,7 @@ class MenuPage(WidgetBasePage):
             list: Список текстов видимых элементов меню
         """
         visible_items = []
-        menu_items = self.page.locator("ul[role='menubar'] a")
+        menu_items = self.locator("ul[role='menubar'] a")
 
         for i in range(menu_items.count()):
             item = menu_items.nth(i)
@@ -184,7 +191,7 @@ class MenuPage(WidgetBasePage):
             bool: True если элемент доступен
         """
         try:
-            menu_item = self.page.locator(item_selector)
+            menu_item = self.locator(item_selector)
             return menu_item.is_enabled() and menu_item.is_visible()
         except:
             return False
@@ -197,7 +204,7 @@ class MenuPage(WidgetBasePage):
             list: Список пунктов меню с информацией
         """
         menu_items = []
-        main_items = self.page.locator("ul[role='menubar'] > li")
+        main_items = self.locator("ul[role='menubar'] > li")
 
         for i in range(main_items.count()):
             item = main_items.nth(i)
@@ -223,7 +230,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
             return "active" in item.get_attribute("class") or item.get_attribute("aria-expanded") == "true"
         return False
 
@@ -239,7 +246,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             item.click()
             return True
         return False
@@ -256,7 +263,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items) and menu_items[index]["has_submenu"]:
-            submenu = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) ul")
+            submenu = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) ul")
             return submenu.is_visible()
         return False
 
@@ -272,7 +279,7 @@ class MenuPage(WidgetBasePage):
         """
         submenu_items = []
         if self.is_submenu_visible(index):
-            submenu = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) ul li")
+            submenu = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) ul li")
             for i in range(submenu.count()):
                 item = submenu.nth(i)
                 if item.is_visible():
@@ -295,7 +302,7 @@ class MenuPage(WidgetBasePage):
         """
         if self.is_submenu_visible(index):
             # Кликаем вне меню для закрытия
-            self.page.locator("body").click()
+            self.locator("body").click()
             return True
         return False
 
@@ -323,7 +330,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             item.hover()
 
     def click_submenu_item(self, main_index: int, sub_index: int) -> bool:
@@ -339,7 +346,7 @@ class MenuPage(WidgetBasePage):
         """
         submenu_items = self.get_submenu_items(main_index)
         if 0 <= sub_index < len(submenu_items):
-            submenu = self.page.locator(f"ul[role='menubar'] > li:nth-child({main_index + 1}) ul li:nth-child({sub_index + 1}) a")
+            submenu = self.locator(f"ul[role='menubar'] > li:nth-child({main_index + 1}) ul li:nth-child({sub_index + 1}) a")
             submenu.click()
             return True
         return False
@@ -357,7 +364,7 @@ class MenuPage(WidgetBasePage):
         """
         submenu_items = self.get_submenu_items(main_index)
         if 0 <= sub_index < len(submenu_items):
-            submenu = self.page.locator(f"ul[role='menubar'] > li:nth-child({main_index + 1}) ul li:nth-child({sub_index + 1})")
+            submenu = self.locator(f"ul[role='menubar'] > li:nth-child({main_index + 1}) ul li:nth-child({sub_index + 1})")
             return "active" in submenu.get_attribute("class")
         return False
 
@@ -373,7 +380,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
             return {
                 "class": item.get_attribute("class"),
                 "style": item.get_attribute("style"),
@@ -408,7 +415,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1})")
             return item.get_attribute("aria-disabled") == "true" or not item.is_enabled()
         return False
 
@@ -452,7 +459,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             item.focus()
             return True
         return False
@@ -469,7 +476,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             return item.evaluate("element => element === document.activeElement")
         return False
 
@@ -515,7 +522,7 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             return {
                 "role": item.get_attribute("role"),
                 "aria-label": item.get_attribute("aria-label"),
@@ -566,6 +573,6 @@ class MenuPage(WidgetBasePage):
         """
         menu_items = self.get_main_menu_items()
         if 0 <= index < len(menu_items):
-            item = self.page.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
+            item = self.locator(f"ul[role='menubar'] > li:nth-child({index + 1}) a")
             return item.is_enabled() and item.is_visible()
         return False
@@ -4,11 +4,83 @@ Page Object для страницы Progress Bar с интерактивным 
 """
 
 import time
-from playwright.sync_api import Page
+import statistics
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from locators.widgets.progress_bar_locators import ProgressBarLocators
 from pages.base_page import BasePage
 
 
+# Наблюдатель за полосой прогресса: при каждом изменении aria-valuenow, ширины
+# или текста дописывает в буфер window.__qaProgress.series отметку
+# {t: performance.now(), value, text, fill}, где fill - видимая доля заполнения в %.
+# since - момент последнего сброса: ожидания учитывают только отметки после него
+PROGRESS_OBSERVER_SCRIPT = """(selector) => {
+    const bar = document.querySelector(selector);
+    if (!bar) return false;
+    const current = window.__qaProgress;
+    if (current && current.bar === bar) return true;
+    if (current && current.observer) current.observer.disconnect();
+
+    const read = () => {
+        const text = bar.textContent.trim();
+        const valueNow = parseFloat(bar.getAttribute('aria-valuenow'));
+        const track = bar.parentElement.getBoundingClientRect().width;
+        return {
+            t: performance.now(),
+            value: isNaN(valueNow) ? parseFloat(text) || 0 : valueNow,
+            text: text,
+            fill: track ? bar.getBoundingClientRect().width / track * 100 : 0,
+        };
+    };
+    const state = window.__qaProgress = {
+        bar: bar, series: [read()], since: -1, observer: null,
+    };
+    state.observer = new MutationObserver(() => {
+        const sample = read();
+        const last = state.series[state.series.length - 1];
+        if (sample.value !== last.value || sample.text !== last.text) {
+            state.series.push(sample);
+            if (state.series.length > 5000) state.series.shift();
+        }
+    });
+    state.observer.observe(bar, {
+        attributes: true,
+        attributeFilter: ['aria-valuenow', 'style'],
+        childList: true,
+        characterData: true,
+        subtree: true,
+    });
+    return true;
+}"""
+
+# Значение достигнуто, если оно встречалось в буфере после отметки since
+# (даже если кадр был пропущен); отметки прошлых запусков не учитываются
+PROGRESS_REACHED_SCRIPT = """([text, threshold]) => {
+    const state = window.__qaProgress;
+    if (!state) return false;
+    return state.series.find(
+        s => s.t > state.since && (text !== null ? s.text === text : s.value >= threshold)
+    ) || false;
+}"""
+
+# Сброс - начало нового запуска: история прошлых запусков отбрасывается, последняя отметка
+# остается точкой отсчета для интервалов, но ожиданиями уже не учитывается
+PROGRESS_MARK_SCRIPT = """() => {
+    const state = window.__qaProgress;
+    if (!state) return false;
+    state.since = performance.now();
+    state.series = state.series.slice(-1);
+    return true;
+}"""
+
+FILL_SCRIPT = """(selector) => {
+    const bar = document.querySelector(selector);
+    if (!bar) return null;
+    const track = bar.parentElement.getBoundingClientRect().width;
+    return track ? bar.getBoundingClientRect().width / track * 100 : 0;
+}"""
+
+
 class ProgressBarPage(BasePage):
     """
     Страница тестирования прогресс-бара с кнопками Start/Stop/Reset.
@@ -58,8 +130,8 @@ class ProgressBarPage(BasePage):
         self.log_step("Запускаем прогресс-бар")
         for attempt in range(retries):
             try:
-                button = self.page.locator(ProgressBarLocators.START_STOP_BUTTON)
-                self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON, 10000)
+                button = self.locator(ProgressBarLocators.START_STOP_BUTTON)
+                self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON)
                 self._wait_for_enabled(button, timeout=5000)
                 button.click()
                 return
@@ -80,8 +152,8 @@ class ProgressBarPage(BasePage):
         self.log_step("Останавливаем прогресс-бар")
         for attempt in range(retries):
             try:
-                button = self.page.locator(ProgressBarLocators.START_STOP_BUTTON)
-                self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON, 10000)
+                button = self.locator(ProgressBarLocators.START_STOP_BUTTON)
+                self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON)
                 self._wait_for_enabled(button, timeout=5000)
                 button.click()
                 return
@@ -100,10 +172,11 @@ class ProgressBarPage(BasePage):
         Postconditions: прогресс сбрасывается на 0%, появляется кнопка Reset
         """
         self.log_step("Сбрасываем прогресс-бар")
+        self._mark_progress()
         for attempt in range(retries):
             try:
-                button = self.page.locator(ProgressBarLocators.RESET_BUTTON)
-                self.wait_for_visible(ProgressBarLocators.RESET_BUTTON, 10000)
+                button = self.locator(ProgressBarLocators.RESET_BUTTON)
+                self.wait_for_visible(ProgressBarLocators.RESET_BUTTON)
                 self._wait_for_enabled(button, timeout=5000)
                 button.click()
                 return
@@ -112,27 +185,83 @@ class ProgressBarPage(BasePage):
                     raise Exception(f"Failed to reset after {retries} attempts") from e
                 self.page.wait_for_timeout(1000)
 
+    def observe_progress(self) -> None:
+        """
+        Устанавливает в странице наблюдатель за полосой прогресса.
+        Повторный вызов ничего не делает, если наблюдатель уже следит за тем же элементом.
+        """
+        self.wait_for_visible(ProgressBarLocators.PROGRESS_BAR_VALUE)
+        self.page.evaluate(PROGRESS_OBSERVER_SCRIPT, ProgressBarLocators.PROGRESS_BAR_VALUE)
+
+    def _mark_progress(self) -> None:
+        """
+        Отмечает начало нового запуска в буфере наблюдателя (если он установлен),
+        чтобы ожидания не срабатывали на значениях прошлого запуска.
+        Вызывается при сбросе: после 100% новый запуск возможен только через Reset,
+        а Start после Stop продолжает тот же запуск.
+        """
+        self.page.evaluate(PROGRESS_MARK_SCRIPT)
+
+    def _wait_for_progress(self, text, threshold, timeout: int) -> dict:
+        """Ждет значения одним wait_for_function по буферу наблюдателя."""
+        self.observe_progress()
+        try:
+            handle = self.page.wait_for_function(
+                PROGRESS_REACHED_SCRIPT, arg=[text, threshold], timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            target = text if text is not None else f">= {threshold}%"
+            raise TimeoutError(f"Timeout waiting for progress value {target}")
+        return handle.json_value()
+
     def wait_for_progress_value(
         self, expected_value: str, timeout: int = 30000
-    ) -> None:
+    ) -> dict:
         """
         Ожидает достижения прогрессом определенного значения.
 
+        Проверка выполняется в браузере по буферу наблюдателя, без опроса из Python.
+        Учитываются только значения после последнего reset_progress.
+
         Args:
             expected_value: Ожидаемое значение прогресса (например, "50%")
             timeout: Максимальное время ожидания в миллисекундах
 
+        Returns:
+            dict: Отметка буфера, в которой значение было достигнуто (t, value, text, fill)
+
         Raises:
             TimeoutError: Если значение не достигнуто за указанное время
         """
         self.log_step(f"Ожидаем значение прогресса: {expected_value}")
-        start = time.time()
-        while time.time() - start < timeout / 1000:
-            val = self.get_progress_value()
-            if val == expected_value:
-                return
-            time.sleep(0.1)
-        raise TimeoutError(f"Timeout waiting for progress value {expected_value}")
+        return self._wait_for_progress(expected_value, None, timeout)
+
+    def wait_for_progress_at_least(self, percent: float, timeout: int = 30000) -> dict:
+        """
+        Ожидает, пока прогресс не достигнет порога.
+
+        Args:
+            percent: Порог в процентах
+            timeout: Максимальное время ожидания в миллисекундах
+
+        Returns:
+            dict: Первая отметка буфера со значением не ниже порога
+
+        Raises:
+            TimeoutError: Если порог не достигнут за указанное время
+        """
+        self.log_step(f"Ожидаем прогресс не ниже {percent}%")
+        return self._wait_for_progress(None, percent, timeout)
+
+    def get_progress_series(self) -> list:
+        """
+        Возвращает записанную наблюдателем историю значений.
+
+        Returns:
+            list: Отметки {t (мс, performance.now), value, text, fill}
+        """
+        self.observe_progress()
+        return self.page.evaluate("() => window.__qaProgress.series.map(s => ({...s}))")
 
     def get_progress_value(self) -> str:
         """
@@ -141,8 +270,8 @@ class ProgressBarPage(BasePage):
         Returns:
             str: Текущее значение прогресса в процентах (например, "25%")
         """
-        progress_bar = self.page.locator(ProgressBarLocators.PROGRESS_BAR)
-        self.wait_for_visible(ProgressBarLocators.PROGRESS_BAR, 10000)
+        progress_bar = self.locator(ProgressBarLocators.PROGRESS_BAR)
+        self.wait_for_visible(ProgressBarLocators.PROGRESS_BAR)
         return progress_bar.inner_text().strip()
 
     def get_button_text(self) -> str:
@@ -152,8 +281,8 @@ class ProgressBarPage(BasePage):
         Returns:
             str: Текст кнопки ("Start", "Stop" или "Reset")
         """
-        button = self.page.locator(ProgressBarLocators.START_STOP_BUTTON)
-        self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON, 10000)
+        button = self.locator(ProgressBarLocators.START_STOP_BUTTON)
+        self.wait_for_visible(ProgressBarLocators.START_STOP_BUTTON)
         return button.inner_text().strip()
 
     # === Методы для совместимости с тестами ===
@@ -165,7 +294,7 @@ class ProgressBarPage(BasePage):
         Returns:
             bool: True если статический прогресс-бар присутствует
         """
-        return self.page.locator(ProgressBarLocators.PROGRESS_BAR).is_visible()
+        return self.locator(ProgressBarLocators.PROGRESS_BAR).is_visible()
 
     def is_dynamic_progress_bar_present(self) -> bool:
         """
@@ -174,7 +303,7 @@ class ProgressBarPage(BasePage):
         Returns:
             bool: True если динамический прогресс-бар присутствует
         """
-        return self.page.locator(ProgressBarLocators.PROGRESS_BAR).is_visible()
+        return self.locator(ProgressBarLocators.PROGRESS_BAR).is_visible()
 
     def get_available_progress_controls(self) -> dict:
         """
@@ -184,9 +313,9 @@ class ProgressBarPage(BasePage):
             dict: Словарь с информацией о доступных элементах управления
         """
         controls = {
-            "start_stop_button": self.page.locator(ProgressBarLocators.START_STOP_BUTTON).is_visible(),
-            "reset_button": self.page.locator(ProgressBarLocators.RESET_BUTTON).is_visible(),
-            "progress_bar": self.page.locator(ProgressBarLocators.PROGRESS_BAR).is_visible(),
+            "start_stop_button": self.locator(ProgressBarLocators.START_STOP_BUTTON).is_visible(),
+            "reset_button": self.locator(ProgressBarLocators.RESET_BUTTON).is_visible(),
+            "progress_bar": self.locator(ProgressBarLocators.PROGRESS_BAR).is_visible(),
         }
         return controls
 
@@ -197,7 +326,7 @@ class ProgressBarPage(BasePage):
         Returns:
             int: Количество прогресс-баров
         """
-        return self.page.locator(ProgressBarLocators.PROGRESS_BAR).count()
+        return self.locator(ProgressBarLocators.PROGRESS_BAR).count()
 
     def is_reset_progress_button_available(self) -> bool:
         """
@@ -206,7 +335,7 @@ class ProgressBarPage(BasePage):
         Returns:
             bool: True если кнопка сброса доступна
         """
-        return self.page.locator(ProgressBarLocators.RESET_BUTTON).is_visible()
+        return self.locator(ProgressBarLocators.RESET_BUTTON).is_visible()
 
     def click_reset_progress_button(self) -> None:
         """
@@ -229,7 +358,7 @@ class ProgressBarPage(BasePage):
         Returns:
             bool: True если кнопка запуска доступна
         """
-        button = self.page.locator(ProgressBarLocators.START_STOP_BUTTON)
+        button = self.locator(ProgressBarLocators.START_STOP_BUTTON)
         if button.is_visible():
             text = button.inner_text().strip().lower()
             return "start" in text
@@ -271,7 +400,7 @@ class ProgressBarPage(BasePage):
         Returns:
             dict: Словарь с визуальными свойствами
         """
-        progress_bar = self.page.locator(ProgressBarLocators.PROGRESS_BAR)
+        progress_bar = self.locator(ProgressBarLocators.PROGRESS_BAR)
         is_visible = progress_bar.is_visible()
 
         if is_visible:
@@ -339,7 +468,7 @@ class ProgressBarPage(BasePage):
             bool: True если анимирован
         """
         # Проверяем наличие CSS классов анимации или атрибутов
-        progress_bar = self.page.locator(ProgressBarLocators.PROGRESS_BAR)
+        progress_bar = self.locator(ProgressBarLocators.PROGRESS_BAR)
         if progress_bar.is_visible():
             # Проверяем наличие классов анимации
             classes = progress_bar.get_attribute("class") or ""
@@ -375,20 +504,41 @@ class ProgressBarPage(BasePage):
 
     def get_progress_update_frequency(self) -> float:
         """
-        Получает частоту обновления прогресса.
+        Получает измеренный интервал между обновлениями прогресса.
 
         Returns:
-            float: Частота обновлений в секундах
+            float: Медианный интервал между обновлениями в секундах
+                   (0.0, если обновлений было меньше двух)
         """
-        # Для простоты возвращаем фиксированное значение
-        return 0.1  # 10 обновлений в секунду
+        series = self.get_progress_series()
+        intervals = [b["t"] - a["t"] for a, b in zip(series[1:], series[2:])]
+        # Первая отметка - состояние на момент установки наблюдателя, а не обновление
+        if not intervals:
+            return 0.0
+        return round(statistics.median(intervals) / 1000, 3)
 
     def calculate_visual_fill_percentage(self) -> float:
         """
         Рассчитывает визуальный процент заполнения прогресс-бара.
 
         Returns:
-            float: Процент заполнения (0-100)
+            float: Ширина полосы относительно дорожки в процентах (0-100)
         """
-        # Для простоты возвращаем процент на основе текущего значения
-        return float(self.get_dynamic_progress_percentage())
+        fill = self.page.evaluate(FILL_SCRIPT, ProgressBarLocators.PROGRESS_BAR_VALUE)
+        return round(fill or 0.0, 1)
+
+    def get_fill_consistency(self) -> dict:
+        """
+        Сравнивает видимое заполнение с текстовым значением по истории наблюдателя.
+        Заполнение может отставать из-за CSS перехода ширины.
+
+        Returns:
+            dict: samples, max_deviation и mean_deviation (в процентных пунктах)
+        """
+        series = self.get_progress_series()
+        deviations = [abs(sample["fill"] - sample["value"]) for sample in series]
+        return {
+            "samples": len(series),
+            "max_deviation": round(max(deviations), 1) if deviations else 0.0,
+            "mean_deviation": round(statistics.mean(deviations), 1) if deviations else 0.0,
+        }
@@ -3,10 +3,11 @@ Page Object для страницы Select Menu.
 Содержит методы для работы с различными типами выпадающих списков.
 """
 
-import time
 from playwright.sync_api import Page
 from locators.widgets.selectmenu_locators import SelectMenuLocators
+from pages.base_page import VISIBLE_PREDICATE
 from pages.widgets.base_page import WidgetBasePage
+from utils.helper import WaitHelper
 
 
 class SelectMenuPage(WidgetBasePage):
@@ -40,7 +41,7 @@ class SelectMenuPage(WidgetBasePage):
         self.wait_for_dropdown_to_appear(".css-26l3qy-menu")
 
         # Выбираем опцию по тексту
-        option = self.page.locator(f"text={value_text}").first
+        option = self.locator(f"text={value_text}").first
         if option.is_visible():
             option.click()
 
@@ -60,7 +61,7 @@ class SelectMenuPage(WidgetBasePage):
         self.wait_for_dropdown_to_appear(".css-26l3qy-menu")
 
         # Выбираем опцию
-        option = self.page.locator(f"text={option_text}").first
+        option = self.locator(f"text={option_text}").first
         if option.is_visible():
             option.click()
 
@@ -74,7 +75,7 @@ class SelectMenuPage(WidgetBasePage):
         Postconditions: выбранное значение установлено в select
         """
         self.log_step(f"Выбираем в старом стиле меню: {value}")
-        select_element = self.page.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
+        select_element = self.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
         select_element.select_option(value)
 
     def select_multiple_values(self, values: list[str]) -> None:
@@ -93,10 +94,14 @@ class SelectMenuPage(WidgetBasePage):
             self.safe_click(SelectMenuLocators.MULTISELECT)
 
             # Ждем появления dropdown
-            time.sleep(500)
+            self.wait_until(
+                self.browser_condition(
+                    VISIBLE_PREDICATE, SelectMenuLocators.DROPDOWN_MENU, name="dropdown_menu"
+                )
+            )
 
             # Выбираем опцию
-            option = self.page.locator(f".css-26l3qy-menu text={value}").first
+            option = self.locator(f".css-26l3qy-menu text={value}").first
             if option.is_visible():
                 option.click()
 
@@ -110,7 +115,7 @@ class SelectMenuPage(WidgetBasePage):
         Postconditions: все указанные опции выбраны в multiselect
         """
         self.log_step(f"Выбираем в стандартном multiselect: {values}")
-        multiselect = self.page.locator(SelectMenuLocators.STANDARD_MULTISELECT)
+        multiselect = self.locator(SelectMenuLocators.STANDARD_MULTISELECT)
 
         # Выбираем каждое значение с зажатым Ctrl
         for i, value in enumerate(values):
@@ -127,7 +132,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             str: Текст выбранного значения
         """
-        selected_element = self.page.locator(
+        selected_element = self.locator(
             f"{SelectMenuLocators.SELECT_VALUE} .css-1wa3eu0-placeholder"
         )
         return selected_element.inner_text() if selected_element.is_visible() else ""
@@ -139,7 +144,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             str: Текст выбранной опции
         """
-        selected_element = self.page.locator(
+        selected_element = self.locator(
             f"{SelectMenuLocators.SELECT_ONE} .css-1wa3eu0-placeholder"
         )
         return selected_element.inner_text() if selected_element.is_visible() else ""
@@ -151,7 +156,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             str: Значение выбранной опции
         """
-        select_element = self.page.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
+        select_element = self.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
         return select_element.input_value()
 
     def get_multiselect_values(self) -> list[str]:
@@ -162,7 +167,7 @@ class SelectMenuPage(WidgetBasePage):
             list: Список текстов выбранных значений
         """
         values = []
-        tags = self.page.locator(f"{SelectMenuLocators.MULTISELECT} .css-12jo7m5")
+        tags = self.locator(f"{SelectMenuLocators.MULTISELECT} .css-12jo7m5")
 
         for i in range(tags.count()):
             tag_text = tags.nth(i).inner_text()
@@ -180,7 +185,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             list: Список значений выбранных опций
         """
-        multiselect = self.page.locator(SelectMenuLocators.STANDARD_MULTISELECT)
+        multiselect = self.locator(SelectMenuLocators.STANDARD_MULTISELECT)
         return multiselect.evaluate(
             "el => Array.from(el.selectedOptions).map(o => o.value)"
         )
@@ -191,7 +196,7 @@ class SelectMenuPage(WidgetBasePage):
         Postconditions: dropdown возвращается к состоянию placeholder.
         """
         self.log_step("Очищаем Select Value")
-        clear_button = self.page.locator(
+        clear_button = self.locator(
             f"{SelectMenuLocators.SELECT_VALUE} .css-1wy0on6"
         )
         if clear_button.is_visible():
@@ -203,7 +208,7 @@ class SelectMenuPage(WidgetBasePage):
         Postconditions: dropdown возвращается к состоянию placeholder.
         """
         self.log_step("Очищаем Select One")
-        clear_button = self.page.locator(
+        clear_button = self.locator(
             f"{SelectMenuLocators.SELECT_ONE} .css-1wy0on6"
         )
         if clear_button.is_visible():
@@ -221,7 +226,7 @@ class SelectMenuPage(WidgetBasePage):
         self.log_step(f"Удаляем значение из multiselect: {value_text}")
 
         # Ищем тег с указанным текстом и кликаем по кнопке X
-        tags = self.page.locator(f"{SelectMenuLocators.MULTISELECT} .css-12jo7m5")
+        tags = self.locator(f"{SelectMenuLocators.MULTISELECT} .css-12jo7m5")
 
         for i in range(tags.count()):
             tag = tags.nth(i)
@@ -237,7 +242,7 @@ class SelectMenuPage(WidgetBasePage):
         Postconditions: все значения удалены из multiselect.
         """
         self.log_step("Очищаем все значения multiselect")
-        clear_all_button = self.page.locator(
+        clear_all_button = self.locator(
             f"{SelectMenuLocators.MULTISELECT} .css-1wy0on6"
         ).first
         if clear_all_button.is_visible():
@@ -253,7 +258,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             bool: True если dropdown открыт
         """
-        menu = self.page.locator(".css-26l3qy-menu")
+        menu = self.locator(".css-26l3qy-menu")
         return menu.is_visible()
 
     def get_available_options(self, dropdown_selector: str) -> list[str]:
@@ -274,7 +279,7 @@ class SelectMenuPage(WidgetBasePage):
 
         # Собираем опции
         options = []
-        option_elements = self.page.locator(".css-26l3qy-menu .css-1n7v3ny-option")
+        option_elements = self.locator(".css-26l3qy-menu .css-1n7v3ny-option")
 
         for i in range(option_elements.count()):
             option_text = option_elements.nth(i).inner_text()
@@ -301,13 +306,22 @@ class SelectMenuPage(WidgetBasePage):
         self.safe_click(dropdown_selector)
 
         # Печатаем текст поиска
-        search_input = self.page.locator(f"{dropdown_selector} input")
+        search_input = self.locator(f"{dropdown_selector} input")
         if search_input.is_visible():
             search_input.type(search_text)
-            time.sleep(500)
+            self.wait_until(
+                WaitHelper.any_of(
+                    self.browser_condition(
+                        VISIBLE_PREDICATE, SelectMenuLocators.OPTION_GROUP_OPTIONS, name="options"
+                    ),
+                    self.browser_condition(
+                        VISIBLE_PREDICATE, SelectMenuLocators.NO_OPTIONS_MESSAGE, name="no_options"
+                    ),
+                )
+            )
 
             # Выбираем первую опцию
-            first_option = self.page.locator(
+            first_option = self.locator(
                 ".css-26l3qy-menu .css-1n7v3ny-option"
             ).first
             if first_option.is_visible():
@@ -329,7 +343,7 @@ class SelectMenuPage(WidgetBasePage):
         """
         Возвращает элемент стандартного select для совместимости с тестами.
         """
-        return self.page.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
+        return self.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
 
     def multiselect_get_placeholder(self) -> str:
         """
@@ -338,7 +352,7 @@ class SelectMenuPage(WidgetBasePage):
         Returns:
             str: Текст placeholder
         """
-        placeholder = self.page.locator(f"{SelectMenuLocators.MULTISELECT} .css-1wa3eu0-placeholder")
+        placeholder = self.locator(f"{SelectMenuLocators.MULTISELECT} .css-1wa3eu0-placeholder")
         return placeholder.inner_text() if placeholder.is_visible() else ""
 
     def select_standard_multiselect_options(self, values: list[str]) -> None:
@@ -358,7 +372,7 @@ class SelectMenuPage(WidgetBasePage):
         """
         Возвращает элемент Select One для совместимости с тестами.
         """
-        return self.page.locator(SelectMenuLocators.SELECT_ONE)
+        return self.locator(SelectMenuLocators.SELECT_ONE)
 
     def select_simple_option_by_index(self, index: int) -> None:
         """
@@ -367,5 +381,5 @@ class SelectMenuPage(WidgetBasePage):
         Args:
             index: Индекс опции для выбора
         """
-        select_element = self.page.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
+        select_element = self.locator(SelectMenuLocators.OLD_STYLE_SELECT_MENU)
         select_element.select_option(index=index)
@@ -7,6 +7,11 @@ from playwright.sync_api import Page
 from locators.widgets.slider_locators import SliderLocators
 from pages.base_page import BasePage
 
+# Значение и границы input[type=range]
+SLIDER_STATE_SCRIPT = """
+(el) => ({value: Number(el.value), min: Number(el.min || 0), max: Number(el.max || 100)})
+"""
+
 
 class SliderPage(BasePage):
     """
@@ -23,6 +28,26 @@ class SliderPage(BasePage):
         """
         super().__init__(page)
 
+    def _slider_state(self) -> dict:
+        """Значение и границы слайдера одним запросом: {value, min, max}."""
+        return self.locator(SliderLocators.SLIDER).evaluate(SLIDER_STATE_SCRIPT)
+
+    @staticmethod
+    def _fraction(state: dict, value: float) -> float:
+        """Доля ширины слайдера, соответствующая значению."""
+        span = state["max"] - state["min"]
+        return (value - state["min"]) / span if span else 0.0
+
+    def _nudge_to(self, target_value: int) -> None:
+        """
+        Доводит значение клавишами стрелок (слайдер в фокусе после перетаскивания):
+        положение ползунка по пикселям зависит от ширины ручки, шаг клавиши - нет.
+        """
+        difference = target_value - self._slider_state()["value"]
+        key = "ArrowRight" if difference > 0 else "ArrowLeft"
+        for _ in range(abs(int(difference))):
+            self.page.keyboard.press(key)
+
     def set_slider_value(self, target_value: int) -> None:
         """
         Устанавливает значение слайдера путем перемещения ползунка.
@@ -30,32 +55,30 @@ class SliderPage(BasePage):
         Args:
             target_value: Целевое значение слайдера (0-100)
 
+        Raises:
+            AssertionError: Если значение не установлено
+
         Postconditions: слайдер установлен на указанное значение
         """
         self.log_step(f"Устанавливаем значение слайдера: {target_value}")
 
-        # Получаем элементы
-        slider = self.page.locator(SliderLocators.SLIDER)
-        thumb = self.page.locator(SliderLocators.SLIDER_THUMB)
-
-        # Получаем размеры слайдера
-        slider_box = slider.bounding_box()
-        slider_width = slider_box["width"]
-
-        # Вычисляем позицию для целевого значения (0-100)
-        target_percentage = target_value / 100
-        target_x = slider_box["x"] + (slider_width * target_percentage)
-        target_y = slider_box["y"] + slider_box["height"] / 2
-
-        # Перемещаем ползунок
-        thumb_box = thumb.bounding_box()
-        current_x = thumb_box["x"] + thumb_box["width"] / 2
-        current_y = thumb_box["y"] + thumb_box["height"] / 2
-
-        self.page.mouse.move(current_x, current_y)
-        self.page.mouse.down()
-        self.page.mouse.move(target_x, target_y, steps=10)
-        self.page.mouse.up()
+        state = self._slider_state()
+        target_value = max(state["min"], min(state["max"], target_value))
+        self.drag(
+            SliderLocators.SLIDER,
+            SliderLocators.SLIDER,
+            grab=(self._fraction(state, state["value"]), 0.5),
+            drop=(self._fraction(state, target_value), 0.5),
+            scope=SliderLocators.SLIDER,
+        )
+        self._nudge_to(target_value)
+
+        value = self._slider_state()["value"]
+        if value != target_value:
+            raise AssertionError(
+                f"Слайдер установлен на {value} вместо {target_value} "
+                f"(диапазон {state['min']}-{state['max']})"
+            )
 
     def drag_slider_by_offset(self, x_offset: int) -> None:
         """
@@ -67,16 +90,14 @@ class SliderPage(BasePage):
         Postconditions: ползунок смещен на указанное количество пикселей
         """
         self.log_step(f"Перемещаем слайдер на смещение: {x_offset}px")
-        thumb = self.page.locator(SliderLocators.SLIDER_THUMB)
-
-        thumb_box = thumb.bounding_box()
-        start_x = thumb_box["x"] + thumb_box["width"] / 2
-        start_y = thumb_box["y"] + thumb_box["height"] / 2
-
-        self.page.mouse.move(start_x, start_y)
-        self.page.mouse.down()
-        self.page.mouse.move(start_x + x_offset, start_y, steps=5)
-        self.page.mouse.up()
+        state = self._slider_state()
+        self.drag(
+            SliderLocators.SLIDER,
+            grab=(self._fraction(state, state["value"]), 0.5),
+            offset=(x_offset, 0),
+            steps=5,
+            scope=SliderLocators.SLIDER,
+        )
 
     def get_slider_value(self) -> int:
         """
@@ -98,7 +119,7 @@ class SliderPage(BasePage):
         Returns:
             int: Значение из атрибута или 0 при ошибке
         """
-        slider = self.page.locator(SliderLocators.SLIDER)
+        slider = self.locator(SliderLocators.SLIDER)
         value = slider.get_attribute("aria-valuenow")
         try:
             return int(value) if value else 0
@@ -112,7 +133,7 @@ class SliderPage(BasePage):
         Returns:
             bool: True если слайдер активен
         """
-        slider = self.page.locator(SliderLocators.SLIDER)
+        slider = self.locator(SliderLocators.SLIDER)
         return slider.is_enabled()
 
     def get_slider_range(self) -> tuple[int, int]:
@@ -122,7 +143,7 @@ class SliderPage(BasePage):
         Returns:
             tuple: (минимальное_значение, максимальное_значение)
         """
-        slider = self.page.locator(SliderLocators.SLIDER)
+        slider = self.locator(SliderLocators.SLIDER)
         min_val = slider.get_attribute("aria-valuemin")
         max_val = slider.get_attribute("aria-valuemax")
 
@@ -140,7 +161,7 @@ class SliderPage(BasePage):
         Returns:
             bool: True если одиночный слайдер присутствует
         """
-        return self.page.locator(SliderLocators.SLIDER).is_visible()
+        return self.locator(SliderLocators.SLIDER).is_visible()
 
     def is_range_slider_present(self) -> bool:
         """
@@ -151,7 +172,7 @@ class SliderPage(BasePage):
         """
         # Для простоты считаем, что если есть обычный слайдер, то это одиночный
         # В реальности может быть два слайдера для диапазона
-        return self.page.locator(SliderLocators.SLIDER).count() > 1
+        return self.locator(SliderLocators.SLIDER).count() > 1
 
     def get_slider_step_properties(self) -> dict:
         """
@@ -160,7 +181,7 @@ class SliderPage(BasePage):
         Returns:
             dict: Словарь со свойствами шага
         """
-        slider = self.page.locator(SliderLocators.SLIDER)
+        slider = self.locator(SliderLocators.SLIDER)
         step = slider.get_attribute("step")
         min_val, max_val = self.get_slider_range()
 
@@ -181,7 +202,7 @@ class SliderPage(BasePage):
             int: Текущее значение слайдера
         """
         try:
-            slider = self.page.locator(SliderLocators.SLIDER)
+            slider = self.locator(SliderLocators.SLIDER)
             value = slider.input_value()
             return int(value) if value else 0
         except:
@@ -195,7 +216,7 @@ class SliderPage(BasePage):
             float: Позиция в процентах (0-100)
         """
         try:
-            slider = self.page.locator(SliderLocators.SLIDER)
+            slider = self.locator(SliderLocators.SLIDER)
             value = slider.input_value()
             min_val, max_val = self.get_slider_range()
             if max_val > min_val:
@@ -246,7 +267,7 @@ class SliderPage(BasePage):
             new_value = max(min_val, min(max_val, current_value + value_change))
 
             # Имитируем изменение путем установки значения напрямую
-            slider = self.page.locator(SliderLocators.SLIDER)
+            slider = self.locator(SliderLocators.SLIDER)
             slider.fill(str(new_value))
             return True
         except Exception as e:
@@ -266,7 +287,7 @@ class SliderPage(BasePage):
         try:
             self.log_step(f"Установка значения слайдера: {value}")
             # Устанавливаем значение напрямую в поле ввода
-            slider = self.page.locator(SliderLocators.SLIDER)
+            slider = self.locator(SliderLocators.SLIDER)
             slider.fill(str(value))
             return True
         except Exception as e:
@@ -60,7 +60,7 @@ class TabsPage(WidgetBasePage):
         """
         self.log_step("Пытаемся кликнуть по вкладке More (может быть отключена)")
         try:
-            more_tab = self.page.locator(TabsLocators.MORE_TAB)
+            more_tab = self.locator(TabsLocators.MORE_TAB)
             if more_tab.is_visible() and more_tab.is_enabled():
                 more_tab.click()
                 self.wait_for_animation_complete(500)
@@ -114,7 +114,7 @@ class TabsPage(WidgetBasePage):
         Returns:
             bool: True если вкладка "What" активна
         """
-        what_tab = self.page.locator(TabsLocators.WHAT_TAB)
+        what_tab = self.locator(TabsLocators.WHAT_TAB)
         tab_class = what_tab.get_attribute("class") or ""
         return "active" in tab_class or "selected" in tab_class
 
@@ -125,7 +125,7 @@ class TabsPage(WidgetBasePage):
         Returns:
             bool: True если вкладка "Origin" активна
         """
-        origin_tab = self.page.locator(TabsLocators.ORIGIN_TAB)
+        origin_tab = self.locator(TabsLocators.ORIGIN_TAB)
         tab_class = origin_tab.get_attribute("class") or ""
         return "active" in tab_class or "selected" in tab_class
 
@@ -136,7 +136,7 @@ class TabsPage(WidgetBasePage):
         Returns:
             bool: True если вкладка "Use" активна
         """
-        use_tab = self.page.locator(TabsLocators.USE_TAB)
+        use_tab = self.locator(TabsLocators.USE_TAB)
         tab_class = use_tab.get_attribute("class") or ""
         return "active" in tab_class or "selected" in tab_class
 
@@ -148,7 +148,7 @@ class TabsPage(WidgetBasePage):
             bool: True если вкладка "More" активна
         """
         if self.is_more_tab_enabled():
-            more_tab = self.page.locator(TabsLocators.MORE_TAB)
+            more_tab = self.locator(TabsLocators.MORE_TAB)
             tab_class = more_tab.get_attribute("class") or ""
             return "active" in tab_class or "selected" in tab_class
         return False
@@ -160,7 +160,7 @@ class TabsPage(WidgetBasePage):
         Returns:
             bool: True если вкладка "More" доступна
         """
-        more_tab = self.page.locator(TabsLocators.MORE_TAB)
+        more_tab = self.locator(TabsLocators.MORE_TAB)
         return more_tab.is_visible() and more_tab.is_enabled()
 
     def get_active_tab_name(self) -> str:
@@ -189,7 +189,7 @@ class TabsPage(WidgetBasePage):
             list: Список названий всех вкладок
         """
         tab_names = []
-        tab_elements = self.page.locator(".nav-tabs .nav-item")
+        tab_elements = self.locator(".nav-tabs .nav-item")
 
         for i in range(tab_elements.count()):
             tab = tab_elements.nth(i)
@@ -323,9 +323,9 @@ class TabsPage(WidgetBasePage):
         """
         # Проверяем наличие tabindex атрибутов у вкладок
         try:
-            what_tab = self.page.locator(TabsLocators.WHAT_TAB)
-            origin_tab = self.page.locator(TabsLocators.ORIGIN_TAB)
-            use_tab = self.page.locator(TabsLocators.USE_TAB)
+            what_tab = self.locator(TabsLocators.WHAT_TAB)
+            origin_tab = self.locator(TabsLocators.ORIGIN_TAB)
+            use_tab = self.locator(TabsLocators.USE_TAB)
 
             what_tabindex = what_tab.get_attribute("tabindex")
             origin_tabindex = origin_tab.get_attribute("tabindex")
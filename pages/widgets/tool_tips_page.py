@@ -4,9 +4,85 @@ Page Object для страницы Tool Tips.
 """
 
 import time
+import logging
+from typing import Dict, Optional
 from playwright.sync_api import Page
+from data import Timeouts
 from locators.widgets.tooltips_locators import ToolTipsLocators
 from pages.widgets.base_page import WidgetBasePage
+from utils.geometry import Layout, Rect, overlaps, placement, read_layout, within
+
+logger = logging.getLogger(__name__)
+
+# Элементы страницы с подсказками для сбора (имя -> селектор), порядок наведения
+TOOLTIP_TARGETS = {
+    "button": ToolTipsLocators.TOOLTIP_BUTTON,
+    "text_field": ToolTipsLocators.TOOLTIP_TEXT_FIELD,
+    "contrary_link": ToolTipsLocators.TOOLTIP_TEXT_LINK,
+    "section_link": ToolTipsLocators.TOOLTIP_SECTION_LINK,
+}
+
+# Устанавливает (один раз на документ) наблюдатель за вставкой подсказок. Каждая
+# подсказка с непустым текстом получает порядковый номер и момент появления
+# (performance.now() в колбэке MutationObserver); возвращается текущий номер, чтобы
+# подсказки, показанные до наведения, не принимались за новые
+TOOLTIP_OBSERVER_SCRIPT = """
+(selector) => {
+    let state = window.__qaTooltips;
+    if (!state) {
+        state = {seq: 0, latest: null, notify: null, seen: new WeakSet()};
+        state.capture = () => {
+            for (const el of document.querySelectorAll(selector)) {
+                if (state.seen.has(el)) continue;
+                const text = (el.innerText || el.textContent || '').trim();
+                if (!text) continue;
+                state.seen.add(el);
+                state.seq += 1;
+                state.latest = {seq: state.seq, el, text, at: performance.now()};
+                if (state.notify) state.notify();
+            }
+        };
+        state.observer = new MutationObserver(state.capture);
+        state.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        window.__qaTooltips = state;
+    }
+    state.capture();
+    return state.seq;
+}
+"""
+
+# Ожидает подсказку с номером больше after и возвращает ее текст, геометрию и
+# геометрию элемента под курсором. Размеры снимаются через два кадра после появления,
+# когда popper уже выставил позицию подсказки
+WAIT_TOOLTIP_SCRIPT = """
+({after, timeout}) => new Promise(resolve => {
+    const state = window.__qaTooltips;
+    if (!state) return resolve(null);
+    const box = el => {
+        const rect = el.getBoundingClientRect();
+        return {x: rect.x, y: rect.y, width: rect.width, height: rect.height};
+    };
+    const measure = () => requestAnimationFrame(() => requestAnimationFrame(() => {
+        const {seq, el, text, at} = state.latest;
+        const placement = el.getAttribute('x-placement')
+            || el.getAttribute('data-popper-placement')
+            || ((el.className.match && el.className.match(/bs-tooltip-(\\w+)/)) || [])[1]
+            || null;
+        const hovered = [...document.querySelectorAll(':hover')].pop();
+        resolve({
+            seq, text, at, placement, ...box(el),
+            element: hovered ? box(hovered) : null,
+        });
+    }));
+    if (state.latest && state.latest.seq > after) return measure();
+    const timer = setTimeout(() => { state.notify = null; resolve(null); }, timeout);
+    state.notify = () => {
+        clearTimeout(timer);
+        state.notify = null;
+        measure();
+    };
+})
+"""
 
 
 class ToolTipsPage(WidgetBasePage):
@@ -56,27 +132,6 @@ class ToolTipsPage(WidgetBasePage):
         self.log_step("Наводим курсор на ссылку раздела")
         self.hover_and_wait(ToolTipsLocators.TOOLTIP_SECTION_LINK)
 
-    def get_tooltip_text(self) -> str:
-        """
-        Получает текст видимого tooltip.
-
-        Returns:
-            str: Текст tooltip или пустая строка если tooltip не виден
-        """
-        tooltip_selectors = [
-            ".tooltip-inner",
-            ".tooltip .tooltip-inner",
-            "[role='tooltip']",
-            ".react-tooltip",
-        ]
-
-        for selector in tooltip_selectors:
-            tooltip = self.page.locator(selector)
-            if tooltip.is_visible():
-                return tooltip.inner_text().strip()
-
-        return ""
-
     def is_tooltip_visible(self) -> bool:
         """
         Проверяет видимость tooltip.
@@ -98,6 +153,58 @@ class ToolTipsPage(WidgetBasePage):
         """
         return self.wait_for_tooltip(timeout=timeout)
 
+    def harvest_tooltips(
+        self,
+        targets: Optional[Dict[str, str]] = None,
+        timeout: int = Timeouts.TOOLTIP,
+        move_away: bool = True,
+    ) -> Dict[str, dict]:
+        """
+        Собирает подсказки элементов: наводит курсор на каждый элемент по очереди
+        и получает подсказку, как только наблюдатель в странице зафиксирует ее
+        появление (без фиксированных пауз).
+
+        Args:
+            targets: Элементы {имя: селектор} (по умолчанию TOOLTIP_TARGETS)
+            timeout: Максимальное ожидание подсказки одного элемента в миллисекундах
+            move_away: Убрать курсор с элементов после сбора
+
+        Returns:
+            dict: {имя: подсказка} - text, x, y, width, height, placement,
+                element (геометрия элемента под курсором), at_ms (момент появления
+                от начала навигации), elapsed_ms (наведение и ожидание);
+                пустой словарь, если подсказка не появилась
+
+        Example:
+            {
+                'button': {'text': 'You hovered over the Button', 'x': 412.5,
+                           'y': 236.0, 'width': 194.2, 'height': 34.0,
+                           'placement': 'right', ...},
+                ...
+            }
+        """
+        targets = targets or TOOLTIP_TARGETS
+        self.log_step(f"Собираем подсказки элементов: {', '.join(targets)}")
+
+        seq = self.page.evaluate(TOOLTIP_OBSERVER_SCRIPT, ToolTipsLocators.TOOLTIP)
+        tooltips = {}
+        for name, selector in targets.items():
+            started = time.perf_counter()
+            self.locator(selector).hover(timeout=timeout)
+            tooltip = self.page.evaluate(WAIT_TOOLTIP_SCRIPT, {"after": seq, "timeout": timeout})
+            if tooltip is None:
+                logger.warning(f"Подсказка {name} ({selector}) не появилась за {timeout} мс")
+                tooltips[name] = {}
+                continue
+            seq = tooltip.pop("seq")
+            tooltip["at_ms"] = round(tooltip.pop("at"), 1)
+            tooltip["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            tooltips[name] = tooltip
+
+        if move_away:
+            self.move_cursor_away()
+        return tooltips
+
     def hover_and_get_tooltip(self, element_selector: str) -> str:
         """
         Наводит курсор на элемент и получает текст tooltip.
@@ -111,15 +218,8 @@ class ToolTipsPage(WidgetBasePage):
         Postconditions: курсор наведен на элемент, tooltip виден
         """
         self.log_step(f"Наводим курсор и получаем tooltip для: {element_selector}")
-
-        self.page.hover(element_selector)
-
-        # Ждем появления tooltip
-        if self.wait_for_tooltip_to_appear(3000):
-            time.sleep(500)  # Дополнительная задержка для стабилизации
-            return self.get_tooltip_text()
-        else:
-            return ""
+        tooltips = self.harvest_tooltips({element_selector: element_selector}, move_away=False)
+        return tooltips[element_selector].get("text", "")
 
     def get_button_tooltip(self) -> str:
         """
@@ -163,9 +263,14 @@ class ToolTipsPage(WidgetBasePage):
         Postconditions: все tooltip скрыты.
         """
         self.log_step("Убираем курсор от элементов")
-        # Перемещаем курсор в нейтральную область
+        # Перемещаем курсор в нейтральную область и ждем скрытия подсказки
         self.page.mouse.move(50, 50)
-        time.sleep(500)
+        try:
+            self.page.wait_for_selector(
+                ToolTipsLocators.TOOLTIP, state="hidden", timeout=Timeouts.TOOLTIP
+            )
+        except Exception:
+            logger.warning("Подсказка не скрылась после ухода курсора")
 
     def verify_tooltip_positioning(self, element_selector: str) -> dict:
         """
@@ -201,14 +306,14 @@ class ToolTipsPage(WidgetBasePage):
             result["tooltip_visible"] = True
 
             # Получаем границы элемента
-            element = self.page.locator(element_selector)
+            element = self.locator(element_selector)
             result["element_bounds"] = element.bounding_box()
 
             # Пытаемся найти tooltip и получить его границы
             tooltip_selectors = [".tooltip-inner", "[role='tooltip']", ".react-tooltip"]
 
             for selector in tooltip_selectors:
-                tooltip = self.page.locator(selector)
+                tooltip = self.locator(selector)
                 if tooltip.is_visible():
                     result["tooltip_bounds"] = tooltip.bounding_box()
 
@@ -229,7 +334,8 @@ class ToolTipsPage(WidgetBasePage):
 
     def test_all_tooltips(self) -> dict:
         """
-        Тестирует все tooltip на странице и собирает их тексты.
+        Тестирует все tooltip на странице и собирает их тексты
+        (одним проходом harvest_tooltips).
 
         Returns:
             dict: Словарь с текстами всех tooltip
@@ -242,25 +348,8 @@ class ToolTipsPage(WidgetBasePage):
                 'section_link': 'You hovered over the 1.10.32'
             }
         """
-        tooltips = {}
-
-        # Тестируем кнопку
-        tooltips["button"] = self.get_button_tooltip()
-        self.move_away_from_elements()
-
-        # Тестируем текстовое поле
-        tooltips["text_field"] = self.get_text_field_tooltip()
-        self.move_away_from_elements()
-
-        # Тестируем ссылку Contrary
-        tooltips["contrary_link"] = self.get_contrary_link_tooltip()
-        self.move_away_from_elements()
-
-        # Тестируем ссылку раздела
-        tooltips["section_link"] = self.get_section_link_tooltip()
-        self.move_away_from_elements()
-
-        return tooltips
+        tooltips = self.harvest_tooltips()
+        return {name: tooltip.get("text", "") for name, tooltip in tooltips.items()}
 
     def get_elements_with_tooltips(self) -> list:
         """
@@ -269,49 +358,39 @@ class ToolTipsPage(WidgetBasePage):
         Returns:
             list: Список элементов с информацией о подсказках
         """
-        elements = []
-
-        # Проверяем кнопку
-        button_element = self.page.locator(ToolTipsLocators.TOOLTIP_BUTTON)
-        if button_element.is_visible():
-            elements.append({
-                "type": "button",
-                "selector": ToolTipsLocators.TOOLTIP_BUTTON,
-                "element_text": "Button",
-                "tooltip_text": ToolTipsLocators.BUTTON_TOOLTIP_TEXT
-            })
-
-        # Проверяем текстовое поле
-        text_field_element = self.page.locator(ToolTipsLocators.TOOLTIP_TEXT_FIELD)
-        if text_field_element.is_visible():
-            elements.append({
-                "type": "text_field",
-                "selector": ToolTipsLocators.TOOLTIP_TEXT_FIELD,
-                "element_text": "Text Field",
-                "tooltip_text": ToolTipsLocators.INPUT_TOOLTIP_TEXT
-            })
-
-        # Проверяем ссылку Contrary
-        contrary_link = self.page.locator(ToolTipsLocators.TOOLTIP_TEXT_LINK)
-        if contrary_link.is_visible():
-            elements.append({
-                "type": "contrary_link",
-                "selector": ToolTipsLocators.TOOLTIP_TEXT_LINK,
-                "element_text": "Contrary",
-                "tooltip_text": ToolTipsLocators.LINK_TOOLTIP_TEXT
-            })
-
-        # Проверяем ссылку раздела
-        section_link = self.page.locator(ToolTipsLocators.TOOLTIP_SECTION_LINK)
-        if section_link.is_visible():
-            elements.append({
-                "type": "section_link",
-                "selector": ToolTipsLocators.TOOLTIP_SECTION_LINK,
-                "element_text": "1.10.32",
-                "tooltip_text": ToolTipsLocators.SECTION_TOOLTIP_TEXT
-            })
-
-        return elements
+        layout = self.get_layout(include_tooltip=False)
+        details = {
+            "button": ("Button", ToolTipsLocators.BUTTON_TOOLTIP_TEXT),
+            "text_field": ("Text Field", ToolTipsLocators.INPUT_TOOLTIP_TEXT),
+            "contrary_link": ("Contrary", ToolTipsLocators.LINK_TOOLTIP_TEXT),
+            "section_link": ("1.10.32", ToolTipsLocators.SECTION_TOOLTIP_TEXT),
+        }
+        return [
+            {
+                "type": name,
+                "selector": selector,
+                "element_text": details[name][0],
+                "tooltip_text": details[name][1],
+            }
+            for name, selector in TOOLTIP_TARGETS.items()
+            if layout[name].visible
+        ]
+
+    def get_layout(self, include_tooltip: bool = True) -> Layout:
+        """
+        Читает геометрию всех элементов с подсказками (и показанной подсказки)
+        одним запросом к странице.
+
+        Args:
+            include_tooltip: Добавить показанную подсказку под именем "tooltip"
+
+        Returns:
+            Layout: Геометрия элементов по именам TOOLTIP_TARGETS
+        """
+        selectors = dict(TOOLTIP_TARGETS)
+        if include_tooltip:
+            selectors["tooltip"] = ToolTipsLocators.TOOLTIP_SHOW
+        return read_layout(self.page, selectors)
 
     def hover_over_element(self, index: int) -> bool:
         """
@@ -345,29 +424,33 @@ class ToolTipsPage(WidgetBasePage):
             elements = self.get_elements_with_tooltips()
             if 0 <= index < len(elements):
                 # Для простоты проверяем общую видимость tooltip
-                return self.page.locator(".tooltip").is_visible()
+                return self.locator(".tooltip").is_visible()
 
-        return self.page.locator(".tooltip").is_visible()
+        return self.locator(".tooltip").is_visible()
 
     def get_tooltip_text(self, index: int = None) -> str:
         """
-        Получает текст tooltip.
+        Получает текст видимого tooltip.
+        Альтернативные селекторы подсказки проверяются одним запросом
+        (BasePage.resolve_selector), первым - выученный для этой страницы.
 
         Args:
-            index: Индекс элемента (опционально)
+            index: Индекс элемента (опционально): если задан, на элемент наводится курсор
+                   и появление подсказки ожидается
 
         Returns:
-            str: Текст tooltip
+            str: Текст tooltip или пустая строка если tooltip не виден
         """
-        if index is not None:
-            elements = self.get_elements_with_tooltips()
-            if 0 <= index < len(elements):
-                # Наводим курсор и получаем текст
-                self.hover_over_element(index)
-                self.page.wait_for_timeout(500)
-                return self.get_tooltip_text()
+        timeout = 0
+        if index is not None and self.hover_over_element(index):
+            timeout = Timeouts.TOOLTIP
 
-        return self.get_tooltip_text()
+        selector = self.resolve_selector(
+            ToolTipsLocators.TOOLTIP_TEXT_CANDIDATES, "get_tooltip_text", timeout=timeout
+        )
+        if selector is None:
+            return ""
+        return self.locator(selector).first.inner_text().strip()
 
     def get_tooltip_position(self, index: int) -> dict:
         """
@@ -377,18 +460,16 @@ class ToolTipsPage(WidgetBasePage):
             index: Индекс элемента
 
         Returns:
-            dict: Позиция tooltip
+            dict: Позиция tooltip в формате bounding_box или пустой словарь
         """
-        elements = self.get_elements_with_tooltips()
-        if 0 <= index < len(elements):
-            self.hover_over_element(index)
-            self.page.wait_for_timeout(500)
-
-            tooltip = self.page.locator(".tooltip")
-            if tooltip.is_visible():
-                return tooltip.bounding_box()
-
-        return {}
+        if not self.hover_over_element(index):
+            return {}
+        if not self.wait_for_tooltip(ToolTipsLocators.TOOLTIP_SHOW, timeout=Timeouts.TOOLTIP):
+            return {}
+        rect = read_layout(self.page, [ToolTipsLocators.TOOLTIP_SHOW]).rect(
+            ToolTipsLocators.TOOLTIP_SHOW
+        )
+        return rect.as_dict() if rect else {}
 
     def move_cursor_away(self) -> None:
         """
@@ -408,8 +489,9 @@ class ToolTipsPage(WidgetBasePage):
         """
         elements = self.get_elements_with_tooltips()
         if 0 <= index < len(elements):
-            element = self.page.locator(elements[index]["selector"])
-            return element.bounding_box()
+            selector = elements[index]["selector"]
+            rect = read_layout(self.page, [selector]).rect(selector)
+            return rect.as_dict() if rect else {}
         return {}
 
     def get_element_size(self, index: int) -> dict:
@@ -449,24 +531,13 @@ class ToolTipsPage(WidgetBasePage):
             tooltip_size: Размер tooltip
 
         Returns:
-            str: Относительная позиция
+            str: Сторона подсказки: top, bottom, left, right, overlap или unknown
         """
-        if not all([element_pos, tooltip_pos]):
+        if not (element_pos and tooltip_pos):
             return "unknown"
-
-        element_center_x = element_pos.get("x", 0) + element_size.get("width", 0) / 2
-        element_center_y = element_pos.get("y", 0) + element_size.get("height", 0) / 2
-        tooltip_center_x = tooltip_pos.get("x", 0) + tooltip_size.get("width", 0) / 2
-        tooltip_center_y = tooltip_pos.get("y", 0) + tooltip_size.get("height", 0) / 2
-
-        if tooltip_center_y < element_center_y:
-            return "top"
-        elif tooltip_center_y > element_center_y:
-            return "bottom"
-        elif tooltip_center_x < element_center_x:
-            return "left"
-        else:
-            return "right"
+        element = Rect.from_dict({**element_pos, **(element_size or {})})
+        tooltip = Rect.from_dict({**tooltip_pos, **(tooltip_size or {})})
+        return placement([element], [tooltip])[0]
 
     def check_tooltip_element_overlap(self, element_pos, element_size, tooltip_pos, tooltip_size) -> bool:
         """
@@ -481,18 +552,11 @@ class ToolTipsPage(WidgetBasePage):
         Returns:
             bool: True если есть перекрытие
         """
-        if not all([element_pos, tooltip_pos]):
+        if not (element_pos and tooltip_pos):
             return False
-
-        element_right = element_pos.get("x", 0) + element_size.get("width", 0)
-        element_bottom = element_pos.get("y", 0) + element_size.get("height", 0)
-        tooltip_right = tooltip_pos.get("x", 0) + tooltip_size.get("width", 0)
-        tooltip_bottom = tooltip_pos.get("y", 0) + tooltip_size.get("height", 0)
-
-        return not (element_right < tooltip_pos.get("x", 0) or
-                   tooltip_right < element_pos.get("x", 0) or
-                   element_bottom < tooltip_pos.get("y", 0) or
-                   tooltip_bottom < element_pos.get("y", 0))
+        element = Rect.from_dict({**element_pos, **(element_size or {})})
+        tooltip = Rect.from_dict({**tooltip_pos, **(tooltip_size or {})})
+        return overlaps([element], [tooltip])[0]
 
     def is_tooltip_within_viewport(self, tooltip_pos, tooltip_size) -> bool:
         """
@@ -512,13 +576,9 @@ class ToolTipsPage(WidgetBasePage):
         if not viewport_size:
             return True
 
-        tooltip_right = tooltip_pos.get("x", 0) + tooltip_size.get("width", 0)
-        tooltip_bottom = tooltip_pos.get("y", 0) + tooltip_size.get("height", 0)
-
-        return (tooltip_pos.get("x", 0) >= 0 and
-                tooltip_pos.get("y", 0) >= 0 and
-                tooltip_right <= viewport_size["width"] and
-                tooltip_bottom <= viewport_size["height"])
+        tooltip = Rect.from_dict({**tooltip_pos, **(tooltip_size or {})})
+        viewport = Rect(0, 0, viewport_size["width"], viewport_size["height"])
+        return within([tooltip], viewport)[0]
 
     def analyze_tooltip_types(self) -> dict:
         """
@@ -591,7 +651,7 @@ class ToolTipsPage(WidgetBasePage):
         """
         elements = self.get_elements_with_tooltips()
         if 0 <= index < len(elements):
-            element = self.page.locator(elements[index]["selector"])
+            element = self.locator(elements[index]["selector"])
             return {
                 "aria-describedby": element.get_attribute("aria-describedby"),
                 "aria-label": element.get_attribute("aria-label"),
@@ -612,7 +672,7 @@ class ToolTipsPage(WidgetBasePage):
         """
         elements = self.get_elements_with_tooltips()
         if 0 <= index < len(elements):
-            element = self.page.locator(elements[index]["selector"])
+            element = self.locator(elements[index]["selector"])
             return element.is_enabled() and element.is_visible()
         return False
 
@@ -628,7 +688,7 @@ class ToolTipsPage(WidgetBasePage):
         """
         elements = self.get_elements_with_tooltips()
         if 0 <= index < len(elements):
-            element = self.page.locator(elements[index]["selector"])
+            element = self.locator(elements[index]["selector"])
             element.focus()
             return True
         return False
@@ -645,7 +705,7 @@ class ToolTipsPage(WidgetBasePage):
         """
         elements = self.get_elements_with_tooltips()
         if 0 <= index < len(elements):
-            element = self.page.locator(elements[index]["selector"])
+            element = self.locator(elements[index]["selector"])
             element.blur()
             return True
         return False
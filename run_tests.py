@@ -4,11 +4,22 @@
 """
 
 import os
+import json
 import subprocess
 import argparse
 import sys
 from pathlib import Path
 
+from utils.autoscaler import (
+    AdaptiveRunner,
+    ScalingPolicy,
+    build_reports,
+    clear_stale_samples,
+    collect_test_batches,
+)
+from utils.data_corpus import build_corpus
+from utils.locator_registry import validate_locators
+
 
 class TestRunner:
     """Улучшенный класс для управления запуском тестов."""
@@ -41,6 +52,10 @@ class TestRunner:
         parallel: bool = False,
         verbose: bool = True,
         html_report: bool = False,
+        perf_metrics: bool = False,
+        network_stats: bool = False,
+        resource_sampler: bool = False,
+        adaptive_timeouts: bool = False,
     ):
         """Запускает тесты с указанными параметрами."""
         base_command = ["python", "-m", "pytest", "--alluredir=allure-results"]
@@ -57,9 +72,88 @@ class TestRunner:
         if html_report:
             base_command.extend(["--html=pytest-report.html", "--self-contained-html"])
 
+        if perf_metrics:
+            base_command.append("--perf-metrics")
+
+        if network_stats:
+            base_command.append("--network-stats")
+
+        if resource_sampler:
+            base_command.append("--resource-sampler")
+
+        if adaptive_timeouts:
+            base_command.append("--adaptive-timeouts")
+
         command = " ".join(base_command)
         return self.run_command(command)[0]
 
+    def run_benchmark(
+        self,
+        save_baseline: bool = False,
+        threshold: float = None,
+        verbose: bool = True,
+    ):
+        """Запускает бенчмарк фреймворка и сравнивает результаты с базовой линией."""
+        command_parts = [
+            "python",
+            "-m",
+            "pytest",
+            "tests/benchmark",
+            "-m",
+            "benchmark",
+            "--benchmark",
+        ]
+
+        if verbose:
+            command_parts.append("-v")
+
+        if save_baseline:
+            command_parts.append("--benchmark-save-baseline")
+
+        if threshold is not None:
+            command_parts.append(f"--benchmark-threshold={threshold}")
+
+        return self.run_command(" ".join(command_parts))[0]
+
+    def recommended_workers(self) -> int:
+        """Возвращает рекомендацию сэмплера ресурсов (--resource-sampler), если она есть."""
+        report_path = self.project_root / "resource-results" / "resource_report.json"
+        try:
+            with open(report_path, "r", encoding="utf-8") as f:
+                return int(json.load(f)["recommended_workers"])
+        except (OSError, ValueError, KeyError):
+            return os.cpu_count() or 1
+
+    def run_adaptive(
+        self,
+        marker: str = None,
+        test_path: str = None,
+        start_workers: int = 2,
+        max_workers: int = None,
+    ):
+        """Запускает тесты с адаптивным числом воркеров по загрузке машины."""
+        selection = [test_path] if test_path else []
+        if marker:
+            selection.extend(["-m", marker])
+
+        batches = collect_test_batches(selection)
+        if not batches:
+            print("❌ Тесты для запуска не найдены.")
+            return 5
+
+        policy = ScalingPolicy(max_workers=max_workers or self.recommended_workers())
+        runner = AdaptiveRunner(
+            policy,
+            start_workers=start_workers,
+            pytest_args=["--alluredir=allure-results", "-q"]
+            + (["-m", marker] if marker else []),
+        )
+        # Пакеты только сохраняют свои замеры, отчеты строятся один раз после всех пакетов
+        clear_stale_samples()
+        exit_code = runner.run(batches)
+        build_reports(str(self.allure_results), str(self.allure_report))
+        return exit_code
+
     def run_specific_tests(self, test_path: str, verbose: bool = True):
         """Запускает конкретные тесты по пути."""
         command = f"python -m pytest {test_path} --alluredir=allure-results"
@@ -80,6 +174,13 @@ class TestRunner:
             "htmlcov",
             "pytest-report.html",
             ".coverage",
+            "benchmark-results",
+            "perf-results",
+            "network-results",
+            "resource-results",
+            "adaptive-results",
+            ".dataset-cache",
+            "locator-results",
         ]
 
         for path_str in paths_to_clean:
@@ -135,6 +236,12 @@ def main():
             "install",
             "coverage",
             "lint",
+            "benchmark",
+            "benchmark-baseline",
+            "adaptive",
+            "build-corpus",
+            "data-driven",
+            "validate-locators",
         ],
         help="Действие для выполнения",
     )
@@ -151,6 +258,73 @@ def main():
         help="Дополнительно создать HTML отчет pytest",
     )
 
+    parser.add_argument(
+        "--perf-metrics",
+        action="store_true",
+        help="Собирать браузерные метрики страниц (отчет в perf-results/)",
+    )
+
+    parser.add_argument(
+        "--network-stats",
+        action="store_true",
+        help="Учитывать сетевой трафик тестов (отчет в network-results/)",
+    )
+
+    parser.add_argument(
+        "--resource-sampler",
+        action="store_true",
+        help="Замерять CPU/RSS воркеров и браузеров (отчет в resource-results/)",
+    )
+
+    parser.add_argument(
+        "--adaptive-timeouts",
+        action="store_true",
+        help="Таймауты по истории длительностей прошлых прогонов (timeout-history.json)",
+    )
+
+    parser.add_argument(
+        "--marker", help="Маркер pytest для режима adaptive (например, smoke)"
+    )
+
+    parser.add_argument(
+        "--start-workers",
+        type=int,
+        default=2,
+        help="Начальное число воркеров в режиме adaptive",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Максимальное число воркеров в режиме adaptive "
+        "(по умолчанию рекомендация --resource-sampler или число CPU)",
+    )
+
+    parser.add_argument(
+        "--corpus-size",
+        type=int,
+        default=100_000,
+        help="Количество записей корпуса тестовых данных (build-corpus)",
+    )
+
+    parser.add_argument(
+        "--corpus-seed",
+        type=int,
+        default=0,
+        help="Зерно генерации корпуса тестовых данных (build-corpus)",
+    )
+
+    parser.add_argument(
+        "--benchmark-threshold",
+        type=float,
+        help="Допустимый относительный рост метрики бенчмарка (по умолчанию 0.2)",
+    )
+
+    parser.add_argument(
+        "--har",
+        help="HAR файл, из которого отдаются страницы при проверке локаторов (validate-locators)",
+    )
+
     args = parser.parse_args()
 
     runner = TestRunner()
@@ -195,6 +369,43 @@ def main():
         )[0]
         sys.exit(result)
 
+    elif args.action in ("benchmark", "benchmark-baseline"):
+        result = runner.run_benchmark(
+            save_baseline=args.action == "benchmark-baseline",
+            threshold=args.benchmark_threshold,
+            verbose=verbose,
+        )
+        sys.exit(result)
+
+    elif args.action == "adaptive":
+        result = runner.run_adaptive(
+            marker=args.marker,
+            test_path=args.path,
+            start_workers=args.start_workers,
+            max_workers=args.max_workers,
+        )
+        sys.exit(result)
+
+    elif args.action == "build-corpus":
+        path = os.getenv("TEST_DATA_CORPUS", "test_data_corpus.bin")
+        print(f"🏗️  Генерируем корпус из {args.corpus_size} записей: {path}")
+        build_corpus(path, count=args.corpus_size, seed=args.corpus_seed)
+        print("✅ Корпус тестовых данных создан.")
+        sys.exit(0)
+
+    elif args.action == "validate-locators":
+        source = args.har or os.getenv("DEMOQA_BASE_URL", "https://demoqa.com")
+        print(f"🔎 Проверяем селекторы локаторов ({source})")
+        summary = validate_locators(har=args.har)
+        print(
+            f"Селекторов: {summary['total']}, мертвых: {len(summary['dead'])}, "
+            f"неоднозначных: {len(summary['ambiguous'])}, неразобранных: {len(summary['invalid'])}"
+        )
+        for item in summary["slowest"][:5]:
+            print(f"  🐢 {item['owner']}.{item['name']}: {item['cost_us']} мкс ({item['selector']})")
+        print("✅ Отчет: locator-results/locator_report.json")
+        sys.exit(0)
+
     elif args.action == "lint":
         commands = [
             "flake8 pages tests locators --max-line-length=120",
@@ -219,6 +430,7 @@ def main():
             "forms": ("forms", False),
             "interactions": ("interactions", False),
             "parallel": (None, True),
+            "data-driven": ("data_driven", True),
         }
 
         if args.action in action_map:
@@ -228,6 +440,10 @@ def main():
                 parallel=parallel,
                 verbose=verbose,
                 html_report=args.html_report,
+                perf_metrics=args.perf_metrics,
+                network_stats=args.network_stats,
+                resource_sampler=args.resource_sampler,
+                adaptive_timeouts=args.adaptive_timeouts,
             )
         else:
             print(f"❌ Неизвестное действие: {args.action}")
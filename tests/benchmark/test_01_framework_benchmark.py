@@ -0,0 +1,95 @@
+"""
+Бенчмарк фреймворка.
+Замеряет производительность самой тестовой обвязки:
+- Время создания фикстур страниц (замеряется автоматически хуком в conftest)
+- Время навигации по каждому URL из data.URLs
+- Типовые операции Page Object: извлечение таблицы, заполнение формы,
+  drag-and-drop, сбор подсказок
+
+Запуск: python run_tests.py benchmark (или pytest -m benchmark --benchmark).
+Для прогона против локального стенда задайте DEMOQA_BASE_URL.
+"""
+
+import pytest
+import allure
+from data import URLs, TestData
+from pages.elements.web_tables_page import WebTablesPage
+from pages.forms.practice_form_page import AutomationPracticeFormPage
+from pages.interactions.droppable_page import DroppablePage
+from pages.widgets.tool_tips_page import ToolTipsPage
+
+NAVIGATION_URLS = [
+    (name, value)
+    for name, value in vars(URLs).items()
+    if name.isupper() and name not in ("BASE_URL", "BOOK_STORE_API")
+]
+
+
+@allure.epic("Benchmark")
+@allure.feature("Navigation")
+@pytest.mark.benchmark
+@pytest.mark.parametrize("url_name,url", NAVIGATION_URLS, ids=[n for n, _ in NAVIGATION_URLS])
+def test_navigation_time(page, benchmark_recorder, url_name, url):
+    """
+    Замер времени навигации до состояния domcontentloaded и появления #app.
+    """
+    with benchmark_recorder.measure(f"navigation.{url_name}"):
+        response = page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        page.locator("#app").wait_for(state="attached", timeout=10000)
+
+    assert response is None or response.status < 400, f"{url} вернул {response.status}"
+
+
+@allure.epic("Benchmark")
+@allure.feature("Page Object Operations")
+@pytest.mark.benchmark
+def test_web_table_extraction(web_tables_page: WebTablesPage, benchmark_recorder):
+    """
+    Замер извлечения всех строк таблицы Web Tables.
+    """
+    with benchmark_recorder.measure("operation.web_tables.get_table_data"):
+        rows = web_tables_page.get_table_data()
+
+    assert rows, "Таблица должна содержать записи"
+
+
+@allure.epic("Benchmark")
+@allure.feature("Page Object Operations")
+@pytest.mark.benchmark
+def test_practice_form_fill(
+    practice_form_page: AutomationPracticeFormPage, benchmark_recorder
+):
+    """
+    Замер заполнения Practice Form без отправки.
+    """
+    form_data = dict(TestData.FORM_DATA["practice_form"])
+    form_data["address"] = form_data.pop("current_address")
+
+    with benchmark_recorder.measure("operation.practice_form.fill_complete_form"):
+        practice_form_page.fill_complete_form(form_data)
+
+
+@allure.epic("Benchmark")
+@allure.feature("Page Object Operations")
+@pytest.mark.benchmark
+def test_drag_and_drop(droppable_page: DroppablePage, benchmark_recorder):
+    """
+    Замер простого drag-and-drop на странице Droppable.
+    """
+    with benchmark_recorder.measure("operation.droppable.drag_to_drop_box"):
+        droppable_page.drag_to_drop_box()
+
+    assert droppable_page.is_dropped(), "Элемент должен быть сброшен в drop box"
+
+
+@allure.epic("Benchmark")
+@allure.feature("Page Object Operations")
+@pytest.mark.benchmark
+def test_tooltip_harvest(tool_tips_page: ToolTipsPage, benchmark_recorder):
+    """
+    Замер сбора текстов всех подсказок на странице Tool Tips.
+    """
+    with benchmark_recorder.measure("operation.tool_tips.test_all_tooltips"):
+        tooltips = tool_tips_page.test_all_tooltips()
+
+    assert len(tooltips) == 4, f"Ожидалось 4 подсказки, получено: {tooltips}"
@@ -0,0 +1,84 @@
+"""
+Data-driven тесты: строки наборов из datasets/ прогоняются через общий сценарий
+на одной странице воркера со сбросом состояния между строками.
+Каждая строка - отдельный результат pytest.
+"""
+
+import pytest
+import allure
+from data import URLs, PracticeForm, ValidUser
+from pages.elements.web_tables_page import WebTablesPage
+from pages.forms.practice_form_page import AutomationPracticeFormPage
+from utils.data_driven import DataDrivenSession, Scenario
+from utils.datasets import datasets
+
+
+def _submit_practice_form(form_page: AutomationPracticeFormPage, row: PracticeForm) -> None:
+    """Заполняет и отправляет форму, проверяет таблицу результатов."""
+    data = row.to_dict()
+    data["address"] = data.pop("current_address")
+    form_page.fill_complete_form(data)
+    form_page.submit_form()
+
+    assert form_page.is_modal_visible(), "Должно появиться модальное окно с результатами"
+    table_text = form_page.page.locator(".modal-body .table").inner_text()
+    assert row.email in table_text, f"Email {row.email} отсутствует в результатах"
+    assert row.mobile in table_text, f"Телефон {row.mobile} отсутствует в результатах"
+
+
+def _reset_practice_form(form_page: AutomationPracticeFormPage, row: PracticeForm) -> None:
+    """Форма не очищается после отправки - загружаем страницу заново."""
+    form_page.page.goto(URLs.PRACTICE_FORM, wait_until="domcontentloaded")
+
+
+def _add_web_table_person(tables_page: WebTablesPage, row: ValidUser) -> None:
+    """Добавляет запись и проверяет, что она появилась в таблице."""
+    tables_page.add_new_person(row.to_dict())
+    assert tables_page.find_row_by_email(row.email) >= 0, f"Запись {row.email} не найдена"
+
+
+def _delete_web_table_person(tables_page: WebTablesPage, row: ValidUser) -> None:
+    """Удаляет добавленную запись, чтобы таблица вернулась к исходным строкам."""
+    index = tables_page.find_row_by_email(row.email)
+    if index < 0:
+        raise LookupError(f"Запись {row.email} не найдена для удаления")
+    tables_page.delete_row(index)
+
+
+PRACTICE_FORM = Scenario(
+    name="practice_form",
+    url=URLs.PRACTICE_FORM,
+    page_class=AutomationPracticeFormPage,
+    run=_submit_practice_form,
+    reset=_reset_practice_form,
+)
+
+WEB_TABLES = Scenario(
+    name="web_tables",
+    url=URLs.WEB_TABLES,
+    page_class=WebTablesPage,
+    run=_add_web_table_person,
+    reset=_delete_web_table_person,
+)
+
+
+@allure.epic("Data-Driven")
+@allure.feature("Practice Form")
+@pytest.mark.data_driven
+@pytest.mark.forms
+@pytest.mark.parametrize("row", datasets.params("practice_form_rows", PracticeForm))
+def test_practice_form_rows(data_driven_session: DataDrivenSession, row):
+    """Отправка Practice Form для каждой строки datasets/practice_form_rows.csv."""
+    result = data_driven_session.run_row(PRACTICE_FORM, row)
+    allure.attach(str(result), "row_result")
+
+
+@allure.epic("Data-Driven")
+@allure.feature("Web Tables")
+@pytest.mark.data_driven
+@pytest.mark.elements
+@pytest.mark.parametrize("row", datasets.params("web_tables_rows", ValidUser))
+def test_web_tables_rows(data_driven_session: DataDrivenSession, row):
+    """Добавление записи в Web Tables для каждой строки datasets/web_tables_rows.csv."""
+    result = data_driven_session.run_row(WEB_TABLES, row)
+    allure.attach(str(result), "row_result")
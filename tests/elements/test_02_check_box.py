@@ -10,6 +10,10 @@
 import pytest
 import allure
 from pages.elements.check_box_page import CheckBoxPage
+from data import URLs
+from locators.elements.check_box_locators import CheckboxLocators
+from utils.checkbox_model import CheckboxExplorer
+from utils.locator_registry import LocatorValidator
 
 
 @allure.epic("Elements")
@@ -306,3 +310,126 @@ def test_bulk_checkbox_operations(check_box_page: CheckBoxPage):
             "bulk_operations_summary",
             allure.attachment_type.JSON,
         )
+
+
+@allure.epic("Elements")
+@allure.feature("Check Box")
+@allure.story("Tree Snapshot")
+@pytest.mark.elements
+def test_tree_snapshot_select_many(check_box_page: CheckBoxPage):
+    """
+    Тест снимка дерева и массового выбора.
+
+    Проверяет, что выбор нескольких узлов выполняется минимальным числом кликов,
+    а состояния родителей в снимке соответствуют выбранным листьям.
+    """
+    with allure.step("Снимаем полное дерево"):
+        check_box_page.expand_all()
+        tree = check_box_page.snapshot()
+        check_box_page.log_step(f"Узлов в снимке: {len(tree.nodes)}")
+
+        assert tree.complete, "После раскрытия снимок должен содержать все узлы"
+        assert len(tree.all_leaves()) == 11, f"Ожидалось 11 листьев: {tree.all_leaves()}"
+        assert not tree.checked_leaves(), "Изначально отмеченных узлов быть не должно"
+
+    with allure.step("Выбираем Desktop, WorkSpace и Excel File"):
+        tree = check_box_page.select_many(["Desktop", "WorkSpace", "excelFile"])
+        check_box_page.log_step(f"План кликов: {check_box_page.last_plan}")
+
+        allure.attach(
+            str(check_box_page.last_plan), "click_plan", allure.attachment_type.JSON
+        )
+
+        assert len(check_box_page.last_plan) == 3, "Каждый узел выбирается одним кликом"
+        assert tree.state("Desktop") == "checked"
+        assert tree.state("Documents") == "indeterminate"
+        assert tree.state("Office") == "unchecked"
+        assert tree.state("Downloads") == "indeterminate"
+        assert tree.state("Home") == "indeterminate"
+
+    with allure.step("Дополняем выбор до всего дерева"):
+        tree = check_box_page.select_many(["Office", "Word File"])
+
+        # Клик по частично отмеченному Home отмечает оставшиеся листья разом
+        assert check_box_page.last_plan == ["home"], check_box_page.last_plan
+        assert tree.state("Home") == "checked", "Все листья отмечены - Home отмечен"
+
+    with allure.step("Снимаем выбор со всего дерева одним кликом"):
+        check_box_page.clear_all_selections()
+
+        assert check_box_page.last_plan == ["home"], (
+            f"Для снятия полностью отмеченного дерева достаточно клика по Home: "
+            f"{check_box_page.last_plan}"
+        )
+
+
+@allure.epic("Elements")
+@allure.feature("Check Box")
+@allure.story("Model-Based Exploration")
+@pytest.mark.elements
+@pytest.mark.regression
+def test_checkbox_tree_model_exploration(check_box_page: CheckBoxPage):
+    """
+    Модельный тест дерева чекбоксов.
+
+    Случайные и исчерпывающие последовательности действий сверяются после каждого
+    шага с моделью распространения отметок; расхождение сокращается до минимальной
+    воспроизводимой последовательности.
+    """
+    explorer = CheckboxExplorer(check_box_page)
+
+    with allure.step("Исчерпывающий обход последовательностей из двух действий"):
+        report = explorer.exhaustive(depth=2)
+        check_box_page.log_step(
+            f"Последовательностей: {report.sequences}, переходов: {report.transitions}, "
+            f"{report.per_minute} переходов/мин"
+        )
+        assert report.failure is None, f"Расхождение с моделью:\n{report.failure}"
+
+    with allure.step("Случайное исследование"):
+        report = explorer.explore(transitions=300, sequence_length=30, seed=20240601)
+        check_box_page.log_step(
+            f"Переходов: {report.transitions}, состояний: {report.states}, "
+            f"{report.per_minute} переходов/мин"
+        )
+        allure.attach(
+            str({
+                "transitions": report.transitions,
+                "sequences": report.sequences,
+                "states": report.states,
+                "per_minute": report.per_minute,
+            }),
+            "exploration_report",
+            allure.attachment_type.JSON,
+        )
+        assert report.failure is None, f"Расхождение с моделью:\n{report.failure}"
+
+
+@allure.epic("Elements")
+@allure.feature("Check Box")
+@allure.story("Locator Validation")
+@pytest.mark.elements
+def test_checkbox_locators_validation(check_box_page: CheckBoxPage):
+    """
+    Тест проверки селекторов CheckboxLocators.
+
+    Рабочие селекторы дерева должны находить элементы, Locator страницы кэшируется.
+    """
+    with allure.step("Проверяем селекторы класса на странице"):
+        reports = LocatorValidator(check_box_page.page).validate_class(
+            CheckboxLocators, URLs.CHECK_BOX
+        )
+        by_name = {report.name: report for report in reports}
+        allure.attach(
+            str([(r.name, r.status, r.count, r.cost_us) for r in reports]),
+            "checkbox_locators",
+            allure.attachment_type.JSON,
+        )
+
+        for name in ("EXPAND_ALL_BUTTON", "COLLAPSE_ALL_BUTTON", "HOME_CHECKBOX", "TREE_ROOT"):
+            assert by_name[name].status == "ok", f"{name}: {by_name[name]}"
+        assert by_name["ALL_TITLES"].count >= 1
+
+    with allure.step("Проверяем кэш локаторов"):
+        first = check_box_page.locator(CheckboxLocators.HOME_TITLE)
+        assert check_box_page.locator(CheckboxLocators.HOME_TITLE) is first
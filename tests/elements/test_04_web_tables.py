@@ -13,6 +13,7 @@ import allure
 import time
 from pages.elements.web_tables_page import WebTablesPage
 from locators.elements.web_tables_locators import WebTablesLocators
+from pages.base_page import BasePage
 
 
 @allure.epic("Elements")
@@ -676,3 +677,43 @@ def test_table_pagination(web_tables_page: WebTablesPage):
             web_tables_page.log_step("✅ Пагинация работает корректно")
         else:
             web_tables_page.log_step("⚠️ Обнаружены проблемы с пагинацией")
+
+
+@allure.epic("Elements")
+@allure.feature("Web Tables")
+@allure.story("Selector Resolution")
+@pytest.mark.elements
+def test_submit_selector_resolution(web_tables_page: WebTablesPage):
+    """
+    Тест разрешения альтернативных селекторов кнопки Submit.
+
+    Кандидаты проверяются одним запросом, победитель запоминается и при
+    следующем вызове проверяется первым.
+    """
+    with allure.step("Открываем форму и разрешаем селектор Submit"):
+        web_tables_page.click_add()
+        started = time.perf_counter()
+        selector = web_tables_page.resolve_selector(
+            WebTablesLocators.SUBMIT_CANDIDATES, "submit_form"
+        )
+        duration_ms = (time.perf_counter() - started) * 1000
+        web_tables_page.log_step(f"Найден {selector} за {duration_ms:.0f} мс")
+
+        assert selector in WebTablesLocators.SUBMIT_CANDIDATES
+        assert duration_ms < 1000, f"Разрешение не должно ждать таймаутов: {duration_ms:.0f} мс"
+
+    with allure.step("Проверяем выученный порядок"):
+        order = BasePage.selectors.order(
+            "WebTablesPage", "submit_form", WebTablesLocators.SUBMIT_CANDIDATES
+        )
+        assert order[0] == selector, f"Победитель должен проверяться первым: {order}"
+
+    with allure.step("Недоступные кандидаты не стоят таймаута каждый"):
+        started = time.perf_counter()
+        missing = web_tables_page.resolve_selector(
+            ["#missing-one", "#missing-two", "text=No such button"], "missing", timeout=500
+        )
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        assert missing is None
+        assert duration_ms < 1500, f"Ожидание должно быть общим: {duration_ms:.0f} мс"
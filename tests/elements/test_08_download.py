@@ -10,7 +10,6 @@
 import pytest
 import allure
 import os
-import tempfile
 from pathlib import Path
 from pages.elements.upload_download_page import UploadDownloadPage
 
@@ -20,58 +19,44 @@ from pages.elements.upload_download_page import UploadDownloadPage
 @allure.story("File Upload")
 @pytest.mark.elements
 @pytest.mark.smoke
-def test_upload_text_file(upload_download_page: UploadDownloadPage):
+def test_upload_text_file(upload_download_page: UploadDownloadPage, test_file):
     """
     Тест загрузки текстового файла.
 
-    Создает временный текстовый файл и проверяет его успешную загрузку.
+    Берет текстовый файл из кэша файлов и проверяет его успешную загрузку.
     """
     test_content = "This is a test file for upload functionality testing."
 
-    with allure.step("Создаем временный текстовый файл"):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as temp_file:
-            temp_file.write(test_content)
-            temp_file_path = temp_file.name
-
-        file_name = os.path.basename(temp_file_path)
-        upload_download_page.log_step(f"Создан временный файл: {file_name}")
+    with allure.step("Получаем текстовый файл из кэша"):
+        file_path = test_file(kind="text", name="upload_test.txt", content=test_content)
+        file_name = os.path.basename(file_path)
+        upload_download_page.log_step(f"Файл для загрузки: {file_name}")
 
         allure.attach(test_content, "test_file_content", allure.attachment_type.TEXT)
         allure.attach(file_name, "uploaded_filename", allure.attachment_type.TEXT)
 
-    try:
-        with allure.step("Загружаем файл через интерфейс"):
-            upload_download_page.log_step(f"Загрузка файла: {file_name}")
-            upload_download_page.upload_file(temp_file_path)
-
-        with allure.step("Проверяем успешность загрузки"):
-            upload_success = upload_download_page.is_file_uploaded()
-            upload_download_page.log_step(f"Файл успешно загружен: {upload_success}")
+    with allure.step("Загружаем файл через интерфейс"):
+        upload_download_page.log_step(f"Загрузка файла: {file_name}")
+        upload_download_page.upload_file(file_path)
 
-            assert upload_success, "Файл должен быть успешно загружен"
+    with allure.step("Проверяем успешность загрузки"):
+        upload_success = upload_download_page.is_file_uploaded()
+        upload_download_page.log_step(f"Файл успешно загружен: {upload_success}")
 
-        with allure.step("Проверяем отображение пути загруженного файла"):
-            uploaded_file_path = upload_download_page.get_uploaded_file_path()
-            upload_download_page.log_step(
-                f"Путь загруженного файла: {uploaded_file_path}"
-            )
+        assert upload_success, "Файл должен быть успешно загружен"
 
-            allure.attach(
-                uploaded_file_path, "uploaded_file_path", allure.attachment_type.TEXT
-            )
+    with allure.step("Проверяем отображение пути загруженного файла"):
+        uploaded_file_path = upload_download_page.get_uploaded_file_path()
+        upload_download_page.log_step(f"Путь загруженного файла: {uploaded_file_path}")
 
-            # Проверяем что путь содержит имя файла
-            assert (
-                file_name in uploaded_file_path
-            ), f"Путь должен содержать имя файла '{file_name}': {uploaded_file_path}"
+        allure.attach(
+            uploaded_file_path, "uploaded_file_path", allure.attachment_type.TEXT
+        )
 
-    finally:
-        # Очищаем временный файл
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
-            upload_download_page.log_step(f"Временный файл {file_name} удален")
+        # Проверяем что путь содержит имя файла
+        assert (
+            file_name in uploaded_file_path
+        ), f"Путь должен содержать имя файла '{file_name}': {uploaded_file_path}"
 
 
 @allure.epic("Elements")
@@ -79,7 +64,7 @@ def test_upload_text_file(upload_download_page: UploadDownloadPage):
 @allure.story("Multiple File Types Upload")
 @pytest.mark.elements
 @pytest.mark.regression
-def test_upload_different_file_types(upload_download_page: UploadDownloadPage):
+def test_upload_different_file_types(upload_download_page: UploadDownloadPage, test_file):
     """
     Тест загрузки файлов различных типов.
 
@@ -93,89 +78,67 @@ def test_upload_different_file_types(upload_download_page: UploadDownloadPage):
     ]
 
     upload_results = {}
-    temp_files = []
 
-    try:
-        for extension, mime_type, content in test_files:
-            with allure.step(f"Тестируем загрузку файла {extension}"):
-                # Создаем временный файл
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=extension, delete=False
-                ) as temp_file:
-                    temp_file.write(content)
-                    temp_file_path = temp_file.name
+    for extension, mime_type, content in test_files:
+        with allure.step(f"Тестируем загрузку файла {extension}"):
+            file_path = test_file(kind="text", name=f"upload_test{extension}", content=content)
+            file_name = os.path.basename(file_path)
 
-                temp_files.append(temp_file_path)
-                file_name = os.path.basename(temp_file_path)
+            upload_download_page.log_step(f"Загрузка файла {file_name} ({mime_type})")
 
-                upload_download_page.log_step(
-                    f"Загрузка файла {file_name} ({mime_type})"
-                )
-
-                # Загружаем файл
-                upload_download_page.upload_file(temp_file_path)
-
-                # Проверяем результат
-                upload_success = upload_download_page.is_file_uploaded()
-                uploaded_path = (
-                    upload_download_page.get_uploaded_file_path()
-                    if upload_success
-                    else ""
-                )
+            # Загружаем файл
+            upload_download_page.upload_file(file_path)
 
-                upload_results[extension] = {
-                    "filename": file_name,
-                    "mime_type": mime_type,
-                    "upload_success": upload_success,
-                    "uploaded_path": uploaded_path,
-                    "content_length": len(content),
-                }
-
-                upload_download_page.log_step(
-                    f"Результат {extension}: {upload_results[extension]}"
-                )
-
-        with allure.step("Анализируем результаты загрузки разных типов файлов"):
-            allure.attach(
-                str(upload_results),
-                "upload_results_by_type",
-                allure.attachment_type.JSON,
+            # Проверяем результат
+            upload_success = upload_download_page.is_file_uploaded()
+            uploaded_path = (
+                upload_download_page.get_uploaded_file_path() if upload_success else ""
             )
 
-            successful_uploads = sum(
-                1 for result in upload_results.values() if result["upload_success"]
-            )
-            total_uploads = len(upload_results)
-
-            upload_summary = {
-                "total_file_types": total_uploads,
-                "successful_uploads": successful_uploads,
-                "success_rate": (
-                    successful_uploads / total_uploads if total_uploads > 0 else 0
-                ),
-                "supported_extensions": [
-                    ext
-                    for ext, result in upload_results.items()
-                    if result["upload_success"]
-                ],
+            upload_results[extension] = {
+                "filename": file_name,
+                "mime_type": mime_type,
+                "upload_success": upload_success,
+                "uploaded_path": uploaded_path,
+                "content_length": len(content),
             }
 
-            upload_download_page.log_step(f"Сводка загрузки: {upload_summary}")
-            allure.attach(
-                str(upload_summary), "upload_types_summary", allure.attachment_type.JSON
+            upload_download_page.log_step(
+                f"Результат {extension}: {upload_results[extension]}"
             )
 
-            # Проверяем что хотя бы один тип файлов поддерживается
-            assert (
-                successful_uploads > 0
-            ), f"Должен поддерживаться хотя бы один тип файлов, успешных: {successful_uploads}/{total_uploads}"
+    with allure.step("Анализируем результаты загрузки разных типов файлов"):
+        allure.attach(
+            str(upload_results),
+            "upload_results_by_type",
+            allure.attachment_type.JSON,
+        )
+
+        successful_uploads = sum(
+            1 for result in upload_results.values() if result["upload_success"]
+        )
+        total_uploads = len(upload_results)
+
+        upload_summary = {
+            "total_file_types": total_uploads,
+            "successful_uploads": successful_uploads,
+            "success_rate": (
+                successful_uploads / total_uploads if total_uploads > 0 else 0
+            ),
+            "supported_extensions": [
+                ext for ext, result in upload_results.items() if result["upload_success"]
+            ],
+        }
+
+        upload_download_page.log_step(f"Сводка загрузки: {upload_summary}")
+        allure.attach(
+            str(upload_summary), "upload_types_summary", allure.attachment_type.JSON
+        )
 
-    finally:
-        # Очищаем все временные файлы
-        for temp_file_path in temp_files:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-        upload_download_page.log_step(f"Очищены {len(temp_files)} временных файлов")
+        # Проверяем что хотя бы один тип файлов поддерживается
+        assert (
+            successful_uploads > 0
+        ), f"Должен поддерживаться хотя бы один тип файлов, успешных: {successful_uploads}/{total_uploads}"
 
 
 @allure.epic("Elements")
@@ -258,28 +221,21 @@ def test_download_file(upload_download_page: UploadDownloadPage):
 @allure.feature("Upload and Download")
 @allure.story("File Size Validation")
 @pytest.mark.elements
-def test_upload_large_file(upload_download_page: UploadDownloadPage):
+def test_upload_large_file(upload_download_page: UploadDownloadPage, test_file):
     """
     Тест загрузки файла большого размера.
 
     Проверяет ограничения по размеру файла и обработку больших файлов.
     """
-    # Создаем файл размером около 1MB
     large_file_size = 1024 * 1024  # 1MB
-    large_content = "X" * large_file_size
 
-    with allure.step("Создаем файл большого размера"):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as temp_file:
-            temp_file.write(large_content)
-            temp_file_path = temp_file.name
-
-        actual_file_size = os.path.getsize(temp_file_path)
-        file_name = os.path.basename(temp_file_path)
+    with allure.step("Получаем файл большого размера из кэша"):
+        file_path = test_file(kind="text", name="large_upload.txt", size=large_file_size)
+        actual_file_size = os.path.getsize(file_path)
+        file_name = os.path.basename(file_path)
 
         upload_download_page.log_step(
-            f"Создан большой файл: {file_name}, размер: {actual_file_size} bytes"
+            f"Большой файл: {file_name}, размер: {actual_file_size} bytes"
         )
 
         file_info = {
@@ -290,71 +246,64 @@ def test_upload_large_file(upload_download_page: UploadDownloadPage):
 
         allure.attach(str(file_info), "large_file_info", allure.attachment_type.JSON)
 
-    try:
-        with allure.step("Пытаемся загрузить большой файл"):
-            upload_download_page.log_step(
-                f"Загрузка большого файла: {file_info['size_mb']} MB"
-            )
+    with allure.step("Пытаемся загрузить большой файл"):
+        upload_download_page.log_step(
+            f"Загрузка большого файла: {file_info['size_mb']} MB"
+        )
 
-            # Увеличиваем таймаут для большого файла
-            upload_download_page.set_upload_timeout(30000)  # 30 секунд
+        # Увеличиваем таймаут для большого файла
+        upload_download_page.set_upload_timeout(30000)  # 30 секунд
 
-            upload_start_time = upload_download_page.get_current_timestamp()
-            upload_download_page.upload_file(temp_file_path)
-            upload_end_time = upload_download_page.get_current_timestamp()
+        upload_start_time = upload_download_page.get_current_timestamp()
+        upload_download_page.upload_file(file_path)
+        upload_end_time = upload_download_page.get_current_timestamp()
 
-            upload_duration = upload_end_time - upload_start_time
+        upload_duration = upload_end_time - upload_start_time
 
-        with allure.step("Проверяем результат загрузки большого файла"):
-            upload_success = upload_download_page.is_file_uploaded()
-            error_message = (
-                upload_download_page.get_upload_error_message()
-                if not upload_success
-                else ""
-            )
+    with allure.step("Проверяем результат загрузки большого файла"):
+        upload_success = upload_download_page.is_file_uploaded()
+        error_message = (
+            upload_download_page.get_upload_error_message()
+            if not upload_success
+            else ""
+        )
 
-            large_upload_result = {
-                "file_size_mb": file_info["size_mb"],
-                "upload_success": upload_success,
-                "upload_duration_ms": upload_duration,
-                "error_message": error_message,
-                "upload_timeout": upload_duration > 25000,  # Проверяем таймаут
-            }
+        large_upload_result = {
+            "file_size_mb": file_info["size_mb"],
+            "upload_success": upload_success,
+            "upload_duration_ms": upload_duration,
+            "error_message": error_message,
+            "upload_timeout": upload_duration > 25000,  # Проверяем таймаут
+        }
+
+        upload_download_page.log_step(
+            f"Результат загрузки большого файла: {large_upload_result}"
+        )
+        allure.attach(
+            str(large_upload_result),
+            "large_file_upload_result",
+            allure.attachment_type.JSON,
+        )
 
+        # Анализируем результат (большой файл может не загружаться из-за ограничений)
+        if upload_success:
+            upload_download_page.log_step("✅ Большой файл успешно загружен")
+            uploaded_path = upload_download_page.get_uploaded_file_path()
+            assert (
+                file_name in uploaded_path
+            ), f"Путь должен содержать имя файла: {uploaded_path}"
+        else:
             upload_download_page.log_step(
-                f"Результат загрузки большого файла: {large_upload_result}"
-            )
-            allure.attach(
-                str(large_upload_result),
-                "large_file_upload_result",
-                allure.attachment_type.JSON,
+                "ℹ️ Большой файл не загрузился (возможно, есть ограничения)"
             )
-
-            # Анализируем результат (большой файл может не загружаться из-за ограничений)
-            if upload_success:
-                upload_download_page.log_step("✅ Большой файл успешно загружен")
-                uploaded_path = upload_download_page.get_uploaded_file_path()
-                assert (
-                    file_name in uploaded_path
-                ), f"Путь должен содержать имя файла: {uploaded_path}"
-            else:
-                upload_download_page.log_step(
-                    "ℹ️ Большой файл не загрузился (возможно, есть ограничения)"
-                )
-                # Это может быть нормальным поведением для защиты от больших файлов
-
-    finally:
-        # Очищаем большой временный файл
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
-            upload_download_page.log_step(f"Большой временный файл {file_name} удален")
+            # Это может быть нормальным поведением для защиты от больших файлов
 
 
 @allure.epic("Elements")
 @allure.feature("Upload and Download")
 @allure.story("Invalid File Handling")
 @pytest.mark.elements
-def test_upload_invalid_file_types(upload_download_page: UploadDownloadPage):
+def test_upload_invalid_file_types(upload_download_page: UploadDownloadPage, test_file):
     """
     Тест загрузки файлов недопустимых типов.
 
@@ -369,94 +318,108 @@ def test_upload_invalid_file_types(upload_download_page: UploadDownloadPage):
     ]
 
     invalid_upload_results = {}
-    temp_files = []
-
-    try:
-        for extension, mime_type, content in potentially_invalid_files:
-            with allure.step(
-                f"Тестируем загрузку потенциально недопустимого файла {extension}"
-            ):
-                # Создаем временный файл
-                mode = "wb" if extension == ".exe" else "w"
-                with tempfile.NamedTemporaryFile(
-                    mode=mode, suffix=extension, delete=False
-                ) as temp_file:
-                    if extension == ".exe":
-                        temp_file.write(content.encode())
-                    else:
-                        temp_file.write(content)
-                    temp_file_path = temp_file.name
-
-                temp_files.append(temp_file_path)
-                file_name = os.path.basename(temp_file_path)
 
-                upload_download_page.log_step(
-                    f"Попытка загрузки {file_name} ({mime_type})"
-                )
+    for extension, mime_type, content in potentially_invalid_files:
+        with allure.step(
+            f"Тестируем загрузку потенциально недопустимого файла {extension}"
+        ):
+            kind = "binary" if extension == ".exe" else "text"
+            file_path = test_file(kind=kind, name=f"upload_test{extension}", content=content)
+            file_name = os.path.basename(file_path)
 
-                # Пытаемся загрузить файл
-                upload_download_page.upload_file(temp_file_path)
-
-                # Проверяем результат
-                upload_success = upload_download_page.is_file_uploaded()
-                error_message = (
-                    upload_download_page.get_upload_error_message()
-                    if not upload_success
-                    else ""
-                )
-                security_blocked = (
-                    "security" in error_message.lower()
-                    or "forbidden" in error_message.lower()
-                )
-
-                invalid_upload_results[extension] = {
-                    "filename": file_name,
-                    "mime_type": mime_type,
-                    "upload_attempted": True,
-                    "upload_success": upload_success,
-                    "error_message": error_message,
-                    "security_blocked": security_blocked,
-                    "properly_rejected": not upload_success
-                    and extension in [".exe", ".bat"],
-                }
-
-                upload_download_page.log_step(
-                    f"Результат {extension}: {invalid_upload_results[extension]}"
-                )
-
-        with allure.step("Анализируем обработку недопустимых файлов"):
-            allure.attach(
-                str(invalid_upload_results),
-                "invalid_files_results",
-                allure.attachment_type.JSON,
+            upload_download_page.log_step(
+                f"Попытка загрузки {file_name} ({mime_type})"
             )
 
-            properly_rejected = sum(
-                1
-                for result in invalid_upload_results.values()
-                if result["properly_rejected"]
+            # Пытаемся загрузить файл
+            upload_download_page.upload_file(file_path)
+
+            # Проверяем результат
+            upload_success = upload_download_page.is_file_uploaded()
+            error_message = (
+                upload_download_page.get_upload_error_message()
+                if not upload_success
+                else ""
             )
-            security_blocks = sum(
-                1
-                for result in invalid_upload_results.values()
-                if result["security_blocked"]
+            security_blocked = (
+                "security" in error_message.lower()
+                or "forbidden" in error_message.lower()
             )
 
-            security_summary = {
-                "total_invalid_attempts": len(invalid_upload_results),
-                "properly_rejected": properly_rejected,
-                "security_blocks": security_blocks,
-                "security_effective": properly_rejected > 0 or security_blocks > 0,
+            invalid_upload_results[extension] = {
+                "filename": file_name,
+                "mime_type": mime_type,
+                "upload_attempted": True,
+                "upload_success": upload_success,
+                "error_message": error_message,
+                "security_blocked": security_blocked,
+                "properly_rejected": not upload_success
+                and extension in [".exe", ".bat"],
             }
 
-            upload_download_page.log_step(f"Сводка безопасности: {security_summary}")
-            allure.attach(
-                str(security_summary), "security_summary", allure.attachment_type.JSON
+            upload_download_page.log_step(
+                f"Результат {extension}: {invalid_upload_results[extension]}"
             )
 
-    finally:
-        # Очищаем все временные файлы
-        for temp_file_path in temp_files:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-        upload_download_page.log_step(f"Очищены {len(temp_files)} временных файлов")
+    with allure.step("Анализируем обработку недопустимых файлов"):
+        allure.attach(
+            str(invalid_upload_results),
+            "invalid_files_results",
+            allure.attachment_type.JSON,
+        )
+
+        properly_rejected = sum(
+            1
+            for result in invalid_upload_results.values()
+            if result["properly_rejected"]
+        )
+        security_blocks = sum(
+            1
+            for result in invalid_upload_results.values()
+            if result["security_blocked"]
+        )
+
+        security_summary = {
+            "total_invalid_attempts": len(invalid_upload_results),
+            "properly_rejected": properly_rejected,
+            "security_blocks": security_blocks,
+            "security_effective": properly_rejected > 0 or security_blocks > 0,
+        }
+
+        upload_download_page.log_step(f"Сводка безопасности: {security_summary}")
+        allure.attach(
+            str(security_summary), "security_summary", allure.attachment_type.JSON
+        )
+
+
+@allure.epic("Elements")
+@allure.feature("Upload and Download")
+@allure.story("File Download Verification")
+@pytest.mark.elements
+def test_download_streaming_verification(upload_download_page: UploadDownloadPage):
+    """
+    Тест потоковой проверки скачанного файла.
+
+    Проверяет размер, тип и хеш скачанного файла без сохранения его копии.
+    """
+    with allure.step("Скачиваем файл и проверяем его потоково"):
+        result = upload_download_page.download_and_verify(
+            expected_type="image/jpeg", max_size=10 * 1024 * 1024
+        )
+
+        allure.attach(
+            str(
+                {
+                    "filename": result.filename,
+                    "size": result.size,
+                    "sha256": result.sha256,
+                    "mime_type": result.mime_type,
+                }
+            ),
+            "download_verification",
+            allure.attachment_type.JSON,
+        )
+
+    with allure.step("Проверяем результат"):
+        assert result.ok, f"Проверка скачанного файла не прошла: {result.errors}"
+        assert result.size > 0, "Скачанный файл не должен быть пустым"
@@ -10,6 +10,7 @@
 import pytest
 import allure
 import time
+from locators.elements.dynamic_locators import DynamicPropertiesLocators
 from pages.elements.dynamic_properties_page import DynamicPropertiesPage
 
 
@@ -484,3 +485,63 @@ def test_random_id_element(dynamic_properties_page: DynamicPropertiesPage):
             assert id_stability[
                 "id_stable"
             ], f"ID должен оставаться стабильным в течение сессии: {first_id} != {second_id}"
+
+
+@allure.epic("Elements")
+@allure.feature("Dynamic Properties")
+@allure.story("Delay Precision")
+@pytest.mark.elements
+@pytest.mark.regression
+def test_dynamic_delays_precision(dynamic_properties_page: DynamicPropertiesPage):
+    """
+    Тест точности 5-секундных задержек.
+
+    Наблюдатели за всеми тремя кнопками устанавливаются сразу после загрузки,
+    моменты изменений фиксируются в странице с точностью до миллисекунды.
+    """
+    page = dynamic_properties_page
+
+    with allure.step("Подписываемся на изменения всех динамических кнопок"):
+        watches = {
+            "enable": page.watch_element(
+                DynamicPropertiesLocators.ENABLE_AFTER_BUTTON, "enabled", expected=True
+            ),
+            "color": page.watch_element(DynamicPropertiesLocators.COLOR_CHANGE_BUTTON, "class"),
+            "visible": page.watch_element(
+                DynamicPropertiesLocators.VISIBLE_AFTER_BUTTON, "visible", expected=True
+            ),
+        }
+
+    with allure.step("Ожидаем изменений и собираем их моменты"):
+        changes = {name: watch.wait(10000) for name, watch in watches.items()}
+        page.log_step(f"Изменения: {changes}")
+        allure.attach(str(changes), "dynamic_changes", allure.attachment_type.JSON)
+
+        missing = [name for name, change in changes.items() if change is None]
+        assert not missing, f"Изменения не произошли за 10 секунд: {missing}"
+        already = [name for name, change in changes.items() if change["already"]]
+        assert not already, f"Изменения произошли до установки наблюдателей: {already}"
+
+    with allure.step("Проверяем задержки"):
+        moments = [change["at_ms"] for change in changes.values()]
+        spread = max(moments) - min(moments)
+        page.log_step(f"Разброс моментов изменений: {spread:.0f} мс")
+        allure.attach(
+            str({"spread_ms": spread, "moments_ms": moments}),
+            "dynamic_delays",
+            allure.attachment_type.JSON,
+        )
+
+        for name, change in changes.items():
+            # Таймеры запускаются после загрузки страницы: раньше 5 с от начала
+            # навигации изменение невозможно. Верхние границы с запасом на загрузку
+            # CI машины - точные значения только в отчете
+            assert change["at_ms"] >= 5000, f"{name}: изменение раньше 5 с ({change})"
+            if change["since_dom_ready_ms"] is not None:
+                assert change["since_dom_ready_ms"] <= 9000, (
+                    f"{name}: изменение намного позже 5 с после загрузки ({change})"
+                )
+
+        # Все таймеры заводятся при монтировании одновременно, поэтому большой
+        # разброс означает разные задержки, а не медленную машину
+        assert spread <= 2000, f"Кнопки изменились не одновременно: разброс {spread} мс"
@@ -6,7 +6,6 @@
 import pytest
 import allure
 from data import TestData
-import tempfile
 import os
 
 
@@ -15,7 +14,7 @@ import os
 @allure.story("Complete Form Submission")
 @pytest.mark.forms
 @pytest.mark.smoke
-def test_fill_form_and_submit(practice_form_page):
+def test_fill_form_and_submit(practice_form_page, test_file):
     """
     Тест полного заполнения и отправки формы регистрации.
 
@@ -62,21 +61,10 @@ def test_fill_form_and_submit(practice_form_page):
 
         allure.attach(str(form_data["hobbies"]), "selected_hobbies")
 
-    with allure.step("Создаем и загружаем тестовое изображение"):
-        # Создаем временный файл изображения
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_file:
-            tmp_file.write(b"fake image content for testing")
-            temp_image_path = tmp_file.name
-
-        try:
-            practice_form_page.upload_picture(temp_image_path)
-            allure.attach(
-                f"Uploaded file: {os.path.basename(temp_image_path)}", "uploaded_file"
-            )
-        finally:
-            # Очищаем временный файл
-            if os.path.exists(temp_image_path):
-                os.unlink(temp_image_path)
+    with allure.step("Загружаем тестовое изображение"):
+        image_path = test_file("sample_image")
+        practice_form_page.upload_picture(image_path)
+        allure.attach(f"Uploaded file: {os.path.basename(image_path)}", "uploaded_file")
 
     with allure.step("Заполняем адрес"):
         practice_form_page.fill_current_address(form_data["current_address"])
@@ -150,7 +138,7 @@ def test_fill_form_and_submit(practice_form_page):
                 hobby in table_text
             ), f"Хобби {hobby} должен присутствовать в результатах"
         assert (
-            os.path.basename(temp_image_path) in table_text
+            os.path.basename(image_path) in table_text
         ), "Имя файла должно присутствовать в результатах"
         assert (
             form_data["current_address"] in table_text
@@ -290,58 +278,45 @@ def test_email_field_validation(practice_form_page, email, should_be_valid):
 @allure.feature("Practice Form")
 @allure.story("File Upload")
 @pytest.mark.forms
-def test_file_upload_functionality(practice_form_page):
+def test_file_upload_functionality(practice_form_page, test_file):
     """
     Тест функциональности загрузки файла.
 
     Проверяет различные типы файлов и размеры.
     """
     test_files = [
-        ("test.txt", b"Simple text file content", ".txt"),
-        ("test.jpg", b"fake jpg content", ".jpg"),
-        ("test.png", b"fake png content", ".png"),
+        {"kind": "text", "name": "test.txt", "content": "Simple text file content"},
+        {"kind": "image", "name": "test.jpg"},
+        {"kind": "image", "name": "test.png"},
     ]
 
-    for filename, content, extension in test_files:
+    for spec in test_files:
+        filename = spec["name"]
         with allure.step(f"Тестируем загрузку файла: {filename}"):
-            # Создаем временный файл
-            with tempfile.NamedTemporaryFile(
-                suffix=extension, delete=False
-            ) as tmp_file:
-                tmp_file.write(content)
-                temp_path = tmp_file.name
-
-            try:
-                # Заполняем минимальные поля
-                practice_form_page.fill_first_name("FileTest")
-                practice_form_page.fill_last_name("User")
-                practice_form_page.select_gender("Other")
-                practice_form_page.fill_mobile("9876543210")
-
-                # Загружаем файл
-                practice_form_page.upload_picture(temp_path)
-
-                # Отправляем форму
-                practice_form_page.submit_form()
-                practice_form_page.page.wait_for_timeout(2000)
-
-                # Проверяем результат
-                if practice_form_page.is_modal_visible():
-                    modal_content = practice_form_page.page.locator(
-                        ".modal-body"
-                    ).inner_text()
-                    file_mentioned = (
-                        filename in modal_content
-                        or os.path.basename(temp_path) in modal_content
-                    )
-
-                    allure.attach(
-                        f"File upload successful for {filename}: {file_mentioned}",
-                        "file_upload_result",
-                    )
-                    practice_form_page.close_modal()
-
-            finally:
-                # Очищаем временный файл
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            file_path = test_file(**spec)
+
+            # Заполняем минимальные поля
+            practice_form_page.fill_first_name("FileTest")
+            practice_form_page.fill_last_name("User")
+            practice_form_page.select_gender("Other")
+            practice_form_page.fill_mobile("9876543210")
+
+            # Загружаем файл
+            practice_form_page.upload_picture(file_path)
+
+            # Отправляем форму
+            practice_form_page.submit_form()
+            practice_form_page.page.wait_for_timeout(2000)
+
+            # Проверяем результат
+            if practice_form_page.is_modal_visible():
+                modal_content = practice_form_page.page.locator(
+                    ".modal-body"
+                ).inner_text()
+                file_mentioned = filename in modal_content
+
+                allure.attach(
+                    f"File upload successful for {filename}: {file_mentioned}",
+                    "file_upload_result",
+                )
+                practice_form_page.close_modal()
@@ -0,0 +1,100 @@
+"""
+Тесты адаптивного запуска: разбор вывода сбора тестов, запуск пакетов и общие отчеты.
+Браузер не нужен: процессы pytest не запускаются.
+"""
+
+import os
+import json
+import pytest
+import allure
+from utils import autoscaler
+from utils.autoscaler import BATCH_ENV, AdaptiveRunner, ScalingPolicy, build_reports, parse_node_ids
+
+COLLECT_OUTPUT = """tests/elements/test_01_text_box.py::test_fill_all_fields_and_submit
+tests/data_driven/test_01_data_driven.py::test_practice_form_rows[row0]
+tests/data_driven/test_01_data_driven.py::test_practice_form_rows[Jane Doe-1]
+tests/widgets/test_07_tool_tips.py::TestToolTips::test_hover_button
+
+=============================== warnings summary ===============================
+../_pytest/python.py:124
+  /site-packages/_pytest/python.py:124: PytestRemovedIn10Warning: Passing a non-Collection iterable
+  Test: tests/data_driven/test_01_data_driven.py::test_practice_form_rows, argvalues type: generator
+  Please convert to a list or tuple.
+
+-- Docs: https://docs.pytest.org/en/stable/how-to/capture-warnings.html
+4 tests collected in 0.42s
+"""
+
+
+@allure.epic("Framework")
+@allure.feature("Adaptive Run")
+@pytest.mark.framework
+def test_parse_node_ids_ignores_warnings():
+    """
+    Из вывода берутся только node id; строки сводки предупреждений с "::" пропускаются.
+    """
+    assert parse_node_ids(COLLECT_OUTPUT) == [
+        "tests/elements/test_01_text_box.py::test_fill_all_fields_and_submit",
+        "tests/data_driven/test_01_data_driven.py::test_practice_form_rows[row0]",
+        "tests/data_driven/test_01_data_driven.py::test_practice_form_rows[Jane Doe-1]",
+        "tests/widgets/test_07_tool_tips.py::TestToolTips::test_hover_button",
+    ]
+
+
+@allure.epic("Framework")
+@allure.feature("Adaptive Run")
+@pytest.mark.framework
+def test_parse_node_ids_verbose_tree():
+    """
+    Дерево <Module>/<Function> (вывод с -v) не содержит node id - пакеты не создаются.
+    """
+    output = (
+        "<Dir package>\n"
+        "  <Module tests/elements/test_01_text_box.py>\n"
+        "    <Function test_fill_all_fields_and_submit>\n"
+    )
+
+    assert parse_node_ids(output) == []
+
+
+@allure.epic("Framework")
+@allure.feature("Adaptive Run")
+@pytest.mark.framework
+def test_batches_launched_with_batch_id(tmp_path, monkeypatch):
+    """
+    Каждый пакет получает свой идентификатор в BATCH_ENV и не строит общие отчеты.
+    """
+    launched = []
+    monkeypatch.setattr(
+        autoscaler.subprocess, "Popen", lambda command, **kwargs: launched.append(kwargs["env"])
+    )
+    runner = AdaptiveRunner(ScalingPolicy(), logs_dir=str(tmp_path))
+
+    runner._launch(["tests/a/test_01.py::test_one"])
+    runner._launch(["tests/b/test_02.py::test_two"])
+
+    assert [env[BATCH_ENV] for env in launched] == ["batch1", "batch2"]
+    assert BATCH_ENV not in os.environ
+
+
+@allure.epic("Framework")
+@allure.feature("Adaptive Run")
+@pytest.mark.framework
+def test_build_reports_merges_all_batches(tmp_path, monkeypatch):
+    """
+    Замеры всех пакетов сливаются в один отчет после прогона.
+    """
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("perf-results")
+    for batch, value in (("batch1", 100.0), ("batch2", 300.0)):
+        with open(f"perf-results/samples_{batch}.json", "w", encoding="utf-8") as f:
+            json.dump({"https://demoqa.com/": [{"ttfb": value}]}, f)
+
+    reports = build_reports(str(tmp_path / "allure-results"), str(tmp_path / "allure-report"))
+
+    with open(reports["perf"], "r", encoding="utf-8") as f:
+        summary = json.load(f)["https://demoqa.com/"]
+    assert summary["samples"] == 2
+    assert summary["metrics"]["ttfb"] == {"median": 200.0, "max": 300.0}
+    assert reports["network"] is None and reports["resources"] is None
+    assert os.listdir("perf-results") == ["page_metrics.json"], "Замеры пакетов должны быть слиты"
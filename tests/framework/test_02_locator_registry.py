@@ -0,0 +1,35 @@
+"""
+Тесты классификации селекторов при проверке локаторов.
+Браузер не нужен: проверяется только статус по имени константы и числу совпадений.
+"""
+
+import pytest
+import allure
+from utils.locator_registry import LocatorValidator
+
+
+@allure.epic("Framework")
+@allure.feature("Locator Registry")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "name",
+    ["CURRENT_ADDRESS", "OUTPUT_PERMANENT_ADDRESS", "LINK_HTTP_STATUS", "ACTIVE_CLASS"],
+)
+def test_single_element_names_ending_in_s(name):
+    """
+    Одиночные элементы с именем на S (ADDRESS, STATUS, CLASS) не считаются коллекциями.
+    """
+    assert LocatorValidator(page=None)._status(name, 2) == "ambiguous"
+
+
+@allure.epic("Framework")
+@allure.feature("Locator Registry")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "name", ["ALL_LINKS", "TABLE_ROWS", "DROPDOWN_OPTIONS", "HOBBIES_CHECKBOXES", "MENU_LIST"]
+)
+def test_collection_names(name):
+    """
+    Коллекции (префикс ALL_ или окончание из COLLECTION_SUFFIXES) могут совпадать много раз.
+    """
+    assert LocatorValidator(page=None)._status(name, 5) == "ok"
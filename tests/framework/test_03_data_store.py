@@ -0,0 +1,86 @@
+"""
+Тесты журнального хранилища тестовых данных: два менеджера на одном файле,
+как два xdist воркера. Браузер не нужен.
+"""
+
+import pytest
+import allure
+from utils import helper
+from utils.data_store import JournalBackend
+
+
+def _manager(path, compact_every: int) -> "helper.TestDataManager":
+    return helper.TestDataManager(str(path), backend=JournalBackend(str(path), compact_every))
+
+
+def _journal_lines(path) -> int:
+    with open(f"{path}.journal", "rb") as f:
+        return sum(1 for _ in f)
+
+
+@allure.epic("Framework")
+@allure.feature("Test Data Store")
+@pytest.mark.framework
+def test_compaction_keeps_unread_entries_of_other_worker(tmp_path):
+    """
+    Уплотнение журнала не теряет для уплотнившего процесса записи другого воркера,
+    которые он еще не прочитал.
+    """
+    path = tmp_path / "d.json"
+    a = _manager(path, compact_every=2)
+    b = _manager(path, compact_every=2)
+    assert a.get_test_data("missing") is None
+
+    b.set_test_data("from_b", "b")
+    a.set_test_data("first", 1)
+    a.set_test_data("second", 2)
+    a.compact()
+
+    assert a.get_test_data("from_b") == "b"
+    assert a.get_test_data("second") == 2
+    assert b.get_test_data("first") == 1
+
+
+@allure.epic("Framework")
+@allure.feature("Test Data Store")
+@pytest.mark.framework
+def test_automatic_compaction_shared_file(tmp_path):
+    """
+    Автоматическое уплотнение по compact_every: оба менеджера после него видят все ключи.
+    """
+    path = tmp_path / "d.json"
+    a = _manager(path, compact_every=2)
+    b = _manager(path, compact_every=2)
+    assert a.get_test_data("missing") is None
+
+    b.set_test_data("from_b", "b")
+    assert a.get_test_data("from_b") == "b"
+    a.set_test_data("from_a", "a")
+
+    assert _journal_lines(path) == 0, "Журнал должен быть уплотнен после двух записей"
+    assert a.get_test_data("from_b") == "b"
+    assert b.get_test_data("from_a") == "a"
+    assert helper.TestDataManager(str(path), backend="json").get_test_data("from_a") == "a"
+
+
+@allure.epic("Framework")
+@allure.feature("Test Data Store")
+@pytest.mark.framework
+def test_own_entries_counted_once(tmp_path):
+    """
+    Собственная запись не перечитывается refresh, поэтому уплотнение не наступает раньше срока.
+    """
+    path = tmp_path / "d.json"
+    _manager(path, compact_every=5).set_test_data("seed", 0)
+    a = _manager(path, compact_every=5)
+    assert a.get_test_data("seed") == 0
+
+    a.set_test_data("k1", 1)
+    a.set_test_data("k2", 2)
+    assert a.get_test_data("k2") == 2
+    a.set_test_data("k3", 3)
+
+    assert _journal_lines(path) == 4
+    a.set_test_data("k4", 4)
+    assert _journal_lines(path) == 0
+    assert _manager(path, compact_every=5).get_test_data("k4") == 4
@@ -0,0 +1,61 @@
+"""
+Тесты пакетной генерации данных: воспроизводимость по зерну.
+Браузер не нужен.
+"""
+
+import pytest
+import allure
+from utils.helper import DataGenerator
+
+
+@allure.epic("Framework")
+@allure.feature("Data Generation")
+@pytest.mark.framework
+def test_same_seed_gives_same_batches(data_seed):
+    """
+    Одно и то же зерно (фикстура data_seed) дает одинаковые пакеты.
+    """
+    assert DataGenerator.users(50, seed=data_seed) == DataGenerator.users(50, seed=data_seed)
+    assert DataGenerator.addresses(20, seed=data_seed) == DataGenerator.addresses(20, seed=data_seed)
+    assert DataGenerator.emails(20, rng=DataGenerator.rng(data_seed)) == DataGenerator.emails(
+        20, rng=DataGenerator.rng(data_seed)
+    )
+    assert DataGenerator.phones(20, rng=DataGenerator.rng(data_seed)) == DataGenerator.phones(
+        20, rng=DataGenerator.rng(data_seed)
+    )
+
+
+@allure.epic("Framework")
+@allure.feature("Data Generation")
+@pytest.mark.framework
+def test_different_seeds_give_different_batches(data_seed):
+    """
+    Разные зерна дают разные пакеты; строковое зерно хешируется так же, как целое.
+    """
+    other = f"{data_seed}-other"
+
+    assert DataGenerator.users(50, seed=data_seed) != DataGenerator.users(50, seed=other)
+    assert DataGenerator.addresses(20, seed=data_seed) != DataGenerator.addresses(20, seed=other)
+    assert DataGenerator.emails(20, rng=DataGenerator.rng(data_seed)) != DataGenerator.emails(
+        20, rng=DataGenerator.rng(other)
+    )
+    assert DataGenerator.rng(data_seed).random() != DataGenerator.rng(other).random()
+    assert DataGenerator.rng(42).random() == DataGenerator.rng(42).random()
+
+
+@allure.epic("Framework")
+@allure.feature("Data Generation")
+@pytest.mark.framework
+def test_batch_uniqueness_and_shape(data_seed):
+    """
+    Email и username уникальны в пакете, телефоны из 10 цифр.
+    """
+    users = DataGenerator.users(500, seed=data_seed)
+    emails = DataGenerator.emails(500, rng=DataGenerator.rng(data_seed))
+    phones = DataGenerator.phones(100, rng=DataGenerator.rng(data_seed))
+
+    assert len(users) == 500
+    assert len({user["email"] for user in users}) == 500
+    assert len({user["username"] for user in users}) == 500
+    assert len(set(emails)) == 500
+    assert all(len(phone) == 10 and phone.isdigit() for phone in phones)
@@ -0,0 +1,76 @@
+"""
+Тесты корпуса тестовых данных: запись и чтение через mmap, срезы xdist воркеров.
+Браузер не нужен.
+"""
+
+import pytest
+import allure
+from utils.helper import DataGenerator
+from utils.data_corpus import FIELDS, HOBBIES, STATE_CITIES, SUBJECTS, DataCorpus, build_corpus
+
+COUNT = 103
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Небольшой корпус в tmp_path (один пакет генерации)."""
+    corpus = DataCorpus(build_corpus(str(tmp_path / "corpus.bin"), count=COUNT, seed=7))
+    yield corpus
+    corpus.close()
+
+
+@allure.epic("Framework")
+@allure.feature("Data Corpus")
+@pytest.mark.framework
+def test_records_read_back_unchanged(corpus):
+    """
+    Записи читаются такими, какими были сгенерированы (с учетом ширины поля).
+    """
+    # Корпус из одного пакета строится из DataGenerator.users с первым зерном генератора
+    users = DataGenerator.users(COUNT, seed=DataGenerator.rng(7).getrandbits(64))
+    widths = dict(FIELDS)
+
+    assert len(corpus) == COUNT
+    for index, user in enumerate(users):
+        record = corpus[index]
+        for name, value in user.items():
+            expected = value.encode("utf-8")[: widths[name]].decode("utf-8", errors="ignore")
+            assert record[name] == expected.rstrip(" "), f"Запись {index}, поле {name}"
+        assert set(record["subjects"]) <= set(SUBJECTS)
+        assert set(record["hobbies"]) <= set(HOBBIES)
+        assert record["city"] in STATE_CITIES[record["state"]]
+
+    assert corpus[-1] == corpus[COUNT - 1]
+    with pytest.raises(IndexError):
+        corpus[COUNT]
+
+
+@allure.epic("Framework")
+@allure.feature("Data Corpus")
+@pytest.mark.framework
+@pytest.mark.parametrize("worker_count", [1, 2, 4, 7])
+def test_worker_slices_partition_corpus(corpus, worker_count):
+    """
+    Срезы разных воркеров не пересекаются и вместе покрывают весь корпус.
+    """
+    slices = [corpus.worker_slice(f"gw{index}", worker_count) for index in range(worker_count)]
+    indexes = [index for part in slices for index in range(part.start, part.stop)]
+
+    assert sorted(indexes) == list(range(COUNT))
+    assert len(set(indexes)) == COUNT
+
+
+@allure.epic("Framework")
+@allure.feature("Data Corpus")
+@pytest.mark.framework
+def test_slice_take_without_repeats(corpus):
+    """
+    take() выдает записи среза по порядку без повторов и падает на исчерпанном срезе.
+    """
+    part = corpus.worker_slice("gw1", 2)
+    taken = part.take(10) + part.take(part.remaining)
+
+    assert taken == list(part)
+    assert len({record["email"] for record in taken}) == len(part)
+    with pytest.raises(IndexError):
+        part.take()
@@ -0,0 +1,102 @@
+"""
+Тесты загрузчика наборов данных: компиляция в кэш, повторное использование кэша,
+очистка устаревших кэшей и разбиение списков в ячейках CSV. Браузер не нужен.
+"""
+
+import os
+import json
+import pytest
+import allure
+from utils.datasets import DatasetLoader
+from utils.records import record_type
+
+FormRow = record_type(
+    "FormRow", {"first_name": str, "subjects": tuple, "hobbies": tuple}, module=__name__
+)
+
+CSV_ROWS = "first_name,subjects,hobbies\nJohn,Maths|Physics,Sports\nJane,,Reading|Music\n"
+
+
+@pytest.fixture
+def dataset_dirs(tmp_path):
+    """Директории наборов и кэша."""
+    source, cache = tmp_path / "datasets", tmp_path / "cache"
+    source.mkdir()
+    return source, cache
+
+
+def _cache_files(cache) -> list:
+    return sorted(os.listdir(cache))
+
+
+@allure.epic("Framework")
+@allure.feature("Datasets")
+@pytest.mark.framework
+def test_compile_and_reuse_cache(dataset_dirs, monkeypatch):
+    """
+    Набор компилируется один раз; при неизменном исходнике новый загрузчик берет кэш.
+    """
+    source, cache = dataset_dirs
+    (source / "rows.json").write_text(json.dumps([{"a": 1}, {"a": 2}]), encoding="utf-8")
+
+    assert DatasetLoader(str(source), str(cache)).load("rows") == ({"a": 1}, {"a": 2})
+    files = _cache_files(cache)
+    assert len(files) == 2, f"Ожидались кэш и индекс: {files}"
+
+    def fail_compile(*args):
+        raise AssertionError("Кэш должен использоваться повторно")
+
+    monkeypatch.setattr(DatasetLoader, "_compile", fail_compile)
+    loader = DatasetLoader(str(source), str(cache))
+    assert loader.load("rows") == ({"a": 1}, {"a": 2})
+    assert [param.values[0].load() for param in loader.params("rows")] == [{"a": 1}, {"a": 2}]
+    assert _cache_files(cache) == files
+
+
+@allure.epic("Framework")
+@allure.feature("Datasets")
+@pytest.mark.framework
+def test_recompile_removes_only_own_stale_cache(dataset_dirs):
+    """
+    Перекомпиляция набора "form" удаляет его прежний кэш, но не кэш набора "form-data".
+    """
+    source, cache = dataset_dirs
+    (source / "form.json").write_text(json.dumps({"version": 1}), encoding="utf-8")
+    (source / "form-data.json").write_text(json.dumps({"other": True}), encoding="utf-8")
+    DatasetLoader(str(source), str(cache)).load("form-data")
+    DatasetLoader(str(source), str(cache)).load("form")
+    before = _cache_files(cache)
+
+    (source / "form.json").write_text(json.dumps({"version": 2}), encoding="utf-8")
+    loader = DatasetLoader(str(source), str(cache))
+
+    assert loader.load("form") == {"version": 2}
+    after = _cache_files(cache)
+    form_data = [name for name in before if name.startswith("form-data-")]
+    assert len(form_data) == 2 and set(form_data) <= set(after), f"Кэш form-data удален: {after}"
+    assert len(after) == 4
+    assert loader.load("form-data") == {"other": True}
+
+
+@allure.epic("Framework")
+@allure.feature("Datasets")
+@pytest.mark.framework
+def test_csv_list_columns_split(dataset_dirs):
+    """
+    Ячейки CSV для полей-кортежей схемы разбиваются по разделителю, пустая ячейка - пустой кортеж.
+    """
+    source, cache = dataset_dirs
+    (source / "form_rows.csv").write_text(CSV_ROWS, encoding="utf-8")
+    loader = DatasetLoader(str(source), str(cache))
+
+    rows = loader.load("form_rows", FormRow)
+
+    assert rows == (
+        FormRow(first_name="John", subjects=("Maths", "Physics"), hobbies=("Sports",)),
+        FormRow(first_name="Jane", subjects=(), hobbies=("Reading", "Music")),
+    )
+    assert loader.load("form_rows")[0]["subjects"] == "Maths|Physics"
+    assert [param.id for param in loader.params("form_rows", FormRow)] == [
+        "form_rows-0",
+        "form_rows-1",
+    ]
@@ -0,0 +1,217 @@
+"""
+Тесты модели дерева чекбоксов и сокращения упавшей последовательности.
+Страница заменяется объектом в памяти с намеренной ошибкой. Браузер не нужен.
+"""
+
+from typing import Iterable, Set
+
+import pytest
+import allure
+from utils.checkbox_model import Action, CheckboxExplorer, CheckboxModel, InvalidAction
+from utils.checkbox_tree import CHECKED, INDETERMINATE, UNCHECKED, CheckboxNode, CheckboxTree
+
+# Пути узлов в порядке документа; листья - узлы без детей
+PATHS = [
+    "home",
+    "home/desktop",
+    "home/desktop/notes",
+    "home/desktop/commands",
+    "home/documents",
+    "home/documents/office",
+    "home/documents/office/public",
+    "home/documents/office/private",
+    "home/downloads",
+    "home/downloads/word",
+]
+
+
+def _is_leaf(path: str) -> bool:
+    return not any(other.startswith(path + "/") for other in PATHS)
+
+
+def build_tree(checked: Iterable[str] = (), expanded: Iterable[str] = None) -> CheckboxTree:
+    """
+    Снимок дерева, как его возвращает CheckBoxPage.snapshot: только отрисованные узлы.
+
+    Args:
+        checked: Отмеченные листья
+        expanded: Раскрытые узлы (по умолчанию все)
+    """
+    checked = set(checked)
+    expanded = {p for p in PATHS if not _is_leaf(p)} if expanded is None else set(expanded)
+    nodes = []
+    for path in PATHS:
+        parent = path.rsplit("/", 1)[0] if "/" in path else None
+        if parent is not None and not all(
+            ancestor in expanded for ancestor in PATHS if path.startswith(ancestor + "/")
+        ):
+            continue
+        leaves = [p for p in PATHS if (p == path or p.startswith(path + "/")) and _is_leaf(p)]
+        count = len(checked.intersection(leaves))
+        state = CHECKED if count == len(leaves) else INDETERMINATE if count else UNCHECKED
+        nodes.append(
+            CheckboxNode(
+                id=path.rsplit("/", 1)[-1],
+                path=path,
+                title=path.rsplit("/", 1)[-1].capitalize(),
+                parent=parent,
+                depth=path.count("/"),
+                leaf=_is_leaf(path),
+                expanded=path in expanded,
+                state=state,
+                visible=True,
+            )
+        )
+    return CheckboxTree(nodes)
+
+
+class FakeCheckboxPage:
+    """
+    CheckBoxPage в памяти. Ошибка: клик по частично отмеченному узлу снимает
+    отметки вместо того, чтобы отметить поддерево.
+    """
+
+    def __init__(self):
+        self.page = self
+        self.checked: Set[str] = set()
+        self.expanded: Set[str] = set()
+
+    def _path(self, node_id: str) -> str:
+        return next(path for path in PATHS if path.rsplit("/", 1)[-1] == node_id)
+
+    def snapshot(self) -> CheckboxTree:
+        return build_tree(self.checked, self.expanded)
+
+    def expand_all(self) -> None:
+        self.expanded = {path for path in PATHS if not _is_leaf(path)}
+
+    def collapse_all(self) -> None:
+        self.expanded = set()
+
+    def clear_all_selections(self) -> None:
+        self.checked = set()
+
+    def reload(self, **kwargs) -> None:
+        self.checked, self.expanded = set(), set()
+
+    def toggle_expand(self, node_id: str) -> None:
+        self.expanded ^= {self._path(node_id)}
+
+    def click_node(self, node_id: str) -> None:
+        path = self._path(node_id)
+        leaves = {p for p in PATHS if (p == path or p.startswith(path + "/")) and _is_leaf(p)}
+        if leaves <= self.checked or leaves & self.checked:
+            self.checked -= leaves
+        else:
+            self.checked |= leaves
+
+
+@pytest.fixture
+def model() -> CheckboxModel:
+    return CheckboxModel(build_tree())
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Model")
+@pytest.mark.framework
+def test_apply_and_node_state(model):
+    """
+    Отметка узла распространяется на листья, состояние родителей считается по листьям.
+    """
+    state = model.apply(model.initial(), Action("expand", "home"))
+    state = model.apply(state, Action("toggle", "home/desktop"))
+
+    assert state.checked == {"home/desktop/notes", "home/desktop/commands"}
+    assert model.node_state(state, "home/desktop") == CHECKED
+    assert model.node_state(state, "home") == INDETERMINATE
+    assert model.node_state(state, "home/documents") == UNCHECKED
+
+    state = model.apply(state, Action("toggle", "home/desktop"))
+    assert state.checked == frozenset()
+    assert model.apply(state, Action("collapse_all")).expanded == frozenset()
+    assert "home/documents/office" in model.apply(state, Action("expand_all")).expanded
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Model")
+@pytest.mark.framework
+def test_click_on_half_checked_parent_checks_subtree(model):
+    """
+    Клик по частично отмеченному родителю отмечает все поддерево.
+    """
+    state = model.replay(
+        [
+            Action("expand_all"),
+            Action("toggle", "home/documents/office/public"),
+            Action("toggle", "home/documents"),
+        ]
+    )
+
+    assert state.checked == {"home/documents/office/public", "home/documents/office/private"}
+    assert model.node_state(state, "home/documents") == CHECKED
+    assert model.node_state(state, "home") == INDETERMINATE
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Model")
+@pytest.mark.framework
+def test_invalid_actions(model):
+    """
+    Действия над скрытыми узлами и неприменимые раскрытия отклоняются, replay возвращает None.
+    """
+    state = model.initial()
+    with pytest.raises(InvalidAction):
+        model.apply(state, Action("toggle", "home/desktop"))
+    with pytest.raises(InvalidAction):
+        model.apply(state, Action("collapse", "home"))
+    with pytest.raises(InvalidAction):
+        model.apply(model.apply(state, Action("expand_all")), Action("expand", "home/desktop/notes"))
+
+    assert model.replay([Action("toggle", "home/downloads/word")]) is None
+    assert model.replay([Action("expand", "home"), Action("expand", "home/downloads")]) is not None
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Model")
+@pytest.mark.framework
+def test_diff_reports_mismatches(model):
+    """
+    Снимок, совпадающий с моделью, дает пустой diff; отличия описываются по узлам.
+    """
+    state = model.replay([Action("expand", "home"), Action("toggle", "home/downloads")])
+
+    assert model.diff(state, build_tree({"home/downloads/word"}, {"home"})) == []
+    problems = model.diff(state, build_tree(set(), {"home"}))
+    assert "home/downloads: состояние unchecked, ожидалось checked" in problems
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Model")
+@pytest.mark.framework
+def test_shrink_with_fake_page():
+    """
+    Длинная упавшая последовательность сокращается до минимальной, воспроизводящей ошибку.
+    """
+    explorer = CheckboxExplorer(FakeCheckboxPage())
+    sequence = [
+        Action("expand_all"),
+        Action("toggle", "home/downloads"),
+        Action("toggle", "home/desktop/notes"),
+        Action("collapse", "home/documents"),
+        Action("toggle", "home/downloads"),
+        Action("expand", "home/documents"),
+        Action("toggle", "home/desktop/commands"),
+        Action("toggle", "home/documents/office/private"),
+        Action("toggle", "home/documents/office"),
+    ]
+
+    failure = explorer.run(sequence)
+    assert failure is not None and failure.step == len(sequence) - 1
+
+    shrunk = explorer.shrink(failure)
+
+    assert len(shrunk.sequence) == 3, str(shrunk)
+    assert shrunk.original_length == len(sequence)
+    assert shrunk.sequence[-1].kind == "toggle"
+    assert explorer.model.replay(shrunk.sequence) is not None
+    assert explorer.run(shrunk.sequence) is not None
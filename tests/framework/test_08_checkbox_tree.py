@@ -0,0 +1,138 @@
+"""
+Тесты плана кликов по дереву чекбоксов на синтетическом снимке.
+Клики применяются по правилам react-checkbox-tree в памяти. Браузер не нужен.
+"""
+
+from typing import Iterable, List, Set
+
+import pytest
+import allure
+from utils.checkbox_tree import CHECKED, INDETERMINATE, UNCHECKED, CheckboxTree
+
+TREE = {
+    "home": ["home/desktop", "home/documents", "home/downloads"],
+    "home/desktop": ["home/desktop/notes", "home/desktop/commands"],
+    "home/documents": ["home/documents/office"],
+    "home/documents/office": ["home/documents/office/public", "home/documents/office/private"],
+    "home/downloads": [
+        "home/downloads/word",
+        "home/downloads/excel",
+        "home/downloads/pdf",
+        "home/downloads/zip",
+    ],
+}
+
+
+def _leaves(path: str) -> List[str]:
+    return [leaf for child in TREE[path] for leaf in _leaves(child)] if path in TREE else [path]
+
+
+def snapshot(checked: Iterable[str] = ()) -> CheckboxTree:
+    """
+    Снимок полностью раскрытого дерева в формате скрипта CheckBoxPage.snapshot.
+
+    Args:
+        checked: Отмеченные листья
+    """
+    checked = set(checked)
+    nodes = []
+
+    def add(path: str, parent: str = None) -> None:
+        leaves = _leaves(path)
+        count = len(checked.intersection(leaves))
+        nodes.append(
+            {
+                "id": path.rsplit("/", 1)[-1],
+                "path": path,
+                "title": path.rsplit("/", 1)[-1].capitalize(),
+                "parent": parent,
+                "depth": path.count("/"),
+                "leaf": path not in TREE,
+                "expanded": path in TREE,
+                "state": CHECKED if count == len(leaves) else INDETERMINATE if count else UNCHECKED,
+                "visible": True,
+            }
+        )
+        for child in TREE.get(path, []):
+            add(child, path)
+
+    add("home")
+    return CheckboxTree.from_snapshot({"nodes": nodes})
+
+
+def click(tree: CheckboxTree, checked: Set[str], clicks: List[str]) -> Set[str]:
+    """Отмеченные листья после кликов: полностью отмеченный узел снимается, иначе отмечается."""
+    checked = set(checked)
+    for path in clicks:
+        leaves = set(tree.leaves(path))
+        checked = checked - leaves if leaves <= checked else checked | leaves
+    return checked
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Tree")
+@pytest.mark.framework
+def test_plan_select_subtree():
+    """
+    Отметка всех листьев папки - один клик по папке.
+    """
+    tree = snapshot()
+    target = tree.desired_leaves(["Desktop"])
+
+    assert tree.plan(target) == ["home/desktop"]
+    assert tree.plan(tree.all_leaves()) == ["home"]
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Tree")
+@pytest.mark.framework
+def test_plan_unselect():
+    """
+    Снятие всех отметок - один клик по полностью отмеченному корню; пустое дерево не кликается.
+    """
+    tree = snapshot(_leaves("home"))
+
+    assert tree.plan([]) == ["home"]
+    assert snapshot().plan([]) == []
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Tree")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "checked, target, clicks",
+    [
+        ([], ["home/desktop/notes", "home/downloads/word"], 2),
+        (_leaves("home/desktop"), ["home/desktop/notes"], 1),
+        (["home/documents/office/public"], _leaves("home/documents"), 1),
+        (_leaves("home/downloads"), _leaves("home/desktop") + ["home/documents/office/private"], 3),
+        (_leaves("home"), _leaves("home/downloads"), 2),
+    ],
+)
+def test_plan_exact_target(checked, target, clicks):
+    """
+    После клика по плану отмечены ровно нужные листья, число кликов минимально.
+    """
+    tree = snapshot(checked)
+
+    plan = tree.plan(target)
+
+    assert click(tree, set(checked), plan) == set(target)
+    assert len(plan) == clicks, plan
+
+
+@allure.epic("Framework")
+@allure.feature("Checkbox Tree")
+@pytest.mark.framework
+def test_plan_two_clicks_on_partially_checked_parent():
+    """
+    Частично отмеченную папку выгоднее отметить и снять (два клика), чем снимать листья по одному.
+    """
+    checked = ["home/downloads/word", "home/downloads/excel", "home/downloads/pdf"]
+    tree = snapshot(checked)
+    assert tree.state("Downloads") == INDETERMINATE
+
+    plan = tree.plan(["home/desktop/notes"])
+
+    assert plan == ["home/desktop/notes", "home/downloads", "home/downloads"]
+    assert click(tree, set(checked), plan) == {"home/desktop/notes"}
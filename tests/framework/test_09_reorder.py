@@ -0,0 +1,73 @@
+"""
+Тесты планирования перестановки сортируемого списка: перебор всех перестановок
+небольших списков со сверкой с эталонным квадратичным LIS. Браузер не нужен.
+"""
+
+from itertools import permutations
+from typing import Sequence
+
+import pytest
+import allure
+from utils.reorder import apply_moves, longest_increasing_subsequence, plan_moves
+
+
+def lis_length(values: Sequence[int]) -> int:
+    """Эталонная длина наибольшей возрастающей подпоследовательности (O(n^2))."""
+    lengths = []
+    for index, value in enumerate(values):
+        lengths.append(1 + max([lengths[j] for j in range(index) if values[j] < value], default=0))
+    return max(lengths, default=0)
+
+
+@allure.epic("Framework")
+@allure.feature("Reorder")
+@pytest.mark.framework
+@pytest.mark.parametrize("size", range(7))
+def test_longest_increasing_subsequence(size):
+    """
+    Индексы LIS возрастают, значения по ним строго возрастают, длина совпадает с эталоном.
+    """
+    for values in permutations(range(size)):
+        indices = longest_increasing_subsequence(values)
+
+        assert indices == sorted(set(indices))
+        assert all(values[a] < values[b] for a, b in zip(indices, indices[1:]))
+        assert len(indices) == lis_length(values)
+
+
+@allure.epic("Framework")
+@allure.feature("Reorder")
+@pytest.mark.framework
+@pytest.mark.parametrize("size", range(7))
+def test_plan_moves_all_permutations(size):
+    """
+    Для любой перестановки план приводит к целевому порядку за n - LIS перемещений.
+    """
+    current = [f"Item {index}" for index in range(size)]
+    for target in permutations(current):
+        moves = plan_moves(current, target)
+
+        assert apply_moves(current, moves) == list(target)
+        ranks = [target.index(item) for item in current]
+        assert len(moves) == size - lis_length(ranks), (target, moves)
+        assert all(from_index != to_index for from_index, to_index in moves)
+
+
+@allure.epic("Framework")
+@allure.feature("Reorder")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "current, target",
+    [
+        (["One", "Two", "Three"], ["One", "Two"]),
+        (["One", "Two", "Three"], ["One", "Two", "Four"]),
+        (["One", "Two", "Three"], ["One", "One", "Two"]),
+        (["One", "One", "Two"], ["One", "Two", "One"]),
+    ],
+)
+def test_plan_moves_rejects_non_permutation(current, target):
+    """
+    Целевой порядок, не являющийся перестановкой текущего, отклоняется.
+    """
+    with pytest.raises(ValueError, match="не является перестановкой"):
+        plan_moves(current, target)
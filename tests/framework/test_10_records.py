@@ -0,0 +1,132 @@
+"""
+Тесты записей тестовых данных: проверка схемы, неизменяемость, хеширование и pickle.
+Браузер не нужен.
+"""
+
+import copy
+import pickle
+
+import pytest
+import allure
+from utils.records import Record, SchemaError, record_type
+
+Address = record_type("Address", {"city": str, "zip": str}, module=__name__)
+User = record_type(
+    "User",
+    {"username": str, "age": int, "tags": tuple, "address": Address, "email": str},
+    optional=["email"],
+    module=__name__,
+)
+
+DATA = {
+    "username": "jdoe",
+    "age": 30,
+    "tags": ["admin", "qa"],
+    "address": {"city": "Berlin", "zip": "10115"},
+}
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+def test_record_from_dict():
+    """
+    Вложенные словари становятся записями, списки - кортежами, необязательные поля - None.
+    """
+    user = User.from_dict(DATA)
+
+    assert isinstance(user.address, Address) and user.address.city == "Berlin"
+    assert user["address"]["zip"] == "10115"
+    assert user.tags == ("admin", "qa")
+    assert user.email is None
+    assert list(user) == ["username", "age", "tags", "address", "email"]
+    assert user.to_dict() == {**DATA, "tags": ("admin", "qa"), "email": None}
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({key: value for key, value in DATA.items() if key != "age"}, "User: отсутствуют поля age"),
+        ({**DATA, "password": "secret"}, "User: неизвестные поля password"),
+        ({**DATA, "age": "30"}, "User.age: ожидался int, получено str"),
+        ({**DATA, "address": {"city": "Berlin"}}, "Address: отсутствуют поля zip"),
+        ({**DATA, "address": "Berlin"}, "User.address: ожидался Address, получено str"),
+    ],
+)
+def test_schema_errors(data, message):
+    """
+    Отсутствующие, лишние поля и неверные типы (в том числе во вложенной записи) отклоняются.
+    """
+    with pytest.raises(SchemaError) as error:
+        User.from_dict(data)
+
+    assert str(error.value) == message
+    assert isinstance(error.value, ValueError)
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+def test_reserved_field_names():
+    """
+    Поле с именем метода записи запрещено схемой.
+    """
+    with pytest.raises(SchemaError, match="keys"):
+        record_type("Broken", {"keys": str})
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+def test_record_is_immutable():
+    """
+    Поля нельзя изменить или удалить, новые атрибуты не добавляются.
+    """
+    user = User.from_dict(DATA)
+
+    with pytest.raises(AttributeError):
+        user.age = 31
+    with pytest.raises(AttributeError):
+        del user.username
+    with pytest.raises(AttributeError):
+        user.nickname = "jd"
+    with pytest.raises(TypeError):
+        user["age"] = 31
+    assert not hasattr(user, "__dict__")
+    assert user.age == 30
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+def test_record_hash_and_equality():
+    """
+    Одинаковые записи равны и имеют одинаковый хеш; записи используются как ключи.
+    """
+    first, second = User.from_dict(DATA), User.from_dict(DATA)
+    other = User.from_dict({**DATA, "age": 31})
+
+    assert first == second and hash(first) == hash(second)
+    assert first != other
+    assert len({first, second, other}) == 2
+    assert isinstance(first, Record)
+
+
+@allure.epic("Framework")
+@allure.feature("Records")
+@pytest.mark.framework
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_record_pickle_round_trip(protocol):
+    """
+    Запись восстанавливается из pickle (нужно для передачи данных xdist воркерам) и копируется.
+    """
+    user = User.from_dict(DATA)
+
+    restored = pickle.loads(pickle.dumps(user, protocol=protocol))
+
+    assert restored == user and type(restored) is User
+    assert type(restored.address) is Address
+    assert copy.deepcopy(user) == user
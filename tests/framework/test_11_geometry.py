@@ -0,0 +1,138 @@
+"""
+Тесты проверок взаимного расположения прямоугольников: перекрытие, вложенность,
+сторона и попадание во viewport, включая касание краев и допуски. Браузер не нужен.
+"""
+
+import pytest
+import allure
+from utils.geometry import ElementGeometry, Layout, Rect, contains, overlaps, placement, within
+
+BOX = Rect(0, 0, 10, 10)
+VIEWPORT = Rect(0, 0, 1280, 720)
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (Rect(5, 5, 10, 10), True),
+        (Rect(2, 2, 4, 4), True),
+        (Rect(10, 0, 10, 10), False),
+        (Rect(0, 10, 10, 10), False),
+        (Rect(9.9, 9.9, 5, 5), True),
+        (Rect(20, 20, 5, 5), False),
+        (Rect(5, 5, 0, 0), False),
+        (None, False),
+    ],
+)
+def test_overlaps(other, expected):
+    """
+    Перекрытие - пересечение ненулевой площади; касание краем и отсутствие прямоугольника - нет.
+    """
+    assert overlaps([BOX], [other]) == [expected]
+    assert overlaps([other], [BOX]) == [expected]
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+def test_broadcasting():
+    """
+    Список из одного прямоугольника сравнивается со всеми; списки разной длины отклоняются.
+    """
+    others = [Rect(5, 5, 10, 10), Rect(10, 0, 10, 10), None]
+
+    assert overlaps([BOX], others) == [True, False, False]
+    assert overlaps(others, [BOX]) == [True, False, False]
+    assert overlaps([BOX, None], [Rect(1, 1, 1, 1), BOX]) == [True, False]
+    assert overlaps([], []) == []
+    with pytest.raises(ValueError, match="разной длины: 2 и 3"):
+        overlaps([BOX, BOX], others)
+    with pytest.raises(ValueError):
+        placement([BOX, BOX], [])
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "inner, expected",
+    [
+        (Rect(2, 2, 5, 5), True),
+        (Rect(0, 0, 10, 10), True),
+        (Rect(-0.4, 0, 10.4, 10.4), True),
+        (Rect(-1, 0, 5, 5), False),
+        (Rect(5, 5, 6, 5), False),
+        (None, False),
+    ],
+)
+def test_contains(inner, expected):
+    """
+    Вложенность допускает совпадение краев и субпиксельный выход за границу.
+    """
+    assert contains([BOX], [inner]) == [expected]
+    assert contains([None], [inner]) == [False]
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (Rect(100, 70, 50, 30), "top"),
+        (Rect(100, 70, 50, 30.8), "top"),
+        (Rect(100, 120, 50, 30), "bottom"),
+        (Rect(100, 119.5, 50, 30), "bottom"),
+        (Rect(40, 100, 60, 20), "left"),
+        (Rect(150, 95, 60, 30), "right"),
+        (Rect(100, 70, 50, 32), "overlap"),
+        (Rect(110, 105, 10, 10), "overlap"),
+        (None, "unknown"),
+    ],
+)
+def test_placement(other, expected):
+    """
+    Сторона определяется с допуском касания (стрелка подсказки заходит на элемент).
+    """
+    reference = Rect(100, 100, 50, 20)
+
+    assert placement([reference], [other]) == [expected]
+    assert placement([None], [reference]) == ["unknown"]
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+def test_within_viewport():
+    """
+    Прямоугольник во viewport, у края, за краем и отсутствующий.
+    """
+    rects = [Rect(10, 10, 100, 50), Rect(1180, 670, 100, 50), Rect(1200, 10, 100, 50), None]
+
+    assert within(rects, VIEWPORT) == [True, True, False, False]
+    assert within([], VIEWPORT) == []
+
+
+@allure.epic("Framework")
+@allure.feature("Geometry")
+@pytest.mark.framework
+def test_layout_checks():
+    """
+    Layout сравнивает элемент со всеми остальными; ненайденный элемент дает unknown/False.
+    """
+    layout = Layout(
+        {
+            "button": ElementGeometry("#button", True, True, Rect(100, 100, 50, 20)),
+            "tooltip": ElementGeometry(".tooltip", True, True, Rect(90, 60, 70, 40)),
+            "missing": ElementGeometry("#missing", False, False, None),
+        },
+        VIEWPORT,
+    )
+
+    assert layout.placement("button") == {"tooltip": "top", "missing": "unknown"}
+    assert layout.overlaps("button") == {"tooltip": False, "missing": False}
+    assert layout.within_viewport() == {"button": True, "tooltip": True, "missing": False}
+    assert layout.size("missing") == {"width": 0, "height": 0}
@@ -468,3 +468,38 @@ def test_sortable_elements_validation(sortable_page: SortablePage):
         assert overall_validation[
             "interactive_elements"
         ], "Элементы должны быть интерактивными (draggable или hoverable)"
+
+
+@allure.epic("Interactions")
+@allure.feature("Sortable")
+@allure.story("Batch Reorder")
+@pytest.mark.interactions
+def test_batch_reorder_minimal_moves(sortable_page: SortablePage):
+    """
+    Тест перестановки списка по плану с минимальным числом перетаскиваний.
+
+    Обращение порядка требует n - 1 перетаскиваний, циклический сдвиг - одного;
+    итоговый порядок проверяется внутри reorder одним чтением.
+    """
+    with allure.step("Получаем исходный порядок списка"):
+        initial_order = sortable_page.get_list_order()
+        sortable_page.log_step(f"Исходный порядок: {initial_order}")
+        assert len(initial_order) > 2, f"Слишком мало элементов: {initial_order}"
+
+    with allure.step("Обращаем порядок списка"):
+        sortable_page.reverse_list_order()
+        assert sortable_page.get_list_order() == initial_order[::-1]
+        assert len(sortable_page.last_plan) == len(initial_order) - 1, (
+            f"Лишние перетаскивания: {sortable_page.last_plan}"
+        )
+
+    with allure.step("Сдвигаем первый элемент в конец одним перетаскиванием"):
+        reversed_order = initial_order[::-1]
+        rotated = reversed_order[1:] + reversed_order[:1]
+        moves = sortable_page.reorder(rotated)
+        allure.attach(str(moves), "reorder_plan", allure.attachment_type.TEXT)
+        assert moves == [(0, len(rotated) - 1)], f"Неоптимальный план: {moves}"
+
+    with allure.step("Возвращаем исходный порядок"):
+        sortable_page.reorder(initial_order)
+        assert sortable_page.get_list_order() == initial_order
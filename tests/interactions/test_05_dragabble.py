@@ -9,6 +9,7 @@
 
 import pytest
 import allure
+from locators.interactions.dragabble_locators import DragabbleLocators
 from pages.interactions.dragabble_page import DragabblePage
 
 
@@ -712,3 +713,34 @@ def test_all_dragabble_modes_integration(dragabble_page: DragabblePage):
             dragabble_page.log_step(
                 f"⚠️ Только часть режимов Dragabble функциональна: {functional_tabs}/{total_tabs}"
             )
+
+
+@allure.epic("Interactions")
+@allure.feature("Dragabble")
+@allure.story("Drag Engine")
+@pytest.mark.interactions
+def test_drag_engine_moves_exactly(dragabble_page: DragabblePage):
+    """
+    Тест движка перетаскивания BasePage.drag.
+
+    Элемент смещается ровно на заданное смещение, завершение определяется
+    по событиям DOM, а проверка выполняется в том же вызове.
+    """
+    offset = (120, 60)
+
+    with allure.step(f"Перетаскиваем элемент на {offset}"):
+        result = dragabble_page.drag(
+            DragabbleLocators.DRAG_BOX,
+            offset=offset,
+            steps=8,
+            scope=DragabbleLocators.SIMPLE_TAB_PANE,
+            verify=lambda r: all(
+                abs(moved - expected) <= 1 for moved, expected in zip(r.moved, offset)
+            ),
+        )
+        dragabble_page.log_step(f"Результат перетаскивания: {result}")
+        allure.attach(str(result), "drag_result", allure.attachment_type.TEXT)
+
+    with allure.step("Проверяем результат"):
+        assert result.verified, f"Элемент смещен на {result.moved}, ожидалось {offset}"
+        assert result.settled, f"Страница не успокоилась за {result.settle_ms} мс"
@@ -826,3 +826,78 @@ def test_progress_bar_performance(progress_bar_page: ProgressBarPage):
         assert (
             len(performance_metrics) > 0
         ), "Должны быть собраны метрики производительности"
+
+
+@allure.epic("Widgets")
+@allure.feature("Progress Bar")
+@allure.story("Progress Observer")
+@pytest.mark.widgets
+def test_progress_observer_series(progress_bar_page: ProgressBarPage):
+    """
+    Тест наблюдателя прогресса.
+
+    Проверяет, что значения записываются в браузере с отметками времени,
+    растут монотонно, а измеренная частота обновлений реальна.
+    """
+    with allure.step("Запускаем прогресс и ждем порога 20% в браузере"):
+        progress_bar_page.observe_progress()
+        progress_bar_page.start_progress()
+        reached = progress_bar_page.wait_for_progress_at_least(20, timeout=15000)
+        progress_bar_page.stop_progress()
+
+    with allure.step("Анализируем историю значений"):
+        series = progress_bar_page.get_progress_series()
+        frequency = progress_bar_page.get_progress_update_frequency()
+        consistency = progress_bar_page.get_fill_consistency()
+
+        allure.attach(
+            str({"reached": reached, "frequency_s": frequency, "consistency": consistency}),
+            "progress_observer",
+            allure.attachment_type.JSON,
+        )
+
+        values = [sample["value"] for sample in series]
+        assert reached["value"] >= 20, f"Порог не достигнут: {reached}"
+        assert len(series) >= 20, f"Слишком мало отметок: {len(series)}"
+        assert values == sorted(values), "Значения прогресса должны расти монотонно"
+        assert 0 < frequency < 1, f"Нереалистичный интервал обновлений: {frequency} с"
+
+
+@allure.epic("Widgets")
+@allure.feature("Progress Bar")
+@allure.story("Progress Observer")
+@pytest.mark.widgets
+def test_progress_completion_after_reset(progress_bar_page: ProgressBarPage):
+    """
+    Тест ожидания завершения после сброса.
+
+    Проверяет, что после Reset ожидание 100% не срабатывает на отметке
+    прошлого запуска, а ждет завершения нового.
+    """
+    with allure.step("Доводим первый запуск до 100%"):
+        progress_bar_page.observe_progress()
+        progress_bar_page.start_progress()
+        first = progress_bar_page.wait_for_progress_value("100%", timeout=20000)
+
+    with allure.step("Сбрасываем прогресс и запускаем заново"):
+        progress_bar_page.reset_progress()
+        reset_sample = progress_bar_page.wait_for_progress_value("0%", timeout=5000)
+        progress_bar_page.start_progress()
+
+    with allure.step("Ждем завершения второго запуска"):
+        assert progress_bar_page.wait_for_progress_completion(
+            timeout=20000
+        ), "Второй запуск должен завершиться"
+        series = progress_bar_page.get_progress_series()
+
+        # Первая отметка - последнее значение до сброса, точка отсчета истории
+        completed = [sample for sample in series[1:] if sample["text"] == "100%"]
+        assert completed, "В истории нового запуска должна быть отметка 100%"
+        assert all(
+            sample["t"] > reset_sample["t"] for sample in completed
+        ), "Отметка 100% должна относиться к новому запуску"
+        assert reset_sample["t"] > first["t"], "Сброс должен быть после первого завершения"
+        assert completed[0]["t"] - reset_sample["t"] > 1000, (
+            "Второй запуск не может завершиться мгновенно: "
+            f"{completed[0]['t'] - reset_sample['t']:.0f} мс"
+        )
@@ -10,6 +10,7 @@
 import pytest
 import allure
 import time
+from locators.widgets.tooltips_locators import ToolTipsLocators
 from pages.widgets.tool_tips_page import ToolTipsPage
 
 
@@ -721,3 +722,85 @@ def test_tooltip_accessibility(tool_tips_page: ToolTipsPage):
         assert (
             len(accessibility_tests) > 0
         ), "Должны быть проверены элементы на доступность"
+
+
+@allure.epic("Widgets")
+@allure.feature("Tool Tips")
+@allure.story("Tooltip Harvesting")
+@pytest.mark.widgets
+def test_tooltip_harvest(tool_tips_page: ToolTipsPage):
+    """
+    Тест сбора всех подсказок одним проходом.
+
+    Подсказка каждого элемента фиксируется наблюдателем в момент появления,
+    без фиксированных пауз между наведениями.
+    """
+    expected_texts = {
+        "button": ToolTipsLocators.BUTTON_TOOLTIP_TEXT,
+        "text_field": ToolTipsLocators.INPUT_TOOLTIP_TEXT,
+        "contrary_link": ToolTipsLocators.LINK_TOOLTIP_TEXT,
+        "section_link": ToolTipsLocators.SECTION_TOOLTIP_TEXT,
+    }
+
+    with allure.step("Собираем подсказки всех элементов"):
+        started = time.perf_counter()
+        tooltips = tool_tips_page.harvest_tooltips()
+        elapsed = time.perf_counter() - started
+        tool_tips_page.log_step(f"Сбор подсказок: {elapsed * 1000:.0f} мс")
+        allure.attach(str(tooltips), "harvested_tooltips", allure.attachment_type.JSON)
+
+    with allure.step("Проверяем тексты и геометрию подсказок"):
+        for name, text in expected_texts.items():
+            tooltip = tooltips.get(name, {})
+            assert tooltip.get("text") == text, f"Подсказка {name}: {tooltip}"
+            assert (
+                tooltip["width"] > 0 and tooltip["height"] > 0
+            ), f"Подсказка {name} без размеров: {tooltip}"
+
+    with allure.step("Проверяем время появления каждой подсказки"):
+        # Без фиксированных пауз подсказка появляется сразу после наведения: промежуток
+        # между появлениями соседних подсказок намного меньше таймаута ожидания (2 с)
+        moments = [tooltips[name]["at_ms"] for name in expected_texts]
+        gaps = [later - earlier for earlier, later in zip(moments, moments[1:])]
+        tool_tips_page.log_step(f"Промежутки между подсказками: {gaps} мс")
+        for name in expected_texts:
+            assert (
+                tooltips[name]["elapsed_ms"] < 1000
+            ), f"Подсказка {name} появилась через {tooltips[name]['elapsed_ms']} мс"
+        assert all(
+            0 < gap < 1000 for gap in gaps
+        ), f"Подсказки появлялись с промежутками {gaps} мс"
+        assert elapsed < 4.0, f"Сбор четырех подсказок занял {elapsed:.2f} с"
+
+
+@allure.epic("Widgets")
+@allure.feature("Tool Tips")
+@allure.story("Tooltip Layout")
+@pytest.mark.widgets
+def test_tooltip_layout_batch(tool_tips_page: ToolTipsPage):
+    """
+    Тест взаимного расположения подсказки и элементов по одному снимку геометрии.
+
+    Геометрия всех элементов и показанной подсказки читается одним запросом,
+    проверки расположения выполняются без обращений к странице.
+    """
+    with allure.step("Наводим курсор на кнопку и читаем геометрию"):
+        tool_tips_page.hover_button()
+        assert tool_tips_page.wait_for_tooltip(
+            ToolTipsLocators.TOOLTIP_SHOW
+        ), "Подсказка кнопки не появилась"
+        layout = tool_tips_page.get_layout()
+        allure.attach(
+            str({name: geometry.rect for name, geometry in layout.elements.items()}),
+            "tooltip_layout",
+            allure.attachment_type.TEXT,
+        )
+
+    with allure.step("Проверяем расположение подсказки"):
+        assert all(
+            layout[name].visible for name in layout.elements
+        ), f"Не все элементы видимы: {layout.elements}"
+        side = layout.placement("button", ["tooltip"])["tooltip"]
+        assert side in ("top", "bottom", "left", "right"), f"Подсказка перекрывает кнопку: {side}"
+        assert not layout.overlaps("tooltip", ["button"])["button"]
+        assert layout.within_viewport(["tooltip"])["tooltip"], "Подсказка вне viewport"
@@ -0,0 +1,113 @@
+"""
+Адаптивные таймауты: длительности операций (страница, операция) накапливаются между
+прогонами, а таймаут выставляется по высокому перцентилю с запасом. Быстрые операции
+падают быстро, а не ждут 10 с отсутствующий элемент. Без истории используются
+статические константы data.Timeouts.
+"""
+
+import math
+import logging
+from typing import Dict, List, Optional
+
+from utils.data_store import file_lock, read_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveTimeouts:
+    """Сервис таймаутов на основе истории наблюдаемых длительностей."""
+
+    def __init__(
+        self,
+        history_file: str = "timeout-history.json",
+        percentile: float = 0.99,
+        margin: float = 2.0,
+        min_samples: int = 20,
+        floor_ms: int = 1000,
+        max_samples: int = 200,
+    ):
+        """
+        Инициализация сервиса.
+
+        Args:
+            history_file: Файл истории длительностей
+            percentile: Перцентиль длительности, от которого считается таймаут
+            margin: Множитель запаса над перцентилем
+            min_samples: Минимум наблюдений, после которого таймаут становится адаптивным
+            floor_ms: Нижняя граница адаптивного таймаута в миллисекундах
+            max_samples: Сколько последних наблюдений хранить на операцию
+        """
+        self.history_file = history_file
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.floor_ms = floor_ms
+        self.max_samples = max_samples
+        self.history: Dict[str, List[float]] = {}
+        self._new_samples: Dict[str, List[float]] = {}
+        self._cache: Dict[str, Optional[int]] = {}
+
+    @staticmethod
+    def key(page: str, operation: str) -> str:
+        """Ключ истории для пары (страница, операция)."""
+        return f"{page}::{operation}"
+
+    def load(self) -> None:
+        """Загружает историю прошлых прогонов."""
+        self.history = read_json(self.history_file)
+        self._cache.clear()
+
+    def record(self, page: str, operation: str, duration_ms: float) -> None:
+        """
+        Записывает длительность успешно завершенной операции.
+
+        Args:
+            page: Имя страницы (класс Page Object)
+            operation: Операция (метод и селектор)
+            duration_ms: Длительность в миллисекундах
+        """
+        self._new_samples.setdefault(self.key(page, operation), []).append(
+            round(duration_ms, 1)
+        )
+
+    def timeout(self, page: str, operation: str, default: int) -> int:
+        """
+        Возвращает таймаут операции.
+
+        Args:
+            page: Имя страницы (класс Page Object)
+            operation: Операция (метод и селектор)
+            default: Статический таймаут в миллисекундах (из data.Timeouts)
+
+        Returns:
+            int: Перцентиль истории с запасом, но не больше default;
+                 default если истории недостаточно
+        """
+        key = self.key(page, operation)
+        if key not in self._cache:
+            samples = self.history.get(key, [])
+            if len(samples) < self.min_samples:
+                self._cache[key] = None
+            else:
+                ordered = sorted(samples)
+                index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+                self._cache[key] = max(self.floor_ms, math.ceil(ordered[index] * self.margin))
+        adaptive: Optional[int] = self._cache[key]
+        return default if adaptive is None else min(default, adaptive)
+
+    def save(self) -> None:
+        """
+        Дописывает новые наблюдения в историю.
+        Выполняется под межпроцессной блокировкой, поэтому безопасен для xdist воркеров.
+        """
+        if not self._new_samples:
+            return
+        with file_lock(self.history_file + ".lock"):
+            history = read_json(self.history_file)
+            for key, samples in self._new_samples.items():
+                history[key] = (history.get(key, []) + samples)[-self.max_samples:]
+            write_json_atomic(self.history_file, history)
+        logger.info(
+            f"История таймаутов обновлена: {sum(map(len, self._new_samples.values()))} наблюдений"
+        )
+        self._new_samples.clear()
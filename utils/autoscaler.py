@@ -0,0 +1,363 @@
+"""
+Адаптивный запуск тестов: число параллельных процессов подстраивается под загрузку машины.
+Вместо фиксированного -n контроллер запускает пакеты тестов (по модулям) отдельными
+процессами pytest и добавляет/убирает воркеры по CPU, запасу памяти и времени на тест.
+"""
+
+import os
+import re
+import sys
+import time
+import logging
+import shutil
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil - необязательная зависимость
+    psutil = None
+
+from utils import resource_sampler
+from utils.network_stats import NetworkReport
+from utils.perf_metrics import PerformanceAggregator
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Переменная окружения процесса-пакета (значение - идентификатор пакета). Такой процесс,
+# как xdist воркер, только сохраняет свои замеры: общие отчеты строит build_reports
+BATCH_ENV = "PYTEST_ADAPTIVE_BATCH"
+
+# Строка node id в выводе --collect-only -q: путь к модулю, имя теста и параметры
+NODE_ID = re.compile(r"^[^\s:]+\.py::[^\s\[:]+(?:::[^\s\[:]+)*(?:\[.*\])?$")
+
+
+@dataclass
+class LoadSnapshot:
+    """Срез загрузки машины, на основе которого принимается решение о масштабировании."""
+
+    cpu_percent: float
+    available_memory_mb: Optional[float]
+    worker_rss_mb: float
+    seconds_per_test: Optional[float]
+
+
+@dataclass
+class ScalingPolicy:
+    """
+    Правила масштабирования воркеров.
+
+    Воркер добавляется, если CPU ниже cpu_high, памяти хватает еще на один воркер
+    с запасом и время на тест не деградировало. Воркер убирается при нехватке памяти,
+    перегрузке CPU или заметном росте времени на тест.
+    """
+
+    min_workers: int = 1
+    max_workers: int = os.cpu_count() or 1
+    cpu_high: float = 85.0
+    cpu_low: float = 60.0
+    memory_headroom: float = 1.5
+    latency_degradation: float = 2.0
+    default_worker_rss_mb: float = 800.0
+    baseline_seconds_per_test: Optional[float] = field(default=None)
+
+    def decide(self, current: int, load: LoadSnapshot) -> int:
+        """
+        Рассчитывает целевое число воркеров.
+
+        Args:
+            current: Текущее число воркеров
+            load: Срез загрузки машины
+
+        Returns:
+            int: Новое число воркеров в пределах [min_workers, max_workers]
+        """
+        worker_rss = load.worker_rss_mb or self.default_worker_rss_mb
+        latency = load.seconds_per_test
+
+        # Базовое время на тест фиксируется на консервативном стартовом уровне
+        if latency is not None and self.baseline_seconds_per_test is None:
+            self.baseline_seconds_per_test = latency
+
+        memory_low = (
+            load.available_memory_mb is not None
+            and load.available_memory_mb < worker_rss
+        )
+        latency_degraded = (
+            latency is not None
+            and self.baseline_seconds_per_test
+            and latency > self.baseline_seconds_per_test * self.latency_degradation
+        )
+
+        if memory_low or load.cpu_percent > self.cpu_high or latency_degraded:
+            target = current - 1
+        elif (
+            load.cpu_percent < self.cpu_low
+            and load.available_memory_mb is not None
+            and load.available_memory_mb > worker_rss * self.memory_headroom
+        ):
+            target = current + 1
+        else:
+            target = current
+
+        return max(self.min_workers, min(self.max_workers, target))
+
+
+def parse_node_ids(output: str) -> List[str]:
+    """
+    Извлекает node id из вывода pytest --collect-only -q.
+
+    Учитываются только строки до первой пустой строки или заголовка секции:
+    ниже идут сводка предупреждений и итог, где тоже встречаются пути с "::".
+
+    Args:
+        output: Stdout процесса pytest
+
+    Returns:
+        list: Node id в порядке сбора, без повторов
+    """
+    node_ids: List[str] = []
+    for line in output.splitlines():
+        if not line.strip() or line.startswith("="):
+            break
+        if NODE_ID.match(line) and line not in node_ids:
+            node_ids.append(line)
+    return node_ids
+
+
+def collect_test_batches(test_args: List[str]) -> List[List[str]]:
+    """
+    Собирает тесты и группирует их по модулям.
+
+    addopts из pytest.ini сбрасывается: его -v отменяет -q, и вместо node id
+    печатается дерево <Module>/<Function>.
+
+    Args:
+        test_args: Аргументы pytest для отбора тестов (пути, -m маркер)
+
+    Returns:
+        list: Пакеты node id, один пакет на модуль
+    """
+    command = [
+        sys.executable, "-m", "pytest", "--collect-only", "-q",
+        "-o", "addopts=", "-p", "no:cacheprovider",
+    ]
+    result = subprocess.run(
+        command + test_args, capture_output=True, text=True, check=False
+    )
+
+    batches: Dict[str, List[str]] = {}
+    for node_id in parse_node_ids(result.stdout):
+        module = node_id.split("::", 1)[0]
+        batches.setdefault(module, []).append(node_id)
+
+    # Крупные модули первыми, чтобы хвост прогона был коротким
+    return sorted(batches.values(), key=len, reverse=True)
+
+
+class AdaptiveRunner:
+    """Контроллер, выполняющий пакеты тестов с адаптивным числом процессов pytest."""
+
+    def __init__(
+        self,
+        policy: ScalingPolicy,
+        start_workers: int = 2,
+        pytest_args: Optional[List[str]] = None,
+        poll_interval: float = 2.0,
+        logs_dir: str = "adaptive-results",
+    ):
+        """
+        Инициализация контроллера.
+
+        Args:
+            policy: Правила масштабирования
+            start_workers: Начальное (консервативное) число воркеров
+            pytest_args: Дополнительные аргументы для каждого процесса pytest
+            poll_interval: Интервал опроса процессов и загрузки в секундах
+            logs_dir: Директория для логов пакетов
+        """
+        self.policy = policy
+        self.workers = max(policy.min_workers, min(policy.max_workers, start_workers))
+        self.pytest_args = pytest_args or []
+        self.poll_interval = poll_interval
+        self.logs_dir = logs_dir
+        self.history: List[Dict[str, float]] = []
+        self._durations = deque(maxlen=5)
+        self._peak_worker_rss = 0.0
+        self._launched = 0
+
+    @staticmethod
+    def _cpu_percent() -> float:
+        """Загрузка CPU в процентах (psutil или load average)."""
+        if psutil is not None:
+            return psutil.cpu_percent(interval=None)
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1) * 100
+        except (AttributeError, OSError):
+            return 0.0
+
+    @staticmethod
+    def _available_memory_mb() -> Optional[float]:
+        """Доступная память в МБ или None без psutil."""
+        if psutil is None:
+            return None
+        return psutil.virtual_memory().available / MB
+
+    def _process_tree_rss(self, process: subprocess.Popen) -> float:
+        """RSS процесса pytest вместе с драйвером и браузером в МБ."""
+        if psutil is None:
+            return 0.0
+        try:
+            root = psutil.Process(process.pid)
+            tree = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in tree if p.is_running()) / MB
+        except psutil.Error:
+            return 0.0
+
+    def _snapshot(self, running: Dict[subprocess.Popen, tuple]) -> LoadSnapshot:
+        """Снимает срез загрузки и обновляет пик памяти одного воркера."""
+        for process in running:
+            self._peak_worker_rss = max(
+                self._peak_worker_rss, self._process_tree_rss(process)
+            )
+        seconds_per_test = (
+            sum(self._durations) / len(self._durations)
+            if len(self._durations) >= 3
+            else None
+        )
+        return LoadSnapshot(
+            cpu_percent=self._cpu_percent(),
+            available_memory_mb=self._available_memory_mb(),
+            worker_rss_mb=self._peak_worker_rss,
+            seconds_per_test=seconds_per_test,
+        )
+
+    def _launch(self, batch: List[str]) -> subprocess.Popen:
+        """Запускает процесс pytest для пакета тестов, вывод пишется в лог пакета."""
+        os.makedirs(self.logs_dir, exist_ok=True)
+        module = batch[0].split("::", 1)[0]
+        log_path = os.path.join(
+            self.logs_dir, module.replace("/", "_").replace("\\", "_") + ".log"
+        )
+        command = [sys.executable, "-m", "pytest", *self.pytest_args, *batch]
+        self._launched += 1
+        env = {**os.environ, BATCH_ENV: f"batch{self._launched}"}
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            return subprocess.Popen(
+                command, stdout=log_file, stderr=subprocess.STDOUT, env=env
+            )
+
+    def run(self, batches: List[List[str]]) -> int:
+        """
+        Выполняет все пакеты, подстраивая число одновременных процессов.
+
+        Args:
+            batches: Пакеты node id
+
+        Returns:
+            int: 0 если все пакеты прошли, иначе код возврата первого упавшего пакета
+        """
+        pending = deque(batches)
+        running: Dict[subprocess.Popen, tuple] = {}
+        exit_code = 0
+        started_at = time.time()
+        last_decision = 0.0
+
+        print(f"🚦 Адаптивный запуск: {len(batches)} пакетов, старт с {self.workers} воркеров")
+
+        while pending or running:
+            while pending and len(running) < self.workers:
+                batch = pending.popleft()
+                running[self._launch(batch)] = (batch, time.time())
+
+            time.sleep(self.poll_interval)
+
+            for process in [p for p in running if p.poll() is not None]:
+                batch, batch_started = running.pop(process)
+                self._durations.append((time.time() - batch_started) / len(batch))
+                # 5 - pytest не нашел тестов (например, все отфильтрованы маркером)
+                if process.returncode not in (0, 5) and exit_code == 0:
+                    exit_code = process.returncode
+                    print(
+                        f"❌ Пакет {batch[0].split('::')[0]} завершился с кодом "
+                        f"{process.returncode} (лог в {self.logs_dir})"
+                    )
+
+            if time.time() - last_decision < self.poll_interval * 3:
+                continue
+            last_decision = time.time()
+
+            load = self._snapshot(running)
+            target = self.policy.decide(self.workers, load)
+            self.history.append(
+                {
+                    "elapsed": round(time.time() - started_at, 1),
+                    "workers": target,
+                    "cpu_percent": round(load.cpu_percent, 1),
+                    "available_memory_mb": round(load.available_memory_mb or 0, 1),
+                    "seconds_per_test": round(load.seconds_per_test or 0, 2),
+                }
+            )
+            if target != self.workers:
+                print(
+                    f"⚖️  Воркеры: {self.workers} -> {target} "
+                    f"(CPU {load.cpu_percent:.0f}%, память {load.available_memory_mb or 0:.0f} МБ)"
+                )
+                # Уменьшение применяется мягко: текущие процессы дорабатывают свой пакет
+                self.workers = target
+
+        print(
+            f"✅ Адаптивный запуск завершен за {time.time() - started_at:.0f} с, "
+            f"пик памяти воркера {self._peak_worker_rss:.0f} МБ"
+        )
+        return exit_code
+
+
+def clear_stale_samples() -> None:
+    """Удаляет замеры прерванных прогонов до запуска пакетов (сами пакеты их не чистят)."""
+    PerformanceAggregator().clear_stale_samples()
+    NetworkReport().clear_stale_samples()
+    resource_sampler.ResourceSampler().clear_stale_samples()
+
+
+def build_reports(
+    allure_results: str = "allure-results", allure_report: str = "allure-report"
+) -> Dict[str, Optional[str]]:
+    """
+    Строит общие отчеты один раз после всех пакетов: сливает замеры метрик страниц,
+    сетевого трафика и ресурсов и генерирует HTML отчет Allure.
+
+    Args:
+        allure_results: Директория результатов Allure
+        allure_report: Директория HTML отчета Allure
+
+    Returns:
+        dict: Пути к построенным отчетам (None - данных для отчета не было)
+    """
+    resources = resource_sampler.merge_and_report()
+    reports = {
+        "perf": PerformanceAggregator().merge_and_report(),
+        "network": NetworkReport().merge_and_report(),
+        "resources": resources["path"] if resources else None,
+        "allure": None,
+    }
+
+    if shutil.which("allure") and os.path.exists(allure_results):
+        result = subprocess.run(
+            ["allure", "generate", allure_results, "-o", allure_report, "--clean"],
+            check=False,
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            reports["allure"] = allure_report
+        else:
+            logger.warning(f"Не удалось сгенерировать Allure отчет: {result.stderr!r}")
+
+    for name, path in reports.items():
+        if path:
+            print(f"📊 Отчет {name}: {path}")
+    return reports
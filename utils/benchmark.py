@@ -0,0 +1,233 @@
+"""
+Бенчмарк самого фреймворка: замеры времени фикстур, навигации и операций Page Object.
+Сохраняет результаты вместе с метаданными машины и сравнивает их с базовой линией.
+"""
+
+import os
+import glob
+import json
+import time
+import socket
+import platform
+import statistics
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+
+class BenchmarkRecorder:
+    """Накопитель замеров производительности с поддержкой сравнения с baseline."""
+
+    def __init__(
+        self,
+        threshold: float = 0.2,
+        min_delta_ms: float = 50.0,
+        results_dir: str = "benchmark-results",
+    ):
+        """
+        Инициализация накопителя.
+
+        Args:
+            threshold: Допустимый относительный рост медианы (0.2 = +20%)
+            min_delta_ms: Минимальный абсолютный рост в мс, считающийся регрессией
+            results_dir: Директория для сырых замеров воркеров и результатов
+        """
+        self.threshold = threshold
+        self.min_delta_ms = min_delta_ms
+        self.results_dir = results_dir
+        self.samples: Dict[str, List[float]] = {}
+
+    def record(self, name: str, duration_ms: float) -> None:
+        """
+        Добавляет замер метрики.
+
+        Args:
+            name: Имя метрики, например "navigation.TEXT_BOX"
+            duration_ms: Длительность в миллисекундах
+        """
+        self.samples.setdefault(name, []).append(round(duration_ms, 3))
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Контекстный менеджер для замера длительности блока кода.
+
+        Args:
+            name: Имя метрики
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def clear_stale_samples(self) -> None:
+        """Удаляет сырые замеры воркеров, оставшиеся от прерванных прогонов."""
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            os.remove(path)
+
+    def save_samples(self, worker_id: str) -> Optional[str]:
+        """
+        Сохраняет сырые замеры xdist воркера для слияния на контроллере.
+
+        Args:
+            worker_id: Идентификатор xdist воркера
+
+        Returns:
+            str или None: Путь к файлу или None если замеров нет
+        """
+        if not self.samples:
+            return None
+        os.makedirs(self.results_dir, exist_ok=True)
+        path = os.path.join(self.results_dir, f"samples_{worker_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.samples, f, ensure_ascii=False)
+        return path
+
+    def merge_samples(self) -> int:
+        """
+        Добавляет к своим замерам сырые замеры всех воркеров и удаляет их файлы.
+
+        Returns:
+            int: Число слитых файлов воркеров
+        """
+        merged = 0
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for name, values in json.load(f).items():
+                        self.samples.setdefault(name, []).extend(values)
+            except (json.JSONDecodeError, IOError):
+                continue
+            os.remove(path)
+            merged += 1
+        return merged
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Сводная статистика по всем метрикам.
+
+        Returns:
+            dict: {метрика: {"count", "min", "median", "p95", "max"}}
+        """
+        result = {}
+        for name, values in sorted(self.samples.items()):
+            ordered = sorted(values)
+            p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+            result[name] = {
+                "count": len(ordered),
+                "min": ordered[0],
+                "median": round(statistics.median(ordered), 3),
+                "p95": ordered[p95_index],
+                "max": ordered[-1],
+            }
+        return result
+
+    @staticmethod
+    def machine_metadata() -> Dict[str, Any]:
+        """
+        Собирает метаданные машины, на которой выполнялся бенчмарк.
+
+        Returns:
+            dict: Платформа, процессор, версии Python и Playwright, базовый URL
+        """
+        try:
+            from importlib.metadata import version
+
+            playwright_version = version("playwright")
+        except Exception:
+            playwright_version = "unknown"
+
+        from data import URLs
+
+        return {
+            "hostname": socket.gethostname(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "playwright": playwright_version,
+            "base_url": URLs.BASE_URL,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def save(self, path: str) -> str:
+        """
+        Сохраняет результаты вместе с метаданными в JSON.
+
+        Args:
+            path: Путь к файлу результатов
+
+        Returns:
+            str: Путь к сохраненному файлу
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        payload = {
+            "metadata": self.machine_metadata(),
+            "threshold": self.threshold,
+            "metrics": self.summary(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+
+        return path
+
+    @staticmethod
+    def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+        """
+        Загружает сохраненную базовую линию.
+
+        Args:
+            path: Путь к файлу baseline
+
+        Returns:
+            dict или None: Содержимое baseline или None если файла нет
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    def compare(self, baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Сравнивает медианы текущего прогона с базовой линией.
+
+        Метрика считается регрессией, если медиана выросла больше чем на
+        threshold относительно baseline и больше чем на min_delta_ms в абсолюте.
+
+        Args:
+            baseline: Содержимое baseline файла
+
+        Returns:
+            list: Список регрессий с именем метрики и значениями
+        """
+        regressions = []
+        baseline_metrics = baseline.get("metrics", {})
+
+        for name, current in self.summary().items():
+            previous = baseline_metrics.get(name)
+            if not previous:
+                continue
+
+            base_median = previous["median"]
+            delta = current["median"] - base_median
+            ratio = delta / base_median if base_median else 0.0
+
+            if delta > self.min_delta_ms and ratio > self.threshold:
+                regressions.append(
+                    {
+                        "metric": name,
+                        "baseline_ms": base_median,
+                        "current_ms": current["median"],
+                        "regression": round(ratio, 3),
+                    }
+                )
+
+        return regressions
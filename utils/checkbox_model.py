@@ -0,0 +1,412 @@
+"""
+Модельное тестирование дерева чекбоксов.
+CheckboxModel вычисляет ожидаемое распространение отметок между родителями и детьми
+и раскрытие узлов на чистом Python, CheckboxExplorer выполняет случайные или
+исчерпывающие последовательности действий в одной сессии страницы, сверяя снимок
+дерева с моделью после каждого шага, и сокращает упавшую последовательность.
+"""
+
+import time
+import random
+import logging
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional
+
+from utils.checkbox_tree import CHECKED, INDETERMINATE, UNCHECKED, CheckboxTree
+
+logger = logging.getLogger(__name__)
+
+
+class Action(NamedTuple):
+    """Действие над деревом: toggle/expand/collapse узла или expand_all/collapse_all."""
+
+    kind: str
+    path: Optional[str] = None
+
+    def __str__(self) -> str:
+        return f"{self.kind}({self.path})" if self.path else self.kind
+
+
+class ModelState(NamedTuple):
+    """Состояние модели: отмеченные листья и раскрытые узлы."""
+
+    checked: FrozenSet[str]
+    expanded: FrozenSet[str]
+
+
+class InvalidAction(ValueError):
+    """Действие неприменимо в текущем состоянии (например, узел скрыт)."""
+
+
+class CheckboxModel:
+    """Модель react-checkbox-tree: структура дерева и правила переходов."""
+
+    def __init__(self, tree: CheckboxTree):
+        """
+        Строит модель по полному снимку дерева.
+
+        Args:
+            tree: Снимок со всеми узлами (tree.complete)
+
+        Raises:
+            ValueError: Если снимок неполный
+        """
+        if not tree.complete:
+            raise ValueError("Для модели нужен снимок полностью раскрытого дерева")
+        self.order: List[str] = list(tree.nodes)
+        self.ids: Dict[str, str] = {path: node.id for path, node in tree.nodes.items()}
+        self.parents: Dict[str, Optional[str]] = {
+            path: node.parent for path, node in tree.nodes.items()
+        }
+        self.children: Dict[str, List[str]] = {
+            path: list(node.children) for path, node in tree.nodes.items()
+        }
+        self.leaves: Dict[str, FrozenSet[str]] = {
+            path: frozenset(tree.leaves(path)) for path in tree.nodes
+        }
+        self.branches: List[str] = [path for path in self.order if self.children[path]]
+
+    def initial(self) -> ModelState:
+        """Исходное состояние страницы: ничего не отмечено, дерево свернуто."""
+        return ModelState(frozenset(), frozenset())
+
+    def visible(self, state: ModelState, path: str) -> bool:
+        """Узел отрисован, если раскрыты все его предки."""
+        parent = self.parents[path]
+        while parent is not None:
+            if parent not in state.expanded:
+                return False
+            parent = self.parents[parent]
+        return True
+
+    def node_state(self, state: ModelState, path: str) -> str:
+        """Ожидаемое состояние отметки узла по отмеченным листьям."""
+        checked = len(self.leaves[path] & state.checked)
+        if checked == len(self.leaves[path]):
+            return CHECKED
+        return INDETERMINATE if checked else UNCHECKED
+
+    def actions(self, state: ModelState) -> List[Action]:
+        """Действия, применимые в состоянии (только над отрисованными узлами)."""
+        actions = [Action("expand_all"), Action("collapse_all")]
+        for path in self.order:
+            if not self.visible(state, path):
+                continue
+            actions.append(Action("toggle", path))
+            if self.children[path]:
+                kind = "collapse" if path in state.expanded else "expand"
+                actions.append(Action(kind, path))
+        return actions
+
+    def apply(self, state: ModelState, action: Action) -> ModelState:
+        """
+        Вычисляет состояние после действия.
+
+        Args:
+            state: Текущее состояние
+            action: Действие
+
+        Returns:
+            ModelState: Новое состояние
+
+        Raises:
+            InvalidAction: Если узел не отрисован или действие неприменимо
+        """
+        if action.kind == "expand_all":
+            return ModelState(state.checked, frozenset(self.branches))
+        if action.kind == "collapse_all":
+            return ModelState(state.checked, frozenset())
+        if action.path not in self.parents or not self.visible(state, action.path):
+            raise InvalidAction(f"{action}: узел не отрисован")
+
+        if action.kind == "toggle":
+            leaves = self.leaves[action.path]
+            # Полностью отмеченный узел снимается, частично или не отмеченный - отмечается
+            if leaves <= state.checked:
+                return ModelState(state.checked - leaves, state.expanded)
+            return ModelState(state.checked | leaves, state.expanded)
+        if not self.children[action.path]:
+            raise InvalidAction(f"{action}: у листа нет раскрытия")
+        if action.kind == "expand" and action.path not in state.expanded:
+            return ModelState(state.checked, state.expanded | {action.path})
+        if action.kind == "collapse" and action.path in state.expanded:
+            return ModelState(state.checked, state.expanded - {action.path})
+        raise InvalidAction(f"{action}: неприменимо в текущем состоянии")
+
+    def replay(self, sequence: List[Action]) -> Optional[ModelState]:
+        """Состояние после последовательности или None, если она неприменима."""
+        state = self.initial()
+        try:
+            for action in sequence:
+                state = self.apply(state, action)
+        except InvalidAction:
+            return None
+        return state
+
+    def diff(self, state: ModelState, tree: CheckboxTree) -> List[str]:
+        """
+        Сравнивает снимок страницы с ожидаемым состоянием.
+
+        Args:
+            state: Ожидаемое состояние модели
+            tree: Снимок дерева страницы
+
+        Returns:
+            list: Описания расхождений (пустой список - совпадение)
+        """
+        problems = []
+        expected = [path for path in self.order if self.visible(state, path)]
+        for path in expected:
+            node = tree.nodes.get(path)
+            if node is None:
+                problems.append(f"{path}: не отрисован")
+                continue
+            node_state = self.node_state(state, path)
+            if node.state != node_state:
+                problems.append(f"{path}: состояние {node.state}, ожидалось {node_state}")
+            if self.children[path] and node.expanded != (path in state.expanded):
+                problems.append(
+                    f"{path}: раскрыт={node.expanded}, ожидалось {path in state.expanded}"
+                )
+        for path in set(tree.nodes) - set(expected):
+            problems.append(f"{path}: отрисован, хотя предок свернут")
+        return problems
+
+
+@dataclass
+class ModelFailure:
+    """Расхождение страницы с моделью."""
+
+    sequence: List[Action]
+    step: int
+    problems: List[str]
+    original_length: int
+
+    def __str__(self) -> str:
+        steps = " -> ".join(map(str, self.sequence))
+        return (
+            f"Шаг {self.step} ({self.sequence[self.step]}) последовательности "
+            f"из {len(self.sequence)} (исходно {self.original_length}): {steps}\n"
+            + "\n".join(self.problems)
+        )
+
+
+@dataclass
+class ExplorationReport:
+    """Итог исследования дерева."""
+
+    transitions: int = 0
+    sequences: int = 0
+    duration_s: float = 0.0
+    states: int = 0
+    failure: Optional[ModelFailure] = None
+
+    @property
+    def per_minute(self) -> float:
+        """Переходов в минуту."""
+        return round(self.transitions * 60 / self.duration_s, 1) if self.duration_s else 0.0
+
+
+class CheckboxExplorer:
+    """
+    Исполнитель модельных тестов на странице CheckBoxPage.
+    Все последовательности выполняются в одной странице: между ними дерево
+    сбрасывается снятием отметок и сворачиванием, а не перезагрузкой.
+    """
+
+    def __init__(
+        self, page, model: Optional[CheckboxModel] = None, max_shrink_runs: int = 200
+    ):
+        """
+        Args:
+            page: CheckBoxPage
+            model: Модель дерева (по умолчанию строится по снимку раскрытого дерева)
+            max_shrink_runs: Максимум повторных прогонов при сокращении последовательности
+        """
+        self.page = page
+        if model is None:
+            page.expand_all()
+            model = CheckboxModel(page.snapshot())
+        self.model = model
+        self.max_shrink_runs = max_shrink_runs
+        self.transitions = 0
+        self._executed: List[Action] = []
+        self._state = model.initial()
+        self.reset()
+
+    def reset(self) -> None:
+        """Возвращает дерево в исходное состояние модели; при неудаче перезагружает страницу."""
+        self.page.clear_all_selections()
+        self.page.collapse_all()
+        self._state = self.model.initial()
+        self._executed = []
+        if self.model.diff(self._state, self.page.snapshot()):
+            logger.warning("Сброс дерева не удался, перезагружаем страницу")
+            self.page.page.reload(wait_until="domcontentloaded")
+
+    def _perform(self, action: Action) -> None:
+        """Выполняет действие на странице."""
+        if action.kind == "expand_all":
+            self.page.expand_all()
+        elif action.kind == "collapse_all":
+            self.page.collapse_all()
+        elif action.kind == "toggle":
+            self.page.click_node(self.model.ids[action.path])
+        else:
+            self.page.toggle_expand(self.model.ids[action.path])
+
+    def step(self, action: Action) -> List[str]:
+        """
+        Выполняет действие и сверяет снимок с моделью.
+
+        Args:
+            action: Действие, применимое в текущем состоянии
+
+        Returns:
+            list: Расхождения после шага
+        """
+        self._state = self.model.apply(self._state, action)
+        self._perform(action)
+        self._executed.append(action)
+        self.transitions += 1
+        return self.model.diff(self._state, self.page.snapshot())
+
+    def run(self, sequence: List[Action]) -> Optional[ModelFailure]:
+        """
+        Выполняет последовательность с исходного состояния.
+        Если на странице уже выполнен ее префикс, выполняется только продолжение.
+
+        Args:
+            sequence: Действия
+
+        Returns:
+            ModelFailure или None, если все шаги совпали с моделью
+        """
+        prefix = len(self._executed)
+        if sequence[:prefix] != self._executed:
+            self.reset()
+            prefix = 0
+        for index in range(prefix, len(sequence)):
+            problems = self.step(sequence[index])
+            if problems:
+                failed = list(sequence[: index + 1])
+                return ModelFailure(failed, index, problems, len(failed))
+        return None
+
+    def shrink(self, failure: ModelFailure) -> ModelFailure:
+        """
+        Сокращает упавшую последовательность удалением блоков действий (delta debugging),
+        сохраняя применимость в модели и воспроизводимость расхождения.
+
+        Args:
+            failure: Исходное расхождение
+
+        Returns:
+            ModelFailure: Расхождение на минимальной найденной последовательности
+        """
+        best = failure
+        runs = 0
+        chunk = max(1, len(best.sequence) // 2)
+        while chunk >= 1 and runs < self.max_shrink_runs:
+            reduced = False
+            start = 0
+            while start < len(best.sequence) and runs < self.max_shrink_runs:
+                candidate = best.sequence[:start] + best.sequence[start + chunk:]
+                if candidate and self.model.replay(candidate) is not None:
+                    runs += 1
+                    result = self.run(candidate)
+                    if result is not None:
+                        best = result
+                        reduced = True
+                        continue
+                # Окно сдвигается на одно действие: парные действия не выровнены по блокам
+                start += 1
+            if not reduced:
+                # Размер 2 не пропускается: парные действия (двойной toggle) удаляются вместе
+                chunk = max(chunk // 2, 2) if chunk > 2 else chunk - 1
+            elif chunk == 1:
+                # Удаление одиночных действий может сделать соседними парные (collapse/expand)
+                chunk = max(1, len(best.sequence) // 2)
+        best.original_length = failure.original_length
+        logger.info(
+            f"Последовательность сокращена с {failure.original_length} до "
+            f"{len(best.sequence)} действий за {runs} прогонов"
+        )
+        return best
+
+    def explore(
+        self, transitions: int = 1000, sequence_length: int = 50, seed: Optional[int] = None
+    ) -> ExplorationReport:
+        """
+        Случайное исследование: последовательности случайных применимых действий.
+
+        Args:
+            transitions: Общее число переходов
+            sequence_length: Длина одной последовательности (между сбросами)
+            seed: Зерно генератора для воспроизводимости
+
+        Returns:
+            ExplorationReport: Итог; при расхождении содержит сокращенную последовательность
+        """
+        rng = random.Random(seed)
+        report = ExplorationReport()
+        seen = set()
+        started = time.perf_counter()
+        while report.transitions < transitions:
+            if self._executed:
+                self.reset()
+            for _ in range(min(sequence_length, transitions - report.transitions)):
+                problems = self.step(rng.choice(self.model.actions(self._state)))
+                seen.add(self._state)
+                report.transitions += 1
+                if problems:
+                    sequence = list(self._executed)
+                    failure = ModelFailure(sequence, len(sequence) - 1, problems, len(sequence))
+                    report.failure = self.shrink(failure)
+                    break
+            report.sequences += 1
+            if report.failure:
+                break
+        report.duration_s = round(time.perf_counter() - started, 2)
+        report.states = len(seen)
+        return report
+
+    def sequences(self, depth: int) -> Iterator[List[Action]]:
+        """Все применимые последовательности длины depth в порядке обхода в глубину."""
+
+        def walk(state: ModelState, prefix: List[Action]) -> Iterator[List[Action]]:
+            if len(prefix) == depth:
+                yield prefix
+                return
+            for action in self.model.actions(state):
+                yield from walk(self.model.apply(state, action), prefix + [action])
+
+        return walk(self.model.initial(), [])
+
+    def exhaustive(self, depth: int = 3) -> ExplorationReport:
+        """
+        Исчерпывающее исследование всех применимых последовательностей длины depth.
+        Каждый префикс сверяется с моделью по ходу выполнения, поэтому короткие
+        последовательности проверяются как префиксы длинных.
+
+        Args:
+            depth: Длина последовательностей
+
+        Returns:
+            ExplorationReport: Итог; при расхождении содержит сокращенную последовательность
+        """
+        report = ExplorationReport()
+        seen = set()
+        started = time.perf_counter()
+        before = self.transitions
+        for sequence in self.sequences(depth):
+            failure = self.run(sequence)
+            report.sequences += 1
+            seen.add(self._state)
+            if failure:
+                report.failure = self.shrink(failure)
+                break
+        report.transitions = self.transitions - before
+        report.duration_s = round(time.perf_counter() - started, 2)
+        report.states = len(seen)
+        return report
@@ -0,0 +1,182 @@
+"""
+Модель дерева чекбоксов (react-checkbox-tree) в памяти.
+Снимок дерева получается одним evaluate (см. CheckBoxPage.snapshot), узлы индексируются
+по пути вида home/documents/office, а план кликов для нужного набора отмеченных
+листьев вычисляется без обращений к странице.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+CHECKED = "checked"
+UNCHECKED = "unchecked"
+INDETERMINATE = "indeterminate"
+
+
+@dataclass
+class CheckboxNode:
+    """Узел дерева чекбоксов."""
+
+    id: str
+    path: str
+    title: str
+    parent: Optional[str]
+    depth: int
+    leaf: bool
+    expanded: bool
+    state: str
+    visible: bool
+    children: List[str] = field(default_factory=list)
+
+
+class CheckboxTree:
+    """Снимок дерева чекбоксов с индексом узлов по пути."""
+
+    def __init__(self, nodes: Iterable[CheckboxNode], results: Iterable[str] = ()):
+        """
+        Args:
+            nodes: Узлы в порядке документа (родитель раньше детей)
+            results: Тексты блока результатов (#result)
+        """
+        self.nodes: Dict[str, CheckboxNode] = {}
+        self.results = list(results)
+        self._names: Dict[str, str] = {}
+        for node in nodes:
+            self.nodes[node.path] = node
+            if node.parent in self.nodes:
+                self.nodes[node.parent].children.append(node.path)
+            for name in (node.path, node.id, node.title, node.title.rsplit(".", 1)[0]):
+                self._names.setdefault(name.lower(), node.path)
+        self._leaves: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_snapshot(cls, data: Dict) -> "CheckboxTree":
+        """
+        Создает дерево из результата скрипта снимка.
+
+        Args:
+            data: {"nodes": [...], "results": [...]}
+
+        Returns:
+            CheckboxTree: Дерево
+        """
+        return cls(
+            (CheckboxNode(**node) for node in data.get("nodes", [])),
+            data.get("results", []),
+        )
+
+    @property
+    def roots(self) -> List[CheckboxNode]:
+        """Корневые узлы."""
+        return [node for node in self.nodes.values() if node.parent is None]
+
+    @property
+    def complete(self) -> bool:
+        """True если все узлы раскрыты и снимок содержит все листья дерева."""
+        return all(node.leaf or node.expanded for node in self.nodes.values())
+
+    def find(self, name: str) -> CheckboxNode:
+        """
+        Находит узел по пути, id или заголовку (без учета регистра и расширения).
+
+        Args:
+            name: Путь (home/desktop), id (wordFile) или заголовок (Word File.doc)
+
+        Returns:
+            CheckboxNode: Узел
+
+        Raises:
+            KeyError: Если узел отсутствует в снимке
+        """
+        key = name.strip().lower()
+        path = self._names.get(key) or self._names.get(key.replace(" ", ""))
+        if path is None:
+            raise KeyError(f"Узел {name} отсутствует в снимке дерева")
+        return self.nodes[path]
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self.find(name)
+            return True
+        except KeyError:
+            return False
+
+    def state(self, name: str) -> str:
+        """
+        Состояние узла: checked, unchecked или indeterminate.
+        Узлы, отсутствующие в снимке (свернутые), считаются неотмеченными.
+        """
+        return self.find(name).state if name in self else UNCHECKED
+
+    def leaves(self, path: str) -> List[str]:
+        """Пути листьев поддерева (сам узел, если это лист)."""
+        if path not in self._leaves:
+            node = self.nodes[path]
+            self._leaves[path] = (
+                [path] if node.leaf
+                else [leaf for child in node.children for leaf in self.leaves(child)]
+            )
+        return self._leaves[path]
+
+    def all_leaves(self) -> List[str]:
+        """Пути всех листьев снимка."""
+        return [leaf for root in self.roots for leaf in self.leaves(root.path)]
+
+    def checked_leaves(self) -> Set[str]:
+        """Пути отмеченных листьев."""
+        return {path for path in self.all_leaves() if self.nodes[path].state == CHECKED}
+
+    def visible_titles(self) -> List[str]:
+        """Заголовки видимых узлов в порядке документа."""
+        return [node.title for node in self.nodes.values() if node.visible and node.title]
+
+    def desired_leaves(self, names: Iterable[str]) -> Set[str]:
+        """Листья, которые нужно отметить, чтобы были отмечены указанные узлы."""
+        return {leaf for name in names for leaf in self.leaves(self.find(name).path)}
+
+    def plan(self, desired: Iterable[str]) -> List[str]:
+        """
+        Минимальная последовательность кликов, после которой отмечены ровно desired листья.
+
+        Клик по узлу, отмеченному полностью, снимает отметки со всего поддерева, по
+        частично отмеченному или неотмеченному - отмечает все поддерево. Для каждого
+        узла сравниваются варианты: без клика, один клик, два клика (снять все), после
+        чего рекурсивно исправляются дочерние узлы.
+
+        Args:
+            desired: Пути листьев, которые должны остаться отмеченными
+
+        Returns:
+            list: Пути узлов в порядке кликов (родитель раньше детей)
+        """
+        target: FrozenSet[str] = frozenset(desired)
+        memo: Dict[tuple, List[str]] = {}
+
+        def solve(path: str, uniform: Optional[bool]) -> List[str]:
+            key = (path, uniform)
+            if key in memo:
+                return memo[key]
+            leaves = self.leaves(path)
+            checked = [
+                uniform if uniform is not None else self.nodes[leaf].state == CHECKED
+                for leaf in leaves
+            ]
+            if all(value == (leaf in target) for leaf, value in zip(leaves, checked)):
+                memo[key] = []
+                return []
+            node = self.nodes[path]
+            if node.leaf:
+                memo[key] = [path]
+                return memo[key]
+
+            def children(state: Optional[bool]) -> List[str]:
+                return [click for child in node.children for click in solve(child, state)]
+
+            after_click = not all(checked)
+            options = [children(uniform), [path] + children(after_click)]
+            if after_click:
+                options.append([path, path] + children(False))
+            memo[key] = min(options, key=len)
+            return memo[key]
+
+        return [click for root in self.roots for click in solve(root.path, None)]
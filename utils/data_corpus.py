@@ -0,0 +1,263 @@
+"""
+Заранее сгенерированный корпус тестовых данных в бинарном файле с записями фиксированной ширины.
+Чтение через mmap дает O(1) доступ по индексу, а xdist воркеры получают непересекающиеся
+срезы корпуса, поэтому уникальность данных между воркерами не требует координации.
+"""
+
+import os
+import json
+import mmap
+from typing import Dict, List, Iterator, Optional, Tuple
+
+from utils.helper import DataGenerator
+
+MAGIC = b"QACORPUS1\n"
+HEADER_SIZE = 4096
+
+# Поля записи и их ширина в байтах: TestData.USERS, TestData.FORM_DATA
+# и аргументы WebTablesPage.fill_registration_form
+FIELDS: List[Tuple[str, int]] = [
+    ("first_name", 16),
+    ("last_name", 16),
+    ("email", 40),
+    ("username", 16),
+    ("age", 3),
+    ("salary", 6),
+    ("department", 16),
+    ("gender", 6),
+    ("mobile", 10),
+    ("current_address", 48),
+    ("subjects", 40),
+    ("hobbies", 24),
+    ("state", 16),
+    ("city", 10),
+]
+
+# Значения, которые принимает Practice Form на demoqa
+SUBJECTS = ["Maths", "Physics", "Chemistry", "English", "Computer Science", "History"]
+HOBBIES = ["Sports", "Reading", "Music"]
+STATE_CITIES = {
+    "NCR": ["Delhi", "Gurgaon", "Noida"],
+    "Uttar Pradesh": ["Agra", "Lucknow", "Merrut"],
+    "Haryana": ["Karnal", "Panipat"],
+    "Rajasthan": ["Jaipur", "Jaiselmer"],
+}
+LIST_FIELDS = ("subjects", "hobbies")
+
+
+def _encode(value: str, width: int) -> bytes:
+    """Кодирует значение в поле фиксированной ширины (дополняется пробелами)."""
+    raw = value.encode("utf-8")[:width]
+    return raw.ljust(width, b" ")
+
+
+def build_corpus(
+    path: str,
+    count: int = 100_000,
+    seed: int = 0,
+    chunk_size: int = 10_000,
+) -> str:
+    """
+    Генерирует корпус и записывает его в файл.
+    Генерация идет пакетами, поэтому память не зависит от размера корпуса.
+
+    Args:
+        path: Путь к файлу корпуса
+        count: Количество записей
+        seed: Зерно генерации
+        chunk_size: Размер пакета генерации
+
+    Returns:
+        str: Путь к созданному файлу
+    """
+    header = json.dumps(
+        {"fields": FIELDS, "count": count, "seed": seed}, ensure_ascii=False
+    ).encode("utf-8")
+    if len(MAGIC) + len(header) + 1 > HEADER_SIZE:
+        raise ValueError("Заголовок корпуса не помещается в HEADER_SIZE")
+
+    rng = DataGenerator.rng(seed)
+    states = list(STATE_CITIES)
+    tmp_path = path + ".tmp"
+    written = 0
+    used_emails = set()
+
+    with open(tmp_path, "wb") as f:
+        f.write((MAGIC + header + b"\n").ljust(HEADER_SIZE, b"\0"))
+
+        while written < count:
+            size = min(chunk_size, count - written)
+            users = DataGenerator.users(size, seed=rng.getrandbits(64))
+            subject_counts = rng.choices(range(1, 4), k=size)
+            hobby_counts = rng.choices(range(1, 3), k=size)
+            chosen_states = rng.choices(states, k=size)
+
+            records = []
+            for user, n_subjects, n_hobbies, state in zip(
+                users, subject_counts, hobby_counts, chosen_states
+            ):
+                # Уникальность email между пакетами
+                while user["email"] in used_emails:
+                    user["username"] = DataGenerator.strings(
+                        1, 10, DataGenerator.LOWER_DIGITS, rng=rng
+                    )[0]
+                    user["email"] = f"{user['username']}@example.com"
+                used_emails.add(user["email"])
+
+                user["subjects"] = ",".join(rng.sample(SUBJECTS, n_subjects))
+                user["hobbies"] = ",".join(rng.sample(HOBBIES, n_hobbies))
+                user["state"] = state
+                user["city"] = rng.choice(STATE_CITIES[state])
+                records.append(
+                    b"".join(_encode(user[name], width) for name, width in FIELDS)
+                )
+
+            f.write(b"".join(records))
+            written += size
+
+    os.replace(tmp_path, path)
+    return path
+
+
+class DataCorpus:
+    """Доступ к корпусу только на чтение через mmap."""
+
+    def __init__(self, path: str):
+        """
+        Открывает корпус.
+
+        Args:
+            path: Путь к файлу корпуса
+
+        Raises:
+            ValueError: Если файл не является корпусом
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Файл {path} не является корпусом тестовых данных")
+
+        header_end = self._mmap.find(b"\n", len(MAGIC))
+        header = json.loads(self._mmap[len(MAGIC) : header_end])
+        self.fields: List[Tuple[str, int]] = [tuple(field) for field in header["fields"]]
+        self.count: int = header["count"]
+        self.seed: int = header["seed"]
+        self.record_size = sum(width for _, width in self.fields)
+
+        offsets = []
+        offset = 0
+        for name, width in self.fields:
+            offsets.append((name, offset, offset + width))
+            offset += width
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Dict[str, object]:
+        """
+        Возвращает запись по индексу за O(1).
+
+        Args:
+            index: Индекс записи
+
+        Returns:
+            dict: Поля записи; subjects и hobbies - списки
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Индекс {index} вне корпуса из {self.count} записей")
+
+        start = HEADER_SIZE + index * self.record_size
+        raw = self._mmap[start : start + self.record_size]
+        record: Dict[str, object] = {}
+        for name, begin, end in self._offsets:
+            value = raw[begin:end].decode("utf-8", errors="ignore").rstrip(" ")
+            record[name] = value.split(",") if name in LIST_FIELDS and value else value
+        return record
+
+    def worker_slice(
+        self, worker_id: Optional[str] = None, worker_count: Optional[int] = None
+    ) -> "CorpusSlice":
+        """
+        Возвращает непересекающийся срез корпуса для xdist воркера.
+
+        Args:
+            worker_id: Идентификатор воркера (gw0, gw1, ...), по умолчанию из окружения
+            worker_count: Число воркеров, по умолчанию из окружения
+
+        Returns:
+            CorpusSlice: Срез корпуса для текущего воркера
+        """
+        worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        worker_count = worker_count or int(
+            os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1")
+        )
+        index = int(worker_id.lstrip("gw") or 0)
+        per_worker = self.count // worker_count
+        start = index * per_worker
+        stop = self.count if index == worker_count - 1 else start + per_worker
+        return CorpusSlice(self, start, stop)
+
+    def close(self) -> None:
+        """Закрывает mmap и файл."""
+        self._mmap.close()
+        self._file.close()
+
+
+class CorpusSlice:
+    """Диапазон записей корпуса, выдаваемых воркеру по порядку без повторов."""
+
+    def __init__(self, corpus: DataCorpus, start: int, stop: int):
+        """
+        Args:
+            corpus: Корпус
+            start: Первый индекс среза
+            stop: Индекс за последним элементом среза
+        """
+        self.corpus = corpus
+        self.start = start
+        self.stop = stop
+        self._cursor = start
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, offset: int) -> Dict[str, object]:
+        if not 0 <= offset < len(self):
+            raise IndexError(f"Смещение {offset} вне среза из {len(self)} записей")
+        return self.corpus[self.start + offset]
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        for index in range(self.start, self.stop):
+            yield self.corpus[index]
+
+    @property
+    def remaining(self) -> int:
+        """Сколько записей еще не выдано."""
+        return self.stop - self._cursor
+
+    def take(self, n: int = 1) -> List[Dict[str, object]]:
+        """
+        Выдает следующие n неиспользованных записей среза.
+
+        Args:
+            n: Количество записей
+
+        Returns:
+            list: Записи корпуса
+
+        Raises:
+            IndexError: Если срез исчерпан
+        """
+        if n > self.remaining:
+            raise IndexError(
+                f"Срез корпуса исчерпан: запрошено {n}, осталось {self.remaining}"
+            )
+        records = [self.corpus[i] for i in range(self._cursor, self._cursor + n)]
+        self._cursor += n
+        return records
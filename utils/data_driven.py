@@ -0,0 +1,150 @@
+"""
+Режим data-driven: строки набора данных прогоняются через один и тот же сценарий
+на одной странице воркера. Между строками выполняется дешевый сброс состояния
+сценария вместо создания браузера, контекста и страницы на каждую строку.
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Scenario:
+    """
+    Сценарий, выполняемый для каждой строки набора.
+
+    run(page_object, row) выполняет шаги и проверки строки (AssertionError - провал),
+    reset(page_object, row) возвращает страницу в исходное состояние после строки.
+    """
+
+    name: str
+    url: str
+    page_class: type
+    run: Callable[[Any, Any], None]
+    reset: Optional[Callable[[Any, Any], None]] = None
+
+
+@dataclass
+class RowResult:
+    """Результат одной строки набора."""
+
+    scenario: str
+    index: int
+    passed: bool
+    duration_ms: float
+    error: Optional[str] = None
+
+
+class DataDrivenSession:
+    """Общая страница воркера для сценариев data-driven режима."""
+
+    def __init__(self, context):
+        """
+        Args:
+            context: BrowserContext Playwright, живущий весь прогон воркера
+        """
+        self.context = context
+        self.results: List[RowResult] = []
+        self._page_objects: Dict[str, Any] = {}
+
+    def page_object(self, scenario: Scenario) -> Any:
+        """
+        Возвращает Page Object сценария, открывая страницу при первом обращении.
+
+        Args:
+            scenario: Сценарий
+
+        Returns:
+            Page Object сценария
+        """
+        if scenario.name not in self._page_objects:
+            page = self.context.new_page()
+            page.goto(scenario.url, wait_until="domcontentloaded")
+            self._page_objects[scenario.name] = scenario.page_class(page)
+        return self._page_objects[scenario.name]
+
+    def _reload(self, scenario: Scenario) -> None:
+        """Полный сброс: повторная загрузка страницы сценария."""
+        page_object = self._page_objects[scenario.name]
+        page_object.page.goto(scenario.url, wait_until="domcontentloaded")
+
+    def run_row(self, scenario: Scenario, row: Any, index: int = 0) -> RowResult:
+        """
+        Выполняет сценарий для одной строки и сбрасывает состояние.
+
+        После успешной строки выполняется сброс сценария, после ошибки (или
+        неудачного сброса) страница загружается заново, чтобы следующая строка
+        начиналась с чистого состояния.
+
+        Args:
+            scenario: Сценарий
+            row: Строка данных (DatasetRow загружается автоматически)
+            index: Номер строки для отчета
+
+        Returns:
+            RowResult: Результат строки
+
+        Raises:
+            Exception: Исключение сценария, чтобы pytest отметил строку как упавшую
+        """
+        page_object = self.page_object(scenario)
+        if hasattr(row, "load"):
+            index = getattr(row, "index", index)
+            row = row.load()
+
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            scenario.run(page_object, row)
+        except Exception as e:
+            error = e
+
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        result = RowResult(
+            scenario=scenario.name,
+            index=index,
+            passed=error is None,
+            duration_ms=duration_ms,
+            error=None if error is None else f"{type(error).__name__}: {error}",
+        )
+        self.results.append(result)
+
+        try:
+            if error is None and scenario.reset is not None:
+                scenario.reset(page_object, row)
+            elif error is not None:
+                self._reload(scenario)
+        except Exception as e:
+            logger.warning(f"Сброс сценария {scenario.name} не удался ({e}), перезагружаем страницу")
+            self._reload(scenario)
+
+        if error is not None:
+            raise error
+        return result
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Сводка по сценариям: количество строк, провалы и среднее время строки.
+
+        Returns:
+            dict: {сценарий: {rows, failed, avg_ms}}
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for result in self.results:
+            stats = summary.setdefault(result.scenario, {"rows": 0, "failed": 0, "total_ms": 0.0})
+            stats["rows"] += 1
+            stats["failed"] += 0 if result.passed else 1
+            stats["total_ms"] += result.duration_ms
+        for stats in summary.values():
+            stats["avg_ms"] = round(stats.pop("total_ms") / stats["rows"], 1)
+        return summary
+
+    def close(self) -> None:
+        """Закрывает страницы сценариев."""
+        for page_object in self._page_objects.values():
+            page_object.page.close()
+        self._page_objects.clear()
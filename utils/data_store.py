@@ -0,0 +1,322 @@
+"""
+Бэкенды хранения для TestDataManager.
+Журнал только на дозапись с периодическим уплотнением или SQLite в режиме WAL,
+оба безопасны при одновременной записи несколькими xdist воркерами.
+"""
+
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Any
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def file_lock(lock_path: str):
+    """
+    Межпроцессная эксклюзивная блокировка на основе lock-файла.
+
+    Args:
+        lock_path: Путь к lock-файлу
+    """
+    with open(lock_path, "a+b") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def read_json(path: str) -> Dict[str, Any]:
+    """
+    Читает JSON файл со словарем.
+
+    Args:
+        path: Путь к файлу
+
+    Returns:
+        dict: Содержимое файла или пустой словарь при отсутствии файла или ошибке
+    """
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
+    return {}
+
+
+def write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    """
+    Записывает JSON через временный файл и атомарную замену: читатели в других
+    процессах видят либо старое, либо новое содержимое целиком.
+
+    Args:
+        path: Путь к файлу
+        data: Данные для записи
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class DataStoreBackend:
+    """Базовый интерфейс хранилища тестовых данных (ключ -> JSON-значение)."""
+
+    def load(self) -> Dict[str, Any]:
+        """Загружает все данные."""
+        raise NotImplementedError
+
+    def refresh(self, data: Dict[str, Any]) -> None:
+        """Дополняет data изменениями, сделанными другими процессами."""
+        data.update(self.load())
+
+    def set(self, key: str, value: Any) -> None:
+        """Сохраняет одно значение."""
+        raise NotImplementedError
+
+    def save_all(self, data: Dict[str, Any]) -> None:
+        """Сохраняет весь набор данных."""
+        for key, value in data.items():
+            self.set(key, value)
+
+    def compact(self) -> None:
+        """Уплотняет хранилище (если поддерживается)."""
+
+
+class JsonFileBackend(DataStoreBackend):
+    """Исходный формат: один JSON файл, перезаписываемый целиком при каждом сохранении."""
+
+    def __init__(self, data_file: str):
+        """
+        Args:
+            data_file: Путь к JSON файлу
+        """
+        self.data_file = data_file
+        self._data: Dict[str, Any] = {}
+
+    def load(self) -> Dict[str, Any]:
+        self._data = read_json(self.data_file)
+        return dict(self._data)
+
+    def set(self, key: str, value: Any) -> None:
+        with file_lock(self.data_file + ".lock"):
+            self._data = read_json(self.data_file)
+            self._data[key] = value
+            write_json_atomic(self.data_file, self._data)
+
+    def save_all(self, data: Dict[str, Any]) -> None:
+        with file_lock(self.data_file + ".lock"):
+            self._data = dict(data)
+            write_json_atomic(self.data_file, self._data)
+
+
+class JournalBackend(DataStoreBackend):
+    """
+    Снимок в JSON файле плюс журнал изменений на дозапись (JSON Lines).
+
+    Запись - одна строка в конец журнала под межпроцессной блокировкой, O(1).
+    Когда журнал превышает compact_every записей, он сливается в снимок.
+    """
+
+    def __init__(self, data_file: str, compact_every: int = 500):
+        """
+        Args:
+            data_file: Путь к файлу снимка (test_data.json)
+            compact_every: Число записей журнала, после которого выполняется уплотнение
+        """
+        self.data_file = data_file
+        self.journal_file = data_file + ".journal"
+        self.lock_file = data_file + ".lock"
+        self.compact_every = compact_every
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._reload = False
+
+    def _journal_stat(self):
+        try:
+            return os.stat(self.journal_file)
+        except FileNotFoundError:
+            return None
+
+    def _replay(self, data: Dict[str, Any], offset: int) -> int:
+        """Применяет записи журнала начиная с offset, возвращает новое смещение."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(offset)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        # Незавершенная запись другого процесса - дочитаем позже
+                        break
+                    offset += len(raw_line)
+                    try:
+                        entry = json.loads(raw_line)
+                    except json.JSONDecodeError:
+                        continue
+                    data[entry["k"]] = entry["v"]
+                    self._journal_entries += 1
+        except FileNotFoundError:
+            pass
+        return offset
+
+    def load(self) -> Dict[str, Any]:
+        data = read_json(self.data_file)
+        stat = self._journal_stat()
+        self._journal_inode = stat.st_ino if stat else None
+        self._journal_entries = 0
+        self._journal_offset = self._replay(data, 0)
+        self._reload = False
+        return data
+
+    def refresh(self, data: Dict[str, Any]) -> None:
+        stat = self._journal_stat()
+        inode = stat.st_ino if stat else None
+        if (
+            self._reload
+            or inode != self._journal_inode
+            or (stat and stat.st_size < self._journal_offset)
+        ):
+            # Журнал был уплотнен (другим процессом или этим, пока в журнале были
+            # непрочитанные записи других процессов) - перечитываем снимок целиком
+            data.clear()
+            data.update(self.load())
+            return
+        if stat and stat.st_size > self._journal_offset:
+            self._journal_offset = self._replay(data, self._journal_offset)
+
+    def set(self, key: str, value: Any) -> None:
+        line = (json.dumps({"k": key, "v": value}, ensure_ascii=False) + "\n").encode("utf-8")
+        with file_lock(self.lock_file):
+            with open(self.journal_file, "ab") as f:
+                stat = os.fstat(f.fileno())
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            if stat.st_ino == self._journal_inode and stat.st_size == self._journal_offset:
+                # Все предыдущие записи уже прочитаны - своя запись тоже учтена,
+                # иначе ее прочитает и посчитает refresh вместе с чужими
+                self._journal_offset = stat.st_size + len(line)
+                self._journal_entries += 1
+            elif self._journal_inode is None:
+                # Журнал еще не читался: load пересчитает записи с начала
+                self._journal_entries += 1
+            if self._journal_entries >= self.compact_every:
+                self._compact_locked()
+
+    def save_all(self, data: Dict[str, Any]) -> None:
+        with file_lock(self.lock_file):
+            write_json_atomic(self.data_file, data)
+            self._rotate_journal()
+
+    def compact(self) -> None:
+        with file_lock(self.lock_file):
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """
+        Сливает журнал в снимок. Вызывается под блокировкой.
+        Снимок может содержать записи других процессов, которые этот процесс еще
+        не прочитал, поэтому следующий refresh перечитывает его целиком.
+        """
+        data = read_json(self.data_file)
+        self._replay(data, 0)
+        write_json_atomic(self.data_file, data)
+        self._rotate_journal()
+        self._reload = True
+
+    def _rotate_journal(self) -> None:
+        """Заменяет журнал пустым файлом (новый inode сигнализирует читателям)."""
+        tmp_path = self.journal_file + ".tmp"
+        open(tmp_path, "wb").close()
+        os.replace(tmp_path, self.journal_file)
+        stat = self._journal_stat()
+        self._journal_inode = stat.st_ino if stat else None
+        self._journal_offset = 0
+        self._journal_entries = 0
+
+
+class SqliteBackend(DataStoreBackend):
+    """Хранилище ключ-значение в SQLite в режиме WAL."""
+
+    def __init__(self, data_file: str):
+        """
+        Args:
+            data_file: Путь к файлу базы (расширение .json заменяется на .sqlite)
+        """
+        base, _ = os.path.splitext(data_file)
+        self.db_file = base + ".sqlite"
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_file, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS test_data (key TEXT PRIMARY KEY, value TEXT)"
+            )
+        return self._connection
+
+    def load(self) -> Dict[str, Any]:
+        rows = self.connection.execute("SELECT key, value FROM test_data")
+        return {key: json.loads(value) for key, value in rows}
+
+    def set(self, key: str, value: Any) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO test_data (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False)),
+            )
+
+    def save_all(self, data: Dict[str, Any]) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM test_data")
+            self.connection.executemany(
+                "INSERT INTO test_data (key, value) VALUES (?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False)) for k, v in data.items()],
+            )
+
+    def compact(self) -> None:
+        self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+BACKENDS = {
+    "json": JsonFileBackend,
+    "journal": JournalBackend,
+    "sqlite": SqliteBackend,
+}
+
+
+def create_backend(name: str, data_file: str) -> DataStoreBackend:
+    """
+    Создает бэкенд по имени.
+
+    Args:
+        name: Имя бэкенда (json, journal, sqlite)
+        data_file: Путь к файлу данных
+
+    Returns:
+        DataStoreBackend: Экземпляр бэкенда
+
+    Raises:
+        ValueError: Если бэкенд неизвестен
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Неизвестный бэкенд данных: {name}. Доступны: {', '.join(BACKENDS)}")
+    return BACKENDS[name](data_file)
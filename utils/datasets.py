@@ -0,0 +1,290 @@
+"""
+Загрузчик наборов тестовых данных из директории datasets/ (YAML, JSON, CSV).
+Файл разбирается при первом обращении и компилируется в бинарный кэш (поток pickle
+с индексом смещений строк), ключом кэша служит хеш содержимого файла. Повторные
+запуски читают кэш, а параметризация получает ссылки на строки вместо самих строк.
+"""
+
+import os
+import re
+import csv
+import glob
+import json
+import pickle
+import hashlib
+import logging
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import yaml
+except ImportError:  # pyyaml нужен только для .yaml/.yml наборов
+    yaml = None
+
+from utils.records import Record
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASETS_DIR = os.getenv("TEST_DATASETS_DIR", os.path.join(PROJECT_ROOT, "datasets"))
+CACHE_DIR = os.getenv("TEST_DATASETS_CACHE", os.path.join(PROJECT_ROOT, ".dataset-cache"))
+
+# Увеличивается при изменении формата скомпилированного кэша
+COMPILED_VERSION = 1
+EXTENSIONS = (".yaml", ".yml", ".json", ".csv")
+# Разделитель значений списка в ячейке CSV (поля-кортежи схемы)
+CSV_LIST_SEPARATOR = "|"
+
+
+class DatasetRow:
+    """Ссылка на строку скомпилированного набора; строка читается только при load()."""
+
+    __slots__ = ("name", "index", "path", "offset", "schema")
+
+    def __init__(self, name: str, index: int, path: str, offset: int, schema: Optional[type]):
+        self.name = name
+        self.index = index
+        self.path = path
+        self.offset = offset
+        self.schema = schema
+
+    def load(self) -> Any:
+        """
+        Читает строку из кэша.
+
+        Returns:
+            Запись схемы или словарь, если схема не задана
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            return _apply_schema(pickle.load(f), self.schema)
+
+    def __repr__(self) -> str:
+        return f"DatasetRow({self.name}[{self.index}])"
+
+
+class DatasetLoader:
+    """Ленивый загрузчик наборов данных с компилированным кэшем."""
+
+    def __init__(self, directory: str = DATASETS_DIR, cache_dir: str = CACHE_DIR):
+        """
+        Args:
+            directory: Директория с наборами данных
+            cache_dir: Директория скомпилированного кэша
+        """
+        self.directory = directory
+        self.cache_dir = cache_dir
+        self._loaded: Dict[tuple, Any] = {}
+        self._compiled: Dict[str, tuple] = {}
+
+    def source_path(self, name: str) -> str:
+        """
+        Находит файл набора по имени без расширения.
+
+        Args:
+            name: Имя набора
+
+        Returns:
+            str: Путь к файлу
+
+        Raises:
+            FileNotFoundError: Если набор не найден
+        """
+        for extension in EXTENSIONS:
+            path = os.path.join(self.directory, name + extension)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"Набор данных {name} не найден в {self.directory}")
+
+    def compiled(self, name: str) -> tuple:
+        """
+        Возвращает скомпилированный набор, компилируя его при изменении исходника.
+
+        Args:
+            name: Имя набора
+
+        Returns:
+            tuple: (путь к кэшу, метаданные, смещения строк)
+        """
+        if name in self._compiled:
+            return self._compiled[name]
+
+        source = self.source_path(name)
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(str(COMPILED_VERSION).encode())
+        path = os.path.join(self.cache_dir, f"{name}-{digest.hexdigest()[:16]}.pkl")
+
+        if not os.path.exists(path):
+            self._compile(source, path)
+
+        with open(path, "rb") as f:
+            meta = pickle.load(f)
+        offsets = array("Q")
+        if meta["kind"] == "rows":
+            with open(path + ".idx", "rb") as f:
+                offsets.frombytes(f.read())
+        self._compiled[name] = (path, meta, offsets)
+        return self._compiled[name]
+
+    def _compile(self, source: str, path: str) -> None:
+        """Разбирает исходный файл и записывает поток pickle с индексом строк."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        extension = os.path.splitext(source)[1]
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        offsets = array("Q")
+
+        with open(tmp_path, "wb") as out:
+            if extension == ".csv":
+                # CSV компилируется построчно, без загрузки файла целиком
+                pickle.dump({"kind": "rows"}, out)
+                with open(source, "r", encoding="utf-8", newline="") as f:
+                    for row in csv.DictReader(f):
+                        offsets.append(out.tell())
+                        pickle.dump(row, out)
+            else:
+                data = self._parse(source, extension)
+                if isinstance(data, list):
+                    pickle.dump({"kind": "rows"}, out)
+                    for row in data:
+                        offsets.append(out.tell())
+                        pickle.dump(row, out)
+                else:
+                    pickle.dump({"kind": "mapping"}, out)
+                    pickle.dump(data, out)
+
+        with open(tmp_path + ".idx", "wb") as f:
+            offsets.tofile(f)
+        # Индекс публикуется первым: кэш без индекса не считается готовым
+        os.replace(tmp_path + ".idx", path + ".idx")
+        os.replace(tmp_path, path)
+
+        # Кэши прежних версий этого набора больше не нужны. Имя сверяется точно:
+        # glob "form-*" захватил бы и кэш набора "form-data"
+        name = os.path.splitext(os.path.basename(source))[0]
+        own_cache = re.compile(rf"{re.escape(name)}-[0-9a-f]{{16}}\.pkl(?:\.idx)?")
+        for stale in glob.glob(os.path.join(self.cache_dir, f"{name}-*.pkl*")):
+            if stale not in (path, path + ".idx") and own_cache.fullmatch(os.path.basename(stale)):
+                os.remove(stale)
+        logger.info(f"Набор данных {os.path.basename(source)} скомпилирован: {len(offsets)} строк")
+
+    @staticmethod
+    def _parse(source: str, extension: str) -> Any:
+        """Разбирает YAML или JSON файл."""
+        with open(source, "r", encoding="utf-8") as f:
+            if extension == ".json":
+                return json.load(f)
+            if yaml is None:
+                raise RuntimeError(f"Для набора {source} требуется pyyaml: pip install pyyaml")
+            return yaml.safe_load(f)
+
+    def load(self, name: str, schema: Optional[type] = None) -> Any:
+        """
+        Загружает набор целиком (один раз за процесс).
+
+        Args:
+            name: Имя набора
+            schema: Класс записи (utils.records) для проверки и заморозки данных;
+                для наборов-словарей - схема всего набора, для строк - схема строки
+
+        Returns:
+            Запись или словарь для набора-словаря, кортеж строк для табличного набора
+        """
+        key = (name, schema)
+        if key not in self._loaded:
+            path, meta, _ = self.compiled(name)
+            if meta["kind"] == "mapping":
+                with open(path, "rb") as f:
+                    pickle.load(f)
+                    self._loaded[key] = _apply_schema(pickle.load(f), schema)
+            else:
+                self._loaded[key] = tuple(self.rows(name, schema))
+        return self._loaded[key]
+
+    def rows(self, name: str, schema: Optional[type] = None) -> Iterator[Any]:
+        """
+        Потоково читает строки табличного набора.
+
+        Args:
+            name: Имя набора
+            schema: Класс записи для строки
+
+        Yields:
+            Запись или словарь очередной строки
+        """
+        path, meta, _ = self.compiled(name)
+        if meta["kind"] != "rows":
+            raise TypeError(f"Набор {name} не табличный")
+        with open(path, "rb") as f:
+            pickle.load(f)
+            while True:
+                try:
+                    row = pickle.load(f)
+                except EOFError:
+                    return
+                yield _apply_schema(row, schema)
+
+    def params(
+        self, name: str, schema: Optional[type] = None, limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Параметры для pytest.mark.parametrize.
+
+        При сборе тестов читается только индекс смещений, сами строки загружаются
+        в тесте вызовом row.load(), поэтому сбор не разбирает тысячи строк.
+        Возвращается список: генераторы в parametrize pytest объявил устаревшими.
+
+        Args:
+            name: Имя табличного набора
+            schema: Класс записи для строки
+            limit: Максимальное количество строк
+
+        Returns:
+            list: pytest.param с DatasetRow и id вида <набор>-<номер>
+        """
+        import pytest
+
+        path, meta, offsets = self.compiled(name)
+        if meta["kind"] != "rows":
+            raise TypeError(f"Набор {name} не табличный")
+        return [
+            pytest.param(DatasetRow(name, index, path, offset, schema), id=f"{name}-{index}")
+            for index, offset in enumerate(offsets[:limit] if limit else offsets)
+        ]
+
+
+class LazyDataset:
+    """Дескриптор атрибута класса, загружающий набор при первом обращении."""
+
+    def __init__(self, name: str, schema: Optional[type] = None):
+        """
+        Args:
+            name: Имя набора
+            schema: Класс записи (utils.records)
+        """
+        self.name = name
+        self.schema = schema
+
+    def __get__(self, instance, owner) -> Any:
+        return datasets.load(self.name, self.schema)
+
+
+def _apply_schema(data: Any, schema: Optional[type]) -> Any:
+    """Проверяет данные по схеме, разбивая ячейки CSV для полей-кортежей."""
+    if schema is None:
+        return data
+    if issubclass(schema, Record):
+        data = {
+            key: [item for item in value.split(CSV_LIST_SEPARATOR) if item]
+            if schema._types.get(key) is tuple and isinstance(value, str)
+            else value
+            for key, value in data.items()
+        }
+        return schema.from_dict(data)
+    return schema(data)
+
+
+# Общий загрузчик проекта
+datasets = DatasetLoader()
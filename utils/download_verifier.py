@@ -0,0 +1,250 @@
+"""
+Потоковая проверка скачанных файлов: хеш, размер и тип считаются по блокам
+за один проход без копирования файла, поэтому память не зависит от размера.
+Проверка доступности URL выполняется HEAD запросом или запросом одного байта.
+"""
+
+import base64
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+# Сигнатуры начала файла для определения типа без доверия к имени и заголовкам
+MAGIC_TYPES = [
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+]
+
+
+def detect_type(head: bytes) -> str:
+    """
+    Определяет MIME тип по первым байтам файла.
+
+    Args:
+        head: Начало файла
+
+    Returns:
+        str: MIME тип (text/plain или application/octet-stream если сигнатура неизвестна)
+    """
+    for magic, mime_type in MAGIC_TYPES:
+        if head.startswith(magic):
+            return mime_type
+    try:
+        head.decode("utf-8")
+        return "text/plain"
+    except UnicodeDecodeError:
+        return "application/octet-stream"
+
+
+@dataclass
+class DownloadVerification:
+    """Результат потоковой проверки скачанного файла."""
+
+    filename: str
+    size: int
+    sha256: str
+    mime_type: str
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True если все ожидания выполнены."""
+        return not self.errors
+
+
+class StreamingVerifier:
+    """Инкрементальный подсчет размера, хеша и типа по мере поступления блоков."""
+
+    def __init__(
+        self,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        expected_type: Optional[str] = None,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            expected_size: Ожидаемый размер в байтах
+            expected_sha256: Ожидаемый SHA-256 в hex
+            expected_type: Ожидаемый MIME тип (определяется по сигнатуре)
+            max_size: Максимально допустимый размер; чтение прекращается при превышении
+        """
+        self.expected_size = expected_size
+        self.expected_sha256 = expected_sha256
+        self.expected_type = expected_type
+        self.max_size = max_size
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._head = b""
+
+    @property
+    def exceeded(self) -> bool:
+        """True если превышен max_size."""
+        return self.max_size is not None and self.size > self.max_size
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Обрабатывает очередной блок данных.
+
+        Args:
+            chunk: Блок данных
+        """
+        if len(self._head) < 64:
+            self._head += chunk[: 64 - len(self._head)]
+        self.size += len(chunk)
+        self._hash.update(chunk)
+
+    def result(self, filename: str) -> DownloadVerification:
+        """
+        Сверяет накопленные значения с ожиданиями.
+
+        Args:
+            filename: Имя файла для отчета
+
+        Returns:
+            DownloadVerification: Результат проверки
+        """
+        sha256 = self._hash.hexdigest()
+        mime_type = detect_type(self._head) if self.size else "application/octet-stream"
+        errors = []
+
+        if self.exceeded:
+            errors.append(f"Размер превышает {self.max_size} байт")
+        elif self.expected_size is not None and self.size != self.expected_size:
+            errors.append(f"Размер {self.size} байт, ожидался {self.expected_size}")
+        if self.expected_sha256 and not self.exceeded and sha256 != self.expected_sha256.lower():
+            errors.append(f"SHA-256 {sha256} не совпадает с ожидаемым")
+        if self.expected_type and mime_type != self.expected_type:
+            errors.append(f"Тип {mime_type}, ожидался {self.expected_type}")
+
+        return DownloadVerification(
+            filename=filename, size=self.size, sha256=sha256, mime_type=mime_type, errors=errors
+        )
+
+
+def verify_file(path: str, filename: str, verifier: StreamingVerifier) -> DownloadVerification:
+    """
+    Прогоняет файл через верификатор блоками по CHUNK_SIZE.
+
+    Args:
+        path: Путь к файлу
+        filename: Имя файла для отчета
+        verifier: Настроенный верификатор
+
+    Returns:
+        DownloadVerification: Результат проверки
+    """
+    with open(path, "rb") as f:
+        while not verifier.exceeded:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            verifier.feed(chunk)
+    return verifier.result(filename)
+
+
+def verify_download(download, verifier: StreamingVerifier, keep: bool = False) -> DownloadVerification:
+    """
+    Проверяет скачивание Playwright без сохранения копии.
+
+    Читается временный файл, который Playwright уже записал (download.path()),
+    после проверки он удаляется, если не запрошено обратное.
+
+    Args:
+        download: Download Playwright
+        verifier: Настроенный верификатор
+        keep: Не удалять временный файл после проверки
+
+    Returns:
+        DownloadVerification: Результат проверки
+    """
+    failure = download.failure()
+    if failure:
+        return DownloadVerification(
+            filename=download.suggested_filename,
+            size=0,
+            sha256="",
+            mime_type="",
+            errors=[f"Скачивание не удалось: {failure}"],
+        )
+    try:
+        return verify_file(download.path(), download.suggested_filename, verifier)
+    finally:
+        if not keep:
+            download.delete()
+
+
+def _probe_data_url(url: str) -> Dict[str, object]:
+    """Разбирает data: URL без декодирования содержимого целиком."""
+    header, _, payload = url[len("data:"):].partition(",")
+    parts = header.split(";")
+    if "base64" in parts:
+        padding = payload[-2:].count("=")
+        size = len(payload) * 3 // 4 - padding
+        # Проверяем, что начало содержимого корректно декодируется
+        base64.b64decode(payload[:64])
+    else:
+        size = len(unquote(payload).encode("utf-8"))
+    return {
+        "status": 200,
+        "content_type": parts[0] or "text/plain",
+        "content_length": size,
+        "accept_ranges": False,
+        "method": "data",
+    }
+
+
+def probe_url(request_context, url: str, timeout: int = 5000) -> Dict[str, object]:
+    """
+    Проверяет доступность файла без полного скачивания.
+
+    Сначала выполняется HEAD запрос; если сервер его не поддерживает,
+    запрашивается один байт (Range: bytes=0-0), а размер берется из Content-Range.
+
+    Args:
+        request_context: APIRequestContext Playwright (page.context.request)
+        url: URL файла
+        timeout: Таймаут запроса в миллисекундах
+
+    Returns:
+        dict: status, content_type, content_length, accept_ranges, method
+    """
+    if url.startswith("data:"):
+        return _probe_data_url(url)
+
+    response = request_context.head(url, timeout=timeout)
+    method = "HEAD"
+    try:
+        if response.status in (405, 501):
+            response.dispose()
+            response = request_context.get(
+                url, headers={"Range": "bytes=0-0"}, timeout=timeout
+            )
+            method = "RANGE"
+
+        headers = response.headers
+        length = headers.get("content-length")
+        content_range = headers.get("content-range", "")
+        if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+            length = content_range.rsplit("/", 1)[1]
+
+        return {
+            "status": response.status,
+            "content_type": headers.get("content-type", "").split(";")[0],
+            "content_length": int(length) if length and length.isdigit() else None,
+            "accept_ranges": headers.get("accept-ranges", "") == "bytes"
+            or response.status == 206,
+            "method": method,
+        }
+    finally:
+        response.dispose()
@@ -0,0 +1,315 @@
+"""
+Геометрия элементов страницы: прямоугольники, вычисленные стили и размер viewport
+для набора селекторов за один evaluate, и проверки взаимного расположения
+(перекрытие, вложенность, сторона, попадание во viewport), которые считаются
+в Python сразу по спискам прямоугольников без обращений к странице.
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Описание элемента: прямоугольник относительно viewport (как у bounding_box),
+# видимость и запрошенные CSS свойства
+_DESCRIBE_ELEMENT = """
+const describe = (el, styles) => {
+    if (!el) return {found: false, visible: false, rect: null, styles: {}};
+    const rect = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    return {
+        found: true,
+        visible: style.visibility !== 'hidden' && style.display !== 'none'
+            && rect.width > 0 && rect.height > 0,
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        styles: Object.fromEntries(styles.map(name => [name, style.getPropertyValue(name)])),
+    };
+};
+"""
+
+# Геометрия набора элементов и viewport за один вызов. Запрос - CSS, XPath или CSS
+# с текстом (аналог :has-text); null - селектор движка Playwright, для него
+# возвращается null и элемент читается через locator
+GEOMETRY_SCRIPT = (
+    "({queries, styles}) => {"
+    + _DESCRIBE_ELEMENT
+    + """
+    const normalize = text => (text || '').replace(/\\s+/g, ' ').toLowerCase();
+    const find = ({css, xpath, text}) => {
+        if (xpath) {
+            return document.evaluate(
+                xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        if (text === undefined || text === null) return document.querySelector(css);
+        const needle = normalize(text);
+        return [...document.querySelectorAll(css)]
+            .find(el => normalize(el.textContent).includes(needle)) || null;
+    };
+    return {
+        viewport: {width: innerWidth, height: innerHeight, scrollX, scrollY},
+        elements: queries.map(query => {
+            if (!query) return null;
+            try {
+                return describe(find(query), styles);
+            } catch (e) {
+                return null;
+            }
+        }),
+    };
+}"""
+)
+
+# Геометрия первого элемента локатора (для селекторов движка Playwright)
+ELEMENT_GEOMETRY_SCRIPT = (
+    "(elements, styles) => {" + _DESCRIBE_ELEMENT + "return describe(elements[0] || null, styles);}"
+)
+
+HAS_TEXT = re.compile(r"(?P<css>.+?):has-text\((?P<quote>['\"])(?P<text>.*)(?P=quote)\)")
+PLAYWRIGHT_ONLY = re.compile(r"^text=|>>|:has-text|:text|:visible|:nth-match|:has\(")
+
+
+@dataclass(frozen=True)
+class Rect:
+    """Прямоугольник в координатах viewport."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.height
+
+    @property
+    def center(self) -> tuple:
+        return self.x + self.width / 2, self.y + self.height / 2
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping]) -> Optional["Rect"]:
+        """Прямоугольник из словаря bounding_box (None или пустой словарь - None)."""
+        if not data:
+            return None
+        return cls(data.get("x", 0), data.get("y", 0), data.get("width", 0), data.get("height", 0))
+
+    def as_dict(self) -> Dict[str, float]:
+        """Словарь в формате bounding_box."""
+        return {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+
+
+@dataclass
+class ElementGeometry:
+    """Геометрия элемента на момент чтения."""
+
+    selector: str
+    found: bool
+    visible: bool
+    rect: Optional[Rect]
+    styles: Dict[str, str] = field(default_factory=dict)
+
+
+def _broadcast(a: Sequence, b: Sequence) -> List[tuple]:
+    """Пары элементов двух списков; список из одного элемента повторяется."""
+    if len(a) == 1 and len(b) != 1:
+        a = list(a) * len(b)
+    elif len(b) == 1 and len(a) != 1:
+        b = list(b) * len(a)
+    if len(a) != len(b):
+        raise ValueError(f"Списки прямоугольников разной длины: {len(a)} и {len(b)}")
+    return list(zip(a, b))
+
+
+def overlaps(a: Sequence[Optional[Rect]], b: Sequence[Optional[Rect]]) -> List[bool]:
+    """
+    Перекрываются ли прямоугольники попарно (пересечение ненулевой площади).
+
+    Args:
+        a: Прямоугольники (один - сравнивается со всеми из b)
+        b: Прямоугольники
+
+    Returns:
+        list: Признак перекрытия для каждой пары (False, если прямоугольника нет)
+    """
+    # Сравнивается размер пересечения: прямоугольник нулевого размера внутри другого
+    # (свернутый элемент) не перекрывает его
+    return [
+        bool(r1 and r2)
+        and min(r1.right, r2.right) - max(r1.x, r2.x) > 0
+        and min(r1.bottom, r2.bottom) - max(r1.y, r2.y) > 0
+        for r1, r2 in _broadcast(a, b)
+    ]
+
+
+def contains(
+    outer: Sequence[Optional[Rect]], inner: Sequence[Optional[Rect]], tolerance: float = 0.5
+) -> List[bool]:
+    """
+    Лежит ли inner целиком внутри outer (попарно, с допуском на субпиксели).
+
+    Args:
+        outer: Внешние прямоугольники
+        inner: Внутренние прямоугольники
+        tolerance: Допуск в пикселях
+
+    Returns:
+        list: Признак вложенности для каждой пары
+    """
+    return [
+        bool(o and i)
+        and i.x >= o.x - tolerance and i.y >= o.y - tolerance
+        and i.right <= o.right + tolerance and i.bottom <= o.bottom + tolerance
+        for o, i in _broadcast(outer, inner)
+    ]
+
+
+def placement(
+    reference: Sequence[Optional[Rect]], other: Sequence[Optional[Rect]], tolerance: float = 1.0
+) -> List[str]:
+    """
+    С какой стороны от reference находится other: top, bottom, left, right,
+    overlap (прямоугольники пересекаются) или unknown (прямоугольника нет).
+
+    Args:
+        reference: Опорные прямоугольники (например, элементы)
+        other: Проверяемые прямоугольники (например, подсказки)
+        tolerance: Допуск касания в пикселях (стрелка подсказки касается элемента)
+
+    Returns:
+        list: Сторона для каждой пары
+    """
+    sides = []
+    for ref, rect in _broadcast(reference, other):
+        if not (ref and rect):
+            sides.append("unknown")
+        elif rect.bottom <= ref.y + tolerance:
+            sides.append("top")
+        elif rect.y >= ref.bottom - tolerance:
+            sides.append("bottom")
+        elif rect.right <= ref.x + tolerance:
+            sides.append("left")
+        elif rect.x >= ref.right - tolerance:
+            sides.append("right")
+        else:
+            sides.append("overlap")
+    return sides
+
+
+def within(rects: Sequence[Optional[Rect]], bounds: Rect, tolerance: float = 0.5) -> List[bool]:
+    """Лежат ли прямоугольники целиком внутри bounds (например, viewport)."""
+    return contains([bounds], rects, tolerance) if rects else []
+
+
+class Layout:
+    """Геометрия набора элементов и viewport, прочитанная одним evaluate."""
+
+    def __init__(self, elements: Dict[str, ElementGeometry], viewport: Rect):
+        """
+        Args:
+            elements: Геометрия элементов по именам
+            viewport: Viewport (x=y=0, размеры окна)
+        """
+        self.elements = elements
+        self.viewport = viewport
+
+    def __getitem__(self, name: str) -> ElementGeometry:
+        return self.elements[name]
+
+    def _names(self, names: Optional[Sequence[str]], exclude: str = None) -> List[str]:
+        return [name for name in (names or self.elements) if name != exclude]
+
+    def rect(self, name: str) -> Optional[Rect]:
+        """Прямоугольник элемента (None, если элемент не найден)."""
+        return self.elements[name].rect
+
+    def size(self, name: str) -> Dict[str, float]:
+        """Размер элемента {'width', 'height'} (нули, если элемент не найден)."""
+        rect = self.rect(name)
+        return {"width": rect.width if rect else 0, "height": rect.height if rect else 0}
+
+    def overlaps(self, name: str, others: Optional[Sequence[str]] = None) -> Dict[str, bool]:
+        """Перекрывает ли элемент name каждый из others (по умолчанию - все остальные)."""
+        others = self._names(others, exclude=name)
+        return dict(zip(others, overlaps([self.rect(name)], [self.rect(o) for o in others])))
+
+    def contains(self, outer: str, others: Optional[Sequence[str]] = None) -> Dict[str, bool]:
+        """Лежит ли каждый из others внутри элемента outer."""
+        others = self._names(others, exclude=outer)
+        return dict(zip(others, contains([self.rect(outer)], [self.rect(o) for o in others])))
+
+    def placement(self, reference: str, others: Optional[Sequence[str]] = None) -> Dict[str, str]:
+        """Сторона каждого из others относительно элемента reference."""
+        others = self._names(others, exclude=reference)
+        return dict(
+            zip(others, placement([self.rect(reference)], [self.rect(o) for o in others]))
+        )
+
+    def within_viewport(self, names: Optional[Sequence[str]] = None) -> Dict[str, bool]:
+        """Лежит ли каждый элемент целиком во viewport."""
+        names = self._names(names)
+        return dict(zip(names, within([self.rect(name) for name in names], self.viewport)))
+
+
+def _query(selector: str) -> Optional[Dict[str, str]]:
+    """Запрос для GEOMETRY_SCRIPT (None - селектор движка Playwright)."""
+    if selector.startswith("xpath=") or selector.startswith("//"):
+        return {"xpath": selector[len("xpath="):] if selector.startswith("xpath=") else selector}
+    match = HAS_TEXT.fullmatch(selector)
+    if match and not PLAYWRIGHT_ONLY.search(match.group("css")):
+        return {"css": match.group("css"), "text": match.group("text")}
+    if PLAYWRIGHT_ONLY.search(selector):
+        return None
+    return {"css": selector}
+
+
+def _geometry(selector: str, data: Optional[Mapping]) -> ElementGeometry:
+    data = data or {}
+    return ElementGeometry(
+        selector=selector,
+        found=data.get("found", False),
+        visible=data.get("visible", False),
+        rect=Rect.from_dict(data.get("rect")),
+        styles=data.get("styles", {}),
+    )
+
+
+def read_layout(
+    page, selectors: Union[Mapping[str, str], Sequence[str]], styles: Sequence[str] = ()
+) -> Layout:
+    """
+    Читает геометрию элементов и viewport.
+
+    CSS, XPath и селекторы вида css:has-text('...') разрешаются в странице одним
+    evaluate; прочие селекторы движка Playwright читаются отдельным запросом
+    через locator (без ожидания элемента).
+
+    Args:
+        page: Страница Playwright
+        selectors: {имя: селектор} или список селекторов (имя - сам селектор)
+        styles: CSS свойства, значения которых нужно вернуть
+
+    Returns:
+        Layout: Геометрия элементов (первый совпавший элемент каждого селектора)
+    """
+    named = dict(selectors) if isinstance(selectors, Mapping) else {s: s for s in selectors}
+    styles = list(styles)
+    data = page.evaluate(
+        GEOMETRY_SCRIPT,
+        {"queries": [_query(selector) for selector in named.values()], "styles": styles},
+    )
+
+    elements = {}
+    for (name, selector), element in zip(named.items(), data["elements"]):
+        if element is None:
+            logger.debug(f"Геометрия {selector} читается через locator")
+            element = page.locator(selector).evaluate_all(ELEMENT_GEOMETRY_SCRIPT, styles)
+        elements[name] = _geometry(selector, element)
+
+    viewport = data["viewport"]
+    return Layout(elements, Rect(0, 0, viewport["width"], viewport["height"]))
@@ -4,17 +4,43 @@
 """
 
 import os
-import json
 import random
 import string
 import time
-from typing import Dict, List, Any
+import json
+import zlib
+import struct
+import hashlib
+import logging
+from collections import deque
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 
+from utils.data_store import DataStoreBackend, create_backend
+
+logger = logging.getLogger(__name__)
+
 
 class DataGenerator:
     """Генератор тестовых данных для различных сценариев."""
 
+    # Предвычисленные алфавиты и справочники для пакетной генерации
+    LETTERS_DIGITS = string.ascii_letters + string.digits
+    LOWER_DIGITS = string.ascii_lowercase + string.digits
+    FIRST_NAMES = [
+        "John", "Alice", "Bob", "Maria", "David", "Emma", "Michael", "Olivia",
+        "James", "Sophia", "Robert", "Linda", "Daniel", "Laura", "Kevin", "Anna",
+    ]
+    LAST_NAMES = [
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis",
+        "Garcia", "Wilson", "Moore", "Taylor", "Anderson", "Thomas", "Martin",
+    ]
+    DEPARTMENTS = ["Engineering", "Legal", "Compliance", "Insurance", "QA", "Sales"]
+    GENDERS = ["Male", "Female", "Other"]
+    STREETS = ["Main St", "Oak Ave", "Pine Rd", "Elm Dr", "Maple Ln"]
+    CITIES = ["Springfield", "Madison", "Franklin", "Georgetown", "Clinton"]
+    STATES = ["NY", "CA", "TX", "FL", "IL"]
+
     @staticmethod
     def random_string(
         length: int = 10, include_digits: bool = True, include_symbols: bool = False
@@ -36,7 +62,7 @@ class DataGenerator:
         if include_symbols:
             chars += "!@#$%^&*"
 
-        return "".join(random.choice(chars) for _ in range(length))
+        return "".join(random.choices(chars, k=length))
 
     @staticmethod
     def random_email(domain: str = "example.com") -> str:
@@ -60,7 +86,7 @@ class DataGenerator:
         Returns:
             str: Номер телефона в формате 1234567890
         """
-        return "".join(random.choice(string.digits) for _ in range(10))
+        return "".join(random.choices(string.digits, k=10))
 
     @staticmethod
     def random_address() -> Dict[str, str]:
@@ -70,9 +96,9 @@ class DataGenerator:
         Returns:
             dict: Словарь с компонентами адреса
         """
-        streets = ["Main St", "Oak Ave", "Pine Rd", "Elm Dr", "Maple Ln"]
-        cities = ["Springfield", "Madison", "Franklin", "Georgetown", "Clinton"]
-        states = ["NY", "CA", "TX", "FL", "IL"]
+        streets = DataGenerator.STREETS
+        cities = DataGenerator.CITIES
+        states = DataGenerator.STATES
 
         return {
             "street": f"{random.randint(100, 9999)} {random.choice(streets)}",
@@ -105,6 +131,200 @@ class DataGenerator:
 
         return start_date + timedelta(days=random_days)
 
+    # ======================== ПАКЕТНАЯ ГЕНЕРАЦИЯ ========================
+
+    @staticmethod
+    def rng(seed: Union[int, str, None] = None) -> random.Random:
+        """
+        Создает независимый генератор случайных чисел.
+
+        Args:
+            seed: Зерно; строка (например, node id теста) хешируется стабильно
+                  между запусками, None - случайное зерно
+
+        Returns:
+            random.Random: Генератор случайных чисел
+        """
+        if isinstance(seed, str):
+            seed = int.from_bytes(hashlib.sha256(seed.encode("utf-8")).digest()[:8], "big")
+        return random.Random(seed)
+
+    @staticmethod
+    def strings(
+        n: int,
+        length: int = 10,
+        alphabet: str = LETTERS_DIGITS,
+        unique: bool = False,
+        rng: Optional[random.Random] = None,
+    ) -> List[str]:
+        """
+        Генерирует n строк одним вызовом random.choices по всему столбцу.
+
+        Args:
+            n: Количество строк
+            length: Длина каждой строки
+            alphabet: Алфавит символов
+            unique: Гарантировать уникальность строк в пакете
+            rng: Генератор случайных чисел (см. DataGenerator.rng)
+
+        Returns:
+            list: Список строк
+
+        Raises:
+            ValueError: Если уникальных строк такой длины не хватает
+        """
+        rng = rng or random.Random()
+        if unique and len(alphabet) ** length < n:
+            raise ValueError(f"Невозможно получить {n} уникальных строк длины {length}")
+
+        def _batch(count: int) -> List[str]:
+            chars = "".join(rng.choices(alphabet, k=count * length))
+            return [chars[i : i + length] for i in range(0, count * length, length)]
+
+        values = _batch(n)
+        if not unique:
+            return values
+
+        seen = set()
+        result = []
+        while True:
+            for value in values:
+                if value not in seen:
+                    seen.add(value)
+                    result.append(value)
+            if len(result) == n:
+                return result
+            values = _batch(n - len(result))
+
+    @staticmethod
+    def emails(
+        n: int,
+        domain: str = "example.com",
+        rng: Optional[random.Random] = None,
+    ) -> List[str]:
+        """
+        Генерирует n уникальных email адресов.
+
+        Args:
+            n: Количество адресов
+            domain: Домен для email
+            rng: Генератор случайных чисел
+
+        Returns:
+            list: Уникальные email адреса
+        """
+        usernames = DataGenerator.strings(
+            n, 8, DataGenerator.LOWER_DIGITS, unique=True, rng=rng
+        )
+        return [f"{username}@{domain}" for username in usernames]
+
+    @staticmethod
+    def phones(n: int, rng: Optional[random.Random] = None) -> List[str]:
+        """
+        Генерирует n номеров телефонов в формате 1234567890.
+
+        Args:
+            n: Количество номеров
+            rng: Генератор случайных чисел
+
+        Returns:
+            list: Номера телефонов
+        """
+        return DataGenerator.strings(n, 10, string.digits, rng=rng)
+
+    @staticmethod
+    def addresses(n: int, seed: Union[int, str, None] = None) -> List[Dict[str, str]]:
+        """
+        Генерирует n адресов, заполняя каждый столбец одним вызовом.
+
+        Args:
+            n: Количество адресов
+            seed: Зерно для воспроизводимости (например, node id теста)
+
+        Returns:
+            list: Словари с компонентами адреса, как у random_address()
+        """
+        rng = DataGenerator.rng(seed)
+        numbers = rng.choices(range(100, 10000), k=n)
+        streets = rng.choices(DataGenerator.STREETS, k=n)
+        cities = rng.choices(DataGenerator.CITIES, k=n)
+        states = rng.choices(DataGenerator.STATES, k=n)
+        zips = rng.choices(range(10000, 100000), k=n)
+
+        return [
+            {
+                "street": f"{number} {street}",
+                "city": city,
+                "state": state,
+                "zip": str(zip_code),
+                "full": f"{number} {street}, {city}, {state} {zip_code}",
+            }
+            for number, street, city, state, zip_code in zip(
+                numbers, streets, cities, states, zips
+            )
+        ]
+
+    @staticmethod
+    def users(
+        n: int,
+        seed: Union[int, str, None] = None,
+        domain: str = "example.com",
+    ) -> List[Dict[str, str]]:
+        """
+        Генерирует n пользователей для Web Tables и Practice Form.
+        Email и username уникальны в пределах пакета.
+
+        Args:
+            n: Количество пользователей
+            seed: Зерно для воспроизводимости (например, node id теста)
+            domain: Домен для email
+
+        Returns:
+            list: Словари с полями first_name, last_name, email, username, age,
+                  salary, department, gender, mobile, current_address
+
+        Example:
+            DataGenerator.users(10_000, seed=request.node.nodeid)
+        """
+        rng = DataGenerator.rng(seed)
+        first_names = rng.choices(DataGenerator.FIRST_NAMES, k=n)
+        last_names = rng.choices(DataGenerator.LAST_NAMES, k=n)
+        usernames = DataGenerator.strings(
+            n, 10, DataGenerator.LOWER_DIGITS, unique=True, rng=rng
+        )
+        ages = rng.choices(range(18, 66), k=n)
+        salaries = rng.choices(range(20000, 150001, 1000), k=n)
+        departments = rng.choices(DataGenerator.DEPARTMENTS, k=n)
+        genders = rng.choices(DataGenerator.GENDERS, k=n)
+        mobiles = DataGenerator.phones(n, rng=rng)
+        addresses = DataGenerator.addresses(n, seed=rng.getrandbits(64))
+
+        return [
+            {
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": f"{username}@{domain}",
+                "username": username,
+                "age": str(age),
+                "salary": str(salary),
+                "department": department,
+                "gender": gender,
+                "mobile": mobile,
+                "current_address": address["full"],
+            }
+            for first_name, last_name, username, age, salary, department, gender, mobile, address in zip(
+                first_names,
+                last_names,
+                usernames,
+                ages,
+                salaries,
+                departments,
+                genders,
+                mobiles,
+                addresses,
+            )
+        ]
+
 
 class FileManager:
     """Менеджер для работы с файлами в тестах."""
@@ -124,12 +344,14 @@ class FileManager:
         Returns:
             str: Полный путь к созданному файлу
         """
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
 
+        # Запись через временный файл, чтобы параллельные воркеры не читали недописанный файл
         file_path = os.path.join(directory, filename)
-        with open(file_path, "w", encoding="utf-8") as f:
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(content)
+        os.replace(tmp_path, file_path)
 
         return file_path
 
@@ -193,6 +415,209 @@ class FileManager:
                 if os.path.isfile(file_path):
                     os.remove(file_path)
 
+    # ======================== КЭШ ФАЙЛОВ ДЛЯ ЗАГРУЗКИ ========================
+
+    # Версия генераторов: увеличивается при изменении формата, чтобы не брать устаревший кэш
+    FILE_CACHE_VERSION = 1
+    FILE_CACHE_DIR = os.getenv(
+        "TEST_FILES_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "demoqa-playwright", "files"),
+    )
+
+    @staticmethod
+    def cached_file(
+        kind: str,
+        name: Optional[str] = None,
+        size: Union[int, tuple, None] = None,
+        seed: int = 0,
+        sparse: bool = False,
+        content: Union[str, bytes, None] = None,
+    ) -> str:
+        """
+        Возвращает путь к файлу-фикстуре, создавая его один раз на машину.
+
+        Файл адресуется хешем спецификации (тип, размер, зерно, версия генератора),
+        которая однозначно определяет содержимое. Повторные вызовы и последующие
+        запуски переиспользуют готовый файл. Файл создается атомарно и доступен
+        только на чтение, поэтому безопасен для параллельных воркеров.
+
+        Args:
+            kind: Тип файла: text, image, pdf, binary
+            name: Имя файла с расширением (по умолчанию по типу)
+            size: Размер в байтах (для image - кортеж (ширина, высота))
+            seed: Зерно генерации содержимого
+            sparse: Для binary - создать разреженный файл из нулей
+            content: Готовое содержимое файла (вместо генерации по size и seed)
+
+        Returns:
+            str: Путь к файлу только для чтения
+
+        Raises:
+            ValueError: Если тип файла неизвестен или формат изображения не поддерживается
+            ImportError: Если для изображения не в PNG не установлен Pillow
+        """
+        defaults = {
+            "text": ("sample.txt", 1024),
+            "image": ("sample.png", (100, 100)),
+            "pdf": ("sample.pdf", None),
+            "binary": ("sample.bin", 1024 * 1024),
+        }
+        if kind not in defaults:
+            raise ValueError(f"Неизвестный тип файла: {kind}")
+
+        default_name, default_size = defaults[kind]
+        name = name or default_name
+        size = tuple(size) if isinstance(size, list) else (size or default_size)
+        extension = os.path.splitext(name)[1].lower()
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        spec = {
+            "kind": kind,
+            "extension": extension,
+            "size": size,
+            "seed": seed,
+            "sparse": sparse,
+            "content": hashlib.sha256(content).hexdigest() if content is not None else None,
+            "version": FileManager.FILE_CACHE_VERSION,
+        }
+        key = hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+        directory = os.path.join(FileManager.FILE_CACHE_DIR, key[:2], key)
+        file_path = os.path.join(directory, name)
+        if os.path.exists(file_path):
+            return file_path
+
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        writers = {
+            "text": FileManager._write_text,
+            "image": FileManager._write_image,
+            "pdf": FileManager._write_pdf,
+            "binary": FileManager._write_binary,
+        }
+        try:
+            if content is not None:
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+            else:
+                writers[kind](tmp_path, size, seed, sparse=sparse, extension=extension)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, file_path)
+
+        return file_path
+
+    @staticmethod
+    def fixture_file(key: Optional[str] = None, **spec) -> str:
+        """
+        Возвращает путь к файлу из TestData.FILES или по явной спецификации.
+
+        Args:
+            key: Ключ в TestData.FILES (sample_image, sample_document, large_file)
+            **spec: Аргументы cached_file, если ключ не задан
+
+        Returns:
+            str: Путь к закэшированному файлу только для чтения
+        """
+        if key is None:
+            return FileManager.cached_file(**spec)
+
+        from data import TestData
+
+        return FileManager.cached_file(**TestData.FILES[key])
+
+    @staticmethod
+    def _write_text(path: str, size: int, seed: int, **kwargs) -> None:
+        """Пишет текст заданного размера потоково, блоками по 1 МБ."""
+        rng = random.Random(seed)
+        words = [DataGenerator.strings(1, rng.randint(3, 9), string.ascii_lowercase, rng=rng)[0] for _ in range(256)]
+        block = (" ".join(rng.choices(words, k=200_000)) + "\n").encode("ascii")[: 1024 * 1024]
+        with open(path, "wb") as f:
+            remaining = size
+            while remaining > 0:
+                chunk = block[:remaining]
+                f.write(chunk)
+                remaining -= len(chunk)
+
+    @staticmethod
+    def _write_image(path: str, size: tuple, seed: int, extension: str = ".png", **kwargs) -> None:
+        """Пишет однотонное изображение с детерминированным по seed цветом."""
+        rng = random.Random(seed)
+        color = (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
+        width, height = size
+
+        if extension != ".png":
+            # Без Pillow доступен только PNG: PNG-байты под другим расширением
+            # проверяли бы не тот формат, который заявлен в имени файла
+            try:
+                from PIL import Image
+            except ImportError as e:
+                raise ImportError(f"Для изображения {extension} нужен Pillow") from e
+
+            image_format = Image.registered_extensions().get(extension)
+            if image_format is None:
+                raise ValueError(f"Неподдерживаемый формат изображения: {extension}")
+            Image.new("RGB", size, color=color).save(path, format=image_format)
+            return
+
+        # PNG собирается вручную и не требует Pillow
+        def _chunk(tag: bytes, data: bytes) -> bytes:
+            return (
+                struct.pack(">I", len(data))
+                + tag
+                + data
+                + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+            )
+
+        row = b"\x00" + bytes(color) * width
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+            f.write(_chunk(b"IDAT", zlib.compress(row * height, 9)))
+            f.write(_chunk(b"IEND", b""))
+
+    @staticmethod
+    def _write_pdf(path: str, size, seed: int, **kwargs) -> None:
+        """Пишет минимальный валидный одностраничный PDF."""
+        text = f"Test document {seed}"
+        stream = f"BT /F1 24 Tf 72 720 Td ({text}) Tj ET".encode("ascii")
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+            b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        ]
+        body = b"%PDF-1.4\n"
+        offsets = []
+        for number, obj in enumerate(objects, start=1):
+            offsets.append(len(body))
+            body += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+        xref = len(body)
+        body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        body += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+        body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+        with open(path, "wb") as f:
+            f.write(body)
+
+    @staticmethod
+    def _write_binary(path: str, size: int, seed: int, sparse: bool = False, **kwargs) -> None:
+        """Пишет бинарный файл: разреженный (нули) или потоково из псевдослучайных блоков."""
+        with open(path, "wb") as f:
+            if sparse:
+                f.truncate(size)
+                return
+            block = random.Random(seed).randbytes(1024 * 1024)
+            remaining = size
+            while remaining > 0:
+                chunk = block[:remaining]
+                f.write(chunk)
+                remaining -= len(chunk)
+
 
 class ValidationHelper:
     """Помощник для валидации данных в тестах."""
@@ -268,42 +693,295 @@ class ValidationHelper:
         return all(word.lower() in text_lower for word in words)
 
 
+class BrowserCondition:
+    """
+    Условие, проверяемое внутри браузера.
+
+    Предикат - исходный код JS функции от одного аргумента. При ожидании он
+    выполняется в браузере через page.wait_for_function, без round-trip на каждую
+    проверку. Вызов объекта проверяет условие один раз (для композиции с Python условиями).
+    """
+
+    # Наблюдатель вычисляет предикат только при изменениях DOM и выставляет флаг,
+    # который дешево проверяется в requestAnimationFrame
+    _MUTATION_INSTALL = """([id, source, arg]) => {
+        const predicate = eval('(' + source + ')');
+        window.__qaWaits = window.__qaWaits || {};
+        const state = window.__qaWaits[id] = {done: false, observer: null};
+        const check = () => {
+            try { state.done = state.done || !!predicate(arg); } catch (e) {}
+            if (state.done && state.observer) state.observer.disconnect();
+        };
+        state.observer = new MutationObserver(check);
+        state.observer.observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true
+        });
+        check();
+    }"""
+    _MUTATION_CLEANUP = """(id) => {
+        const state = (window.__qaWaits || {})[id];
+        if (state && state.observer) state.observer.disconnect();
+        if (window.__qaWaits) delete window.__qaWaits[id];
+    }"""
+    _counter = 0
+
+    def __init__(
+        self,
+        page,
+        predicate: str,
+        arg: Any = None,
+        polling: Union[str, int] = "raf",
+        name: Optional[str] = None,
+    ):
+        """
+        Args:
+            page: Страница Playwright
+            predicate: Исходный код JS функции, например "(sel) => !!document.querySelector(sel)"
+            arg: Аргумент предиката (сериализуемый в JSON)
+            polling: "raf" - каждый кадр, "mutation" - при изменениях DOM, число - интервал в мс
+            name: Имя условия для статистики ожиданий
+        """
+        self.page = page
+        self.predicate = predicate
+        self.arg = arg
+        self.polling = polling
+        self.name = name or "browser_condition"
+
+    def __call__(self) -> bool:
+        return bool(self.page.evaluate(f"({self.predicate})", self.arg))
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Ждет выполнения условия в браузере.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            bool: True если условие выполнилось в указанное время
+        """
+        timeout_ms = max(int(timeout * 1000), 1)
+        try:
+            if self.polling != "mutation":
+                self.page.wait_for_function(
+                    f"({self.predicate})", arg=self.arg, polling=self.polling, timeout=timeout_ms
+                )
+                return True
+
+            BrowserCondition._counter += 1
+            wait_id = f"{os.getpid()}_{BrowserCondition._counter}"
+            self.page.evaluate(self._MUTATION_INSTALL, [wait_id, self.predicate, self.arg])
+            try:
+                self.page.wait_for_function(
+                    "(id) => window.__qaWaits && window.__qaWaits[id] && window.__qaWaits[id].done",
+                    arg=wait_id,
+                    polling="raf",
+                    timeout=timeout_ms,
+                )
+                return True
+            finally:
+                try:
+                    self.page.evaluate(self._MUTATION_CLEANUP, wait_id)
+                except Exception:
+                    pass
+        except Exception as e:
+            if "Timeout" not in type(e).__name__ and "Timeout" not in str(e):
+                raise
+            return False
+
+
 class WaitHelper:
-    """Помощник для ожиданий в тестах."""
+    """
+    Помощник для ожиданий в тестах.
+
+    Python условия опрашиваются с экспоненциальной задержкой и джиттером,
+    браузерные (BrowserCondition) выполняются в браузере. Длительность каждого
+    ожидания записывается в WaitHelper.records.
+    """
+
+    # Длительности последних ожиданий: name, kind, duration_ms, success
+    records: deque = deque(maxlen=1000)
+    # Ожидания дольше порога попадают в лог как медленные
+    SLOW_WAIT_MS = 2000
+
+    @staticmethod
+    def _record(name: str, kind: str, started: float, success: bool) -> None:
+        """Записывает длительность ожидания."""
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        WaitHelper.records.append(
+            {"name": name, "kind": kind, "duration_ms": duration_ms, "success": success}
+        )
+        if duration_ms > WaitHelper.SLOW_WAIT_MS:
+            logger.info(f"Медленное ожидание {name} ({kind}): {duration_ms} мс, успех: {success}")
+
+    @staticmethod
+    def drain_records() -> List[Dict[str, Any]]:
+        """
+        Возвращает накопленные записи ожиданий и очищает их.
+
+        Returns:
+            list: Записи name, kind, duration_ms, success
+        """
+        drained = list(WaitHelper.records)
+        WaitHelper.records.clear()
+        return drained
+
+    @staticmethod
+    def backoff_delays(
+        initial: float = 0.05, maximum: float = 0.5, factor: float = 2.0, jitter: float = 0.1
+    ):
+        """
+        Бесконечный генератор задержек с экспоненциальным ростом и джиттером.
+
+        Args:
+            initial: Первая задержка в секундах
+            maximum: Максимальная задержка в секундах
+            factor: Множитель роста
+            jitter: Доля случайного отклонения задержки (0.1 = +-10%)
+
+        Yields:
+            float: Очередная задержка в секундах
+        """
+        delay = initial
+        while True:
+            yield max(0.0, delay * (1 + random.uniform(-jitter, jitter)))
+            delay = min(delay * factor, maximum)
 
     @staticmethod
     def wait_for_condition(
-        condition_func, timeout: int = 10, interval: float = 0.5
+        condition_func,
+        timeout: int = 10,
+        interval: float = 0.5,
+        initial_interval: float = 0.05,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+        name: Optional[str] = None,
     ) -> bool:
         """
-        Ждет выполнения условия с заданным интервалом.
+        Ждет выполнения условия.
+
+        BrowserCondition ожидается в браузере. Python условие проверяется сразу,
+        затем с задержкой от initial_interval, растущей до interval.
 
         Args:
-            condition_func: Функция условия (должна возвращать bool)
+            condition_func: Функция условия (должна возвращать bool) или BrowserCondition
             timeout: Максимальное время ожидания в секундах
-            interval: Интервал проверки в секундах
+            interval: Максимальный интервал проверки в секундах
+            initial_interval: Первый интервал проверки в секундах
+            backoff: Множитель роста интервала
+            jitter: Доля случайного отклонения интервала
+            name: Имя ожидания для статистики
 
         Returns:
             bool: True если условие выполнилось в указанное время
         """
-        start_time = time.time()
+        name = name or getattr(condition_func, "name", None) or getattr(
+            condition_func, "__name__", "condition"
+        )
+        started = time.perf_counter()
+
+        if isinstance(condition_func, BrowserCondition):
+            success = condition_func.wait(timeout)
+            WaitHelper._record(name, "browser", started, success)
+            return success
 
-        while time.time() - start_time < timeout:
+        deadline = started + timeout
+        delays = WaitHelper.backoff_delays(initial_interval, interval, backoff, jitter)
+        while True:
             if condition_func():
+                WaitHelper._record(name, "python", started, True)
                 return True
-            time.sleep(interval)
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                WaitHelper._record(name, "python", started, False)
+                return False
+            time.sleep(min(next(delays), remaining))
+
+    @staticmethod
+    def all_of(*conditions):
+        """
+        Объединяет условия: выполнено, когда выполнены все.
+        Браузерные условия одной страницы сливаются в один предикат.
+
+        Args:
+            *conditions: Функции условий или BrowserCondition
+
+        Returns:
+            Условие (BrowserCondition, если все условия браузерные на одной странице)
+        """
+        return WaitHelper._combine(conditions, "every", all)
+
+    @staticmethod
+    def any_of(*conditions):
+        """
+        Объединяет условия: выполнено, когда выполнено хотя бы одно.
+
+        Args:
+            *conditions: Функции условий или BrowserCondition
+
+        Returns:
+            Условие (BrowserCondition, если все условия браузерные на одной странице)
+        """
+        return WaitHelper._combine(conditions, "some", any)
+
+    @staticmethod
+    def _combine(conditions, js_method: str, py_func):
+        """Строит составное условие."""
+        browser = [c for c in conditions if isinstance(c, BrowserCondition)]
+        if browser and len(browser) == len(conditions) and len({id(c.page) for c in browser}) == 1:
+            predicates = ", ".join(f"({c.predicate})" for c in browser)
+            polling = "mutation" if all(c.polling == "mutation" for c in browser) else "raf"
+            return BrowserCondition(
+                browser[0].page,
+                f"(args) => [{predicates}].{js_method}((p, i) => p(args[i]))",
+                [c.arg for c in browser],
+                polling=polling,
+                name=f"{py_func.__name__}({', '.join(c.name for c in browser)})",
+            )
+
+        def combined() -> bool:
+            return py_func(condition() for condition in conditions)
 
-        return False
+        combined.__name__ = f"{py_func.__name__}_of"
+        return combined
 
     @staticmethod
-    def wait_and_retry(action_func, retry_count: int = 3, delay: float = 1.0):
+    def wait_for_sequence(conditions, timeout: int = 10, **kwargs) -> bool:
         """
-        Выполняет действие с повторными попытками.
+        Ждет выполнения условий по порядку в пределах общего таймаута.
+
+        Args:
+            conditions: Список функций условий или BrowserCondition
+            timeout: Общий таймаут в секундах
+            **kwargs: Параметры опроса для wait_for_condition
+
+        Returns:
+            bool: True если все условия выполнились по порядку
+        """
+        deadline = time.perf_counter() + timeout
+        for condition in conditions:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not WaitHelper.wait_for_condition(condition, remaining, **kwargs):
+                return False
+        return True
+
+    @staticmethod
+    def wait_and_retry(
+        action_func,
+        retry_count: int = 3,
+        delay: float = 1.0,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+    ):
+        """
+        Выполняет действие с повторными попытками и растущей задержкой.
 
         Args:
             action_func: Функция для выполнения
             retry_count: Количество попыток
-            delay: Задержка между попытками
+            delay: Задержка перед второй попыткой в секундах
+            backoff: Множитель роста задержки
+            jitter: Доля случайного отклонения задержки
 
         Returns:
             Результат выполнения функции
@@ -312,6 +990,7 @@ class WaitHelper:
             Exception: Последнее исключение если все попытки неуспешны
         """
         last_exception = None
+        delays = WaitHelper.backoff_delays(delay, delay * backoff ** retry_count, backoff, jitter)
 
         for attempt in range(retry_count):
             try:
@@ -319,39 +998,59 @@ class WaitHelper:
             except Exception as e:
                 last_exception = e
                 if attempt < retry_count - 1:
-                    time.sleep(delay)
+                    time.sleep(next(delays))
 
         if last_exception:
             raise last_exception
 
 
 class TestDataManager:
-    """Менеджер тестовых данных с сохранением в JSON."""
-
-    def __init__(self, data_file: str = "test_data.json"):
+    """
+    Менеджер тестовых данных с сохранением на диск.
+
+    Данные загружаются лениво при первом обращении. Хранилище задается бэкендом:
+    journal (по умолчанию, журнал на дозапись), sqlite (WAL) или json (исходный формат).
+    Бэкенд можно выбрать переменной окружения TEST_DATA_BACKEND.
+    """
+
+    def __init__(
+        self,
+        data_file: str = "test_data.json",
+        backend: Union[str, DataStoreBackend, None] = None,
+    ):
         """
         Инициализация менеджера.
 
         Args:
             data_file: Путь к файлу с данными
+            backend: Имя бэкенда или его экземпляр
         """
         self.data_file = data_file
-        self.data = self._load_data()
+        if backend is None:
+            backend = os.getenv("TEST_DATA_BACKEND", "journal")
+        if isinstance(backend, str):
+            backend = create_backend(backend, data_file)
+        self.backend = backend
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Данные менеджера, загружаемые при первом обращении."""
+        if self._data is None:
+            self._data = self._load_data()
+        return self._data
 
     def _load_data(self) -> Dict[str, Any]:
-        """Загружает данные из файла."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+        """Загружает данные из хранилища."""
+        return self.backend.load()
 
     def save_data(self) -> None:
-        """Сохраняет данные в файл."""
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        """Сохраняет все данные в хранилище."""
+        self.backend.save_all(self.data)
+
+    def compact(self) -> None:
+        """Уплотняет хранилище (сливает журнал в снимок)."""
+        self.backend.compact()
 
     def get_test_data(self, test_name: str, default: Any = None) -> Any:
         """
@@ -364,18 +1063,22 @@ class TestDataManager:
         Returns:
             Сохраненные данные или значение по умолчанию
         """
+        self.backend.refresh(self.data)
         return self.data.get(test_name, default)
 
     def set_test_data(self, test_name: str, data: Any) -> None:
         """
         Сохраняет данные для теста.
+        Записывается только измененный ключ, а не весь файл;
+        если данные еще не загружены, они и не загружаются.
 
         Args:
             test_name: Имя теста
             data: Данные для сохранения
         """
-        self.data[test_name] = data
-        self.save_data()
+        if self._data is not None:
+            self._data[test_name] = data
+        self.backend.set(test_name, data)
 
     def generate_unique_user(self, prefix: str = "user") -> Dict[str, str]:
         """
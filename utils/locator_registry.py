@@ -0,0 +1,328 @@
+"""
+Реестр локаторов: кэш объектов Locator на экземпляр страницы и проверка селекторов
+пакета locators. Проверка открывает страницу каждого класса локаторов (демо-сайт,
+локальный стенд через DEMOQA_BASE_URL или HAR), считает совпадения каждого селектора
+и измеряет стоимость его разрешения, чтобы находить мертвые, неоднозначные
+и медленные (:has-text) селекторы.
+"""
+
+import os
+import re
+import json
+import time
+import inspect
+import logging
+import pkgutil
+import importlib
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from data import URLs
+
+logger = logging.getLogger(__name__)
+
+# Страница, на которой проверяются селекторы класса локаторов (атрибут data.URLs)
+PAGE_URLS = {
+    "TextBoxLocators": "TEXT_BOX",
+    "CheckboxLocators": "CHECK_BOX",
+    "RadioButtonLocators": "RADIO_BUTTON",
+    "WebTablesLocators": "WEB_TABLES",
+    "ButtonsLocators": "BUTTONS",
+    "LinksLocators": "LINKS_PAGE",
+    "BrokenLinksLocators": "BROKEN_LINKS",
+    "UploadDownloadLocators": "DOWNLOAD",
+    "DynamicPropertiesLocators": "DYNAMIC",
+    "AutomationPracticeFormLocators": "PRACTICE_FORM",
+    "BrowserWindowsLocators": "BROWSER_WINDOWS",
+    "AlertsLocators": "ALERTS_PAGE",
+    "FramesLocators": "FRAMES_PAGE",
+    "NestedFramesLocators": "NESTED_FRAMES_PAGE",
+    "ModalDialogsLocators": "MODAL_DIALOGS",
+    "AccordionLocators": "ACCORDION",
+    "AutoCompleteLocators": "AUTO_COMPLETE",
+    "DatePickerLocators": "DATE_PICKER",
+    "SliderLocators": "SLIDER",
+    "ProgressBarLocators": "PROGRESS_BAR",
+    "TabsLocators": "TABS",
+    "ToolTipsLocators": "TOOL_TIPS",
+    "MenuLocators": "MENU",
+    "SelectMenuLocators": "SELECT_MENU",
+    "SortableLocators": "SORTABLE",
+    "SelectableLocators": "SELECTABLE",
+    "ResizableLocators": "RESIZABLE",
+    "DroppableLocators": "DROPPABLE",
+    "DragabbleLocators": "DRAGABBLE",
+    "LoginLocators": "LOGIN_PAGE",
+}
+
+# Окончания имен констант-коллекций, для которых ожидается несколько совпадений.
+# Список явный: ADDRESS, STATUS, CLASS и подобные тоже оканчиваются на S, но
+# обозначают одиночный элемент
+COLLECTION_SUFFIXES = (
+    "LIST", "ITEMS", "BUTTONS", "LINKS", "OPTIONS", "VALUES", "CHECKBOXES", "RADIOS",
+    "LABELS", "HEADERS", "PANELS", "TITLES", "NAMES", "FRAMES", "HANDLES", "IMAGES",
+    "ROWS", "CELLS", "FIELDS", "ERRORS", "RESULTS", "NOTIFICATIONS", "DETAILS",
+    "DIMENSIONS", "REDIRECTS",
+)
+COLLECTION_NAME = re.compile(r"^ALL_|_(?:" + "|".join(COLLECTION_SUFFIXES) + r")$")
+
+# Разрешение CSS и XPath селекторов в странице с замером стоимости. Селекторы
+# движка Playwright (:has-text, text=, >>, :visible) браузер не разбирает,
+# для них возвращается engine=playwright и они измеряются через locator.count()
+MEASURE_SCRIPT = """
+({selectors, repeat}) => selectors.map(selector => {
+    const xpath = selector.startsWith('xpath=') || selector.startsWith('//');
+    let query;
+    if (xpath) {
+        const expression = selector.replace(/^xpath=/, '');
+        query = () => document.evaluate(
+            expression, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        ).snapshotLength;
+    } else {
+        query = () => document.querySelectorAll(selector).length;
+    }
+    try {
+        const count = query();
+        const started = performance.now();
+        for (let i = 0; i < repeat; i++) query();
+        const cost = (performance.now() - started) * 1000 / repeat;
+        return {engine: xpath ? 'xpath' : 'css', count, cost};
+    } catch (e) {
+        return {engine: 'playwright', count: null, cost: null};
+    }
+})
+"""
+
+
+class LocatorRegistry:
+    """Кэш объектов Locator на экземпляр страницы Playwright."""
+
+    def __init__(self):
+        self._cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def get(self, page, selector: str):
+        """
+        Возвращает Locator для селектора, создавая его один раз на страницу.
+        Locator ленивый и переживает навигацию, поэтому кэш безопасен.
+
+        Args:
+            page: Страница Playwright
+            selector: Селектор
+
+        Returns:
+            Locator: Закэшированный локатор
+        """
+        locators = self._cache.setdefault(page, {})
+        if selector not in locators:
+            locators[selector] = page.locator(selector)
+        return locators[selector]
+
+    def clear(self, page=None) -> None:
+        """Очищает кэш страницы (или весь кэш)."""
+        if page is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(page, None)
+
+
+@dataclass
+class SelectorReport:
+    """Результат проверки одного селектора."""
+
+    owner: str
+    name: str
+    selector: str
+    count: Optional[int]
+    status: str
+    engine: str
+    cost_us: Optional[float]
+
+
+def discover_locator_classes() -> Dict[str, type]:
+    """
+    Находит классы локаторов пакета locators.
+
+    Returns:
+        dict: {имя класса: класс}
+    """
+    import locators
+
+    classes = {}
+    for info in pkgutil.walk_packages(locators.__path__, "locators."):
+        module = importlib.import_module(info.name)
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if name.endswith("Locators") and cls.__module__ == module.__name__:
+                classes[name] = cls
+    return classes
+
+
+def locator_constants(cls: type) -> Dict[str, str]:
+    """Строковые константы-селекторы класса (шаблоны с {} пропускаются)."""
+    return {
+        name: value
+        for name, value in vars(cls).items()
+        if name.isupper() and isinstance(value, str) and "{" not in value
+    }
+
+
+class LocatorValidator:
+    """Проверка селекторов классов локаторов на их страницах."""
+
+    def __init__(self, page, repeat: int = 20, max_matches: int = 1):
+        """
+        Args:
+            page: Страница Playwright
+            repeat: Повторов замера для CSS/XPath селекторов
+            max_matches: Допустимое число совпадений для одиночного элемента
+        """
+        self.page = page
+        self.repeat = repeat
+        self.max_matches = max_matches
+
+    def _status(self, name: str, count: Optional[int]) -> str:
+        if count is None:
+            return "invalid"
+        if count == 0:
+            return "dead"
+        if count > self.max_matches and not COLLECTION_NAME.search(name):
+            return "ambiguous"
+        return "ok"
+
+    def _round_trip_us(self, selector: str, repeat: int = 3) -> float:
+        """Минимальное время locator.count() в микросекундах."""
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            self.page.locator(selector).count()
+            best = min(best, time.perf_counter() - started)
+        return best * 1_000_000
+
+    def validate_class(self, cls: type, url: str) -> List[SelectorReport]:
+        """
+        Открывает страницу и проверяет все селекторы класса.
+
+        CSS и XPath селекторы разрешаются и замеряются одним evaluate, селекторы
+        движка Playwright - отдельным count() с вычетом стоимости пустого запроса.
+
+        Args:
+            cls: Класс локаторов
+            url: URL страницы
+
+        Returns:
+            list: Отчеты по селекторам
+        """
+        constants = locator_constants(cls)
+        self.page.goto(url, wait_until="load")
+        measured = self.page.evaluate(
+            MEASURE_SCRIPT, {"selectors": list(constants.values()), "repeat": self.repeat}
+        )
+
+        baseline = None
+        reports = []
+        for (name, selector), result in zip(constants.items(), measured):
+            count, cost, engine = result["count"], result["cost"], result["engine"]
+            if engine == "playwright":
+                if baseline is None:
+                    baseline = self._round_trip_us("html")
+                try:
+                    count = self.page.locator(selector).count()
+                    cost = max(0.0, self._round_trip_us(selector) - baseline)
+                except Exception as e:
+                    logger.warning(f"{cls.__name__}.{name}: селектор не разобран ({e})")
+            reports.append(
+                SelectorReport(
+                    owner=cls.__name__,
+                    name=name,
+                    selector=selector,
+                    count=count,
+                    status=self._status(name, count),
+                    engine=engine,
+                    cost_us=None if cost is None else round(cost, 1),
+                )
+            )
+        return reports
+
+    def validate_all(self, classes: Optional[Dict[str, type]] = None) -> List[SelectorReport]:
+        """
+        Проверяет все классы локаторов, для которых известна страница.
+
+        Args:
+            classes: Классы для проверки (по умолчанию все из пакета locators)
+
+        Returns:
+            list: Отчеты по всем селекторам
+        """
+        reports = []
+        for name, cls in (classes or discover_locator_classes()).items():
+            if name not in PAGE_URLS:
+                logger.info(f"{name}: страница не задана в PAGE_URLS, пропускаем")
+                continue
+            reports.extend(self.validate_class(cls, getattr(URLs, PAGE_URLS[name])))
+        return reports
+
+
+def write_report(reports: List[SelectorReport], output_dir: str = "locator-results") -> Dict:
+    """
+    Сохраняет отчет проверки: проблемные селекторы и рейтинг по стоимости разрешения.
+
+    Args:
+        reports: Отчеты по селекторам
+        output_dir: Директория отчета
+
+    Returns:
+        dict: Сводка (total, dead, ambiguous, invalid, slowest)
+    """
+    ranked = sorted(
+        (report for report in reports if report.cost_us is not None),
+        key=lambda report: report.cost_us,
+        reverse=True,
+    )
+    summary = {
+        "total": len(reports),
+        "dead": [asdict(r) for r in reports if r.status == "dead"],
+        "ambiguous": [asdict(r) for r in reports if r.status == "ambiguous"],
+        "invalid": [asdict(r) for r in reports if r.status == "invalid"],
+        "slowest": [asdict(r) for r in ranked[:20]],
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "locator_report.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {"summary": summary, "selectors": [asdict(r) for r in reports]},
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    return summary
+
+
+def validate_locators(
+    har: Optional[str] = None, output_dir: str = "locator-results", headless: bool = True
+) -> Dict:
+    """
+    Проверяет селекторы всех классов локаторов в отдельном браузере.
+
+    Args:
+        har: HAR файл, из которого отдаются ответы (иначе URLs.BASE_URL)
+        output_dir: Директория отчета
+        headless: Запуск браузера без окна
+
+    Returns:
+        dict: Сводка отчета (см. write_report)
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        try:
+            context = browser.new_context()
+            if har:
+                context.route_from_har(har, not_found="fallback")
+            reports = LocatorValidator(context.new_page()).validate_all()
+        finally:
+            browser.close()
+    return write_report(reports, output_dir)
+
+
+# Общий реестр проекта
+registry = LocatorRegistry()
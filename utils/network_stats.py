@@ -0,0 +1,298 @@
+"""
+Учет сетевого трафика браузерного контекста: запросы, байты, блокировки, кэш и задержки.
+Формирует сводку по тесту и итоговый отчет прогона, отсортированный по стоимости.
+"""
+
+import os
+import glob
+import json
+import logging
+import statistics
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
+
+from utils.perf_metrics import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+def _domain(url: str) -> str:
+    """Возвращает домен URL в нижнем регистре."""
+    return (urlsplit(url).hostname or "unknown").lower()
+
+
+def _page_key(request) -> str:
+    """Возвращает URL страницы, инициировавшей запрос."""
+    try:
+        return normalize_url(request.frame.page.url)
+    except Exception:
+        return "unknown"
+
+
+class NetworkAccountant:
+    """Счетчик сетевой активности одного браузерного контекста."""
+
+    def __init__(self):
+        """Инициализация счетчика."""
+        self.blocked: List[Dict[str, str]] = []
+        self.failed: List[Dict[str, str]] = []
+        self._finished = []
+        self._records: List[Dict[str, Any]] = []
+        self._blocked_requests = set()
+        self._requests_total = 0
+
+    def attach(self, context) -> None:
+        """
+        Подписывается на сетевые события контекста.
+
+        Args:
+            context: BrowserContext Playwright
+        """
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_finished)
+        context.on("requestfailed", self._on_failed)
+
+    def _on_request(self, request) -> None:
+        self._requests_total += 1
+
+    def _on_finished(self, request) -> None:
+        self._finished.append((request, _page_key(request)))
+
+    def _on_failed(self, request) -> None:
+        if request in self._blocked_requests:
+            # Заблокированные нами запросы учитываются отдельно
+            return
+        self.failed.append(
+            {"url": request.url, "domain": _domain(request.url), "page": _page_key(request)}
+        )
+
+    def record_blocked(self, request) -> None:
+        """
+        Учитывает запрос, заблокированный обработчиком маршрутов.
+
+        Args:
+            request: Request Playwright
+        """
+        self._blocked_requests.add(request)
+        self.blocked.append(
+            {
+                "url": request.url,
+                "domain": _domain(request.url),
+                "resource_type": request.resource_type,
+                "page": _page_key(request),
+            }
+        )
+
+    @staticmethod
+    def _request_record(request, page: str) -> Dict[str, Any]:
+        """Собирает данные завершенного запроса (размер, задержка, кэш)."""
+        response = request.response()
+        try:
+            sizes = request.sizes()
+            size = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:
+            size = 0
+
+        timing = request.timing
+        latency = timing.get("responseEnd", -1)
+
+        cache_hit = False
+        if response is not None:
+            cache_hit = (
+                response.status == 304
+                or response.from_service_worker
+                or "hit" in response.headers.get("x-cache", "").lower()
+            )
+
+        return {
+            "domain": _domain(request.url),
+            "page": page,
+            "resource_type": request.resource_type,
+            "bytes": max(size, 0),
+            "latency_ms": latency if latency >= 0 else None,
+            "cache_hit": cache_hit,
+        }
+
+    def resolve(self) -> None:
+        """
+        Запрашивает размеры и тайминги завершенных запросов.
+        Вызывается до закрытия страницы, а не в обработчиках событий,
+        чтобы не добавлять round-trip на каждый запрос во время теста.
+        """
+        pending, self._finished = self._finished, []
+        self._records.extend(self._request_record(req, page) for req, page in pending)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Формирует сводку сетевой активности.
+
+        Returns:
+            dict: Счетчики запросов, байт, блокировок, кэша и статистика по доменам
+        """
+        self.resolve()
+        records = self._records
+
+        domains: Dict[str, Dict[str, Any]] = {}
+        pages: Dict[str, Dict[str, int]] = {}
+        for record in records:
+            domain = domains.setdefault(
+                record["domain"], {"requests": 0, "bytes": 0, "latencies": []}
+            )
+            domain["requests"] += 1
+            domain["bytes"] += record["bytes"]
+            if record["latency_ms"] is not None:
+                domain["latencies"].append(record["latency_ms"])
+
+            page = pages.setdefault(record["page"], {"requests": 0, "bytes": 0})
+            page["requests"] += 1
+            page["bytes"] += record["bytes"]
+
+        for domain in domains.values():
+            latencies = domain.pop("latencies")
+            domain["latency_median_ms"] = (
+                round(statistics.median(latencies), 1) if latencies else None
+            )
+
+        blocked_by_domain: Dict[str, int] = {}
+        for item in self.blocked:
+            blocked_by_domain[item["domain"]] = blocked_by_domain.get(item["domain"], 0) + 1
+
+        return {
+            "requests": self._requests_total,
+            "allowed": len(records),
+            "blocked": len(self.blocked),
+            "failed": len(self.failed),
+            "bytes": sum(record["bytes"] for record in records),
+            "cache_hits": sum(1 for record in records if record["cache_hit"]),
+            "domains": dict(
+                sorted(domains.items(), key=lambda item: item[1]["bytes"], reverse=True)
+            ),
+            "pages": pages,
+            "blocked_domains": dict(
+                sorted(blocked_by_domain.items(), key=lambda item: item[1], reverse=True)
+            ),
+        }
+
+
+class NetworkReport:
+    """Итоговый отчет по сетевой активности прогона с учетом xdist воркеров."""
+
+    def __init__(self, results_dir: str = "network-results"):
+        """
+        Инициализация отчета.
+
+        Args:
+            results_dir: Директория для сохранения сырых данных и отчета
+        """
+        self.results_dir = results_dir
+        self.tests: Dict[str, Dict[str, Any]] = {}
+
+    def clear_stale_samples(self) -> None:
+        """Удаляет сырые данные, оставшиеся от прерванных прогонов."""
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            os.remove(path)
+
+    def add(self, nodeid: str, summary: Dict[str, Any]) -> None:
+        """
+        Добавляет сводку одного теста.
+
+        Args:
+            nodeid: Идентификатор теста pytest
+            summary: Сводка NetworkAccountant.summary()
+        """
+        self.tests[nodeid] = summary
+
+    def save_samples(self, worker_id: str = "master") -> Optional[str]:
+        """
+        Сохраняет сводки тестов воркера для последующего слияния.
+
+        Args:
+            worker_id: Идентификатор xdist воркера
+
+        Returns:
+            str или None: Путь к файлу или None если данных нет
+        """
+        if not self.tests:
+            return None
+        os.makedirs(self.results_dir, exist_ok=True)
+        path = os.path.join(self.results_dir, f"samples_{worker_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.tests, f, ensure_ascii=False)
+        return path
+
+    @staticmethod
+    def build_report(tests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Строит отчет прогона: тесты и домены, отсортированные по объему трафика.
+
+        Args:
+            tests: Сводки тестов {nodeid: summary}
+
+        Returns:
+            dict: Итоги, рейтинг тестов, доменов и заблокированных доменов
+        """
+        domains: Dict[str, Dict[str, int]] = {}
+        pages: Dict[str, Dict[str, int]] = {}
+        blocked: Dict[str, int] = {}
+        for summary in tests.values():
+            for name, stats in summary["domains"].items():
+                total = domains.setdefault(name, {"requests": 0, "bytes": 0})
+                total["requests"] += stats["requests"]
+                total["bytes"] += stats["bytes"]
+            for name, stats in summary["pages"].items():
+                total = pages.setdefault(name, {"requests": 0, "bytes": 0})
+                total["requests"] += stats["requests"]
+                total["bytes"] += stats["bytes"]
+            for name, count in summary["blocked_domains"].items():
+                blocked[name] = blocked.get(name, 0) + count
+
+        def _by_bytes(items):
+            return dict(sorted(items, key=lambda item: item[1]["bytes"], reverse=True))
+
+        return {
+            "totals": {
+                key: sum(summary[key] for summary in tests.values())
+                for key in ("requests", "allowed", "blocked", "failed", "bytes", "cache_hits")
+            },
+            "tests": [
+                {
+                    "test": nodeid,
+                    **{
+                        key: summary[key]
+                        for key in ("requests", "blocked", "bytes", "cache_hits")
+                    },
+                }
+                for nodeid, summary in sorted(
+                    tests.items(), key=lambda item: item[1]["bytes"], reverse=True
+                )
+            ],
+            "domains": _by_bytes(domains.items()),
+            "pages": _by_bytes(pages.items()),
+            "blocked_domains": dict(
+                sorted(blocked.items(), key=lambda item: item[1], reverse=True)
+            ),
+        }
+
+    def merge_and_report(self) -> Optional[str]:
+        """
+        Сливает данные всех воркеров и пишет итоговый отчет.
+
+        Returns:
+            str или None: Путь к отчету или None если данных нет
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    merged.update(json.load(f))
+            except (json.JSONDecodeError, IOError):
+                continue
+            os.remove(path)
+
+        if not merged:
+            return None
+
+        report_path = os.path.join(self.results_dir, "network_report.json")
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.build_report(merged), f, indent=2, ensure_ascii=False)
+        return report_path
@@ -0,0 +1,280 @@
+"""
+Сбор браузерных метрик производительности страниц во время функциональных тестов.
+Navigation/Paint/Long Tasks/Resource Timing через Performance API и CDP Performance.getMetrics.
+"""
+
+import os
+import glob
+import json
+import logging
+import statistics
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Скрипт инициализации: буферизует long tasks, которые не попадают в getEntries()
+LONG_TASKS_INIT_SCRIPT = """
+(() => {
+    window.__qaLongTasks = [];
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                window.__qaLongTasks.push({start: entry.startTime, duration: entry.duration});
+            }
+        }).observe({type: "longtask", buffered: true});
+    } catch (e) {}
+})();
+"""
+
+# Извлечение метрик страницы одним evaluate
+COLLECT_METRICS_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paint = {};
+    for (const entry of performance.getEntriesByType("paint")) {
+        paint[entry.name] = entry.startTime;
+    }
+    const resources = performance.getEntriesByType("resource");
+    const byType = {};
+    let transferSize = 0;
+    for (const r of resources) {
+        const key = r.initiatorType || "other";
+        byType[key] = (byType[key] || 0) + 1;
+        transferSize += r.transferSize || 0;
+    }
+    const longTasks = window.__qaLongTasks || [];
+    return {
+        navigation: nav ? {
+            ttfb: nav.responseStart - nav.requestStart,
+            dom_interactive: nav.domInteractive,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load_event: nav.loadEventEnd,
+            duration: nav.duration,
+            transfer_size: nav.transferSize,
+        } : {},
+        paint: paint,
+        long_tasks: {
+            count: longTasks.length,
+            total_duration: longTasks.reduce((sum, t) => sum + t.duration, 0),
+        },
+        resources: {
+            count: resources.length,
+            transfer_size: transferSize,
+            by_type: byType,
+        },
+    };
+}
+"""
+
+# Метрики CDP Performance.getMetrics, которые попадают в отчет
+CDP_METRICS = (
+    "JSHeapUsedSize",
+    "JSHeapTotalSize",
+    "LayoutCount",
+    "RecalcStyleCount",
+    "ScriptDuration",
+    "LayoutDuration",
+    "TaskDuration",
+    "Nodes",
+)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Приводит URL к ключу агрегации: без query (cache-buster) и фрагмента.
+
+    Args:
+        url: URL страницы
+
+    Returns:
+        str: URL без query и фрагмента
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/") or "/", "", ""))
+
+
+class PagePerformanceCollector:
+    """Сборщик метрик производительности для одной страницы Playwright."""
+
+    def __init__(self, page):
+        """
+        Инициализация сборщика.
+
+        Args:
+            page: Экземпляр страницы Playwright
+        """
+        self.page = page
+        self.cdp_session = None
+        try:
+            self.cdp_session = page.context.new_cdp_session(page)
+            self.cdp_session.send("Performance.enable")
+        except Exception:
+            # CDP доступен только в Chromium
+            self.cdp_session = None
+
+    def _collect_cdp_metrics(self) -> Dict[str, float]:
+        """Получает метрики CDP Performance.getMetrics."""
+        if self.cdp_session is None:
+            return {}
+        try:
+            response = self.cdp_session.send("Performance.getMetrics")
+        except Exception as e:
+            logger.debug(f"CDP метрики недоступны: {e}")
+            return {}
+        return {
+            item["name"]: item["value"]
+            for item in response.get("metrics", [])
+            if item["name"] in CDP_METRICS
+        }
+
+    def collect(self) -> Optional[Dict[str, Any]]:
+        """
+        Собирает все метрики текущей страницы.
+
+        Returns:
+            dict или None: Метрики страницы или None если страница недоступна
+        """
+        if self.page.is_closed() or not self.page.url.startswith("http"):
+            return None
+        try:
+            metrics = self.page.evaluate(COLLECT_METRICS_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Не удалось собрать метрики страницы: {e}")
+            return None
+
+        metrics["url"] = normalize_url(self.page.url)
+        metrics["cdp"] = self._collect_cdp_metrics()
+        return metrics
+
+    def detach(self) -> None:
+        """Закрывает CDP сессию."""
+        if self.cdp_session is not None:
+            try:
+                self.cdp_session.detach()
+            except Exception:
+                pass
+            self.cdp_session = None
+
+
+def flatten_metrics(metrics: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Разворачивает вложенные метрики в плоский словарь числовых значений.
+
+    Args:
+        metrics: Метрики, собранные PagePerformanceCollector
+
+    Returns:
+        dict: {"navigation.ttfb": 12.3, "cdp.LayoutCount": 40, ...}
+    """
+    flat = {}
+
+    def _walk(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for key, nested in value.items():
+                _walk(f"{prefix}.{key}" if prefix else key, nested)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[prefix] = float(value)
+
+    _walk("", {k: v for k, v in metrics.items() if k != "url"})
+    return flat
+
+
+class PerformanceAggregator:
+    """Агрегатор метрик по URL в рамках прогона (одного процесса/воркера)."""
+
+    def __init__(self, results_dir: str = "perf-results"):
+        """
+        Инициализация агрегатора.
+
+        Args:
+            results_dir: Директория для сохранения сырых данных и отчета
+        """
+        self.results_dir = results_dir
+        self.samples: Dict[str, List[Dict[str, float]]] = {}
+
+    def clear_stale_samples(self) -> None:
+        """Удаляет сырые замеры, оставшиеся от прерванных прогонов."""
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            os.remove(path)
+
+    def add(self, metrics: Dict[str, Any]) -> None:
+        """
+        Добавляет метрики одной страницы.
+
+        Args:
+            metrics: Метрики, собранные PagePerformanceCollector
+        """
+        self.samples.setdefault(metrics["url"], []).append(flatten_metrics(metrics))
+
+    def save_samples(self, worker_id: str = "master") -> Optional[str]:
+        """
+        Сохраняет сырые замеры воркера для последующего слияния.
+
+        Args:
+            worker_id: Идентификатор xdist воркера
+
+        Returns:
+            str или None: Путь к файлу или None если замеров нет
+        """
+        if not self.samples:
+            return None
+        os.makedirs(self.results_dir, exist_ok=True)
+        path = os.path.join(self.results_dir, f"samples_{worker_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.samples, f, ensure_ascii=False)
+        return path
+
+    @staticmethod
+    def summarize(samples: Dict[str, List[Dict[str, float]]]) -> Dict[str, Any]:
+        """
+        Считает медиану и максимум каждой метрики по каждому URL.
+
+        Args:
+            samples: Сырые замеры {url: [плоские метрики]}
+
+        Returns:
+            dict: {url: {"samples": n, "metrics": {метрика: {"median", "max"}}}}
+        """
+        report = {}
+        for url, entries in sorted(samples.items()):
+            values: Dict[str, List[float]] = {}
+            for entry in entries:
+                for name, value in entry.items():
+                    values.setdefault(name, []).append(value)
+            report[url] = {
+                "samples": len(entries),
+                "metrics": {
+                    name: {
+                        "median": round(statistics.median(series), 3),
+                        "max": round(max(series), 3),
+                    }
+                    for name, series in sorted(values.items())
+                },
+            }
+        return report
+
+    def merge_and_report(self) -> Optional[str]:
+        """
+        Сливает замеры всех воркеров и пишет итоговый отчет по URL.
+
+        Returns:
+            str или None: Путь к отчету или None если замеров нет
+        """
+        merged: Dict[str, List[Dict[str, float]]] = {}
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for url, entries in json.load(f).items():
+                        merged.setdefault(url, []).extend(entries)
+            except (json.JSONDecodeError, IOError):
+                continue
+            os.remove(path)
+
+        if not merged:
+            return None
+
+        report_path = os.path.join(self.results_dir, "page_metrics.json")
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.summarize(merged), f, indent=2, ensure_ascii=False)
+        return report_path
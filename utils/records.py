@@ -0,0 +1,164 @@
+"""
+Неизменяемые записи тестовых данных на __slots__, генерируемые по схеме.
+Поддерживают доступ и по атрибутам (USERS.test_user.username), и по ключам
+(USERS["valid_user"]["first_name"]), проверяют типы при загрузке и не дают
+тестам изменять общие данные.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class SchemaError(ValueError):
+    """Данные не соответствуют схеме записи."""
+
+
+class Record(Mapping):
+    """
+    Базовый класс записи. Подклассы создаются функцией record_type.
+    Значения хранятся в слотах, отдельного словаря экземпляра нет.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _types: Dict[str, Any] = {}
+    _optional: frozenset = frozenset()
+
+    def __init__(self, **values: Any):
+        """
+        Создает запись, проверяя значения по схеме.
+
+        Args:
+            **values: Значения полей
+
+        Raises:
+            SchemaError: Если поля отсутствуют, лишние или имеют неверный тип
+        """
+        name = type(self).__name__
+        missing = [f for f in self._fields if f not in values and f not in self._optional]
+        extra = [key for key in values if key not in self._types]
+        if missing:
+            raise SchemaError(f"{name}: отсутствуют поля {', '.join(missing)}")
+        if extra:
+            raise SchemaError(f"{name}: неизвестные поля {', '.join(extra)}")
+        for field in self._fields:
+            object.__setattr__(self, field, self._coerce(field, values.get(field)))
+
+    @classmethod
+    def _coerce(cls, field: str, value: Any) -> Any:
+        """Приводит значение поля к типу схемы: словари - в записи, списки - в кортежи."""
+        expected = cls._types[field]
+        if value is None and field in cls._optional:
+            return None
+        if isinstance(expected, type) and issubclass(expected, Record):
+            if isinstance(value, Mapping) and not isinstance(value, expected):
+                value = expected.from_dict(value)
+        elif isinstance(value, list):
+            value = tuple(value)
+        if not isinstance(value, expected):
+            expected_name = (
+                " | ".join(t.__name__ for t in expected)
+                if isinstance(expected, tuple)
+                else expected.__name__
+            )
+            raise SchemaError(
+                f"{cls.__name__}.{field}: ожидался {expected_name}, "
+                f"получено {type(value).__name__}"
+            )
+        return value
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Record":
+        """
+        Создает запись из словаря (вложенные словари становятся записями).
+
+        Args:
+            data: Исходные данные
+
+        Returns:
+            Record: Запись
+        """
+        return cls(**data)
+
+    @classmethod
+    def _make(cls, values: Iterable[Any]) -> "Record":
+        """Восстанавливает запись из значений полей (для pickle/copy)."""
+        return cls(**dict(zip(cls._fields, values)))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._types:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(self.values())))
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} доступна только для чтения")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{type(self).__name__} доступна только для чтения")
+
+    def __reduce__(self):
+        return (type(self)._make, (tuple(self.values()),))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает изменяемую копию записи (вложенные записи тоже становятся словарями).
+
+        Returns:
+            dict: Копия данных
+        """
+        return {
+            key: value.to_dict() if isinstance(value, Record) else value
+            for key, value in self.items()
+        }
+
+
+def record_type(
+    name: str,
+    fields: Dict[str, Any],
+    optional: Iterable[str] = (),
+    module: Optional[str] = None,
+) -> type:
+    """
+    Генерирует класс записи по схеме.
+
+    Args:
+        name: Имя класса
+        fields: Поля и их типы (тип, кортеж типов или другой класс записи)
+        optional: Поля, которые можно не указывать (значение None)
+        module: Модуль класса для pickle (по умолчанию модуль вызывающего кода)
+
+    Returns:
+        type: Подкласс Record со слотами под поля схемы
+
+    Raises:
+        SchemaError: Если имя поля совпадает с методом записи
+    """
+    reserved = [field for field in fields if hasattr(Record, field)]
+    if reserved:
+        raise SchemaError(f"{name}: имена полей заняты методами записи: {', '.join(reserved)}")
+    cls = type(
+        name,
+        (Record,),
+        {
+            "__slots__": tuple(fields),
+            "_fields": tuple(fields),
+            "_types": dict(fields),
+            "_optional": frozenset(optional),
+        },
+    )
+    cls.__module__ = module or sys._getframe(1).f_globals.get("__name__", __name__)
+    return cls
@@ -0,0 +1,105 @@
+"""
+Планирование перестановки элементов сортируемого списка минимальным числом
+перетаскиваний. Элементы наибольшей возрастающей подпоследовательности (по их
+позициям в целевом порядке) остаются на месте, каждый из остальных перетаскивается
+один раз - сразу на свое итоговое место.
+"""
+
+from bisect import bisect_left
+from typing import Hashable, List, Sequence, Tuple
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> List[int]:
+    """
+    Индексы наибольшей строго возрастающей подпоследовательности (O(n log n)).
+
+    Args:
+        values: Последовательность чисел
+
+    Returns:
+        list: Индексы элементов подпоследовательности в порядке возрастания
+    """
+    tails: List[int] = []  # индексы последних элементов подпоследовательностей каждой длины
+    tail_values: List[int] = []
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length > 0:
+            previous[index] = tails[length - 1]
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+
+    result = []
+    index = tails[-1] if tails else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+    return result[::-1]
+
+
+def apply_moves(order: Sequence[Hashable], moves: Sequence[Tuple[int, int]]) -> List[Hashable]:
+    """
+    Применяет перемещения (from_index, to_index) к порядку: элемент извлекается
+    с позиции from_index и вставляется на позицию to_index - так же, как
+    перетаскивание элемента на элемент с индексом to_index.
+
+    Args:
+        order: Исходный порядок
+        moves: Перемещения
+
+    Returns:
+        list: Порядок после перемещений
+    """
+    result = list(order)
+    for from_index, to_index in moves:
+        result.insert(to_index, result.pop(from_index))
+    return result
+
+
+def plan_moves(
+    current: Sequence[Hashable], target: Sequence[Hashable]
+) -> List[Tuple[int, int]]:
+    """
+    Минимальная последовательность перемещений, превращающая current в target.
+
+    Элементы, не входящие в наибольшую возрастающую подпоследовательность, обходятся
+    в целевом порядке и вставляются сразу после своего предшественника в target
+    (он уже стоит на месте), поэтому перемещений ровно len - LIS.
+
+    Args:
+        current: Текущий порядок (элементы уникальны)
+        target: Целевой порядок - перестановка current
+
+    Returns:
+        list: Перемещения (from_index, to_index) в семантике apply_moves
+
+    Raises:
+        ValueError: Если target не является перестановкой current
+    """
+    if len(set(current)) != len(current) or len(current) != len(target) \
+            or set(current) != set(target):
+        raise ValueError(f"Целевой порядок {list(target)} не является перестановкой {list(current)}")
+
+    rank = {item: position for position, item in enumerate(target)}
+    ranks = [rank[item] for item in current]
+    kept = {current[index] for index in longest_increasing_subsequence(ranks)}
+
+    order = list(current)
+    moves = []
+    for position, item in enumerate(target):
+        if item in kept:
+            continue
+        from_index = order.index(item)
+        if position == 0:
+            to_index = 0
+        else:
+            anchor = order.index(target[position - 1])
+            to_index = anchor if from_index < anchor else anchor + 1
+        if from_index != to_index:
+            moves.append((from_index, to_index))
+            order.insert(to_index, order.pop(from_index))
+    return moves
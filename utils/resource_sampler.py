@@ -0,0 +1,287 @@
+"""
+Сэмплер потребления ресурсов xdist воркера: CPU и RSS процесса Python и дерева процессов браузера.
+Привязывает пики памяти к тестам и рекомендует безопасное число воркеров для машины.
+"""
+
+import os
+import glob
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil - необязательная зависимость
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class ResourceSampler:
+    """Фоновый поток, периодически снимающий CPU/RSS процесса воркера и его потомков."""
+
+    def __init__(self, interval_ms: int = 500, results_dir: str = "resource-results"):
+        """
+        Инициализация сэмплера.
+
+        Args:
+            interval_ms: Интервал между замерами в миллисекундах
+            results_dir: Директория для сохранения данных и отчета
+        """
+        self.interval = interval_ms / 1000
+        self.results_dir = results_dir
+        self.current_test: Optional[str] = None
+        self.tests: Dict[str, Dict[str, float]] = {}
+        self.peak = {"python_rss_mb": 0.0, "browser_rss_mb": 0.0, "total_rss_mb": 0.0}
+        self.samples_count = 0
+        self._processes: Dict[int, Any] = {}
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Проверяет, установлен ли psutil."""
+        return psutil is not None
+
+    def start(self) -> bool:
+        """
+        Запускает фоновый поток сэмплирования.
+
+        Returns:
+            bool: True если сэмплер запущен
+        """
+        if not self.is_available():
+            logger.warning("psutil не установлен, сэмплер ресурсов отключен")
+            return False
+        self._own_process = psutil.Process()
+        self._own_process.cpu_percent(None)
+        self._thread = threading.Thread(
+            target=self._run, name="resource-sampler", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Останавливает поток и снимает финальный замер."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=self.interval * 2 + 1)
+        self._thread = None
+
+    def begin_test(self, nodeid: str) -> None:
+        """
+        Начинает привязку замеров к тесту.
+
+        Args:
+            nodeid: Идентификатор теста pytest
+        """
+        with self._lock:
+            self.current_test = nodeid
+            self.tests.setdefault(
+                nodeid,
+                {
+                    "python_rss_mb": 0.0,
+                    "browser_rss_mb": 0.0,
+                    "total_rss_mb": 0.0,
+                    "cpu_percent_max": 0.0,
+                    "browser_processes": 0,
+                },
+            )
+
+    def end_test(self) -> None:
+        """Завершает привязку замеров к текущему тесту."""
+        with self._lock:
+            self.current_test = None
+
+    def _child_processes(self) -> List[Any]:
+        """Возвращает потомков процесса (драйвер Playwright и процессы браузера)."""
+        try:
+            children = self._own_process.children(recursive=True)
+        except psutil.Error:
+            return []
+
+        alive = {}
+        for child in children:
+            # Переиспользуем объекты Process, чтобы cpu_percent считался между замерами
+            process = self._processes.get(child.pid, child)
+            if process is child:
+                try:
+                    child.cpu_percent(None)
+                except psutil.Error:
+                    continue
+            alive[child.pid] = process
+        self._processes = alive
+        return list(alive.values())
+
+    def sample(self) -> Dict[str, float]:
+        """
+        Снимает один замер ресурсов.
+
+        Returns:
+            dict: RSS (МБ) и CPU (%) процесса Python и процессов браузера
+        """
+        python_rss = self._own_process.memory_info().rss / MB
+        python_cpu = self._own_process.cpu_percent(None)
+
+        browser_rss = 0.0
+        browser_cpu = 0.0
+        children = self._child_processes()
+        for child in children:
+            try:
+                browser_rss += child.memory_info().rss / MB
+                browser_cpu += child.cpu_percent(None)
+            except psutil.Error:
+                continue
+
+        return {
+            "python_rss_mb": round(python_rss, 1),
+            "browser_rss_mb": round(browser_rss, 1),
+            "total_rss_mb": round(python_rss + browser_rss, 1),
+            "cpu_percent": round(python_cpu + browser_cpu, 1),
+            "browser_processes": len(children),
+        }
+
+    def _record(self, sample: Dict[str, float]) -> None:
+        """Обновляет пики прогона и текущего теста."""
+        with self._lock:
+            self.samples_count += 1
+            for key in self.peak:
+                self.peak[key] = max(self.peak[key], sample[key])
+
+            if self.current_test is None:
+                return
+            test = self.tests[self.current_test]
+            for key in ("python_rss_mb", "browser_rss_mb", "total_rss_mb"):
+                test[key] = max(test[key], sample[key])
+            test["cpu_percent_max"] = max(test["cpu_percent_max"], sample["cpu_percent"])
+            test["browser_processes"] = max(
+                test["browser_processes"], sample["browser_processes"]
+            )
+
+    def _run(self) -> None:
+        """Цикл фонового потока."""
+        while not self._stop_event.is_set():
+            try:
+                self._record(self.sample())
+            except Exception as e:
+                logger.debug(f"Ошибка замера ресурсов: {e}")
+            self._stop_event.wait(self.interval)
+
+    def save_samples(self, worker_id: str = "master") -> Optional[str]:
+        """
+        Сохраняет пики воркера для последующего слияния.
+
+        Args:
+            worker_id: Идентификатор xdist воркера
+
+        Returns:
+            str или None: Путь к файлу или None если замеров нет
+        """
+        if not self.samples_count:
+            return None
+        os.makedirs(self.results_dir, exist_ok=True)
+        path = os.path.join(self.results_dir, f"samples_{worker_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"peak": self.peak, "samples": self.samples_count, "tests": self.tests},
+                f,
+                ensure_ascii=False,
+            )
+        return path
+
+    def clear_stale_samples(self) -> None:
+        """Удаляет данные, оставшиеся от прерванных прогонов."""
+        for path in glob.glob(os.path.join(self.results_dir, "samples_*.json")):
+            os.remove(path)
+
+
+def recommend_workers(
+    peak_worker_rss_mb: float,
+    total_memory_mb: float,
+    cpu_count: int,
+    memory_reserve: float = 0.2,
+) -> int:
+    """
+    Рассчитывает максимальное безопасное число воркеров.
+
+    Args:
+        peak_worker_rss_mb: Пиковое потребление памяти одним воркером (Python + браузер)
+        total_memory_mb: Объем оперативной памяти машины
+        cpu_count: Количество CPU
+        memory_reserve: Доля памяти, оставляемая системе и контроллеру
+
+    Returns:
+        int: Рекомендуемое число воркеров (не меньше 1)
+    """
+    if peak_worker_rss_mb <= 0:
+        return max(1, cpu_count)
+    usable = total_memory_mb * (1 - memory_reserve)
+    return max(1, min(cpu_count, int(usable // peak_worker_rss_mb)))
+
+
+def merge_and_report(results_dir: str = "resource-results") -> Optional[Dict[str, Any]]:
+    """
+    Сливает пики всех воркеров, пишет отчет и рекомендацию по числу воркеров.
+
+    Args:
+        results_dir: Директория с данными воркеров
+
+    Returns:
+        dict или None: Отчет или None если данных нет
+    """
+    workers: Dict[str, Dict[str, Any]] = {}
+    for path in glob.glob(os.path.join(results_dir, "samples_*.json")):
+        worker_id = os.path.basename(path)[len("samples_"):-len(".json")]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                workers[worker_id] = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
+        os.remove(path)
+
+    if not workers:
+        return None
+
+    tests = {}
+    for data in workers.values():
+        tests.update(data["tests"])
+
+    # Замер контроллера xdist (master) охватывает всех воркеров, в пик одного воркера
+    # он не входит; master учитывается только в прогоне без xdist
+    worker_peaks = [
+        data["peak"]["total_rss_mb"]
+        for worker_id, data in workers.items()
+        if worker_id != "master" or len(workers) == 1
+    ]
+    peak_worker = max(worker_peaks)
+    total_memory_mb = psutil.virtual_memory().total / MB if psutil else 0.0
+    cpu_count = os.cpu_count() or 1
+
+    report = {
+        "machine": {
+            "cpu_count": cpu_count,
+            "total_memory_mb": round(total_memory_mb, 1),
+        },
+        "workers": {worker_id: data["peak"] for worker_id, data in sorted(workers.items())},
+        "peak_worker_rss_mb": peak_worker,
+        "recommended_workers": recommend_workers(peak_worker, total_memory_mb, cpu_count),
+        "top_tests_by_memory": [
+            {"test": nodeid, **stats}
+            for nodeid, stats in sorted(
+                tests.items(), key=lambda item: item[1]["total_rss_mb"], reverse=True
+            )[:20]
+        ],
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+    report_path = os.path.join(results_dir, "resource_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    report["path"] = report_path
+    return report
@@ -0,0 +1,81 @@
+"""
+Выученный порядок альтернативных селекторов. Для каждой пары (страница, метод)
+считается, какой из кандидатов находил элемент, и следующие вызовы (и прогоны,
+если задан файл истории) проверяют его первым.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from utils.data_store import file_lock, read_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorPreferences:
+    """Счетчики побед селекторов-кандидатов по (странице, методу)."""
+
+    def __init__(self, history_file: Optional[str] = None):
+        """
+        Args:
+            history_file: Файл истории между прогонами (None - только в памяти процесса)
+        """
+        self.history_file = history_file
+        self.wins: Dict[str, Dict[str, int]] = {}
+        self._new_wins: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def key(page: str, method: str) -> str:
+        """Ключ истории для пары (страница, метод)."""
+        return f"{page}::{method}"
+
+    def load(self) -> None:
+        """Загружает историю прошлых прогонов."""
+        if self.history_file:
+            self.wins = read_json(self.history_file)
+
+    def order(self, page: str, method: str, candidates: Sequence[str]) -> List[str]:
+        """
+        Упорядочивает кандидатов: чаще побеждавшие первыми, остальные в исходном порядке.
+
+        Args:
+            page: Имя страницы (класс Page Object)
+            method: Метод, разрешающий селектор
+            candidates: Кандидаты в порядке по умолчанию
+
+        Returns:
+            list: Кандидаты в порядке проверки
+        """
+        wins = self.wins.get(self.key(page, method), {})
+        return sorted(candidates, key=lambda selector: -wins.get(selector, 0))
+
+    def record(self, page: str, method: str, selector: str) -> None:
+        """
+        Засчитывает победу кандидата.
+
+        Args:
+            page: Имя страницы (класс Page Object)
+            method: Метод, разрешающий селектор
+            selector: Найденный селектор
+        """
+        key = self.key(page, method)
+        for wins in (self.wins, self._new_wins):
+            counters = wins.setdefault(key, {})
+            counters[selector] = counters.get(selector, 0) + 1
+
+    def save(self) -> None:
+        """
+        Дописывает новые победы в историю под межпроцессной блокировкой
+        (безопасно для xdist воркеров).
+        """
+        if not self.history_file or not self._new_wins:
+            return
+        with file_lock(self.history_file + ".lock"):
+            history = read_json(self.history_file)
+            for key, counters in self._new_wins.items():
+                merged = history.setdefault(key, {})
+                for selector, count in counters.items():
+                    merged[selector] = merged.get(selector, 0) + count
+            write_json_atomic(self.history_file, history)
+        logger.info(f"История селекторов обновлена: {len(self._new_wins)} методов")
+        self._new_wins.clear()